@@ -0,0 +1,6 @@
+"""Performance benchmarks for MicroGenesis.
+
+Synthesizes DDL scripts and OpenAPI specifications at increasing sizes, runs
+the parsers and every framework/language generator against them and records
+wall time, files per second and peak RSS. Run with ``python -m benchmarks``.
+"""
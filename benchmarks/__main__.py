@@ -0,0 +1,134 @@
+"""Command line entry point for the benchmark suite."""
+
+import argparse
+import sys
+
+from benchmarks.compare import compare_results, format_comparison, load_results, save_results
+from benchmarks.runner import DEFAULT_SCALES, SCENARIOS, run_benchmarks
+
+
+def parse_arguments(argv=None):
+    """Parse command line arguments.
+
+    Args:
+        argv: Argument list (defaults to sys.argv)
+
+    Returns:
+        argparse.Namespace: Parsed arguments
+    """
+    parser = argparse.ArgumentParser(
+        prog="python -m benchmarks",
+        description="MicroGenesis performance benchmarks"
+    )
+    subparsers = parser.add_subparsers(dest="command")
+
+    run_parser = subparsers.add_parser("run", help="Run the benchmarks and save the results")
+    run_parser.add_argument(
+        "--scales",
+        type=int,
+        nargs="+",
+        default=DEFAULT_SCALES,
+        help="Number of tables/endpoints to benchmark (default: %(default)s)"
+    )
+    run_parser.add_argument(
+        "--scenarios",
+        nargs="+",
+        choices=sorted(SCENARIOS),
+        metavar="SCENARIO",
+        help="Scenarios to run (default: all)"
+    )
+    run_parser.add_argument(
+        "--jobs",
+        type=int,
+        default=1,
+        help="Workers used by parser and generator scenarios"
+    )
+    run_parser.add_argument(
+        "--repeat",
+        type=int,
+        default=1,
+        help="Runs per scenario; the fastest run is kept"
+    )
+    run_parser.add_argument(
+        "--output",
+        default="benchmark-results.json",
+        help="Where to save the results (default: %(default)s)"
+    )
+    run_parser.add_argument(
+        "--baseline",
+        help="Compare the results with this baseline file"
+    )
+    run_parser.add_argument(
+        "--threshold",
+        type=float,
+        default=0.10,
+        help="Relative increase reported as a regression (default: %(default)s)"
+    )
+
+    compare_parser = subparsers.add_parser("compare", help="Compare two result files")
+    compare_parser.add_argument("baseline", help="Baseline results file")
+    compare_parser.add_argument("current", help="Current results file")
+    compare_parser.add_argument(
+        "--threshold",
+        type=float,
+        default=0.10,
+        help="Relative increase reported as a regression (default: %(default)s)"
+    )
+
+    subparsers.add_parser("list", help="List the available scenarios")
+
+    return parser.parse_args(argv)
+
+
+def _report_comparison(baseline, current, threshold: float) -> int:
+    rows = compare_results(baseline, current, threshold=threshold)
+    print(format_comparison(rows))
+    regressions = [row for row in rows if row["status"] == "regression"]
+    if regressions:
+        print(f"\n{len(regressions)} regression(s) beyond {threshold:.0%}")
+        return 1
+    print("\nNo regressions")
+    return 0
+
+
+def main(argv=None) -> int:
+    """Run the benchmark command line.
+
+    Args:
+        argv: Argument list (defaults to sys.argv)
+
+    Returns:
+        int: Exit code (1 if regressions were found)
+    """
+    args = parse_arguments(argv)
+
+    if args.command == "list":
+        for name in SCENARIOS:
+            print(name)
+        return 0
+
+    if args.command == "compare":
+        return _report_comparison(load_results(args.baseline), load_results(args.current), args.threshold)
+
+    if args.command != "run":
+        parse_arguments(["--help"])
+        return 1
+
+    results = run_benchmarks(
+        scales=args.scales,
+        scenarios=args.scenarios,
+        jobs=args.jobs,
+        repeat=args.repeat,
+        progress=print
+    )
+    save_results(results, args.output)
+    print(f"\nResults written to: {args.output}")
+
+    if args.baseline:
+        print()
+        return _report_comparison(load_results(args.baseline), results, args.threshold)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,115 @@
+"""Comparison of benchmark results against a baseline."""
+
+import json
+from typing import Dict, Any, List, Tuple
+
+# Metrics compared between runs (higher is worse for all of them)
+COMPARED_METRICS = ["seconds", "peak_rss_kb"]
+
+# Absolute changes below these values are treated as noise
+MIN_DELTAS = {
+    "seconds": 0.005,
+    "peak_rss_kb": 1024,
+}
+
+
+def load_results(path: str) -> Dict[str, Any]:
+    """Load a benchmark results file.
+
+    Args:
+        path: Path to the JSON results file
+
+    Returns:
+        Dict[str, Any]: Results document
+    """
+    with open(path, "r") as f:
+        return json.load(f)
+
+
+def save_results(results: Dict[str, Any], path: str) -> None:
+    """Save benchmark results as JSON.
+
+    Args:
+        results: Results document
+        path: Target file path
+    """
+    with open(path, "w") as f:
+        json.dump(results, f, indent=2)
+
+
+def _index(results: Dict[str, Any]) -> Dict[Tuple[str, int], Dict[str, Any]]:
+    return {(entry["scenario"], entry["scale"]): entry for entry in results.get("results", [])}
+
+
+def compare_results(baseline: Dict[str, Any], current: Dict[str, Any],
+                    threshold: float = 0.10) -> List[Dict[str, Any]]:
+    """Compare benchmark results with a baseline.
+
+    A metric regresses when it grows by more than ``threshold`` (relative)
+    and by more than its noise floor (absolute). Runs that failed in the
+    current results but succeeded in the baseline are regressions as well.
+
+    Args:
+        baseline: Baseline results document
+        current: Current results document
+        threshold: Allowed relative increase (0.10 = 10%)
+
+    Returns:
+        List[Dict[str, Any]]: One row per scenario and scale with the status
+            "ok", "regression", "improvement", "new" or "missing"
+    """
+    baseline_index = _index(baseline)
+    current_index = _index(current)
+    rows = []
+
+    for key, entry in current_index.items():
+        scenario, scale = key
+        row: Dict[str, Any] = {"scenario": scenario, "scale": scale, "status": "ok", "changes": {}}
+        base = baseline_index.get(key)
+
+        if base is None:
+            row["status"] = "new"
+        elif entry.get("error") and not base.get("error"):
+            row["status"] = "regression"
+            row["error"] = entry["error"]
+        else:
+            for metric in COMPARED_METRICS:
+                old, new = base.get(metric), entry.get(metric)
+                if not old or new is None:
+                    continue
+                change = (new - old) / old
+                row["changes"][metric] = change
+                if abs(new - old) < MIN_DELTAS.get(metric, 0):
+                    continue
+                if change > threshold:
+                    row["status"] = "regression"
+                elif change < -threshold and row["status"] == "ok":
+                    row["status"] = "improvement"
+        rows.append(row)
+
+    for key in baseline_index:
+        if key not in current_index:
+            rows.append({"scenario": key[0], "scale": key[1], "status": "missing", "changes": {}})
+
+    return rows
+
+
+def format_comparison(rows: List[Dict[str, Any]]) -> str:
+    """Format comparison rows as a plain-text table.
+
+    Args:
+        rows: Rows returned by compare_results()
+
+    Returns:
+        str: Comparison table
+    """
+    lines = [f"{'Scenario':<36} {'Scale':>6} {'Time':>9} {'Peak RSS':>9}  Status"]
+    for row in rows:
+        changes = row["changes"]
+        time_change = f"{changes['seconds']:+.1%}" if "seconds" in changes else "-"
+        rss_change = f"{changes['peak_rss_kb']:+.1%}" if "peak_rss_kb" in changes else "-"
+        status = row["status"].upper() if row["status"] == "regression" else row["status"]
+        if row.get("error"):
+            status += f" ({row['error']})"
+        lines.append(f"{row['scenario']:<36} {row['scale']:>6} {time_change:>9} {rss_change:>9}  {status}")
+    return "\n".join(lines)
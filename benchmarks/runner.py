@@ -0,0 +1,269 @@
+"""Benchmark runner.
+
+Every scenario runs in a fresh worker process so that peak RSS reflects that
+scenario alone and no template, module or parser state leaks between runs.
+"""
+
+import logging
+import multiprocessing
+import os
+import platform
+import sys
+import tempfile
+import time
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, Any, List, Optional, Callable
+
+from benchmarks.synthetic import write_ddl, write_dump, write_fixture_openapi, write_openapi
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+# Baseline file format version
+RESULTS_FORMAT = 1
+
+# Default input sizes (tables for DDL, operations for OpenAPI)
+DEFAULT_SCALES = [10, 100, 1000, 10000]
+
+# Framework/language pairs with a dedicated generator
+GENERATOR_TARGETS = [
+    ("spring-boot", "java"),
+    ("spring-boot", "kotlin"),
+    ("micronaut", "java"),
+    ("micronaut", "kotlin"),
+    ("graphql", "java"),
+    ("graphql", "kotlin"),
+]
+
+# Tag of the sample OpenAPI definitions whose operations the selective parse scenario parses
+SELECTED_TAG = "Accounts"
+
+
+def _peak_rss_kb() -> Optional[int]:
+    """Get the peak resident set size of the current process.
+
+    Returns:
+        Optional[int]: Peak RSS in KiB, or None if not available
+    """
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # macOS reports bytes, Linux reports KiB
+    return peak // 1024 if sys.platform == "darwin" else peak
+
+
+def _split_sql(inputs: Dict[str, str], jobs: int) -> Dict[str, Any]:
+    from src.generators.schema.sql_lexer import split_statements
+
+    with open(inputs["ddl_file"], "r") as f:
+        statements = sum(1 for _ in split_statements(f.read()))
+    return {"items": statements, "input_bytes": os.path.getsize(inputs["ddl_file"])}
+
+
+def _parse_ddl(inputs: Dict[str, str], jobs: int) -> Dict[str, Any]:
+    from src.generators.schema.ddl_parser import DDLParser
+
+    tables = DDLParser(jobs=jobs).parse_ddl_file(inputs["ddl_file"])
+    return {"items": len(tables), "input_bytes": os.path.getsize(inputs["ddl_file"])}
+
+
+def _parse_dump(inputs: Dict[str, str], jobs: int) -> Dict[str, Any]:
+    from src.generators.schema.ddl_parser import DDLParser
+
+    tables = DDLParser(jobs=jobs).parse_ddl_file(inputs["dump_file"])
+    return {"items": len(tables), "input_bytes": os.path.getsize(inputs["dump_file"])}
+
+
+def _parse_openapi(inputs: Dict[str, str], jobs: int) -> Dict[str, Any]:
+    from src.generators.micronaut.java import MicronautJavaGenerator
+
+    api_info = MicronautJavaGenerator().parse_swagger_file(inputs["swagger_file"])
+    return {"items": len(api_info.get("endpoints", []))}
+
+
+def _parse_openapi_spring_boot(inputs: Dict[str, str], jobs: int) -> Dict[str, Any]:
+    from src.generators.spring_boot.java import SpringBootJavaGenerator
+
+    api_info = SpringBootJavaGenerator().parse_swagger_file(inputs["swagger_file"])
+    return {"items": len(api_info.get("models", {}))}
+
+
+def _parse_openapi_fixture(inputs: Dict[str, str], jobs: int) -> Dict[str, Any]:
+    from src.generators.schema.openapi_parser import OpenAPIParser
+
+    api_info = OpenAPIParser().parse_file(inputs["fixture_file"])
+    return {"items": len(api_info["endpoints"]), "input_bytes": os.path.getsize(inputs["fixture_file"])}
+
+
+def _parse_openapi_selected_tag(inputs: Dict[str, str], jobs: int) -> Dict[str, Any]:
+    from src.generators.schema.openapi_parser import OpenAPIParser, select_operations
+
+    api_info = OpenAPIParser().parse_file(inputs["fixture_file"], select_operations([SELECTED_TAG]))
+    return {"items": len(api_info["endpoints"]), "input_bytes": os.path.getsize(inputs["fixture_file"])}
+
+
+def _load_yaml(inputs: Dict[str, str], jobs: int) -> Dict[str, Any]:
+    from src.utils.yaml_loader import load_document
+
+    document = load_document(inputs["fixture_file"])
+    return {"items": len(document["paths"]), "input_bytes": os.path.getsize(inputs["fixture_file"])}
+
+
+def _load_yaml_pure_python(inputs: Dict[str, str], jobs: int) -> Dict[str, Any]:
+    import yaml
+
+    with open(inputs["fixture_file"], "rb") as f:
+        document = yaml.load(f, Loader=yaml.SafeLoader)
+    return {"items": len(document["paths"]), "input_bytes": os.path.getsize(inputs["fixture_file"])}
+
+
+def _generator_scenario(framework: str, language: str) -> Callable[[Dict[str, str], int], Dict[str, Any]]:
+    def run(inputs: Dict[str, str], jobs: int) -> Dict[str, Any]:
+        from src.core.scaffolding import ScaffoldingEngine
+
+        config = {
+            "project_name": "bench",
+            "base_package": "com.example.bench",
+            "framework": {"name": framework, "version": "3.2.0" if framework == "spring-boot" else "4.2.0"},
+            "language": {"name": language, "version": "17" if language == "java" else "1.9"},
+            "build_system": {"name": "maven" if language == "java" else "gradle"},
+            "service_type": "entity-driven",
+            "database": {"name": "postgresql"},
+            "pipeline": {"name": "github-actions"},
+            "ddl_file": inputs["ddl_file"],
+            "swagger_file": inputs["swagger_file"],
+        }
+        engine = ScaffoldingEngine(output_dir=inputs["output_dir"])
+        engine.generate_project(config, incremental=False, jobs=jobs)
+        report = engine.last_report
+        return {"files": report.files_written, "bytes": report.bytes_written}
+
+    return run
+
+
+# Benchmark scenarios by name
+SCENARIOS: Dict[str, Callable[[Dict[str, str], int], Dict[str, Any]]] = {
+    "sql_lexer": _split_sql,
+    "ddl_parser": _parse_ddl,
+    "ddl_parser_dump": _parse_dump,
+    "openapi_parser": _parse_openapi,
+    "openapi_parser_spring_boot": _parse_openapi_spring_boot,
+    "openapi_parser_fixture": _parse_openapi_fixture,
+    "openapi_parser_selected_tag": _parse_openapi_selected_tag,
+    "yaml_loader": _load_yaml,
+    "yaml_loader_pure_python": _load_yaml_pure_python,
+}
+for _framework, _language in GENERATOR_TARGETS:
+    SCENARIOS[f"generate_{_framework}_{_language}"] = _generator_scenario(_framework, _language)
+
+
+def run_scenario(name: str, inputs: Dict[str, str], jobs: int = 1) -> Dict[str, Any]:
+    """Run a single scenario in the current process and measure it.
+
+    Args:
+        name: Scenario name
+        inputs: Paths of the synthetic inputs and the output directory
+        jobs: Number of workers used by parser and generator scenarios
+
+    Returns:
+        Dict[str, Any]: Measurements (seconds, files, bytes, files_per_sec,
+            mb_per_sec, peak_rss_kb, error)
+    """
+    from src.core.logging import get_logger
+
+    # Progress logging would dominate the timings of small scenarios
+    get_logger().setLevel(logging.ERROR)
+
+    result: Dict[str, Any] = {"error": None}
+    start = time.perf_counter()
+    try:
+        result.update(SCENARIOS[name](inputs, jobs))
+    except Exception as e:
+        result["error"] = f"{type(e).__name__}: {e}"
+    result["seconds"] = time.perf_counter() - start
+    result["peak_rss_kb"] = _peak_rss_kb()
+
+    files = result.get("files")
+    result["files_per_sec"] = files / result["seconds"] if files and result["seconds"] > 0 else None
+    input_bytes = result.get("input_bytes")
+    result["mb_per_sec"] = input_bytes / 1e6 / result["seconds"] if input_bytes and result["seconds"] > 0 else None
+    return result
+
+
+def _run_isolated(name: str, inputs: Dict[str, str], jobs: int) -> Dict[str, Any]:
+    """Run a scenario in a fresh worker process.
+
+    Args:
+        name: Scenario name
+        inputs: Paths of the synthetic inputs and the output directory
+        jobs: Number of workers used by parser and generator scenarios
+
+    Returns:
+        Dict[str, Any]: Measurements of the scenario
+    """
+    context = multiprocessing.get_context("spawn")
+    with ProcessPoolExecutor(max_workers=1, mp_context=context) as executor:
+        return executor.submit(run_scenario, name, inputs, jobs).result()
+
+
+def run_benchmarks(scales: Optional[List[int]] = None, scenarios: Optional[List[str]] = None,
+                   jobs: int = 1, repeat: int = 1, isolate: bool = True,
+                   progress: Optional[Callable[[str], None]] = None) -> Dict[str, Any]:
+    """Run benchmark scenarios against synthetic inputs of several sizes.
+
+    Args:
+        scales: Input sizes (defaults to DEFAULT_SCALES)
+        scenarios: Scenario names (defaults to all scenarios)
+        jobs: Number of workers used by parser and generator scenarios
+        repeat: Number of runs per scenario; the fastest run is kept
+        isolate: Whether to run every scenario in a fresh process
+        progress: Optional callback receiving a line per finished run
+
+    Returns:
+        Dict[str, Any]: Results document suitable for saving as a baseline
+
+    Raises:
+        ValueError: If an unknown scenario is requested
+    """
+    scales = scales or DEFAULT_SCALES
+    scenarios = scenarios or list(SCENARIOS)
+    unknown = [name for name in scenarios if name not in SCENARIOS]
+    if unknown:
+        raise ValueError(f"Unknown benchmark scenarios: {', '.join(unknown)}")
+
+    results = []
+    with tempfile.TemporaryDirectory(prefix="microgenesis-bench-") as work_dir:
+        for scale in scales:
+            inputs = {
+                "ddl_file": write_ddl(os.path.join(work_dir, f"schema-{scale}.sql"), scale),
+                "dump_file": write_dump(os.path.join(work_dir, f"dump-{scale}.sql"), scale),
+                "swagger_file": write_openapi(os.path.join(work_dir, f"openapi-{scale}.yaml"), scale),
+                "fixture_file": write_fixture_openapi(os.path.join(work_dir, f"fixtures-{scale}.yaml"), scale),
+            }
+            for name in scenarios:
+                best = None
+                for run in range(max(1, repeat)):
+                    run_inputs = dict(inputs, output_dir=os.path.join(work_dir, f"out-{name}-{scale}-{run}"))
+                    measured = _run_isolated(name, run_inputs, jobs) if isolate else run_scenario(name, run_inputs, jobs)
+                    if best is None or measured["seconds"] < best["seconds"]:
+                        best = measured
+
+                entry = {"scenario": name, "scale": scale}
+                entry.update(best)
+                results.append(entry)
+                if progress:
+                    status = f"ERROR {entry['error']}" if entry["error"] else f"{entry['seconds']:.3f}s"
+                    if entry.get("mb_per_sec"):
+                        status += f" ({entry['mb_per_sec']:.1f} MB/s)"
+                    progress(f"{name:<36} {scale:>6}  {status}")
+
+    return {
+        "format": RESULTS_FORMAT,
+        "created_at": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "jobs": jobs,
+        "results": results,
+    }
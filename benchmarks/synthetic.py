@@ -0,0 +1,282 @@
+"""Synthetic inputs for benchmarks.
+
+Builds DDL scripts and OpenAPI specifications of arbitrary size. The output
+is deterministic for a given size so results stay comparable between runs.
+"""
+
+import glob
+import json
+import os
+from typing import Dict, Any, List, Optional
+
+import yaml
+
+# Sample OpenAPI definitions scaled up by generate_fixture_openapi
+FIXTURE_PATTERN = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+                               "tests", "resource", "*", "service.yaml")
+
+# Operations of an OpenAPI path item
+_HTTP_METHODS = {"get", "put", "post", "delete", "options", "head", "patch", "trace"}
+
+# Column definitions added to every synthetic table (besides id and foreign key)
+_COLUMNS = [
+    "name VARCHAR(255) NOT NULL",
+    "description TEXT",
+    "amount DECIMAL(10, 2)",
+    "quantity INT DEFAULT 0",
+    "active BOOLEAN DEFAULT TRUE",
+    "created_at TIMESTAMP NOT NULL",
+    "updated_at TIMESTAMP",
+]
+
+# Operations generated for every synthetic OpenAPI resource
+_OPERATIONS = [
+    ("/{resource}", "get", "list"),
+    ("/{resource}", "post", "create"),
+    ("/{resource}/{{id}}", "get", "get"),
+    ("/{resource}/{{id}}", "put", "update"),
+    ("/{resource}/{{id}}", "delete", "delete"),
+]
+
+
+def generate_ddl(tables: int) -> str:
+    """Generate a DDL script with the given number of tables.
+
+    Every table after the first references the previous one, and every tenth
+    table is a junction table linking its two predecessors.
+
+    Args:
+        tables: Number of CREATE TABLE statements
+
+    Returns:
+        str: DDL script
+    """
+    statements = []
+    for i in range(tables):
+        name = f"table_{i:05d}"
+        lines = ["    id BIGINT NOT NULL AUTO_INCREMENT"]
+
+        if i >= 2 and i % 10 == 9:
+            first, second = f"table_{i - 2:05d}", f"table_{i - 1:05d}"
+            lines = [
+                f"    {first}_id BIGINT NOT NULL",
+                f"    {second}_id BIGINT NOT NULL",
+                f"    PRIMARY KEY ({first}_id, {second}_id)",
+                f"    FOREIGN KEY ({first}_id) REFERENCES {first}(id)",
+                f"    FOREIGN KEY ({second}_id) REFERENCES {second}(id)",
+            ]
+        else:
+            lines.extend(f"    {column}" for column in _COLUMNS)
+            if i > 0:
+                parent = f"table_{i - 1:05d}"
+                lines.append(f"    {parent}_id BIGINT")
+                lines.append("    PRIMARY KEY (id)")
+                lines.append(f"    FOREIGN KEY ({parent}_id) REFERENCES {parent}(id)")
+            else:
+                lines.append("    PRIMARY KEY (id)")
+
+        statements.append(f"CREATE TABLE {name} (\n" + ",\n".join(lines) + "\n);\n")
+
+    return "\n".join(statements)
+
+
+def generate_openapi(endpoints: int) -> Dict[str, Any]:
+    """Generate an OpenAPI 3 specification with the given number of operations.
+
+    Operations are grouped into CRUD resources of five operations each, and
+    every resource has a schema that references the previous resource.
+
+    Args:
+        endpoints: Number of operations
+
+    Returns:
+        Dict[str, Any]: OpenAPI specification
+    """
+    paths: Dict[str, Dict[str, Any]] = {}
+    schemas: Dict[str, Any] = {}
+
+    for i in range(endpoints):
+        index, operation = divmod(i, len(_OPERATIONS))
+        resource = f"resource{index:05d}"
+        schema_name = f"Resource{index:05d}Entity"
+        path_template, method, action = _OPERATIONS[operation]
+        path = path_template.format(resource=resource)
+
+        if schema_name not in schemas:
+            properties = {
+                "id": {"type": "integer", "format": "int64"},
+                "name": {"type": "string", "description": "Display name"},
+                "amount": {"type": "number", "format": "double"},
+                "active": {"type": "boolean"},
+                "createdAt": {"type": "string", "format": "date-time"},
+            }
+            if index > 0:
+                properties["parent"] = {"$ref": f"#/components/schemas/Resource{index - 1:05d}Entity"}
+            schemas[schema_name] = {"type": "object", "required": ["id", "name"], "properties": properties}
+
+        schema_ref = {"$ref": f"#/components/schemas/{schema_name}"}
+        details: Dict[str, Any] = {
+            "operationId": f"{action}{schema_name}",
+            "summary": f"{action.capitalize()} {resource}",
+            "tags": [resource],
+            "responses": {"200": {"description": "OK", "content": {"application/json": {"schema": schema_ref}}}},
+        }
+        if "{id}" in path:
+            details["parameters"] = [
+                {"name": "id", "in": "path", "required": True, "schema": {"type": "integer", "format": "int64"}}
+            ]
+        if method in ("post", "put"):
+            details["requestBody"] = {"content": {"application/json": {"schema": schema_ref}}}
+
+        paths.setdefault(path, {})[method] = details
+
+    return {
+        "openapi": "3.0.3",
+        "info": {"title": "Synthetic API", "version": "1.0.0"},
+        "paths": paths,
+        "components": {"schemas": schemas},
+    }
+
+
+def write_ddl(path: str, tables: int) -> str:
+    """Write a synthetic DDL script to a file.
+
+    Args:
+        path: Target file path
+        tables: Number of tables
+
+    Returns:
+        str: Path of the written file
+    """
+    with open(path, "w") as f:
+        f.write(generate_ddl(tables))
+    return path
+
+
+def write_dump(path: str, tables: int, rows: int = 50) -> str:
+    """Write a synthetic schema dump with table data to a file.
+
+    The DDL of every table is followed by an extended INSERT statement with
+    ``rows`` rows, like the output of ``mysqldump``. The file is written
+    table by table so large dumps don't have to fit in memory.
+
+    Args:
+        path: Target file path
+        tables: Number of tables
+        rows: Number of rows inserted per table
+
+    Returns:
+        str: Path of the written file
+    """
+    statements = generate_ddl(tables).split("\n\n")
+    with open(path, "w") as f:
+        for i, statement in enumerate(statements):
+            f.write(statement + "\n")
+            values = ",".join(
+                f"({row},'name {row}; \\'quoted\\'','text (with) parens',{row}.50,{row % 7},1,"
+                f"'2024-01-01 00:00:00',NULL)"
+                for row in range(rows)
+            )
+            f.write(f"INSERT INTO table_{i:05d} VALUES {values};\n\n")
+    return path
+
+
+def write_openapi(path: str, endpoints: int) -> str:
+    """Write a synthetic OpenAPI specification to a YAML or JSON file.
+
+    Args:
+        path: Target file path (.yaml/.yml for YAML, JSON otherwise)
+        endpoints: Number of operations
+
+    Returns:
+        str: Path of the written file
+    """
+    spec = generate_openapi(endpoints)
+    with open(path, "w") as f:
+        if os.path.splitext(path)[1].lower() in (".yaml", ".yml"):
+            yaml.safe_dump(spec, f, sort_keys=False)
+        else:
+            json.dump(spec, f)
+    return path
+
+
+def generate_fixture_openapi(endpoints: int, fixtures: Optional[List[str]] = None) -> Dict[str, Any]:
+    """Scale up the sample OpenAPI definitions of the test resources.
+
+    The paths and components of all samples are copied, with a suffix per
+    copy, until the specification has at least the given number of
+    operations. References are renamed along with their components.
+
+    Args:
+        endpoints: Minimum number of operations
+        fixtures: Sample definition files (defaults to tests/resource/*/service.yaml)
+
+    Returns:
+        Dict[str, Any]: OpenAPI specification
+    """
+    documents = []
+    for fixture in sorted(fixtures or glob.glob(FIXTURE_PATTERN)):
+        with open(fixture, "r") as f:
+            documents.append(yaml.safe_load(f))
+    if not documents:
+        raise ValueError("No sample OpenAPI definitions found")
+
+    paths: Dict[str, Any] = {}
+    components: Dict[str, Dict[str, Any]] = {}
+    operations = 0
+    copy = 0
+    while operations < endpoints:
+        for index, document in enumerate(documents):
+            suffix = f"V{copy}N{index}"
+            for path, path_item in (document.get("paths") or {}).items():
+                paths[f"/v{copy}/n{index}{path}"] = _rename_refs(path_item, suffix)
+                operations += sum(1 for method in path_item if method in _HTTP_METHODS)
+            for section, entries in (document.get("components") or {}).items():
+                for name, entry in (entries or {}).items():
+                    components.setdefault(section, {})[name + suffix] = _rename_refs(entry, suffix)
+            if operations >= endpoints:
+                break
+        copy += 1
+
+    return {
+        "openapi": "3.0.3",
+        "info": {"title": "Scaled sample API", "version": "1.0.0"},
+        "paths": paths,
+        "components": components,
+    }
+
+
+def _rename_refs(node: Any, suffix: str) -> Any:
+    """Copy a definition fragment, appending a suffix to its local component references."""
+    if isinstance(node, dict):
+        return {
+            key: value + suffix if key == "$ref" and isinstance(value, str) and value.startswith("#/components/")
+            else _rename_refs(value, suffix)
+            for key, value in node.items()
+        }
+    if isinstance(node, list):
+        return [_rename_refs(item, suffix) for item in node]
+    return node
+
+
+def write_fixture_openapi(path: str, endpoints: int) -> str:
+    """Write the sample OpenAPI definitions, scaled up, to a YAML file.
+
+    Args:
+        path: Target file path
+        endpoints: Minimum number of operations
+
+    Returns:
+        str: Path of the written file
+    """
+    spec = generate_fixture_openapi(endpoints)
+    with open(path, "w") as f:
+        yaml.dump(spec, f, Dumper=_NoAliasDumper, sort_keys=False)
+    return path
+
+
+class _NoAliasDumper(getattr(yaml, "CSafeDumper", yaml.SafeDumper)):
+    """YAML dumper that repeats shared objects like hand-written definitions do."""
+
+    def ignore_aliases(self, data):
+        return True
@@ -0,0 +1,304 @@
+"""Batch generation module for MicroGenesis.
+
+This module drives the scaffolding engine over a manifest of project
+configurations, fanning the projects out across a pool of worker processes
+that stay warm between projects.
+"""
+
+import copy
+import importlib
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, Any, List, Optional, Tuple
+
+from src.core.logging import get_logger
+from src.core.scaffolding import ScaffoldingEngine, normalize_project_config
+from src.utils.yaml_loader import load_document
+
+logger = get_logger()
+
+# Modules imported once per worker so that later projects skip the import cost
+WARM_MODULES = [
+    "jinja2",
+    "src.utils.yaml_loader",
+    "src.generators.base",
+    "src.generators.registry",
+    "src.generators.schema.ddl_parser",
+    "src.generators.spring_boot.java",
+    "src.generators.spring_boot.kotlin",
+    "src.generators.micronaut.java",
+    "src.generators.micronaut.kotlin",
+    "src.generators.graphql.java",
+    "src.generators.graphql.kotlin",
+]
+
+# Manifest keys that describe the batch itself rather than a project
+MANIFEST_ONLY_KEYS = ["projects", "defaults", "service_architectures", "test_options"]
+
+
+class BatchResult:
+    """Outcome of generating a single project within a batch."""
+
+    def __init__(self, name: str, success: bool, project_dir: Optional[str] = None,
+                 error: Optional[str] = None, duration: float = 0.0):
+        """Initialize the batch result.
+
+        Args:
+            name: Name identifying the project within the batch
+            success: Whether the project was generated successfully
+            project_dir: Path to the generated project (if successful)
+            error: Error message (if generation failed)
+            duration: Wall time spent generating the project, in seconds
+        """
+        self.name = name
+        self.success = success
+        self.project_dir = project_dir
+        self.error = error
+        self.duration = duration
+
+    def as_dict(self) -> Dict[str, Any]:
+        """Get the result as a dictionary.
+
+        Returns:
+            Dict[str, Any]: Result data
+        """
+        return {
+            "name": self.name,
+            "success": self.success,
+            "project_dir": self.project_dir,
+            "error": self.error,
+            "duration": round(self.duration, 3),
+        }
+
+    def __repr__(self) -> str:
+        status = "ok" if self.success else "failed"
+        return f"BatchResult({self.name!r}, {status})"
+
+
+def load_manifest(manifest_path: str) -> Any:
+    """Load a batch manifest file (JSON or YAML).
+
+    Args:
+        manifest_path: Path to the manifest file
+
+    Returns:
+        Parsed manifest content
+
+    Raises:
+        FileNotFoundError: If the manifest file does not exist
+    """
+    if not os.path.exists(manifest_path):
+        raise FileNotFoundError(f"Batch manifest not found: {manifest_path}")
+
+    return load_document(manifest_path)
+
+
+def expand_manifest(manifest: Any, defaults: Optional[Dict[str, Any]] = None) -> List[Tuple[str, Dict[str, Any]]]:
+    """Expand a batch manifest into individual project configurations.
+
+    A manifest can be a list of project configurations, a dictionary with a
+    ``projects`` list (and optional shared ``defaults``), or a single project
+    configuration with a ``service_architectures`` list. In the latter case
+    every architecture entry is merged over the shared settings and generated
+    into ``output_dir/output_subdir``.
+
+    Args:
+        manifest: Parsed manifest content
+        defaults: Settings shared by every project in the manifest
+
+    Returns:
+        List[Tuple[str, Dict[str, Any]]]: (name, configuration) pairs in manifest
+            order, with unique names
+    """
+    return _deduplicate_names(_expand_entries(manifest, defaults or {}))
+
+
+def _expand_entries(manifest: Any, defaults: Dict[str, Any]) -> List[Tuple[str, Dict[str, Any]]]:
+    """Expand a manifest or manifest entry (see expand_manifest), keeping duplicate names."""
+    if isinstance(manifest, list):
+        projects = []
+        for entry in manifest:
+            projects.extend(_expand_entries(entry, defaults))
+        return projects
+
+    if not isinstance(manifest, dict):
+        raise ValueError(f"Unsupported batch manifest entry: {manifest!r}")
+
+    if "projects" in manifest:
+        shared = _merge(defaults, manifest.get("defaults", {}))
+        return _expand_entries(manifest["projects"], shared)
+
+    base = _merge(defaults, {k: v for k, v in manifest.items() if k not in MANIFEST_ONLY_KEYS})
+
+    architectures = manifest.get("service_architectures")
+    if not architectures:
+        config = normalize_project_config(base)
+        return [(config.get("name") or config.get("project_name", "app"), config)]
+
+    projects = []
+    for architecture in architectures:
+        overrides = {k: v for k, v in architecture.items() if k not in ["name", "output_subdir"]}
+        config = normalize_project_config(_merge(base, overrides))
+
+        output_subdir = architecture.get("output_subdir")
+        if output_subdir:
+            config["output_dir"] = os.path.join(config.get("output_dir") or os.getcwd(), output_subdir)
+
+        name = architecture.get("name") or config.get("service_type") or config.get("project_name", "app")
+        projects.append((name, config))
+
+    return projects
+
+
+def _merge(base: Dict[str, Any], overrides: Dict[str, Any]) -> Dict[str, Any]:
+    """Deep merge two configuration dictionaries into a new dictionary.
+
+    Args:
+        base: Base configuration dictionary
+        overrides: Override configuration dictionary
+
+    Returns:
+        Dict[str, Any]: Merged configuration dictionary
+    """
+    result = copy.deepcopy(base)
+    for key, value in overrides.items():
+        if isinstance(value, dict) and isinstance(result.get(key), dict):
+            result[key] = _merge(result[key], value)
+        else:
+            result[key] = copy.deepcopy(value)
+    return result
+
+
+def _deduplicate_names(projects: List[Tuple[str, Dict[str, Any]]]) -> List[Tuple[str, Dict[str, Any]]]:
+    """Make project names unique so results can be told apart.
+
+    Args:
+        projects: (name, configuration) pairs
+
+    Returns:
+        List[Tuple[str, Dict[str, Any]]]: Pairs with unique names
+    """
+    # Suffixes must not clash with names given in the manifest (e.g. "api", "api", "api-2")
+    taken = {name for name, _ in projects}
+    used = set()
+    result = []
+    for name, config in projects:
+        unique_name = name
+        count = 1
+        while unique_name in used or (count > 1 and unique_name in taken):
+            count += 1
+            unique_name = f"{name}-{count}"
+        used.add(unique_name)
+        result.append((unique_name, config))
+    return result
+
+
+def _warm_worker() -> None:
+    """Import generator modules once when a worker process starts."""
+    for module in WARM_MODULES:
+        try:
+            importlib.import_module(module)
+        except Exception as e:
+            logger.warning(f"Could not preload {module} in batch worker: {e}")
+
+    # Create the shared template environment up front as well
+    from src.generators.base.templating import get_environment
+    get_environment()
+
+
+def generate_single(name: str, config: Dict[str, Any],
+                    options: Optional[Dict[str, Any]] = None) -> BatchResult:
+    """Generate one project, capturing any failure in the result.
+
+    Args:
+        name: Name identifying the project within the batch
+        config: Project configuration dictionary
+        options: Keyword arguments of ScaffoldingEngine.generate_project
+            (incremental, jobs, render_backend, schema_cache)
+
+    Returns:
+        BatchResult: Outcome of the generation
+    """
+    start = time.perf_counter()
+    try:
+        engine = ScaffoldingEngine(output_dir=config.get("output_dir"))
+        project_dir = engine.generate_project(config, **(options or {}))
+        return BatchResult(name, True, project_dir=project_dir, duration=time.perf_counter() - start)
+    except Exception as e:
+        logger.error(f"Batch project '{name}' failed: {e}")
+        return BatchResult(name, False, error=f"{type(e).__name__}: {e}", duration=time.perf_counter() - start)
+
+
+class BatchRunner:
+    """Generate many projects, optionally across a pool of worker processes."""
+
+    def __init__(self, workers: Optional[int] = None, incremental: bool = True, jobs: int = 1,
+                 render_backend: str = "process", schema_cache: bool = True):
+        """Initialize the batch runner.
+
+        Args:
+            workers: Number of worker processes (defaults to the CPU count,
+                1 runs every project in the current process)
+            incremental: Whether to skip files whose inputs are unchanged since
+                the last generation of a project
+            jobs: Number of parallel workers used within each project to parse
+                its DDL file and render its files
+            render_backend: "process" or "thread" pool used when jobs > 1
+            schema_cache: Whether to reuse parsed schemas from the persistent
+                schema cache
+        """
+        self.workers = workers or os.cpu_count() or 1
+        # Options passed to ScaffoldingEngine.generate_project for every project
+        self.generation_options = {
+            "incremental": incremental,
+            "jobs": jobs,
+            "render_backend": render_backend,
+            "schema_cache": schema_cache,
+        }
+        self.logger = get_logger()
+
+    def run_manifest(self, manifest_path: str) -> List[BatchResult]:
+        """Generate every project listed in a manifest file.
+
+        Args:
+            manifest_path: Path to the manifest file (JSON or YAML)
+
+        Returns:
+            List[BatchResult]: One result per project, in manifest order
+        """
+        return self.run(expand_manifest(load_manifest(manifest_path)))
+
+    def run(self, projects: List[Tuple[str, Dict[str, Any]]]) -> List[BatchResult]:
+        """Generate a list of projects.
+
+        A failing project is reported in its result and never aborts the batch.
+
+        Args:
+            projects: (name, configuration) pairs
+
+        Returns:
+            List[BatchResult]: One result per project, in input order
+        """
+        if not projects:
+            return []
+
+        workers = min(self.workers, len(projects))
+        self.logger.info(f"Generating {len(projects)} projects with {workers} worker(s)")
+
+        if workers <= 1:
+            return [generate_single(name, config, self.generation_options) for name, config in projects]
+
+        results = []
+        with ProcessPoolExecutor(max_workers=workers, initializer=_warm_worker) as executor:
+            futures = [executor.submit(generate_single, name, config, self.generation_options)
+                       for name, config in projects]
+            for (name, _), future in zip(projects, futures):
+                try:
+                    results.append(future.result())
+                except Exception as e:
+                    # The worker itself died (e.g. unpicklable config or a crash)
+                    self.logger.error(f"Batch worker failed for '{name}': {e}")
+                    results.append(BatchResult(name, False, error=f"{type(e).__name__}: {e}"))
+
+        return results
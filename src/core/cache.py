@@ -0,0 +1,51 @@
+"""Cache directory management for MicroGenesis.
+
+Persistent caches (compiled templates, parsed schemas, ...) live below a
+single cache root so they can be inspected or wiped in one place.
+"""
+
+import os
+from pathlib import Path
+from typing import Optional
+
+from src.core.logging import get_logger
+
+logger = get_logger()
+
+
+def get_cache_root() -> str:
+    """Get the root directory for persistent caches.
+
+    The location can be set with ``MICROGENESIS_CACHE_DIR``; otherwise a
+    ``cache`` directory next to the MicroGenesis configuration is used.
+
+    Returns:
+        str: Path to the cache root directory
+    """
+    cache_dir = os.environ.get("MICROGENESIS_CACHE_DIR")
+    if cache_dir:
+        return cache_dir
+
+    config_dir = os.environ.get(
+        "MICROGENESIS_CONFIG_DIR",
+        str(Path.home() / ".microgenesis")
+    )
+    return os.path.join(config_dir, "cache")
+
+
+def get_cache_dir(*parts: str) -> Optional[str]:
+    """Get (and create) a cache directory below the cache root.
+
+    Args:
+        *parts: Path components below the cache root (e.g. "templates")
+
+    Returns:
+        Optional[str]: Path to the cache directory, or None if it cannot be created
+    """
+    cache_dir = os.path.join(get_cache_root(), *parts)
+    try:
+        os.makedirs(cache_dir, exist_ok=True)
+    except OSError as e:
+        logger.warning(f"Cache directory not available ({cache_dir}): {e}")
+        return None
+    return cache_dir
@@ -7,6 +7,7 @@ from pathlib import Path
 from typing import Dict, Any, Optional, Union
 
 from src.core.logging import get_logger
+from src.utils.yaml_loader import load_yaml
 
 logger = get_logger()
 
@@ -82,7 +83,7 @@ class Config:
                 if file_extension == ".json":
                     loaded_config = json.load(f)
                 elif file_extension in [".yaml", ".yml"]:
-                    loaded_config = yaml.safe_load(f)
+                    loaded_config = load_yaml(f)
                 else:
                     loaded_config = json.load(f)  # Default to JSON
                 
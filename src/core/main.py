@@ -1,14 +1,14 @@
 """Main module for MicroGenesis application."""
 
 import argparse
-import json
 import os
 import sys
 from typing import Dict, Any, List, Optional
 
-from src.core.scaffolding import ScaffoldingEngine
+from src.core.scaffolding import ScaffoldingEngine, normalize_project_config
 from src.core.logging import get_logger
 from src.core.config import Config
+from src.utils.yaml_loader import load_document
 
 logger = get_logger()
 config_manager = Config()
@@ -115,6 +115,22 @@ def parse_arguments():
         help="Path to Swagger/OpenAPI definition file"
     )
     
+    parser.add_argument(
+        "--swagger-tags",
+        type=str,
+        nargs="+",
+        metavar="TAG",
+        help="Only generate the operations of the Swagger/OpenAPI definition with these tags"
+    )
+    
+    parser.add_argument(
+        "--swagger-operations",
+        type=str,
+        nargs="+",
+        metavar="OPERATION_ID",
+        help="Only generate the operations of the Swagger/OpenAPI definition with these operation ids"
+    )
+    
     # DDL script file
     parser.add_argument(
         "--ddl-file",
@@ -122,6 +138,21 @@ def parse_arguments():
         help="Path to SQL DDL script file for entity generation"
     )
     
+    # Schema snapshots
+    parser.add_argument(
+        "--schema-snapshot",
+        type=str,
+        metavar="PATH",
+        help="Load the schema from a snapshot instead of parsing the DDL file"
+    )
+    
+    parser.add_argument(
+        "--save-schema-snapshot",
+        type=str,
+        metavar="PATH",
+        help="Write a snapshot of the schema the project is generated from to PATH"
+    )
+    
     # Schema mapping file
     parser.add_argument(
         "--schema-mapping",
@@ -143,6 +174,82 @@ def parse_arguments():
         help="Path to JSON configuration file with all settings"
     )
     
+    # Archive output
+    parser.add_argument(
+        "--archive",
+        type=str,
+        help="Write the project straight into a .zip or .tar.gz archive instead of the output directory"
+    )
+    
+    parser.add_argument(
+        "--compression-level",
+        type=int,
+        choices=range(0, 10),
+        metavar="0-9",
+        help="Compression level used with --archive"
+    )
+    
+    parser.add_argument(
+        "--no-incremental",
+        action="store_true",
+        help="Re-render every file even if its inputs are unchanged since the last run"
+    )
+    
+    parser.add_argument(
+        "--no-schema-cache",
+        action="store_true",
+        help="Always parse the DDL file instead of reusing a cached parse of the same schema"
+    )
+    
+    parser.add_argument(
+        "--previous-ddl",
+        type=str,
+        metavar="PATH",
+        help="DDL file the project was last generated from; only files of changed tables are regenerated"
+    )
+    
+    parser.add_argument(
+        "--jobs",
+        type=int,
+        default=1,
+        help="Number of parallel workers used to parse the DDL file and render the files of a project"
+    )
+    
+    parser.add_argument(
+        "--jobs-backend",
+        choices=["process", "thread"],
+        default="process",
+        help="Pool used by --jobs (default: process)"
+    )
+    
+    # Profiling
+    parser.add_argument(
+        "--profile",
+        action="store_true",
+        help="Print per-phase and per-template timings after generation"
+    )
+    
+    parser.add_argument(
+        "--profile-json",
+        type=str,
+        metavar="PATH",
+        help="Write the generation report as JSON to PATH"
+    )
+    
+    # Batch mode
+    parser.add_argument(
+        "--batch",
+        type=str,
+        metavar="MANIFEST",
+        help="Path to a JSON/YAML manifest listing many projects to generate"
+    )
+
+    parser.add_argument(
+        "--batch-workers",
+        type=int,
+        help="Number of worker processes used in batch mode (defaults to CPU count)"
+    )
+
     # Interactive mode
     parser.add_argument(
         "--interactive",
@@ -155,7 +262,27 @@ def parse_arguments():
         action="store_true",
         help="Show version information and exit"
     )
-    
+
+    # Maintenance commands
+    subparsers = parser.add_subparsers(dest="command")
+
+    templates_parser = subparsers.add_parser(
+        "templates",
+        help="Manage the bundled templates"
+    )
+    templates_subparsers = templates_parser.add_subparsers(dest="templates_command")
+
+    compile_parser = templates_subparsers.add_parser(
+        "compile",
+        help="Precompile all templates into importable Python modules"
+    )
+    compile_parser.add_argument(
+        "--output",
+        type=str,
+        help="Directory for the compiled templates (defaults to $MICROGENESIS_COMPILED_TEMPLATES "
+             "or ~/.microgenesis/cache/compiled-templates)"
+    )
+
     return parser.parse_args()
 
 def get_config_from_file(config_file: str) -> Dict[str, Any]:
@@ -173,17 +300,8 @@ def get_config_from_file(config_file: str) -> Dict[str, Any]:
             logger.error(f"Configuration file not found: {config_file}")
             return {}
             
-        # Directly load the file based on its extension
-        file_extension = os.path.splitext(config_file)[1].lower()
-        with open(config_file, 'r') as f:
-            if file_extension == '.json':
-                return json.load(f)
-            elif file_extension in ['.yaml', '.yml']:
-                import yaml
-                return yaml.safe_load(f)
-            else:
-                # Default to JSON
-                return json.load(f)
+        # Load the file based on its extension (JSON unless .yaml/.yml)
+        return load_document(config_file)
     except Exception as e:
         logger.error(f"Error loading configuration file: {e}")
         return {}
@@ -353,29 +471,9 @@ def prepare_config(args) -> Dict[str, Any]:
     if args.config_file:
         file_config = get_config_from_file(args.config_file)
         config = merge_configs(config, file_config)
-        
+
         # Ensure framework and language are properly formatted
-        if "framework" in config and isinstance(config["framework"], str):
-            framework_name = config["framework"]
-            framework_version = config.get("framework_version", "latest")
-            config["framework"] = {
-                "name": framework_name,
-                "version": framework_version
-            }
-            # Remove the separate version key if it exists
-            if "framework_version" in config:
-                del config["framework_version"]
-        
-        if "language" in config and isinstance(config["language"], str):
-            language_name = config["language"]
-            language_version = config.get("language_version", "latest")
-            config["language"] = {
-                "name": language_name,
-                "version": language_version
-            }
-            # Remove the separate version key if it exists
-            if "language_version" in config:
-                del config["language_version"]
+        normalize_project_config(config)
     
     # Interactive mode
     if args.interactive:
@@ -431,10 +529,19 @@ def prepare_config(args) -> Dict[str, Any]:
         cli_config["swagger_file"] = args.swagger_file
         if args.schema_mapping:
             cli_config["schema_mapping"] = args.schema_mapping
+    
+    if args.swagger_tags:
+        cli_config["swagger_tags"] = args.swagger_tags
+    
+    if args.swagger_operations:
+        cli_config["swagger_operations"] = args.swagger_operations
         
     if args.ddl_file:
         cli_config["ddl_file"] = args.ddl_file
     
+    if args.schema_snapshot:
+        cli_config["schema_snapshot"] = args.schema_snapshot
+    
     if args.output_dir:
         cli_config["output_dir"] = args.output_dir
     
@@ -474,7 +581,15 @@ def validate_config(config: Dict[str, Any]) -> List[str]:
         errors.append("Language is required")
     elif isinstance(language, dict) and not language.get("name"):
         errors.append("Language name is required")
-    
+
+    # Check that a generator exists for the framework and language
+    framework_name = framework.get("name") if isinstance(framework, dict) else framework
+    language_name = language.get("name") if isinstance(language, dict) else language
+    if framework_name and language_name:
+        from src.generators.registry import get_registry
+        if not get_registry().is_registered(framework_name, language_name):
+            errors.append(f"No generator available for {framework_name}/{language_name}")
+
     # Check build system (handle both object and string formats)
     build_system = config.get("build_system")
     if not build_system:
@@ -486,6 +601,8 @@ def validate_config(config: Dict[str, Any]) -> List[str]:
     swagger_file = config.get("swagger_file")
     if swagger_file and not os.path.exists(swagger_file):
         errors.append(f"Swagger file not found: {swagger_file}")
+    if not swagger_file and (config.get("swagger_tags") or config.get("swagger_operations")):
+        errors.append("Selecting Swagger tags or operations requires a Swagger file")
     
     # Validate schema mapping file path if specified
     schema_mapping = config.get("schema_mapping")
@@ -496,9 +613,112 @@ def validate_config(config: Dict[str, Any]) -> List[str]:
     ddl_file = config.get("ddl_file")
     if ddl_file and not os.path.exists(ddl_file):
         errors.append(f"DDL file not found: {ddl_file}")
+
+    # Validate the SQL dialect of the DDL file if specified
+    dialect = config.get("sql_dialect")
+    if dialect:
+        from src.generators.schema.sql_lexer import DIALECTS
+        if dialect not in DIALECTS:
+            errors.append(f"Unknown SQL dialect: {dialect} (expected one of {', '.join(DIALECTS)})")
+    
+    # Validate schema snapshot path if specified
+    schema_snapshot = config.get("schema_snapshot")
+    if isinstance(schema_snapshot, str) and not os.path.exists(schema_snapshot):
+        errors.append(f"Schema snapshot not found: {schema_snapshot}")
     
     return errors
 
+def write_report(report, args) -> None:
+    """Print and/or save the generation report as requested on the command line.
+    
+    Args:
+        report: GenerationReport of the generated project
+        args: Parsed command line arguments
+    """
+    if report is None:
+        return
+    
+    if args.profile:
+        print()
+        print(report.format_table())
+    
+    if args.profile_json:
+        with open(args.profile_json, "w") as f:
+            f.write(report.to_json())
+        print(f"\nGeneration report written to: {args.profile_json}")
+
+
+def run_batch(manifest_path: str, workers: Optional[int] = None, incremental: bool = True, jobs: int = 1,
+              render_backend: str = "process", schema_cache: bool = True) -> int:
+    """Generate every project listed in a batch manifest.
+
+    Args:
+        manifest_path: Path to the batch manifest file
+        workers: Number of worker processes to use
+        incremental: Whether to skip files whose inputs are unchanged since
+            the last generation of a project
+        jobs: Number of parallel workers used within each project
+        render_backend: "process" or "thread" pool used when jobs > 1
+        schema_cache: Whether to reuse parsed schemas from the schema cache
+
+    Returns:
+        int: Exit code (0 if all projects were generated, 1 otherwise)
+    """
+    from src.core.batch import BatchRunner, BatchResult, expand_manifest, load_manifest
+
+    projects = expand_manifest(load_manifest(manifest_path))
+
+    # Validate up front so invalid entries are reported without being generated.
+    # Results are kept by position so they never depend on the names being unique.
+    results: List[Optional[BatchResult]] = [None] * len(projects)
+    valid_indexes = []
+    for index, (name, project_config) in enumerate(projects):
+        errors = validate_config(project_config)
+        if errors:
+            results[index] = BatchResult(name, False, error="; ".join(errors))
+        else:
+            valid_indexes.append(index)
+
+    runner = BatchRunner(workers=workers, incremental=incremental, jobs=jobs,
+                         render_backend=render_backend, schema_cache=schema_cache)
+    for index, result in zip(valid_indexes, runner.run([projects[index] for index in valid_indexes])):
+        results[index] = result
+
+    failures = 0
+    print(f"\nBatch generation finished for {len(projects)} project(s):")
+    for (name, _), result in zip(projects, results):
+        if result.success:
+            print(f"  OK      {name} ({result.duration:.2f}s): {result.project_dir}")
+        else:
+            failures += 1
+            print(f"  FAILED  {name}: {result.error}")
+
+    return 1 if failures else 0
+
+def run_templates_command(args) -> int:
+    """Run a ``templates`` maintenance command.
+
+    Args:
+        args: Command line arguments
+
+    Returns:
+        int: Exit code
+    """
+    if args.templates_command == "compile":
+        from src.generators.base.templating import compile_templates, get_compiled_templates_dir
+
+        output_dir = args.output or get_compiled_templates_dir()
+        stats = compile_templates(output_dir)
+        print(f"Compiled {stats['compiled']} templates into {output_dir}")
+        if stats["failed"]:
+            print(f"Warning: {stats['failed']} templates could not be compiled and will be loaded from source")
+        if args.output:
+            print(f"Set MICROGENESIS_COMPILED_TEMPLATES={output_dir} to use them")
+        return 0
+
+    print("Usage: microgenesis templates compile [--output DIR]")
+    return 1
+
 def main():
     """Run the main application."""
     # Parse command line arguments
@@ -511,6 +731,15 @@ def main():
         return 0
     
     try:
+        if args.command == "templates":
+            return run_templates_command(args)
+
+        # Batch mode generates many projects from a manifest
+        if args.batch:
+            return run_batch(args.batch, workers=args.batch_workers, incremental=not args.no_incremental,
+                             jobs=args.jobs, render_backend=args.jobs_backend,
+                             schema_cache=not args.no_schema_cache)
+
         # Prepare configuration
         if args.interactive or args.config_file or any([
             args.project_name, args.base_package, args.framework, 
@@ -528,10 +757,29 @@ def main():
             # Initialize scaffolding engine
             engine = ScaffoldingEngine(output_dir=config.get("output_dir"))
             
+            if args.archive:
+                from src.generators.base.output import create_archive_sink
+                sink = create_archive_sink(args.archive, compresslevel=args.compression_level)
+                engine.generate_project(config, sink=sink, jobs=args.jobs, render_backend=args.jobs_backend,
+                                        schema_cache=not args.no_schema_cache,
+                                        save_schema_snapshot=args.save_schema_snapshot)
+                print(f"\nProject archive written to: {args.archive}")
+                write_report(engine.last_report, args)
+                return 0
+            
             # Generate project
-            project_dir = engine.generate_project(config)
+            project_dir = engine.generate_project(
+                config,
+                incremental=not args.no_incremental,
+                jobs=args.jobs,
+                render_backend=args.jobs_backend,
+                schema_cache=not args.no_schema_cache,
+                previous_ddl=args.previous_ddl,
+                save_schema_snapshot=args.save_schema_snapshot
+            )
             
             print(f"\nProject generated successfully at: {project_dir}")
+            write_report(engine.last_report, args)
             print("\nNext steps:")
             print(f"  1. Navigate to the project directory: cd {project_dir}")
             
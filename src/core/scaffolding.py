@@ -6,9 +6,64 @@ import shutil
 from typing import Dict, List, Any, Optional
 
 from src.core.logging import get_logger
+from src.generators.base.output import FileSystemSink
 
 logger = get_logger()
 
+# File recording the schema of the last generation, next to the generation manifest
+SCHEMA_STATE_FILE = "schema.json"
+
+
+def normalize_project_config(config: Dict[str, Any]) -> Dict[str, Any]:
+    """Convert flat framework/language settings into their nested form.
+
+    Configuration files may specify ``"framework": "spring-boot"`` together
+    with a separate ``framework_version`` key (and likewise for the language).
+    These are folded into ``{"name": ..., "version": ...}`` dictionaries.
+
+    Args:
+        config: Project configuration dictionary (modified in place)
+
+    Returns:
+        Dict[str, Any]: The normalized configuration dictionary
+    """
+    for key in ["framework", "language"]:
+        version_key = f"{key}_version"
+        if key in config and isinstance(config[key], str):
+            config[key] = {
+                "name": config[key],
+                "version": config.get(version_key, "latest")
+            }
+            # Remove the separate version key if it exists
+            if version_key in config:
+                del config[version_key]
+
+    return config
+
+
+def sql_dialect(config: Dict[str, Any]) -> str:
+    """Get the SQL dialect of the DDL of a project.
+
+    An explicit ``sql_dialect`` setting wins; otherwise the dialect follows
+    the database of the project (mysql, postgresql or h2).
+
+    Args:
+        config: Project configuration dictionary
+
+    Returns:
+        str: SQL dialect name ("generic" for other or no databases)
+    """
+    from src.generators.schema.sql_lexer import DIALECTS
+    
+    if config.get("sql_dialect"):
+        return config["sql_dialect"]
+    database = config.get("database")
+    if isinstance(database, dict):
+        database = database.get("name")
+    if isinstance(database, str) and database.lower() in DIALECTS:
+        return database.lower()
+    return "generic"
+
 
 class ScaffoldingEngine:
     """Core engine for generating application scaffolding."""
@@ -21,15 +76,38 @@ class ScaffoldingEngine:
         """
         self.output_dir = output_dir
         self.logger = get_logger()
+        # GenerationReport of the most recent generate_project() call
+        self.last_report = None
+        # SchemaDiff against the previous schema of the most recent generate_project() call
+        self.last_schema_diff = None
     
-    def generate_project(self, config: Dict[str, Any]) -> str:
+    def generate_project(self, config: Dict[str, Any], incremental: bool = True, sink=None,
+                         jobs: int = 1, render_backend: str = "process", schema_cache: bool = True,
+                         previous_ddl: Optional[str] = None, save_schema_snapshot: Optional[str] = None) -> str:
         """Generate a project based on the provided configuration.
         
         Args:
             config: Project configuration dictionary
+            incremental: Whether to skip files whose inputs are unchanged since
+                the last generation into the same directory
+            sink: Output sink for the generated files (defaults to the file
+                system; pass e.g. a ZipSink to write straight into an archive)
+            jobs: Number of parallel workers used to parse the DDL file and
+                render the project files
+            render_backend: "process" or "thread" pool used when jobs > 1
+            schema_cache: Whether to reuse parsed schemas from the persistent
+                schema cache instead of parsing an unchanged DDL or OpenAPI
+                file again
+            previous_ddl: DDL file the project was last generated from. Only
+                the files of tables that changed since then are regenerated.
+                Defaults to the cached parse of the last generation, if any.
+            save_schema_snapshot: Path to write a snapshot of the schema the
+                project is generated from to. Pass it as ``schema_snapshot``
+                in the configuration of later generations to skip parsing.
             
         Returns:
-            str: Path to the generated project
+            str: Path to the generated project (the generation report with
+                phase and template timings is kept in ``last_report``)
         """
         self.logger.info(f"Starting project generation with config: {config}")
         
@@ -76,64 +154,165 @@ class ScaffoldingEngine:
             self.output_dir = os.path.join(os.getcwd(), project_name)
         
         project_dir = os.path.join(self.output_dir, project_name)
-        os.makedirs(project_dir, exist_ok=True)
-        self.logger.info(f"Project will be generated at: {project_dir}")
+        if sink is None or isinstance(sink, FileSystemSink):
+            os.makedirs(project_dir, exist_ok=True)
+            self.logger.info(f"Project will be generated at: {project_dir}")
         
-        # Process DDL file if provided
+        # Process DDL file if provided (a schema snapshot replaces the DDL file and entities)
         entities = []
-        if "ddl_file" in config and config["ddl_file"]:
+        schema_diff = None
+        schema_key = None
+        dialect = "generic"
+        schema_snapshot = config.get("schema_snapshot")
+        if schema_snapshot:
+            if config.get("ddl_file"):
+                self.logger.info("Using the schema snapshot instead of parsing the DDL file")
+        elif "ddl_file" in config and config["ddl_file"]:
             try:
                 from src.generators.schema.ddl_parser import DDLParser
-                ddl_parser = DDLParser()
+                from src.generators.schema.schema_cache import SchemaCache
+                ddl_parser = DDLParser(sql_dialect(config), jobs=jobs,
+                                       cache=SchemaCache() if schema_cache else None)
                 ddl_file = config["ddl_file"]
                 self.logger.info(f"Parsing DDL file: {ddl_file}")
                 entities = ddl_parser.parse_ddl_file(ddl_file)
                 config["entities"] = entities
+                dialect = ddl_parser.dialect
                 self.logger.info(f"Found {len(entities)} entities in DDL file")
+                
+                if ddl_parser.cache is not None and ddl_parser.cache.enabled:
+                    from src.generators.schema.schema_cache import hash_file
+                    schema_key = ddl_parser.cache.make_key(hash_file(ddl_file), ddl_parser.dialect)
+                if incremental and (sink is None or isinstance(sink, FileSystemSink)):
+                    schema_diff = self._diff_schema(project_dir, ddl_parser, entities, previous_ddl)
             except Exception as e:
                 self.logger.error(f"Error parsing DDL file: {e}")
+        self.last_schema_diff = schema_diff
+        
+        # Generate code based on framework and language, with a generator reused across projects
+        openapi_cache = None
+        if schema_cache and config.get("swagger_file"):
+            from src.core.cache import get_cache_dir
+            from src.generators.schema.schema_cache import SchemaCache
+            openapi_cache = SchemaCache(get_cache_dir("openapi"))
+        
+        from src.generators.registry import get_registry
+        with get_registry().lease(framework, language) as generator:
+            # The generator may have been used by an earlier project with other settings
+            generator.openapi_parser.cache = openapi_cache
+            
+            # Normalize the entities once into the typed schema shared by all generation phases
+            if schema_snapshot:
+                schema, dialect = self._load_schema_snapshot(schema_snapshot, generator.language,
+                                                             with_dialect=bool(save_schema_snapshot))
+            else:
+                from src.generators.schema.ir import schema_from_config
+                schema = schema_from_config(config, generator.language, dialect)
+            
+            if save_schema_snapshot:
+                from src.generators.schema.snapshot import save_snapshot
+                save_snapshot(schema, save_schema_snapshot, dialect)
+            
+            plan = generator.generate(project_dir, config, sink=sink, incremental=incremental,
+                                      jobs=jobs, render_backend=render_backend, schema_diff=schema_diff,
+                                      schema=schema)
+            self.last_report = plan.report
         
-        # Generate code based on framework and language
-        generator = self._get_generator(framework, language)
-        generator.generate(project_dir, config)
+        if schema_key is not None and (sink is None or isinstance(sink, FileSystemSink)):
+            self._save_schema_state(project_dir, schema_key)
         
         # Return the path to the generated project
         return project_dir
         
-    def _get_generator(self, framework: str, language: str):
-        """Get the appropriate generator for the framework and language.
+    def _diff_schema(self, project_dir: str, ddl_parser, entities: List[Dict[str, Any]],
+                     previous_ddl: Optional[str] = None):
+        """Compare the parsed schema with the one the project was last generated from.
         
         Args:
-            framework: Name of the framework (spring-boot, micronaut, etc.)
-            language: Name of the language (java, kotlin, etc.)
+            project_dir: Root directory of the generated project
+            ddl_parser: DDLParser used for the current schema
+            entities: Tables of the current schema
+            previous_ddl: DDL file of the previous schema (defaults to the
+                cached parse recorded by the last generation)
             
         Returns:
-            Generator implementation for the specified framework and language
+            Optional[SchemaDiff]: Diff from the previous schema, or None if the
+                previous schema is unknown
         """
-        # Import generator implementations based on framework and language
-        if framework == "spring-boot":
-            if language == "java":
-                from src.generators.spring_boot.java import SpringBootJavaGenerator
-                return SpringBootJavaGenerator()
-            elif language == "kotlin":
-                from src.generators.spring_boot.kotlin import SpringBootKotlinGenerator
-                return SpringBootKotlinGenerator()
-        elif framework == "micronaut":
-            if language == "java":
-                from src.generators.micronaut.java import MicronautJavaGenerator
-                return MicronautJavaGenerator()
-            elif language == "kotlin":
-                from src.generators.micronaut.kotlin import MicronautKotlinGenerator
-                return MicronautKotlinGenerator()
-        elif framework == "graphql":
-            if language == "java":
-                from src.generators.graphql.java import GraphQLJavaGenerator
-                return GraphQLJavaGenerator()
-            elif language == "kotlin":
-                from src.generators.graphql.kotlin import GraphQLKotlinGenerator
-                return GraphQLKotlinGenerator()
-        
-        # Default fallback
-        from src.generators.base import BaseGenerator
-        self.logger.warning(f"No specific generator found for {framework}/{language}. Using base generator.")
-        return BaseGenerator()
+        from src.generators.schema.schema_diff import diff_schemas
+        
+        previous = None
+        if previous_ddl:
+            previous = ddl_parser.parse_ddl_file(previous_ddl)
+        elif ddl_parser.cache is not None:
+            state = self._load_schema_state(project_dir)
+            if state.get("cache_key"):
+                previous = ddl_parser.cache.get(state["cache_key"])
+        
+        if previous is None:
+            return None
+        
+        schema_diff = diff_schemas(previous, entities)
+        self.logger.info(f"Schema changes since the last generation: {schema_diff.format_summary()}")
+        if schema_diff.removed:
+            self.logger.info(f"Files of removed tables are left in place: {', '.join(schema_diff.removed)}")
+        return schema_diff
+    
+    def _load_schema_snapshot(self, snapshot, language: str, with_dialect: bool = False):
+        """Load the schema of a project from a snapshot.
+        
+        Args:
+            snapshot: Snapshot file path or snapshot contents
+            language: Target language of the generator
+            with_dialect: Whether to read the SQL dialect recorded in the snapshot
+            
+        Returns:
+            Tuple[Schema, str]: The schema and the SQL dialect of its column
+                types ("generic" unless ``with_dialect`` is set)
+            
+        Raises:
+            SnapshotError: If the snapshot is invalid
+        """
+        from src.generators.schema.snapshot import loads_snapshot, snapshot_info
+        
+        if isinstance(snapshot, str):
+            self.logger.info(f"Loading schema snapshot: {snapshot}")
+            with open(snapshot, "rb") as f:
+                snapshot = f.read()
+        schema = loads_snapshot(snapshot, language)
+        self.logger.info(f"Loaded {len(schema.entities)} entities from the schema snapshot")
+        dialect = snapshot_info(snapshot).get("dialect", "generic") if with_dialect else "generic"
+        return schema, dialect
+    
+    def _load_schema_state(self, project_dir: str) -> Dict[str, Any]:
+        """Read the schema state recorded by the last generation of a project.
+        
+        Args:
+            project_dir: Root directory of the generated project
+            
+        Returns:
+            Dict[str, Any]: Recorded state (empty if missing or unreadable)
+        """
+        from src.generators.base.manifest import MANIFEST_DIR
+        
+        try:
+            with open(os.path.join(project_dir, MANIFEST_DIR, SCHEMA_STATE_FILE), "r") as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {}
+    
+    def _save_schema_state(self, project_dir: str, cache_key: str) -> None:
+        """Record the schema a project was generated from.
+        
+        Args:
+            project_dir: Root directory of the generated project
+            cache_key: Schema cache key of the parsed DDL file
+        """
+        from src.generators.base.manifest import MANIFEST_DIR
+        
+        try:
+            os.makedirs(os.path.join(project_dir, MANIFEST_DIR), exist_ok=True)
+            with open(os.path.join(project_dir, MANIFEST_DIR, SCHEMA_STATE_FILE), "w") as f:
+                json.dump({"cache_key": cache_key}, f)
+        except OSError as e:
+            self.logger.warning(f"Could not record the schema of {project_dir}: {e}")
@@ -1,15 +1,22 @@
 """Base generator module for application scaffolding."""
 
 import os
-import shutil
-import json
-import yaml
+import time
 from abc import ABC, abstractmethod
-from typing import Dict, List, Any, Optional
-import jinja2
-import re
+from contextlib import contextmanager
+from typing import Dict, Iterable, Iterator, List, Any, Optional, Set, Tuple
 
 from src.core.logging import get_logger
+from src.generators.base.manifest import GenerationManifest
+from src.generators.base.output import OutputSink, FileSystemSink
+from src.generators.base.render_plan import RenderPlan
+from src.generators.base.report import GenerationReport
+from src.generators.base.templating import (
+    get_environment, match_test, to_camel_case, to_kebab_case, to_pascal_case, to_snake_case
+)
+from src.generators.schema.openapi_parser import OpenAPIParser, Selection, select_operations
+from src.generators.schema.ir import Entity, Schema, entity_name, schema_from_api_info, schema_from_config
+from src.generators.schema.schema_diff import SchemaDiff
 
 logger = get_logger()
 
@@ -17,59 +24,324 @@ logger = get_logger()
 class BaseGenerator(ABC):
     """Base class for all generators."""
     
+    # Target language of the types in the schema handed to the generator
+    language = "java"
+    
     def __init__(self):
         """Initialize the base generator."""
         self.logger = get_logger()
-        # Set up Jinja2 template environment
-        templates_dir = os.path.join(
-            os.path.dirname(__file__), 
-            "..", 
-            "..",
-            "templates"
-        )
-        self.template_env = jinja2.Environment(
-            loader=jinja2.FileSystemLoader(templates_dir),
-            trim_blocks=True,
-            lstrip_blocks=True
-        )
-        
-        # Add utility functions to templates
-        self.template_env.filters['camelcase'] = self._to_camel_case
-        self.template_env.filters['pascalcase'] = self._to_pascal_case
-        self.template_env.filters['snakecase'] = self._to_snake_case
-        self.template_env.filters['kebabcase'] = self._to_kebab_case
-        
-        # Add custom tests
-        self.template_env.tests['match'] = self._match_test
-        
-    def generate(self, project_dir: str, config: Dict[str, Any]) -> None:
+        # Templates are compiled once per process through the shared environment
+        self.template_env = get_environment()
+        
+        # Render plan being built by the current generate() call, if any
+        self._plan = None
+        # Report collecting timings of the current generate() call, if any
+        self._report = None
+        # Entities whose files are kept from the previous generation
+        self._retained_entities: Set[str] = set()
+        # Entity whose files are being added to the plan, if any
+        self._current_entity = None
+        # Schema of the plan being built, if any
+        self.schema: Optional[Schema] = None
+        # Schemas of the OpenAPI definitions used by the plan being built
+        self._api_schemas: Dict[str, Schema] = {}
+        # Parser of OpenAPI definitions, remembering the files parsed by the current generation
+        self.openapi_parser = OpenAPIParser()
+        # Operations of the OpenAPI definitions used by the plan being built (None for all)
+        self._api_selection: Selection = None
+        
+    def generate(self, project_dir: str, config: Dict[str, Any], sink: Optional[OutputSink] = None,
+                 incremental: bool = True, jobs: int = 1, render_backend: str = "process",
+                 schema_diff: Optional[SchemaDiff] = None, schema: Optional[Schema] = None) -> RenderPlan:
         """Generate a project based on the provided configuration.
         
+        Generation runs in two phases: every output file is first collected
+        into a render plan and rendered in memory, and only then is the plan
+        handed to the output sink.
+        
+        When writing to the file system, a manifest of the inputs of every
+        file is kept in the project so that regenerating into the same
+        directory only renders files whose template or context changed.
+        
+        With a schema diff, the per-entity files of tables the diff reports
+        as unchanged aren't even planned: their manifest entries are carried
+        over as long as the settings and templates are the same as last time.
+        
         Args:
             project_dir: Target directory for the generated project
             config: Project configuration dictionary
+            sink: Destination for generated files (defaults to the file system)
+            incremental: Whether to skip files whose inputs are unchanged
+            jobs: Number of parallel workers used to render the plan
+            render_backend: "process" or "thread" pool used when jobs > 1
+            schema_diff: SchemaDiff between the previous and the current entities
+            schema: Schema of the project (built from the entities of the
+                configuration if not given)
+            
+        Returns:
+            RenderPlan: The rendered plan that was written, with its write
+                statistics and generation report
         """
         self.logger.info(f"Starting generation in {project_dir}")
         
+        start = time.perf_counter()
+        report = GenerationReport(project_dir, generator=type(self).__name__)
+        sink = sink or FileSystemSink()
+        self._report = report
+        try:
+            # Incremental generation only applies when the previous output is on disk
+            manifest = None
+            if isinstance(sink, FileSystemSink):
+                with self._phase("manifest"):
+                    manifest = GenerationManifest.load(project_dir) if incremental else GenerationManifest(project_dir)
+                    manifest.settings_hash = GenerationManifest.hash_settings(config)
+                    if schema_diff is not None and incremental:
+                        # The diff names tables, generated files are tagged with entity names
+                        unchanged = set(schema_diff.unchanged)
+                        self._retained_entities = manifest.retainable_entities(
+                            {entity_name(e) for e in config.get("entities") or ()
+                             if not isinstance(e, Entity) and e.get("name") in unchanged},
+                            self.template_env
+                        )
+            
+            plan = self.build_plan(project_dir, config, schema)
+            
+            retained = 0
+            if manifest is not None:
+                with self._phase("manifest"):
+                    fingerprints = manifest.select_changed(plan, self.template_env)
+                    retained = manifest.retain_entities(self._retained_entities)
+                if retained:
+                    self.logger.info(f"Keeping the files of {len(self._retained_entities)} unchanged entities")
+                if plan.skipped:
+                    self.logger.info(f"Skipping {len(plan.skipped)} unchanged files")
+            
+            with self._phase("render"):
+                self.render_plan(plan, jobs=jobs, backend=render_backend)
+            
+            with self._phase("write"):
+                if manifest is not None:
+                    for task in list(plan):
+                        manifest.record(task.path, fingerprints[task.path], task.content, task.entity)
+                    plan.add_content(GenerationManifest.manifest_path(project_dir), manifest.to_json())
+                
+                plan.write_stats = sink.write_plan(plan)
+                plan.write_stats.unchanged += len(plan.skipped) + retained
+        finally:
+            sink.close()
+            self._report = None
+            self._retained_entities = set()
+        
+        report.total_seconds = time.perf_counter() - start
+        report.add_plan(plan)
+        plan.report = report
+        
+        self.logger.info(f"Project generation completed in {project_dir} ({plan.write_stats})")
+        return plan
+    
+    def build_plan(self, project_dir: str, config: Dict[str, Any], schema: Optional[Schema] = None) -> RenderPlan:
+        """Collect every directory and file of a project without touching disk.
+        
+        Args:
+            project_dir: Target directory for the generated project
+            config: Project configuration dictionary
+            schema: Schema of the project (built from the entities of the
+                configuration if not given)
+            
+        Returns:
+            RenderPlan: Plan describing the project (not yet rendered)
+        """
+        plan = RenderPlan(project_dir)
+        self._plan = plan
+        self.schema = schema if schema is not None else schema_from_config(config, self.language)
+        self._api_selection = select_operations(config.get("swagger_tags"), config.get("swagger_operations"))
+        try:
+            self._run_generation_phases(project_dir, config)
+        finally:
+            self._plan = None
+            self.schema = None
+            self._api_schemas = {}
+            self._api_selection = None
+            self.openapi_parser.clear()
+        return plan
+    
+    def render_plan(self, plan: RenderPlan, jobs: int = 1, backend: str = "process") -> None:
+        """Render every task of a plan in memory.
+        
+        Args:
+            plan: Plan to render
+            jobs: Number of parallel render workers
+            backend: "process" or "thread" pool used when jobs > 1
+        """
+        plan.render(self.template_env, jobs=jobs, backend=backend)
+    
+    def _run_generation_phases(self, project_dir: str, config: Dict[str, Any]) -> None:
+        """Run the generation phases that populate the current render plan.
+        
+        Args:
+            project_dir: Target directory for the generated project
+            config: Project configuration dictionary
+        """
         # Basic project setup
-        self._create_project_structure(project_dir, config)
+        with self._phase("structure"):
+            self._create_project_structure(project_dir, config)
         
         # Generate build configuration
-        self._generate_build_config(project_dir, config)
+        with self._phase("build_config"):
+            self._generate_build_config(project_dir, config)
         
         # Generate source code
-        self._generate_source_code(project_dir, config)
+        with self._phase("source"):
+            self._generate_source_code(project_dir, config)
         
         # Generate tests
-        self._generate_tests(project_dir, config)
+        with self._phase("tests"):
+            self._generate_tests(project_dir, config)
         
         # Generate CI/CD pipeline configs
-        self._generate_pipeline_config(project_dir, config)
+        with self._phase("pipeline"):
+            self._generate_pipeline_config(project_dir, config)
         
         # Generate documentation
-        self._generate_documentation(project_dir, config)
+        with self._phase("documentation"):
+            self._generate_documentation(project_dir, config)
+    
+    @contextmanager
+    def _phase(self, name: str):
+        """Time a generation phase into the current report.
+        
+        Args:
+            name: Phase name
+        """
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            if self._report is not None:
+                self._report.add_phase(name, time.perf_counter() - start)
+    
+    def _get_entities(self, config: Dict[str, Any]) -> Tuple[Entity, ...]:
+        """Get the entities of the project.
+        
+        Args:
+            config: Project configuration dictionary
+            
+        Returns:
+            Tuple[Entity, ...]: Entities of the schema of the plan being built
+                (outside of build_plan(), of the configuration)
+        """
+        schema = self.schema if self.schema is not None else schema_from_config(config, self.language)
+        return schema.entities
+    
+    def _get_api_schema(self, swagger_path: str) -> Optional[Schema]:
+        """Get the schema of an OpenAPI definition.
+        
+        The definition is parsed once per plan, however many phases use it.
+        
+        Args:
+            swagger_path: Path to the Swagger/OpenAPI definition file
+            
+        Returns:
+            Optional[Schema]: Models and endpoints of the API, or None if the
+                definition could not be parsed
+        """
+        schema = self._api_schemas.get(swagger_path)
+        if schema is None:
+            api_info = self.parse_swagger_file(swagger_path)
+            if not api_info:
+                return None
+            schema = schema_from_api_info(api_info, self.language)
+            if self._plan is not None:
+                self._api_schemas[swagger_path] = schema
+        return schema
+    
+    def _repository_finders(self, entity: Entity) -> List[Dict[str, Any]]:
+        """Get the finder methods a repository derives from the indexes of an entity.
+        
+        Args:
+            entity: Entity of the repository
+            
+        Returns:
+            List[Dict[str, Any]]: Name, index name, uniqueness and parameters
+                (field name and type) of each finder, one per index
+        """
+        finders = []
+        for index in entity.indexes:
+            fields = [entity.field(name) for name in index.fields]
+            if not index.finder or not fields or None in fields:
+                continue
+            finders.append({
+                "name": index.finder,
+                "index": index.name,
+                "unique": index.unique,
+                "parameters": [{"name": field.name, "type": field.type} for field in fields],
+            })
+        return finders
+    
+    def _iter_entities(self, entities: Iterable[Any]) -> Iterator[Any]:
+        """Iterate over the entities whose files must be generated.
+        
+        Files added to the plan while an entity is being processed are tagged
+        with its name. Entities kept from the previous generation (see
+        generate()) are left out.
         
-        self.logger.info(f"Project generation completed in {project_dir}")
+        Args:
+            entities: Entities (or entity definitions)
+            
+        Yields:
+            Entities to generate files for
+        """
+        for entity in entities:
+            name = entity.name if isinstance(entity, Entity) else entity.get("name")
+            if name in self._retained_entities:
+                continue
+            self._current_entity = name
+            try:
+                yield entity
+            finally:
+                self._current_entity = None
+    
+    def _emit(self, path: str, template_name: str, context: Dict[str, Any]) -> None:
+        """Add a templated file to the current render plan.
+        
+        Outside of generate() the file is rendered and written immediately.
+        
+        Args:
+            path: Target path of the generated file
+            template_name: Name of the template file
+            context: Context data for template rendering
+        """
+        if self._plan is not None:
+            self._plan.add_template(path, template_name, context, entity=self._current_entity)
+        else:
+            FileSystemSink().write_file(path, self.render_template(template_name, context))
+    
+    def _write_file(self, path: str, content: str) -> None:
+        """Add a file with ready-made content to the current render plan.
+        
+        Outside of generate() the file is written immediately.
+        
+        Args:
+            path: Target path of the generated file
+            content: File content
+        """
+        if self._plan is not None:
+            self._plan.add_content(path, content, entity=self._current_entity)
+        else:
+            FileSystemSink().write_file(path, content)
+    
+    def _ensure_dir(self, path: str) -> None:
+        """Add a directory to the current render plan.
+        
+        Outside of generate() the directory is created immediately.
+        
+        Args:
+            path: Directory path
+        """
+        if self._plan is not None:
+            self._plan.add_directory(path)
+        else:
+            os.makedirs(path, exist_ok=True)
     
     def _create_project_structure(self, project_dir: str, config: Dict[str, Any]) -> None:
         """Create the basic project structure.
@@ -78,38 +350,38 @@ class BaseGenerator(ABC):
             project_dir: Target directory for the generated project
             config: Project configuration dictionary
         """
-        os.makedirs(project_dir, exist_ok=True)
+        self._ensure_dir(project_dir)
         
         # Create standard directories
         src_dir = os.path.join(project_dir, "src")
-        os.makedirs(src_dir, exist_ok=True)
+        self._ensure_dir(src_dir)
         
         main_dir = os.path.join(src_dir, "main")
-        os.makedirs(main_dir, exist_ok=True)
+        self._ensure_dir(main_dir)
         
         test_dir = os.path.join(src_dir, "test")
-        os.makedirs(test_dir, exist_ok=True)
+        self._ensure_dir(test_dir)
         
         # Create language-specific directories
         language = config.get("language", {}).get("name", "java")
         base_package_path = config.get("base_package", "com.example").replace(".", os.path.sep)
         
         main_code_dir = os.path.join(main_dir, language, base_package_path)
-        os.makedirs(main_code_dir, exist_ok=True)
+        self._ensure_dir(main_code_dir)
         
         test_code_dir = os.path.join(test_dir, language, base_package_path)
-        os.makedirs(test_code_dir, exist_ok=True)
+        self._ensure_dir(test_code_dir)
         
         # Create resource directories
         main_resources = os.path.join(main_dir, "resources")
-        os.makedirs(main_resources, exist_ok=True)
+        self._ensure_dir(main_resources)
         
         test_resources = os.path.join(test_dir, "resources")
-        os.makedirs(test_resources, exist_ok=True)
+        self._ensure_dir(test_resources)
         
         # Create docs directory
         docs_dir = os.path.join(project_dir, "docs")
-        os.makedirs(docs_dir, exist_ok=True)
+        self._ensure_dir(docs_dir)
     
     @abstractmethod
     def _generate_build_config(self, project_dir: str, config: Dict[str, Any]) -> None:
@@ -167,17 +439,13 @@ class BaseGenerator(ABC):
             config: Project configuration dictionary
         """
         github_dir = os.path.join(project_dir, ".github", "workflows")
-        os.makedirs(github_dir, exist_ok=True)
+        self._ensure_dir(github_dir)
         
         build_system = config.get("build_system", {}).get("name", "maven")
         language = config.get("language", {}).get("name", "java")
         
         # Generate CI workflow
-        template = self.template_env.get_template(f"github-actions-{build_system}-{language}.yml.j2")
-        ci_content = template.render(config=config)
-        
-        with open(os.path.join(github_dir, "ci.yml"), "w") as f:
-            f.write(ci_content)
+        self._emit(os.path.join(github_dir, "ci.yml"), f"github-actions-{build_system}-{language}.yml.j2", {"config": config})
     
     def _generate_jenkins(self, project_dir: str, config: Dict[str, Any]) -> None:
         """Generate Jenkinsfile.
@@ -187,11 +455,7 @@ class BaseGenerator(ABC):
             config: Project configuration dictionary
         """
         build_system = config.get("build_system", {}).get("name", "maven")
-        template = self.template_env.get_template(f"Jenkinsfile-{build_system}.j2")
-        jenkinsfile_content = template.render(config=config)
-        
-        with open(os.path.join(project_dir, "Jenkinsfile"), "w") as f:
-            f.write(jenkinsfile_content)
+        self._emit(os.path.join(project_dir, "Jenkinsfile"), f"Jenkinsfile-{build_system}.j2", {"config": config})
     
     def _generate_azure_devops(self, project_dir: str, config: Dict[str, Any]) -> None:
         """Generate Azure DevOps pipeline YAML.
@@ -201,11 +465,7 @@ class BaseGenerator(ABC):
             config: Project configuration dictionary
         """
         build_system = config.get("build_system", {}).get("name", "maven")
-        template = self.template_env.get_template(f"azure-pipelines-{build_system}.yml.j2")
-        pipeline_content = template.render(config=config)
-        
-        with open(os.path.join(project_dir, "azure-pipelines.yml"), "w") as f:
-            f.write(pipeline_content)
+        self._emit(os.path.join(project_dir, "azure-pipelines.yml"), f"azure-pipelines-{build_system}.yml.j2", {"config": config})
     
     def _generate_gitlab_ci(self, project_dir: str, config: Dict[str, Any]) -> None:
         """Generate GitLab CI YAML.
@@ -215,11 +475,7 @@ class BaseGenerator(ABC):
             config: Project configuration dictionary
         """
         build_system = config.get("build_system", {}).get("name", "maven")
-        template = self.template_env.get_template(f"gitlab-ci-{build_system}.yml.j2")
-        ci_content = template.render(config=config)
-        
-        with open(os.path.join(project_dir, ".gitlab-ci.yml"), "w") as f:
-            f.write(ci_content)
+        self._emit(os.path.join(project_dir, ".gitlab-ci.yml"), f"gitlab-ci-{build_system}.yml.j2", {"config": config})
     def _generate_documentation(self, project_dir: str, config: Dict[str, Any]) -> None:
         """Generate project documentation.
         
@@ -228,20 +484,12 @@ class BaseGenerator(ABC):
             config: Project configuration dictionary
         """
         docs_dir = os.path.join(project_dir, "docs")
-        os.makedirs(docs_dir, exist_ok=True)
+        self._ensure_dir(docs_dir)
           # Generate README
-        template = self.template_env.get_template("common/docs/README.md.j2")
-        readme_content = template.render(**config)
-        
-        with open(os.path.join(project_dir, "README.md"), "w") as f:
-            f.write(readme_content)
+        self._emit(os.path.join(project_dir, "README.md"), "common/docs/README.md.j2", config)
         
         # Generate Getting Started guide
-        template = self.template_env.get_template("common/docs/GETTING-STARTED.md.j2")
-        getting_started_content = template.render(**config)
-        
-        with open(os.path.join(docs_dir, "GETTING-STARTED.md"), "w") as f:
-            f.write(getting_started_content)
+        self._emit(os.path.join(docs_dir, "GETTING-STARTED.md"), "common/docs/GETTING-STARTED.md.j2", config)
     def render_template(self, template_name: str, context: Dict[str, Any]) -> str:
         """Render a template with the given context.
         
@@ -273,80 +521,72 @@ class BaseGenerator(ABC):
     def parse_swagger_file(self, swagger_path: str) -> Dict[str, Any]:
         """Parse an OpenAPI/Swagger file and extract API information.
         
+        The file is parsed once per generation (see OpenAPIParser) and the
+        result is shared, so it must not be modified. While a plan is built,
+        only the operations selected by the ``swagger_tags`` and
+        ``swagger_operations`` settings are parsed.
+        
         Args:
             swagger_path: Path to the Swagger/OpenAPI definition file
             
         Returns:
-            Dict[str, Any]: Parsed API information
+            Dict[str, Any]: Parsed API information (see parse_openapi), or an
+                empty dictionary if the file is missing or invalid
         """
         if not os.path.exists(swagger_path):
             self.logger.error(f"Swagger file not found: {swagger_path}")
             return {}
         
         try:
-            with open(swagger_path, 'r') as f:
-                
-                # Determine the file type and parse accordingly
-                file_extension = os.path.splitext(swagger_path)[1].lower()
-                if file_extension in ['.yaml', '.yml']:
-                    swagger_data = yaml.safe_load(f)
-                else:
-                    swagger_data = json.load(f)
-                
-                
-            api_info = {
-                'info': swagger_data.get('info', {}),
-                'endpoints': [],
-                'models': {},
-            }
+            return self.openapi_parser.parse_file(swagger_path, self._api_selection)
+        except (OSError, ValueError) as e:
+            self.logger.error(f"Error parsing Swagger file: {e}")
+            return {}
+    
+    def _to_pascal_case(self, text: str) -> str:
+        """Convert string to PascalCase.
+        
+        Args:
+            text: Text to convert
             
-            # Extract endpoints
-            paths = swagger_data.get('paths', {})
-            for path, methods in paths.items():
-                for method, details in methods.items():
-                    if method in ['get', 'post', 'put', 'delete', 'patch']:
-                        endpoint_info = {
-                            'path': path,
-                            'method': method,
-                            'operation_id': details.get('operationId', ''),
-                            'summary': details.get('summary', ''),
-                            'description': details.get('description', ''),
-                            'tags': details.get('tags', []),
-                            'parameters': details.get('parameters', []),
-                            'request_body': details.get('requestBody', {}),
-                            'responses': details.get('responses', {})
-                        }
-                        api_info['endpoints'].append(endpoint_info)
+        Returns:
+            str: PascalCase text
+        """
+        return to_pascal_case(text)
+    
+    def _to_camel_case(self, text: str, capitalize_first: bool = False) -> str:
+        """Convert string to camelCase or PascalCase.
+        
+        Args:
+            text: Text to convert
+            capitalize_first: Whether to capitalize the first letter (PascalCase) or not (camelCase)
             
-            # Extract models
-            schemas = swagger_data.get('components', {}).get('schemas', {})
-            for schema_name, schema in schemas.items():
-                properties = schema.get('properties', {})
-                required = schema.get('required', [])
-                
-                model_info = {
-                    'name': schema_name,
-                    'properties': [],
-                    'type': 'entity' if 'Entity' in schema_name else 'dto'
-                }
-                
-                for prop_name, prop_details in properties.items():
-                    property_info = {
-                        'name': prop_name,
-                        'type': prop_details.get('type', 'string'),
-                        'format': prop_details.get('format', ''),
-                        'description': prop_details.get('description', ''),
-                        'required': prop_name in required
-                    }
-                    model_info['properties'].append(property_info)
-                
-                api_info['models'][schema_name] = model_info
+        Returns:
+            str: camelCase or PascalCase text
+        """
+        return to_camel_case(text, capitalize_first)
+    
+    def _to_snake_case(self, text: str) -> str:
+        """Convert string to snake_case.
+        
+        Args:
+            text: Text to convert
             
-            return api_info
+        Returns:
+            str: snake_case text
+        """
+        return to_snake_case(text)
+    
+    def _to_kebab_case(self, text: str) -> str:
+        """Convert string to kebab-case.
+        
+        Args:
+            text: Text to convert
             
-        except Exception as e:
-            self.logger.error(f"Error parsing Swagger file: {e}")
-            return {}
+        Returns:
+            str: kebab-case text
+        """
+        return to_kebab_case(text)
     
     def _match_test(self, value: str, pattern: str) -> bool:
         """Custom test to match a value against a regex pattern.
@@ -358,11 +598,4 @@ class BaseGenerator(ABC):
         Returns:
             bool: True if the value matches the pattern, False otherwise
         """
-        if not isinstance(value, str) or not isinstance(pattern, str):
-            return False
-        
-        try:
-            regex = re.compile(pattern)
-            return bool(regex.match(value))
-        except re.error:
-            return False
+        return match_test(value, pattern)
@@ -0,0 +1,336 @@
+"""Generation manifest for incremental regeneration.
+
+Every generated project records, per output file, which template produced it
+and fingerprints of the template source and the rendering context. When the
+project is regenerated into the same directory, files whose fingerprints are
+unchanged (and which still exist on disk) are neither rendered nor written.
+"""
+
+import hashlib
+import json
+import os
+from typing import Dict, Any, List, Optional, Set
+
+from src import __version__
+from src.core.logging import get_logger
+from src.generators.base.render_plan import RenderPlan, RenderTask
+from src.generators.base.templating import get_template_hash
+from src.generators.schema.ir import Node
+
+# Location of the manifest inside a generated project
+MANIFEST_DIR = ".microgenesis"
+MANIFEST_FILE = "manifest.json"
+
+# Bump when the manifest layout or fingerprint algorithm changes
+MANIFEST_FORMAT = 1
+
+# Configuration keys describing the schema rather than the project settings
+SCHEMA_CONFIG_KEYS = {"entities", "schema_snapshot"}
+
+
+class ContextHasher:
+    """Compute canonical hashes of rendering contexts.
+
+    Contexts of one project share large sub-structures (the whole project
+    configuration, entity lists, ...). Hashes of dictionaries and lists are
+    memoized by object identity so each shared structure is hashed only once
+    per plan. A hasher must not outlive the objects it has hashed.
+    """
+
+    def __init__(self):
+        """Initialize the context hasher."""
+        self._memo: Dict[int, str] = {}
+        # Keep hashed containers alive so their ids cannot be reused
+        self._keep_alive: List[Any] = []
+
+    def hash(self, value: Any) -> str:
+        """Get the canonical hash of a value.
+
+        Args:
+            value: Value to hash (dictionaries are hashed independent of key order,
+                schema IR records by their attributes)
+
+        Returns:
+            str: Hex digest of the value
+        """
+        if isinstance(value, (dict, list, tuple, Node)):
+            key = id(value)
+            cached = self._memo.get(key)
+            if cached is not None:
+                return cached
+
+            if isinstance(value, dict):
+                items = sorted((str(k), self.hash(v)) for k, v in value.items())
+                digest = self._digest("d", json.dumps(items))
+            elif isinstance(value, Node):
+                items = [type(value).__name__] + [self.hash(getattr(value, name)) for name in value._fields]
+                digest = self._digest("n", json.dumps(items))
+            else:
+                digest = self._digest("l", json.dumps([self.hash(v) for v in value]))
+
+            self._memo[key] = digest
+            self._keep_alive.append(value)
+            return digest
+
+        try:
+            encoded = json.dumps(value)
+        except (TypeError, ValueError):
+            encoded = repr(value)
+        return self._digest("v", encoded)
+
+    @staticmethod
+    def _digest(kind: str, data: str) -> str:
+        return hashlib.sha256(f"{kind}:{data}".encode("utf-8")).hexdigest()
+
+
+class GenerationManifest:
+    """Record of the inputs that produced each file of a generated project."""
+
+    def __init__(self, project_dir: str, previous: Optional[Dict[str, Dict[str, Any]]] = None,
+                 previous_settings_hash: Optional[str] = None):
+        """Initialize the generation manifest.
+
+        Args:
+            project_dir: Root directory of the generated project
+            previous: Entries of the previous generation keyed by project-relative path
+            previous_settings_hash: Settings hash of the previous generation
+        """
+        self.project_dir = project_dir
+        self.previous = previous or {}
+        self.previous_settings_hash = previous_settings_hash
+        # Entries of the current generation
+        self.entries: Dict[str, Dict[str, Any]] = {}
+        # Hash of the project settings of the current generation (see hash_settings)
+        self.settings_hash: Optional[str] = None
+        self.logger = get_logger()
+
+    @staticmethod
+    def hash_settings(config: Dict[str, Any]) -> str:
+        """Hash the project configuration apart from the schema.
+
+        Args:
+            config: Project configuration dictionary
+
+        Returns:
+            str: Hex digest of every setting except the entities
+        """
+        settings = {key: value for key, value in config.items() if key not in SCHEMA_CONFIG_KEYS}
+        return ContextHasher().hash(settings)
+
+    @staticmethod
+    def manifest_path(project_dir: str) -> str:
+        """Get the path of the manifest file of a project.
+
+        Args:
+            project_dir: Root directory of the generated project
+
+        Returns:
+            str: Path to the manifest file
+        """
+        return os.path.join(project_dir, MANIFEST_DIR, MANIFEST_FILE)
+
+    @classmethod
+    def load(cls, project_dir: str) -> "GenerationManifest":
+        """Load the manifest of a previously generated project.
+
+        A missing, unreadable or outdated manifest yields an empty manifest,
+        which makes every file count as changed.
+
+        Args:
+            project_dir: Root directory of the generated project
+
+        Returns:
+            GenerationManifest: Loaded manifest
+        """
+        path = cls.manifest_path(project_dir)
+        if not os.path.exists(path):
+            return cls(project_dir)
+
+        try:
+            with open(path, "r") as f:
+                data = json.load(f)
+        except (OSError, ValueError) as e:
+            get_logger().warning(f"Ignoring unreadable generation manifest {path}: {e}")
+            return cls(project_dir)
+
+        if data.get("format") != MANIFEST_FORMAT or data.get("version") != __version__:
+            return cls(project_dir)
+
+        return cls(project_dir, data.get("files", {}), data.get("settings_hash"))
+
+    def fingerprint(self, task: RenderTask, template_env, hasher: ContextHasher,
+                    template_hashes: Dict[str, Optional[str]]) -> Dict[str, Any]:
+        """Compute the input fingerprint of a render task.
+
+        Args:
+            task: Render task
+            template_env: Template environment used to load the template
+            hasher: Context hasher shared by all tasks of the plan
+            template_hashes: Template source hashes already computed for the plan
+
+        Returns:
+            Dict[str, Any]: Fingerprint of the task inputs
+        """
+        if task.template_name is None:
+            return {"template": None, "template_hash": None, "context_hash": hasher.hash(task.content)}
+
+        if task.template_name not in template_hashes:
+            template_hashes[task.template_name] = get_template_hash(template_env, task.template_name)
+
+        return {
+            "template": task.template_name,
+            "template_hash": template_hashes[task.template_name],
+            "context_hash": hasher.hash(task.context),
+        }
+
+    def is_current(self, path: str, fingerprint: Dict[str, Any]) -> bool:
+        """Check whether a file was generated from the same inputs and is still present.
+
+        Args:
+            path: Path of the generated file
+            fingerprint: Fingerprint of the current inputs
+
+        Returns:
+            bool: True if the file does not need to be regenerated
+        """
+        if fingerprint.get("template") and not fingerprint.get("template_hash"):
+            # Template source not available, so the inputs cannot be compared
+            return False
+
+        entry = self.previous.get(self._relative(path))
+        if not entry:
+            return False
+
+        for key in ["template", "template_hash", "context_hash"]:
+            if entry.get(key) != fingerprint.get(key):
+                return False
+
+        try:
+            return os.path.getsize(path) == entry.get("size")
+        except OSError:
+            return False
+
+    def record(self, path: str, fingerprint: Dict[str, Any], content: str, entity: Optional[str] = None) -> None:
+        """Record the inputs and size of a generated file.
+
+        Args:
+            path: Path of the generated file
+            fingerprint: Fingerprint of the inputs
+            content: Generated content
+            entity: Name of the entity the file belongs to (if any)
+        """
+        entry = {
+            **fingerprint,
+            "size": len(content.encode("utf-8")),
+        }
+        if entity is not None:
+            entry["entity"] = entity
+        self.entries[self._relative(path)] = entry
+
+    def retainable_entities(self, names: Set[str], template_env) -> Set[str]:
+        """Find entities whose previously generated files are still current.
+
+        Only the settings and templates are checked, so the caller must know
+        from elsewhere (e.g. a schema diff) that the entities are unchanged.
+
+        Args:
+            names: Names of entities that are unchanged since the previous generation
+            template_env: Template environment used to load templates
+
+        Returns:
+            Set[str]: Entities whose files can be kept without rendering them
+        """
+        if self.settings_hash is None or self.settings_hash != self.previous_settings_hash:
+            return set()
+
+        template_hashes: Dict[str, Optional[str]] = {}
+        retainable = set()
+        stale = set()
+        for relative_path, entry in self.previous.items():
+            entity = entry.get("entity")
+            if entity not in names or entity in stale:
+                continue
+
+            template_name = entry.get("template")
+            if template_name is not None:
+                if template_name not in template_hashes:
+                    template_hashes[template_name] = get_template_hash(template_env, template_name)
+                current_hash = template_hashes[template_name]
+                if not current_hash or current_hash != entry.get("template_hash"):
+                    stale.add(entity)
+                    continue
+
+            try:
+                size = os.path.getsize(os.path.join(self.project_dir, relative_path))
+            except OSError:
+                size = None
+            if size != entry.get("size"):
+                stale.add(entity)
+                continue
+            retainable.add(entity)
+
+        return retainable - stale
+
+    def retain_entities(self, names: Set[str]) -> int:
+        """Carry the entries of the given entities over from the previous generation.
+
+        Args:
+            names: Entities whose files were kept without rendering them
+
+        Returns:
+            int: Number of files carried over
+        """
+        retained = 0
+        for relative_path, entry in self.previous.items():
+            if entry.get("entity") in names and relative_path not in self.entries:
+                self.entries[relative_path] = entry
+                retained += 1
+        return retained
+
+    def select_changed(self, plan: RenderPlan, template_env) -> Dict[str, Dict[str, Any]]:
+        """Remove unchanged files from a plan and fingerprint the remaining ones.
+
+        Args:
+            plan: Plan to filter (modified in place)
+            template_env: Template environment used to load templates
+
+        Returns:
+            Dict[str, Dict[str, Any]]: Fingerprints of the remaining tasks keyed by path
+        """
+        hasher = ContextHasher()
+        template_hashes: Dict[str, Optional[str]] = {}
+        fingerprints = {}
+        changed = []
+
+        for task in plan:
+            fingerprint = self.fingerprint(task, template_env, hasher, template_hashes)
+            if self.is_current(task.path, fingerprint):
+                # Carry the entry over unchanged
+                relative_path = self._relative(task.path)
+                self.entries[relative_path] = self.previous[relative_path]
+                plan.skipped.append(task)
+            else:
+                fingerprints[task.path] = fingerprint
+                changed.append(task)
+
+        plan.tasks = changed
+        return fingerprints
+
+    def to_json(self) -> str:
+        """Serialize the manifest.
+
+        Returns:
+            str: Manifest as JSON
+        """
+        data = {
+            "format": MANIFEST_FORMAT,
+            "version": __version__,
+            "files": dict(sorted(self.entries.items())),
+        }
+        if self.settings_hash is not None:
+            data["settings_hash"] = self.settings_hash
+        return json.dumps(data, indent=2) + "\n"
+
+    def _relative(self, path: str) -> str:
+        """Get a path relative to the project directory, using forward slashes."""
+        return os.path.relpath(path, self.project_dir).replace(os.sep, "/")
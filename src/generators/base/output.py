@@ -0,0 +1,358 @@
+"""Output sinks for writing rendered projects.
+
+A sink receives a fully rendered render plan and decides where the files go.
+The default sink writes to the local file system; archive sinks stream the
+files straight into a ZIP or tar.gz file or in-memory buffer.
+"""
+
+import hashlib
+import io
+import os
+import tarfile
+import time
+import zipfile
+from typing import BinaryIO, Dict, Optional, Union
+
+from src.core.logging import get_logger
+from src.generators.base.render_plan import RenderPlan
+
+
+class WriteStats:
+    """Counts of files written by an output sink."""
+
+    def __init__(self):
+        """Initialize the write statistics."""
+        self.created = 0
+        self.updated = 0
+        self.unchanged = 0
+        self.bytes_written = 0
+
+    @property
+    def total(self) -> int:
+        """Total number of files handled."""
+        return self.created + self.updated + self.unchanged
+
+    def as_dict(self) -> Dict[str, int]:
+        """Get the statistics as a dictionary.
+
+        Returns:
+            Dict[str, int]: Counts of created, updated and unchanged files
+        """
+        return {"created": self.created, "updated": self.updated, "unchanged": self.unchanged}
+
+    def __str__(self) -> str:
+        return f"{self.created} created, {self.updated} updated, {self.unchanged} unchanged"
+
+
+class OutputSink:
+    """Base class for destinations of generated files."""
+
+    def __init__(self):
+        """Initialize the output sink."""
+        self.logger = get_logger()
+        self.stats = WriteStats()
+
+    def make_directory(self, path: str) -> None:
+        """Create a directory.
+
+        Args:
+            path: Directory path
+        """
+        raise NotImplementedError
+
+    def write_file(self, path: str, content: str) -> None:
+        """Write a file.
+
+        Args:
+            path: File path
+            content: File content
+        """
+        raise NotImplementedError
+
+    def write_plan(self, plan: RenderPlan) -> WriteStats:
+        """Write every directory and rendered file of a plan.
+
+        Args:
+            plan: Rendered plan to write
+
+        Returns:
+            WriteStats: Statistics of the files written by this sink so far
+        """
+        for directory in plan.directories:
+            self.make_directory(directory)
+
+        for task in plan:
+            if not task.is_rendered:
+                raise ValueError(f"Render task has not been rendered: {task}")
+            self.write_file(task.path, task.content)
+
+        return self.stats
+
+    def close(self) -> None:
+        """Finish writing and release any resources held by the sink."""
+        pass
+
+
+class FileSystemSink(OutputSink):
+    """Write generated files to the local file system.
+
+    Files whose content is identical to what is already on disk are left
+    untouched, so their modification times are preserved and incremental
+    Gradle/Maven builds don't recompile them.
+    """
+
+    def make_directory(self, path: str) -> None:
+        """Create a directory and any missing parents.
+
+        Args:
+            path: Directory path
+        """
+        os.makedirs(path, exist_ok=True)
+
+    def write_file(self, path: str, content: str) -> None:
+        """Write a file unless it already has the same content.
+
+        Args:
+            path: File path
+            content: File content
+        """
+        data = content.encode("utf-8")
+
+        try:
+            existing_size = os.path.getsize(path)
+        except OSError:
+            existing_size = None
+
+        if existing_size is None:
+            parent_dir = os.path.dirname(path)
+            if parent_dir:
+                os.makedirs(parent_dir, exist_ok=True)
+            self.stats.created += 1
+        elif existing_size == len(data) and self._file_digest(path) == hashlib.sha256(data).digest():
+            self.stats.unchanged += 1
+            return
+        else:
+            self.stats.updated += 1
+
+        with open(path, "wb") as f:
+            f.write(data)
+        self.stats.bytes_written += len(data)
+
+    @staticmethod
+    def _file_digest(path: str) -> bytes:
+        """Compute the SHA-256 digest of a file.
+
+        Args:
+            path: File path
+
+        Returns:
+            bytes: Digest of the file content
+        """
+        digest = hashlib.sha256()
+        with open(path, "rb") as f:
+            for chunk in iter(lambda: f.read(65536), b""):
+                digest.update(chunk)
+        return digest.digest()
+
+
+class ArchiveSink(OutputSink):
+    """Base class for sinks that stream generated files into an archive.
+
+    Entries are named relative to ``root_dir``, which defaults to the parent
+    of the project directory so the archive contains a single top-level
+    folder named after the project. Entries can't be replaced once written,
+    so each file may only be written once.
+    """
+
+    def __init__(self, target: Union[str, BinaryIO], compresslevel: Optional[int] = None,
+                 root_dir: Optional[str] = None):
+        """Initialize the archive sink.
+
+        Args:
+            target: Archive file path or writable binary file object (e.g. io.BytesIO)
+            compresslevel: Compression level (0-9, defaults to the format's default)
+            root_dir: Directory that archive entry names are relative to
+        """
+        super().__init__()
+        self.target = target
+        self.compresslevel = compresslevel
+        self.root_dir = root_dir
+        self._entries = set()
+
+    def write_plan(self, plan: RenderPlan) -> WriteStats:
+        """Write every directory and rendered file of a plan into the archive.
+
+        When the plan renders a path more than once, only its last content is
+        written, as it would be the one left on the file system.
+
+        Args:
+            plan: Rendered plan to write
+
+        Returns:
+            WriteStats: Statistics of the files written by this sink so far
+        """
+        if self.root_dir is None and plan.project_dir:
+            self.root_dir = os.path.dirname(os.path.abspath(plan.project_dir))
+
+        for directory in plan.directories:
+            self.make_directory(directory)
+
+        latest = {}
+        for task in plan:
+            if not task.is_rendered:
+                raise ValueError(f"Render task has not been rendered: {task}")
+            latest[self._entry_name(task.path)] = task
+        for task in latest.values():
+            self.write_file(task.path, task.content)
+
+        return self.stats
+
+    def _entry_name(self, path: str) -> str:
+        """Get the archive entry name for a path.
+
+        Args:
+            path: File or directory path
+
+        Returns:
+            str: Entry name using forward slashes
+        """
+        if self.root_dir:
+            path = os.path.relpath(os.path.abspath(path), self.root_dir)
+        return path.replace(os.sep, "/").lstrip("/")
+
+    def make_directory(self, path: str) -> None:
+        """Add a directory entry to the archive.
+
+        Args:
+            path: Directory path
+        """
+        name = self._entry_name(path) + "/"
+        if name not in self._entries:
+            self._entries.add(name)
+            self._add_directory(name)
+
+    def write_file(self, path: str, content: str) -> None:
+        """Add a file entry to the archive.
+
+        Args:
+            path: File path
+            content: File content
+
+        Raises:
+            ValueError: If the archive already has an entry for the path
+        """
+        name = self._entry_name(path)
+        if name in self._entries:
+            raise ValueError(f"Archive already contains {name}")
+        self._entries.add(name)
+        self.stats.created += 1
+        data = content.encode("utf-8")
+        self._add_file(name, data)
+        self.stats.bytes_written += len(data)
+
+    def _add_directory(self, name: str) -> None:
+        raise NotImplementedError
+
+    def _add_file(self, name: str, data: bytes) -> None:
+        raise NotImplementedError
+
+
+class ZipSink(ArchiveSink):
+    """Write generated files straight into a ZIP archive."""
+
+    def __init__(self, target: Union[str, BinaryIO], compresslevel: Optional[int] = None,
+                 root_dir: Optional[str] = None):
+        """Initialize the ZIP sink.
+
+        Args:
+            target: Archive file path or writable binary file object (e.g. io.BytesIO)
+            compresslevel: Deflate compression level (0-9)
+            root_dir: Directory that archive entry names are relative to
+        """
+        super().__init__(target, compresslevel, root_dir)
+        self.archive = zipfile.ZipFile(target, "w", zipfile.ZIP_DEFLATED, compresslevel=compresslevel)
+
+    def _add_directory(self, name: str) -> None:
+        self.archive.writestr(zipfile.ZipInfo(name, time.localtime()[:6]), b"")
+
+    def _add_file(self, name: str, data: bytes) -> None:
+        info = zipfile.ZipInfo(name, time.localtime()[:6])
+        info.compress_type = zipfile.ZIP_DEFLATED
+        self.archive.writestr(info, data, compresslevel=self.compresslevel)
+
+    def close(self) -> None:
+        """Finish the ZIP archive (file objects passed in are left open)."""
+        self.archive.close()
+
+
+class TarGzSink(ArchiveSink):
+    """Write generated files straight into a gzip-compressed tar archive."""
+
+    def __init__(self, target: Union[str, BinaryIO], compresslevel: Optional[int] = None,
+                 root_dir: Optional[str] = None):
+        """Initialize the tar.gz sink.
+
+        Args:
+            target: Archive file path or writable binary file object (e.g. io.BytesIO)
+            compresslevel: Gzip compression level (0-9)
+            root_dir: Directory that archive entry names are relative to
+        """
+        super().__init__(target, compresslevel, root_dir)
+        level = 9 if compresslevel is None else compresslevel
+        if isinstance(target, str):
+            self.archive = tarfile.open(name=target, mode="w:gz", compresslevel=level)
+        else:
+            self.archive = tarfile.open(fileobj=target, mode="w:gz", compresslevel=level)
+        self._mtime = time.time()
+
+    def _add_directory(self, name: str) -> None:
+        info = tarfile.TarInfo(name.rstrip("/"))
+        info.type = tarfile.DIRTYPE
+        info.mode = 0o755
+        info.mtime = self._mtime
+        self.archive.addfile(info)
+
+    def _add_file(self, name: str, data: bytes) -> None:
+        info = tarfile.TarInfo(name)
+        info.size = len(data)
+        info.mode = 0o644
+        info.mtime = self._mtime
+        self.archive.addfile(info, io.BytesIO(data))
+
+    def close(self) -> None:
+        """Finish the tar.gz archive (file objects passed in are left open)."""
+        self.archive.close()
+
+
+# Archive sink classes by format name
+ARCHIVE_SINKS = {
+    "zip": ZipSink,
+    "tar.gz": TarGzSink,
+    "tgz": TarGzSink,
+}
+
+
+def create_archive_sink(target: Union[str, BinaryIO], archive_format: Optional[str] = None,
+                        compresslevel: Optional[int] = None) -> ArchiveSink:
+    """Create an archive sink for a target.
+
+    Args:
+        target: Archive file path or writable binary file object
+        archive_format: "zip" or "tar.gz" (inferred from the file name if omitted)
+        compresslevel: Compression level (0-9)
+
+    Returns:
+        ArchiveSink: Sink writing into the archive
+
+    Raises:
+        ValueError: If the archive format is not supported
+    """
+    if archive_format is None:
+        name = target if isinstance(target, str) else getattr(target, "name", "")
+        name = str(name).lower()
+        archive_format = "tar.gz" if name.endswith((".tar.gz", ".tgz")) else "zip"
+
+    sink_class = ARCHIVE_SINKS.get(archive_format.lower())
+    if sink_class is None:
+        raise ValueError(f"Unsupported archive format: {archive_format}")
+    return sink_class(target, compresslevel=compresslevel)
@@ -0,0 +1,222 @@
+"""Render plan module for two-phase project generation.
+
+Generators first describe every output file as a task in a render plan
+(target path plus template and context, or path plus ready-made content).
+The plan is then rendered and handed to an output sink in separate stages.
+
+Rendering can be spread over a thread or process pool. Every task renders
+into its own slot, so the order of the plan (and of the written output) does
+not depend on the order in which workers finish.
+"""
+
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Dict, Any, List, Optional, Iterator, Tuple
+
+from src.core.logging import get_logger
+from src.generators.base.templating import get_environment, get_environment_key
+
+logger = get_logger()
+
+# Supported pools for parallel rendering
+RENDER_BACKENDS = ("thread", "process")
+
+# Template environment of a render worker process
+_worker_env = None
+
+
+def _init_render_worker(search_path: str, use_bytecode_cache: bool) -> None:
+    """Load the shared template environment in a render worker process.
+
+    Args:
+        search_path: Template directory
+        use_bytecode_cache: Whether to use the on-disk bytecode cache
+    """
+    global _worker_env
+    _worker_env = get_environment(search_path, use_bytecode_cache)
+
+
+def _render_in_worker(item: Tuple[str, Dict[str, Any]]) -> Tuple[str, float]:
+    """Render a template in a worker process.
+
+    Args:
+        item: Template name and context
+
+    Returns:
+        Tuple[str, float]: Rendered content and render time in seconds
+    """
+    template_name, context = item
+    start = time.perf_counter()
+    content = _worker_env.get_template(template_name).render(**context)
+    return content, time.perf_counter() - start
+
+
+class RenderTask:
+    """A single file to be produced by a generator."""
+
+    __slots__ = ("path", "template_name", "context", "content", "render_time", "entity")
+
+    def __init__(self, path: str, template_name: Optional[str] = None,
+                 context: Optional[Dict[str, Any]] = None, content: Optional[str] = None,
+                 entity: Optional[str] = None):
+        """Initialize the render task.
+
+        Args:
+            path: Target path of the generated file
+            template_name: Name of the template to render (if any)
+            context: Context data for template rendering
+            content: Already rendered file content (if no template is used)
+            entity: Name of the entity the file belongs to (if any)
+        """
+        self.path = path
+        self.entity = entity
+        self.template_name = template_name
+        # Copy the top level so later changes to the caller's dict don't leak in
+        self.context = dict(context) if context is not None else {}
+        self.content = content
+        # Seconds spent rendering the template, once rendered
+        self.render_time = None
+
+    @property
+    def is_rendered(self) -> bool:
+        """Whether the content of the task is available."""
+        return self.content is not None
+
+    def render(self, template_env) -> str:
+        """Render the task content with the given template environment.
+
+        Args:
+            template_env: Jinja2 environment used to load the template
+
+        Returns:
+            str: Rendered file content
+        """
+        if self.content is None:
+            start = time.perf_counter()
+            template = template_env.get_template(self.template_name)
+            self.content = template.render(**self.context)
+            self.render_time = time.perf_counter() - start
+        return self.content
+
+    def __repr__(self) -> str:
+        source = self.template_name if self.template_name else "<content>"
+        return f"RenderTask({self.path!r}, {source!r})"
+
+
+class RenderPlan:
+    """Ordered list of directories and files that make up a generated project."""
+
+    def __init__(self, project_dir: Optional[str] = None):
+        """Initialize the render plan.
+
+        Args:
+            project_dir: Root directory of the generated project
+        """
+        self.project_dir = project_dir
+        self.directories: List[str] = []
+        self.tasks: List[RenderTask] = []
+        # Tasks left out because their output is already up to date
+        self.skipped: List[RenderTask] = []
+        # Statistics reported by the output sink once the plan is written
+        self.write_stats = None
+        # Generation report attached once the plan is written
+        self.report = None
+
+    def add_template(self, path: str, template_name: str, context: Dict[str, Any],
+                     entity: Optional[str] = None) -> RenderTask:
+        """Add a file rendered from a template.
+
+        Args:
+            path: Target path of the generated file
+            template_name: Name of the template to render
+            context: Context data for template rendering
+            entity: Name of the entity the file belongs to (if any)
+
+        Returns:
+            RenderTask: The task added to the plan
+        """
+        task = RenderTask(path, template_name=template_name, context=context, entity=entity)
+        self.tasks.append(task)
+        return task
+
+    def add_content(self, path: str, content: str, entity: Optional[str] = None) -> RenderTask:
+        """Add a file with already rendered content.
+
+        Args:
+            path: Target path of the generated file
+            content: File content
+            entity: Name of the entity the file belongs to (if any)
+
+        Returns:
+            RenderTask: The task added to the plan
+        """
+        task = RenderTask(path, content=content, entity=entity)
+        self.tasks.append(task)
+        return task
+
+    def add_directory(self, path: str) -> None:
+        """Add a directory that must exist even if no file is written to it.
+
+        Args:
+            path: Directory path
+        """
+        if path not in self.directories:
+            self.directories.append(path)
+
+    def render(self, template_env, jobs: int = 1, backend: str = "thread") -> None:
+        """Render every task that has no content yet.
+
+        Args:
+            template_env: Jinja2 environment used to load templates
+            jobs: Number of parallel render workers
+            backend: "thread" or "process" pool used when jobs > 1
+
+        Raises:
+            ValueError: If the backend is not supported
+        """
+        if backend not in RENDER_BACKENDS:
+            raise ValueError(f"Unsupported render backend: {backend}")
+
+        pending = [task for task in self.tasks if not task.is_rendered]
+        if jobs <= 1 or len(pending) < 2:
+            for task in pending:
+                task.render(template_env)
+            return
+
+        env_key = get_environment_key(template_env) if backend == "process" else None
+        if backend == "process" and env_key is None:
+            logger.warning("Template environment cannot be shared with worker processes, rendering on threads")
+            backend = "thread"
+
+        if backend == "process":
+            items = [(task.template_name, task.context) for task in pending]
+            chunksize = max(1, len(items) // (jobs * 4))
+            with ProcessPoolExecutor(max_workers=jobs, initializer=_init_render_worker,
+                                     initargs=env_key) as executor:
+                results = executor.map(_render_in_worker, items, chunksize=chunksize)
+                for task, (content, render_time) in zip(pending, results):
+                    task.content = content
+                    task.render_time = render_time
+        else:
+            with ThreadPoolExecutor(max_workers=jobs) as executor:
+                list(executor.map(lambda task: task.render(template_env), pending))
+
+    def relative_path(self, path: str) -> str:
+        """Get a path relative to the project directory.
+
+        Args:
+            path: Absolute or project-relative path
+
+        Returns:
+            str: Path relative to the project directory
+        """
+        if self.project_dir:
+            return os.path.relpath(path, self.project_dir)
+        return path
+
+    def __iter__(self) -> Iterator[RenderTask]:
+        return iter(self.tasks)
+
+    def __len__(self) -> int:
+        return len(self.tasks)
@@ -0,0 +1,180 @@
+"""Generation report module for profiling project generation.
+
+A report collects the wall time of every generation phase, per-template
+render counts and cumulative render time, and the files and bytes written
+by the output sink. Reports can be printed as a table or dumped as JSON.
+"""
+
+import json
+import time
+from typing import Dict, Any, List, Optional
+
+from src.generators.base.render_plan import RenderPlan
+
+# Order in which phases are listed in reports
+PHASES = [
+    "structure",
+    "build_config",
+    "source",
+    "tests",
+    "pipeline",
+    "documentation",
+    "manifest",
+    "render",
+    "write",
+]
+
+
+class TemplateTiming:
+    """Render count and cumulative render time of a template."""
+
+    __slots__ = ("renders", "seconds")
+
+    def __init__(self):
+        """Initialize the template timing."""
+        self.renders = 0
+        self.seconds = 0.0
+
+    def as_dict(self) -> Dict[str, Any]:
+        """Get the timing as a dictionary.
+
+        Returns:
+            Dict[str, Any]: Render count and cumulative time in seconds
+        """
+        return {"renders": self.renders, "seconds": self.seconds}
+
+
+class GenerationReport:
+    """Profile of a single project generation."""
+
+    def __init__(self, project_dir: str, generator: Optional[str] = None):
+        """Initialize the generation report.
+
+        Args:
+            project_dir: Directory of the generated project
+            generator: Name of the generator class
+        """
+        self.project_dir = project_dir
+        self.generator = generator
+        self.started_at = time.time()
+        self.total_seconds = 0.0
+        self.phases: Dict[str, float] = {}
+        self.templates: Dict[str, TemplateTiming] = {}
+        self.files_written = 0
+        self.files_unchanged = 0
+        self.bytes_written = 0
+
+    def add_phase(self, name: str, seconds: float) -> None:
+        """Add wall time to a phase.
+
+        Args:
+            name: Phase name
+            seconds: Elapsed wall time in seconds
+        """
+        self.phases[name] = self.phases.get(name, 0.0) + seconds
+
+    def add_render(self, template_name: str, seconds: float) -> None:
+        """Record one render of a template.
+
+        Args:
+            template_name: Name of the rendered template
+            seconds: Time spent rendering in seconds
+        """
+        timing = self.templates.get(template_name)
+        if timing is None:
+            timing = self.templates[template_name] = TemplateTiming()
+        timing.renders += 1
+        timing.seconds += seconds
+
+    def add_plan(self, plan: RenderPlan) -> None:
+        """Record the render times and write statistics of a plan.
+
+        Args:
+            plan: Rendered and written plan
+        """
+        for task in plan:
+            if task.template_name and task.render_time is not None:
+                self.add_render(task.template_name, task.render_time)
+
+        if plan.write_stats is not None:
+            self.files_written = plan.write_stats.created + plan.write_stats.updated
+            self.files_unchanged = plan.write_stats.unchanged
+            self.bytes_written = plan.write_stats.bytes_written
+
+    def sorted_templates(self) -> List[str]:
+        """Get template names ordered by cumulative render time.
+
+        Returns:
+            List[str]: Template names, slowest first
+        """
+        return sorted(self.templates, key=lambda name: (-self.templates[name].seconds, name))
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Get the report as a dictionary.
+
+        Returns:
+            Dict[str, Any]: Report data
+        """
+        phase_names = [name for name in PHASES if name in self.phases]
+        phase_names += [name for name in self.phases if name not in PHASES]
+        return {
+            "project_dir": self.project_dir,
+            "generator": self.generator,
+            "started_at": self.started_at,
+            "total_seconds": self.total_seconds,
+            "phases": {name: self.phases[name] for name in phase_names},
+            "templates": {name: self.templates[name].as_dict() for name in self.sorted_templates()},
+            "files_written": self.files_written,
+            "files_unchanged": self.files_unchanged,
+            "bytes_written": self.bytes_written,
+        }
+
+    def to_json(self, indent: int = 2) -> str:
+        """Serialize the report as JSON.
+
+        Args:
+            indent: JSON indentation
+
+        Returns:
+            str: JSON document
+        """
+        return json.dumps(self.to_dict(), indent=indent)
+
+    def format_table(self, max_templates: Optional[int] = 20) -> str:
+        """Format the report as a plain-text table.
+
+        Args:
+            max_templates: Maximum number of templates listed (None for all)
+
+        Returns:
+            str: Report table
+        """
+        data = self.to_dict()
+        lines = [f"Generation report for {self.project_dir}" + (f" ({self.generator})" if self.generator else "")]
+
+        lines.append("")
+        lines.append(f"{'Phase':<40} {'Time (ms)':>12}")
+        for name, seconds in data["phases"].items():
+            lines.append(f"{name:<40} {seconds * 1000:>12.1f}")
+        lines.append(f"{'total':<40} {self.total_seconds * 1000:>12.1f}")
+
+        template_names = self.sorted_templates()
+        if max_templates is not None:
+            template_names = template_names[:max_templates]
+        if template_names:
+            lines.append("")
+            lines.append(f"{'Template':<40} {'Renders':>8} {'Time (ms)':>12}")
+            for name in template_names:
+                timing = self.templates[name]
+                lines.append(f"{name:<40} {timing.renders:>8} {timing.seconds * 1000:>12.1f}")
+            hidden = len(self.templates) - len(template_names)
+            if hidden > 0:
+                lines.append(f"... {hidden} more templates")
+
+        lines.append("")
+        lines.append(f"Files written: {self.files_written} ({self.bytes_written} bytes), "
+                     f"{self.files_unchanged} unchanged")
+        return "\n".join(lines)
+
+    def __str__(self) -> str:
+        return self.format_table()
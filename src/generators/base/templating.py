@@ -0,0 +1,377 @@
+"""Shared Jinja2 template environments for generators.
+
+Building a Jinja2 environment is cheap, but every environment keeps its own
+compiled template cache. Generators therefore share one process-wide
+environment per template search path, backed by a bytecode cache on disk so
+templates are compiled once per machine rather than once per project.
+"""
+
+import hashlib
+import json
+import os
+import re
+import threading
+from typing import Dict, Optional, Tuple
+
+import jinja2
+
+from src.core.cache import get_cache_dir, get_cache_root
+from src.core.logging import get_logger
+
+logger = get_logger()
+
+# Default location of the bundled templates
+TEMPLATES_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "..", "templates"))
+
+# Environment variable pointing at precompiled templates (see compile_templates)
+COMPILED_TEMPLATES_ENV = "MICROGENESIS_COMPILED_TEMPLATES"
+
+# Stamp file written next to the precompiled template modules
+COMPILED_STAMP_FILE = "microgenesis-templates.json"
+
+_environments: Dict[Tuple[str, bool], jinja2.Environment] = {}
+_environments_lock = threading.Lock()
+
+
+def to_pascal_case(text: str) -> str:
+    """Convert string to PascalCase.
+
+    Args:
+        text: Text to convert
+
+    Returns:
+        str: PascalCase text
+    """
+    # Replace non-alphanumeric with spaces, split and join with title case
+    return ''.join(word.capitalize() for word in re.sub('[^0-9a-zA-Z]+', ' ', text).split())
+
+
+def to_camel_case(text: str, capitalize_first: bool = False) -> str:
+    """Convert string to camelCase or PascalCase.
+
+    Args:
+        text: Text to convert
+        capitalize_first: Whether to capitalize the first letter (PascalCase) or not (camelCase)
+
+    Returns:
+        str: camelCase or PascalCase text
+    """
+    words = re.sub('[^0-9a-zA-Z]+', ' ', text).split()
+    if not words:
+        return ""
+
+    if capitalize_first:
+        return ''.join(word.capitalize() for word in words)
+    return words[0].lower() + ''.join(word.capitalize() for word in words[1:])
+
+
+def to_snake_case(text: str) -> str:
+    """Convert string to snake_case.
+
+    Args:
+        text: Text to convert
+
+    Returns:
+        str: snake_case text
+    """
+    return '_'.join(word.lower() for word in re.sub('[^0-9a-zA-Z]+', ' ', text).split())
+
+
+def to_kebab_case(text: str) -> str:
+    """Convert string to kebab-case.
+
+    Args:
+        text: Text to convert
+
+    Returns:
+        str: kebab-case text
+    """
+    return '-'.join(word.lower() for word in re.sub('[^0-9a-zA-Z]+', ' ', text).split())
+
+
+def match_test(value: str, pattern: str) -> bool:
+    """Custom test to match a value against a regex pattern.
+
+    Args:
+        value: The value to test
+        pattern: The regex pattern to match against
+
+    Returns:
+        bool: True if the value matches the pattern, False otherwise
+    """
+    if not isinstance(value, str) or not isinstance(pattern, str):
+        return False
+
+    try:
+        return bool(re.match(pattern, value))
+    except re.error:
+        return False
+
+
+def _create_bytecode_cache() -> Optional[jinja2.BytecodeCache]:
+    """Create the persistent bytecode cache for compiled templates.
+
+    Returns:
+        Optional[jinja2.BytecodeCache]: Bytecode cache, or None if no cache directory is available
+    """
+    cache_dir = get_cache_dir("templates")
+    if not cache_dir:
+        return None
+    return jinja2.FileSystemBytecodeCache(cache_dir)
+
+
+def get_compiled_templates_dir() -> str:
+    """Get the directory holding precompiled template modules.
+
+    Returns:
+        str: Path set by ``MICROGENESIS_COMPILED_TEMPLATES`` or a directory below the cache root
+    """
+    return os.environ.get(COMPILED_TEMPLATES_ENV) or os.path.join(get_cache_root(), "compiled-templates")
+
+
+def _read_compiled_stamp(compiled_dir: str) -> Optional[Dict[str, object]]:
+    """Read the stamp describing a set of precompiled templates.
+
+    Args:
+        compiled_dir: Directory holding precompiled template modules
+
+    Returns:
+        Optional[Dict[str, object]]: Stamp data, or None if missing or unreadable
+    """
+    try:
+        with open(os.path.join(compiled_dir, COMPILED_STAMP_FILE), "r") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
+
+
+def _create_loader(search_path: str) -> jinja2.BaseLoader:
+    """Create the template loader for a search path.
+
+    The bundled templates are served from precompiled modules when a matching
+    precompiled set exists; any template missing from it is loaded from source.
+
+    Args:
+        search_path: Template directory
+
+    Returns:
+        jinja2.BaseLoader: Template loader
+    """
+    file_loader = jinja2.FileSystemLoader(search_path)
+    if os.path.abspath(search_path) != TEMPLATES_DIR:
+        return file_loader
+
+    compiled_dir = get_compiled_templates_dir()
+    stamp = _read_compiled_stamp(compiled_dir)
+    if not stamp:
+        return file_loader
+
+    from src import __version__
+    if stamp.get("version") != __version__:
+        logger.warning(
+            f"Ignoring precompiled templates in {compiled_dir}: built for version "
+            f"{stamp.get('version')}, running {__version__}"
+        )
+        return file_loader
+
+    hashes = stamp.get("templates")
+    if not isinstance(hashes, dict):
+        logger.warning(f"Ignoring precompiled templates in {compiled_dir}: no template hashes recorded")
+        return file_loader
+
+    return jinja2.ChoiceLoader([_FreshModuleLoader(compiled_dir, file_loader, hashes), file_loader])
+
+
+class _FreshModuleLoader(jinja2.ModuleLoader):
+    """Module loader serving only templates whose source is unchanged since they were compiled.
+
+    Templates edited after compile_templates() was run are reported as
+    missing, so they are loaded from source instead of from a stale module.
+    """
+
+    def __init__(self, path: str, source_loader: jinja2.BaseLoader, hashes: Dict[str, str]):
+        """Initialize the loader.
+
+        Args:
+            path: Directory holding precompiled template modules
+            source_loader: Loader of the template sources
+            hashes: Source hash of each compiled template (see compile_templates)
+        """
+        super().__init__(path)
+        self._source_loader = source_loader
+        self._hashes = hashes
+
+    def load(self, environment: jinja2.Environment, name: str, globals=None) -> jinja2.Template:
+        expected = self._hashes.get(name)
+        try:
+            source, _, _ = self._source_loader.get_source(environment, name)
+        except jinja2.TemplateNotFound:
+            source = None
+        if expected is None or source is None or _hash_source(source) != expected:
+            if expected is not None:
+                logger.debug(f"Template {name} changed since it was precompiled, loading it from source")
+            raise jinja2.TemplateNotFound(name)
+        return super().load(environment, name, globals)
+
+
+def _hash_source(source: str) -> str:
+    """Hash the source of a template."""
+    return hashlib.sha256(source.encode("utf-8")).hexdigest()
+
+
+def compile_templates(target_dir: Optional[str] = None, search_path: Optional[str] = None) -> Dict[str, int]:
+    """Compile every template into an importable Python module.
+
+    The resulting directory is picked up by the shared environment through a
+    Jinja2 ``ModuleLoader``, so the template sources never have to be parsed.
+    Templates that fail to compile are skipped and keep loading from source,
+    as do templates whose source changes after compiling (the stamp records
+    the source hash of every template).
+
+    Args:
+        target_dir: Output directory (defaults to get_compiled_templates_dir())
+        search_path: Template directory (defaults to the bundled templates)
+
+    Returns:
+        Dict[str, int]: Number of compiled and failed templates
+    """
+    from src import __version__
+
+    target_dir = target_dir or get_compiled_templates_dir()
+    os.makedirs(target_dir, exist_ok=True)
+
+    # Compile with the same options and filters used for rendering
+    env = create_environment(search_path, use_bytecode_cache=False, use_compiled=False)
+    stats = {"compiled": 0, "failed": 0}
+
+    def log_function(message: str) -> None:
+        if message.startswith("Compiled"):
+            stats["compiled"] += 1
+        elif message.startswith("Could not compile"):
+            stats["failed"] += 1
+            logger.warning(message)
+
+    env.compile_templates(
+        target_dir,
+        filter_func=lambda name: name.endswith(".j2"),
+        zip=None,
+        log_function=log_function,
+        ignore_errors=True
+    )
+
+    hashes = {}
+    for name in env.list_templates(filter_func=lambda name: name.endswith(".j2")):
+        source, _, _ = env.loader.get_source(env, name)
+        hashes[name] = _hash_source(source)
+
+    with open(os.path.join(target_dir, COMPILED_STAMP_FILE), "w") as f:
+        json.dump({"version": __version__, **stats, "templates": hashes}, f, indent=2)
+
+    logger.info(f"Compiled {stats['compiled']} templates into {target_dir} ({stats['failed']} failed)")
+    return stats
+
+
+def create_environment(search_path: Optional[str] = None, use_bytecode_cache: bool = True,
+                       use_compiled: bool = True) -> jinja2.Environment:
+    """Create a new template environment with the MicroGenesis filters and tests.
+
+    Args:
+        search_path: Template directory (defaults to the bundled templates)
+        use_bytecode_cache: Whether to persist compiled templates on disk
+        use_compiled: Whether to load precompiled template modules when available
+
+    Returns:
+        jinja2.Environment: Configured template environment
+    """
+    search_path = search_path or TEMPLATES_DIR
+    env = jinja2.Environment(
+        loader=_create_loader(search_path) if use_compiled else jinja2.FileSystemLoader(search_path),
+        trim_blocks=True,
+        lstrip_blocks=True,
+        bytecode_cache=_create_bytecode_cache() if use_bytecode_cache else None
+    )
+
+    # Add utility functions to templates
+    env.filters['camelcase'] = to_camel_case
+    env.filters['pascalcase'] = to_pascal_case
+    env.filters['snakecase'] = to_snake_case
+    env.filters['kebabcase'] = to_kebab_case
+
+    # Add custom tests
+    env.tests['match'] = match_test
+
+    return env
+
+
+def get_environment(search_path: Optional[str] = None, use_bytecode_cache: bool = True) -> jinja2.Environment:
+    """Get the shared template environment for a template search path.
+
+    Environments are created once per process and reused by every generator,
+    so templates are only loaded and compiled the first time they are used.
+
+    Args:
+        search_path: Template directory (defaults to the bundled templates)
+        use_bytecode_cache: Whether to persist compiled templates on disk
+
+    Returns:
+        jinja2.Environment: Shared template environment
+    """
+    key = (os.path.abspath(search_path or TEMPLATES_DIR), use_bytecode_cache)
+    env = _environments.get(key)
+    if env is None:
+        with _environments_lock:
+            env = _environments.get(key)
+            if env is None:
+                env = create_environment(key[0], use_bytecode_cache)
+                _environments[key] = env
+                logger.debug(f"Created template environment for {key[0]}")
+    return env
+
+
+def get_environment_key(env: jinja2.Environment) -> Optional[Tuple[str, bool]]:
+    """Find the arguments a shared environment was created with.
+
+    Worker processes use this to recreate an equivalent environment, since
+    environments themselves cannot be pickled.
+
+    Args:
+        env: Template environment
+
+    Returns:
+        Optional[Tuple[str, bool]]: Search path and bytecode cache flag, or None
+            if the environment was not created by get_environment()
+    """
+    with _environments_lock:
+        for key, shared_env in _environments.items():
+            if shared_env is env:
+                return key
+    return None
+
+
+def get_template_hash(env: jinja2.Environment, template_name: str) -> Optional[str]:
+    """Get a hash of a template's source.
+
+    Args:
+        env: Template environment the template is loaded from
+        template_name: Name of the template
+
+    Returns:
+        Optional[str]: SHA-256 of the template source, or None if the source is not available
+    """
+    loaders = env.loader.loaders if isinstance(env.loader, jinja2.ChoiceLoader) else [env.loader]
+    for loader in loaders:
+        if not loader.has_source_access:
+            continue
+        try:
+            source, _, _ = loader.get_source(env, template_name)
+        except jinja2.TemplateNotFound:
+            continue
+        return _hash_source(source)
+
+    return None
+
+
+def clear_environments() -> None:
+    """Drop all shared template environments (mainly useful for tests)."""
+    with _environments_lock:
+        _environments.clear()
@@ -6,7 +6,8 @@ for projects generated with MicroGenesis.
 
 import os
 from typing import Dict, Any, List
-from jinja2 import Environment, FileSystemLoader
+
+from src.generators.base.templating import get_environment
 
 
 class DocumentationGenerator:
@@ -18,11 +19,7 @@ class DocumentationGenerator:
         Args:
             templates_dir: Directory containing documentation templates
         """
-        self.template_env = Environment(
-            loader=FileSystemLoader(templates_dir),
-            trim_blocks=True,
-            lstrip_blocks=True
-        )
+        self.template_env = get_environment(templates_dir)
     
     def generate_documentation(self, project_dir: str, config: Dict[str, Any]) -> None:
         """Generate documentation for a project.
@@ -6,6 +6,8 @@ from typing import Dict, List, Any, Optional
 import re
 
 from src.generators.base import BaseGenerator
+from src.generators.schema.ir import Entity
+from src.generators.schema.type_mapping import is_builtin_type
 from src.core.logging import get_logger
 
 
@@ -54,9 +56,7 @@ class GraphQLJavaGenerator(BaseGenerator):
         }
         
         # Render pom.xml template
-        pom_content = self.render_template("graphql/pom.xml.j2", context)
-        with open(os.path.join(project_dir, "pom.xml"), "w") as f:
-            f.write(pom_content)
+        self._emit(os.path.join(project_dir, "pom.xml"), "graphql/pom.xml.j2", context)
     
     def _generate_gradle_config(self, project_dir: str, config: Dict[str, Any]) -> None:
         """Generate Gradle configuration (build.gradle).
@@ -79,14 +79,10 @@ class GraphQLJavaGenerator(BaseGenerator):
         }
         
         # Render build.gradle template
-        build_gradle_content = self.render_template("graphql/build.gradle.j2", context)
-        with open(os.path.join(project_dir, "build.gradle"), "w") as f:
-            f.write(build_gradle_content)
+        self._emit(os.path.join(project_dir, "build.gradle"), "graphql/build.gradle.j2", context)
         
         # Render settings.gradle template
-        settings_gradle_content = self.render_template("graphql/settings.gradle.j2", context)
-        with open(os.path.join(project_dir, "settings.gradle"), "w") as f:
-            f.write(settings_gradle_content)
+        self._emit(os.path.join(project_dir, "settings.gradle"), "graphql/settings.gradle.j2", context)
     
     def _generate_source_code(self, project_dir: str, config: Dict[str, Any]) -> None:
         """Generate source code files.
@@ -101,7 +97,7 @@ class GraphQLJavaGenerator(BaseGenerator):
         # Prepare source directories
         src_main_java = os.path.join(project_dir, "src", "main", "java")
         package_path = os.path.join(src_main_java, *package_name.split("."))
-        os.makedirs(package_path, exist_ok=True)
+        self._ensure_dir(package_path)
         
         # Subdirectories for GraphQL components
         resolvers_dir = os.path.join(package_path, "resolvers")
@@ -110,11 +106,11 @@ class GraphQLJavaGenerator(BaseGenerator):
         repositories_dir = os.path.join(package_path, "repositories")
         
         for directory in [resolvers_dir, types_dir, models_dir, repositories_dir]:
-            os.makedirs(directory, exist_ok=True)
+            self._ensure_dir(directory)
         
         # Create resources directory for schema files
         resources_dir = os.path.join(project_dir, "src", "main", "resources")
-        os.makedirs(resources_dir, exist_ok=True)
+        self._ensure_dir(resources_dir)
         
         # Generate application class
         self._generate_application_class(package_path, package_name, config)
@@ -150,9 +146,7 @@ class GraphQLJavaGenerator(BaseGenerator):
             "app_name": config.get("project_name", "app"),
         }
         
-        application_content = self.render_template("graphql/java/Application.java.j2", context)
-        with open(os.path.join(package_path, "Application.java"), "w") as f:
-            f.write(application_content)
+        self._emit(os.path.join(package_path, "Application.java"), "graphql/java/Application.java.j2", context)
     
     def _generate_graphql_schema(self, resources_dir: str, config: Dict[str, Any]) -> None:
         """Generate the GraphQL schema file.
@@ -163,24 +157,18 @@ class GraphQLJavaGenerator(BaseGenerator):
         """
         # Create GraphQL schema directory
         schema_dir = os.path.join(resources_dir, "graphql")
-        os.makedirs(schema_dir, exist_ok=True)
+        self._ensure_dir(schema_dir)
         
         # Generate schema file
-        schema_content = self.render_template("graphql/resources/schema.graphqls.j2", {"entities": config.get("entities", [])})
-        with open(os.path.join(schema_dir, "schema.graphqls"), "w") as f:
-            f.write(schema_content)
+        self._emit(os.path.join(schema_dir, "schema.graphqls"), "graphql/resources/schema.graphqls.j2", {"entities": self._get_entities(config)})
         
         # Generate application properties/yml
         use_yaml = "yaml-config" in config.get("features", [])
         
         if use_yaml:
-            config_content = self.render_template("graphql/resources/application.yml.j2", {"config": config})
-            with open(os.path.join(resources_dir, "application.yml"), "w") as f:
-                f.write(config_content)
+            self._emit(os.path.join(resources_dir, "application.yml"), "graphql/resources/application.yml.j2", {"config": config})
         else:
-            config_content = self.render_template("graphql/resources/application.properties.j2", {"config": config})
-            with open(os.path.join(resources_dir, "application.properties"), "w") as f:
-                f.write(config_content)
+            self._emit(os.path.join(resources_dir, "application.properties"), "graphql/resources/application.properties.j2", {"config": config})
     
     def _generate_model_classes(self, models_dir: str, package_name: str, config: Dict[str, Any]) -> None:
         """Generate model classes based on entities.
@@ -191,7 +179,7 @@ class GraphQLJavaGenerator(BaseGenerator):
             config: Project configuration dictionary
         """
         models_package = f"{package_name}.models"
-        entities = config.get("entities", [])
+        entities = self._get_entities(config)
         
         if not entities:
             # Generate sample entity if no entities defined
@@ -207,22 +195,18 @@ class GraphQLJavaGenerator(BaseGenerator):
                 "imports": ["java.time.LocalDateTime"]
             }
             
-            model_content = self.render_template("graphql/java/Model.java.j2", context)
-            with open(os.path.join(models_dir, "Sample.java"), "w") as f:
-                f.write(model_content)
+            self._emit(os.path.join(models_dir, "Sample.java"), "graphql/java/Model.java.j2", context)
         else:
             # Generate entities from configuration
-            for entity in entities:
+            for entity in self._iter_entities(entities):
                 context = {
                     "package": models_package,
-                    "entity_name": entity["name"],
-                    "fields": entity["fields"],
-                    "imports": self._get_imports_for_entity(entity)
+                    "entity_name": entity.name,
+                    "fields": entity.fields,
+                    "imports": self._get_imports_for_entity(entity, models_package)
                 }
                 
-                model_content = self.render_template("graphql/java/Model.java.j2", context)
-                with open(os.path.join(models_dir, f"{entity['name']}.java"), "w") as f:
-                    f.write(model_content)
+                self._emit(os.path.join(models_dir, f"{entity.name}.java"), "graphql/java/Model.java.j2", context)
     
     def _generate_type_classes(self, types_dir: str, package_name: str, config: Dict[str, Any]) -> None:
         """Generate GraphQL type classes.
@@ -234,7 +218,7 @@ class GraphQLJavaGenerator(BaseGenerator):
         """
         types_package = f"{package_name}.types"
         models_package = f"{package_name}.models"
-        entities = config.get("entities", [])
+        entities = self._get_entities(config)
         
         if not entities:
             # Generate sample type if no entities defined
@@ -245,22 +229,18 @@ class GraphQLJavaGenerator(BaseGenerator):
                 "entity_name": "Sample"
             }
             
-            type_content = self.render_template("graphql/java/Type.java.j2", context)
-            with open(os.path.join(types_dir, "SampleType.java"), "w") as f:
-                f.write(type_content)
+            self._emit(os.path.join(types_dir, "SampleType.java"), "graphql/java/Type.java.j2", context)
         else:
             # Generate type classes from configuration
-            for entity in entities:
+            for entity in self._iter_entities(entities):
                 context = {
                     "package": types_package,
                     "model_package": models_package,
-                    "type_name": f"{entity['name']}Type",
-                    "entity_name": entity["name"]
+                    "type_name": f"{entity.name}Type",
+                    "entity_name": entity.name
                 }
                 
-                type_content = self.render_template("graphql/java/Type.java.j2", context)
-                with open(os.path.join(types_dir, f"{entity['name']}Type.java"), "w") as f:
-                    f.write(type_content)
+                self._emit(os.path.join(types_dir, f"{entity.name}Type.java"), "graphql/java/Type.java.j2", context)
     
     def _generate_resolver_classes(self, resolvers_dir: str, package_name: str, config: Dict[str, Any]) -> None:
         """Generate GraphQL resolver classes.
@@ -273,24 +253,20 @@ class GraphQLJavaGenerator(BaseGenerator):
         resolvers_package = f"{package_name}.resolvers"
         models_package = f"{package_name}.models"
         repos_package = f"{package_name}.repositories"
-        entities = config.get("entities", [])
+        entities = self._get_entities(config)
         
         # Generate query resolver
         context = {
             "package": resolvers_package,
             "model_package": models_package,
             "repository_package": repos_package,
-            "entities": entities if entities else [{"name": "Sample"}]
+            "entities": entities if entities else [Entity("Sample")]
         }
         
-        query_content = self.render_template("graphql/java/QueryResolver.java.j2", context)
-        with open(os.path.join(resolvers_dir, "QueryResolver.java"), "w") as f:
-            f.write(query_content)
+        self._emit(os.path.join(resolvers_dir, "QueryResolver.java"), "graphql/java/QueryResolver.java.j2", context)
         
         # Generate mutation resolver
-        mutation_content = self.render_template("graphql/java/MutationResolver.java.j2", context)
-        with open(os.path.join(resolvers_dir, "MutationResolver.java"), "w") as f:
-            f.write(mutation_content)
+        self._emit(os.path.join(resolvers_dir, "MutationResolver.java"), "graphql/java/MutationResolver.java.j2", context)
     
     def _generate_repository_interfaces(self, repositories_dir: str, package_name: str, config: Dict[str, Any]) -> None:
         """Generate repository interfaces.
@@ -302,7 +278,7 @@ class GraphQLJavaGenerator(BaseGenerator):
         """
         repos_package = f"{package_name}.repositories"
         models_package = f"{package_name}.models"
-        entities = config.get("entities", [])
+        entities = self._get_entities(config)
         
         if not entities:
             # Generate sample repository if no entities defined
@@ -313,24 +289,20 @@ class GraphQLJavaGenerator(BaseGenerator):
                 "id_type": "String"
             }
             
-            repo_content = self.render_template("graphql/java/Repository.java.j2", context)
-            with open(os.path.join(repositories_dir, "SampleRepository.java"), "w") as f:
-                f.write(repo_content)
+            self._emit(os.path.join(repositories_dir, "SampleRepository.java"), "graphql/java/Repository.java.j2", context)
         else:
             # Generate repository interfaces from configuration
-            for entity in entities:
-                id_field = next((f for f in entity.get("fields", []) if f.get("name") == "id"), {"type": "String"})
+            for entity in self._iter_entities(entities):
+                id_field = entity.id_field
                 
                 context = {
                     "package": repos_package,
                     "model_package": models_package,
-                    "entity_name": entity["name"],
-                    "id_type": id_field.get("type", "String")
+                    "entity_name": entity.name,
+                    "id_type": id_field.type if id_field is not None else "String"
                 }
                 
-                repo_content = self.render_template("graphql/java/Repository.java.j2", context)
-                with open(os.path.join(repositories_dir, f"{entity['name']}Repository.java"), "w") as f:
-                    f.write(repo_content)
+                self._emit(os.path.join(repositories_dir, f"{entity.name}Repository.java"), "graphql/java/Repository.java.j2", context)
     
     def _generate_config_classes(self, package_path: str, package_name: str, config: Dict[str, Any]) -> None:
         """Generate configuration classes.
@@ -342,7 +314,7 @@ class GraphQLJavaGenerator(BaseGenerator):
         """
         # Create config directory
         config_dir = os.path.join(package_path, "config")
-        os.makedirs(config_dir, exist_ok=True)
+        self._ensure_dir(config_dir)
         
         # Generate GraphQL configuration
         context = {
@@ -350,9 +322,7 @@ class GraphQLJavaGenerator(BaseGenerator):
             "base_package": package_name
         }
         
-        graphql_config_content = self.render_template("graphql/java/GraphQLConfig.java.j2", context)
-        with open(os.path.join(config_dir, "GraphQLConfig.java"), "w") as f:
-            f.write(graphql_config_content)
+        self._emit(os.path.join(config_dir, "GraphQLConfig.java"), "graphql/java/GraphQLConfig.java.j2", context)
     
     def _generate_tests(self, project_dir: str, config: Dict[str, Any]) -> None:
         """Generate test files.
@@ -366,7 +336,7 @@ class GraphQLJavaGenerator(BaseGenerator):
         # Prepare test directories
         test_dir = os.path.join(project_dir, "src", "test", "java")
         test_package_path = os.path.join(test_dir, *package_name.split("."))
-        os.makedirs(test_package_path, exist_ok=True)
+        self._ensure_dir(test_package_path)
         
         # Generate application tests
         context = {
@@ -374,41 +344,38 @@ class GraphQLJavaGenerator(BaseGenerator):
             "app_name": config.get("project_name", "app"),
         }
         
-        test_content = self.render_template("graphql/java/ApplicationTests.java.j2", context)
-        with open(os.path.join(test_package_path, "ApplicationTests.java"), "w") as f:
-            f.write(test_content)
+        self._emit(os.path.join(test_package_path, "ApplicationTests.java"), "graphql/java/ApplicationTests.java.j2", context)
         
         # Generate resolver tests
         resolvers_test_dir = os.path.join(test_package_path, "resolvers")
-        os.makedirs(resolvers_test_dir, exist_ok=True)
+        self._ensure_dir(resolvers_test_dir)
         
-        entities = config.get("entities", [])
+        entities = self._get_entities(config)
         if not entities:
-            entities = [{"name": "Sample"}]
+            entities = [Entity("Sample")]
         
-        for entity in entities:
+        for entity in self._iter_entities(entities):
             context = {
                 "package": f"{package_name}.resolvers",
-                "entity_name": entity["name"]
+                "entity_name": entity.name
             }
             
-            resolver_test_content = self.render_template("graphql/java/ResolverTests.java.j2", context)
-            with open(os.path.join(resolvers_test_dir, f"{entity['name']}ResolverTests.java"), "w") as f:
-                f.write(resolver_test_content)
+            self._emit(os.path.join(resolvers_test_dir, f"{entity.name}ResolverTests.java"), "graphql/java/ResolverTests.java.j2", context)
     
-    def _get_imports_for_entity(self, entity: Dict[str, Any]) -> List[str]:
+    def _get_imports_for_entity(self, entity: Entity, package: str = "") -> List[str]:
         """Get the required imports for an entity based on its field types.
         
         Args:
-            entity: Entity definition dictionary
+            entity: Entity
+            package: Package of the entity classes (for types inside collections)
             
         Returns:
             List[str]: List of import statements
         """
         imports = set()
         
-        for field in entity.get("fields", []):
-            field_type = field.get("type", "")
+        for field in entity.fields:
+            field_type = field.type
             
             if field_type in ["LocalDate", "LocalDateTime"]:
                 imports.add(f"java.time.{field_type}")
@@ -419,12 +386,12 @@ class GraphQLJavaGenerator(BaseGenerator):
                 
                 # Add import for the type inside the collection if it's not a primitive
                 inner_type = re.search(r"<([^>]+)>", field_type)
-                if inner_type and inner_type.group(1) not in ["String", "Integer", "Long", "Double", "Boolean"]:
+                if package and inner_type and not is_builtin_type(inner_type.group(1), "java"):
                     # Assuming it's from the same package
-                    imports.add(f"{entity.get('package', '')}.{inner_type.group(1)}")
+                    imports.add(f"{package}.{inner_type.group(1)}")
             
             # Add imports for annotations
-            for annotation in field.get("annotations", []):
+            for annotation in field.annotations:
                 if annotation == "@Id":
                     imports.add("jakarta.persistence.Id")
         
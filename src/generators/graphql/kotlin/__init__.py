@@ -59,30 +59,20 @@ class GraphQLKotlinGenerator(BaseGenerator):
         }
         
         # Render build.gradle.kts template
-        build_gradle_content = self.render_template("graphql/kotlin/build.gradle.kts.j2", context)
-        with open(os.path.join(project_dir, "build.gradle.kts"), "w") as f:
-            f.write(build_gradle_content)
+        self._emit(os.path.join(project_dir, "build.gradle.kts"), "graphql/kotlin/build.gradle.kts.j2", context)
         
         # Render settings.gradle.kts template
-        settings_gradle_content = self.render_template("graphql/kotlin/settings.gradle.kts.j2", context)
-        with open(os.path.join(project_dir, "settings.gradle.kts"), "w") as f:
-            f.write(settings_gradle_content)
+        self._emit(os.path.join(project_dir, "settings.gradle.kts"), "graphql/kotlin/settings.gradle.kts.j2", context)
         
         # Add Gradle wrapper
         gradle_wrapper_dir = os.path.join(project_dir, "gradle", "wrapper")
-        os.makedirs(gradle_wrapper_dir, exist_ok=True)
+        self._ensure_dir(gradle_wrapper_dir)
         
-        gradle_wrapper_props = self.render_template("common/gradle-wrapper.properties.j2", context)
-        with open(os.path.join(gradle_wrapper_dir, "gradle-wrapper.properties"), "w") as f:
-            f.write(gradle_wrapper_props)
+        self._emit(os.path.join(gradle_wrapper_dir, "gradle-wrapper.properties"), "common/gradle-wrapper.properties.j2", context)
         
-        gradlew_content = self.render_template("common/gradlew.j2", {})
-        with open(os.path.join(project_dir, "gradlew"), "w") as f:
-            f.write(gradlew_content)
+        self._emit(os.path.join(project_dir, "gradlew"), "common/gradlew.j2", {})
         
-        gradlew_bat_content = self.render_template("common/gradlew.bat.j2", {})
-        with open(os.path.join(project_dir, "gradlew.bat"), "w") as f:
-            f.write(gradlew_bat_content)
+        self._emit(os.path.join(project_dir, "gradlew.bat"), "common/gradlew.bat.j2", {})
     
     def _generate_maven_config(self, project_dir: str, config: Dict[str, Any]) -> None:
         """Generate Maven configuration for GraphQL Kotlin.
@@ -108,9 +98,7 @@ class GraphQLKotlinGenerator(BaseGenerator):
         }
         
         # Render pom.xml template
-        pom_content = self.render_template("graphql/kotlin/pom.xml.j2", context)
-        with open(os.path.join(project_dir, "pom.xml"), "w") as f:
-            f.write(pom_content)
+        self._emit(os.path.join(project_dir, "pom.xml"), "graphql/kotlin/pom.xml.j2", context)
     
     def _generate_source_code(self, project_dir: str, config: Dict[str, Any]) -> None:
         """Generate source code files.
@@ -125,10 +113,10 @@ class GraphQLKotlinGenerator(BaseGenerator):
         
         # Main source directories
         src_main_kotlin = os.path.join(project_dir, "src", "main", "kotlin", base_package_path)
-        os.makedirs(src_main_kotlin, exist_ok=True)
+        self._ensure_dir(src_main_kotlin)
         
         src_main_resources = os.path.join(project_dir, "src", "main", "resources")
-        os.makedirs(src_main_resources, exist_ok=True)
+        self._ensure_dir(src_main_resources)
         
         # Get the appropriate architecture implementation
         service_type = config.get("service_type", "domain-driven")
@@ -152,9 +140,7 @@ class GraphQLKotlinGenerator(BaseGenerator):
         context.update(architecture.get_template_context_additions(config))
         
         # Generate application class
-        app_class_content = self.render_template("graphql/kotlin/Application.kt.j2", context)
-        with open(os.path.join(src_main_kotlin, f"{context['application_name']}.kt"), "w") as f:
-            f.write(app_class_content)
+        self._emit(os.path.join(src_main_kotlin, f"{context['application_name']}.kt"), "graphql/kotlin/Application.kt.j2", context)
         
         # Generate GraphQL schema
         self._generate_graphql_schema(src_main_resources, context, config)
@@ -185,11 +171,9 @@ class GraphQLKotlinGenerator(BaseGenerator):
             config: Project configuration
         """
         graphql_dir = os.path.join(resources_dir, "graphql")
-        os.makedirs(graphql_dir, exist_ok=True)
+        self._ensure_dir(graphql_dir)
         
-        schema_content = self.render_template("graphql/resources/schema.graphqls.j2", context)
-        with open(os.path.join(graphql_dir, "schema.graphqls"), "w") as f:
-            f.write(schema_content)
+        self._emit(os.path.join(graphql_dir, "schema.graphqls"), "graphql/resources/schema.graphqls.j2", context)
     
     def _generate_graphql_types(self, src_main_kotlin: str, context: Dict[str, Any], config: Dict[str, Any]) -> None:
         """Generate GraphQL type definitions.
@@ -208,12 +192,10 @@ class GraphQLKotlinGenerator(BaseGenerator):
         else:
             types_dir = os.path.join(src_main_kotlin, "model")
         
-        os.makedirs(types_dir, exist_ok=True)
+        self._ensure_dir(types_dir)
         
         # Generate sample types
-        sample_type_content = self.render_template(f"graphql/kotlin/{service_type}/model/SampleType.kt.j2", context)
-        with open(os.path.join(types_dir, "SampleType.kt"), "w") as f:
-            f.write(sample_type_content)
+        self._emit(os.path.join(types_dir, "SampleType.kt"), f"graphql/kotlin/{service_type}/model/SampleType.kt.j2", context)
     
     def _generate_graphql_resolvers(self, src_main_kotlin: str, context: Dict[str, Any], config: Dict[str, Any]) -> None:
         """Generate GraphQL resolvers.
@@ -231,17 +213,13 @@ class GraphQLKotlinGenerator(BaseGenerator):
         else:
             resolvers_dir = os.path.join(src_main_kotlin, "resolver")
         
-        os.makedirs(resolvers_dir, exist_ok=True)
+        self._ensure_dir(resolvers_dir)
         
         # Generate query resolver
-        query_resolver_content = self.render_template(f"graphql/kotlin/{service_type}/resolver/QueryResolver.kt.j2", context)
-        with open(os.path.join(resolvers_dir, "QueryResolver.kt"), "w") as f:
-            f.write(query_resolver_content)
+        self._emit(os.path.join(resolvers_dir, "QueryResolver.kt"), f"graphql/kotlin/{service_type}/resolver/QueryResolver.kt.j2", context)
         
         # Generate mutation resolver
-        mutation_resolver_content = self.render_template(f"graphql/kotlin/{service_type}/resolver/MutationResolver.kt.j2", context)
-        with open(os.path.join(resolvers_dir, "MutationResolver.kt"), "w") as f:
-            f.write(mutation_resolver_content)
+        self._emit(os.path.join(resolvers_dir, "MutationResolver.kt"), f"graphql/kotlin/{service_type}/resolver/MutationResolver.kt.j2", context)
     
     def _generate_application_config(self, resources_dir: str, context: Dict[str, Any], config: Dict[str, Any]) -> None:
         """Generate application configuration files.
@@ -252,9 +230,7 @@ class GraphQLKotlinGenerator(BaseGenerator):
             config: Project configuration
         """
         # Generate application.yml
-        app_yml_content = self.render_template("graphql/resources/application.yml.j2", context)
-        with open(os.path.join(resources_dir, "application.yml"), "w") as f:
-            f.write(app_yml_content)
+        self._emit(os.path.join(resources_dir, "application.yml"), "graphql/resources/application.yml.j2", context)
     
     def _generate_sample_code(self, src_main_kotlin: str, context: Dict[str, Any], config: Dict[str, Any]) -> None:
         """Generate sample code for the application.
@@ -290,14 +266,14 @@ class GraphQLKotlinGenerator(BaseGenerator):
             context: Template rendering context
             config: Project configuration
         """
-        api_info = self.parse_swagger_file(swagger_path)
-        if not api_info:
+        api = self._get_api_schema(swagger_path)
+        if api is None:
             self.logger.warning(f"Could not parse Swagger file: {swagger_path}")
             self._generate_sample_code(src_main_kotlin, context, config)
             return
         
-        # Add API info to context
-        context.update({"api": api_info})
+        # Add the models and endpoints of the API to the context
+        context.update({"api": api})
         
         service_type = config.get("service_type", "domain-driven")
         
@@ -323,10 +299,10 @@ class GraphQLKotlinGenerator(BaseGenerator):
         
         # Test source directories
         src_test_kotlin = os.path.join(project_dir, "src", "test", "kotlin", base_package_path)
-        os.makedirs(src_test_kotlin, exist_ok=True)
+        self._ensure_dir(src_test_kotlin)
         
         src_test_resources = os.path.join(project_dir, "src", "test", "resources")
-        os.makedirs(src_test_resources, exist_ok=True)
+        self._ensure_dir(src_test_resources)
         
         # Context for template rendering
         context = {
@@ -336,19 +312,13 @@ class GraphQLKotlinGenerator(BaseGenerator):
         }
         
         # Generate application test
-        app_test_content = self.render_template("graphql/kotlin/ApplicationTest.kt.j2", context)
-        with open(os.path.join(src_test_kotlin, f"{context['application_name']}Test.kt"), "w") as f:
-            f.write(app_test_content)
+        self._emit(os.path.join(src_test_kotlin, f"{context['application_name']}Test.kt"), "graphql/kotlin/ApplicationTest.kt.j2", context)
         
         # Generate test schema executor
-        schema_test_content = self.render_template("graphql/kotlin/SchemaTest.kt.j2", context)
-        with open(os.path.join(src_test_kotlin, "SchemaTest.kt"), "w") as f:
-            f.write(schema_test_content)
+        self._emit(os.path.join(src_test_kotlin, "SchemaTest.kt"), "graphql/kotlin/SchemaTest.kt.j2", context)
         
         # Generate test properties
-        test_yaml_content = self.render_template("graphql/resources/application-test.yml.j2", context)
-        with open(os.path.join(src_test_resources, "application-test.yml"), "w") as f:
-            f.write(test_yaml_content)
+        self._emit(os.path.join(src_test_resources, "application-test.yml"), "graphql/resources/application-test.yml.j2", context)
     
     # Helper methods for generating specific types of code
     
@@ -361,30 +331,24 @@ class GraphQLKotlinGenerator(BaseGenerator):
             config: Project configuration
         """
         domain_model_dir = os.path.join(src_main_kotlin, "domain", "model")
-        os.makedirs(domain_model_dir, exist_ok=True)
+        self._ensure_dir(domain_model_dir)
         
         # Generate sample entity
-        entity_content = self.render_template("graphql/kotlin/domain-driven/model/Entity.kt.j2", context)
-        with open(os.path.join(domain_model_dir, "Entity.kt"), "w") as f:
-            f.write(entity_content)
+        self._emit(os.path.join(domain_model_dir, "Entity.kt"), "graphql/kotlin/domain-driven/model/Entity.kt.j2", context)
         
         # Generate value objects if the architecture has them
         if context.get("has_value_objects"):
             vo_dir = os.path.join(src_main_kotlin, "domain", "valueobject")
-            os.makedirs(vo_dir, exist_ok=True)
+            self._ensure_dir(vo_dir)
             
-            vo_content = self.render_template("graphql/kotlin/domain-driven/valueobject/ValueObject.kt.j2", context)
-            with open(os.path.join(vo_dir, "ValueObject.kt"), "w") as f:
-                f.write(vo_content)
+            self._emit(os.path.join(vo_dir, "ValueObject.kt"), "graphql/kotlin/domain-driven/valueobject/ValueObject.kt.j2", context)
         
         # Generate domain events if the architecture has them
         if context.get("has_domain_events"):
             event_dir = os.path.join(src_main_kotlin, "domain", "event")
-            os.makedirs(event_dir, exist_ok=True)
+            self._ensure_dir(event_dir)
             
-            event_content = self.render_template("graphql/kotlin/domain-driven/event/DomainEvent.kt.j2", context)
-            with open(os.path.join(event_dir, "DomainEvent.kt"), "w") as f:
-                f.write(event_content)
+            self._emit(os.path.join(event_dir, "DomainEvent.kt"), "graphql/kotlin/domain-driven/event/DomainEvent.kt.j2", context)
     
     def _generate_application_services(self, src_main_kotlin: str, context: Dict[str, Any], config: Dict[str, Any]) -> None:
         """Generate application services for DDD architecture.
@@ -395,20 +359,16 @@ class GraphQLKotlinGenerator(BaseGenerator):
             config: Project configuration
         """
         app_service_dir = os.path.join(src_main_kotlin, "application", "service")
-        os.makedirs(app_service_dir, exist_ok=True)
+        self._ensure_dir(app_service_dir)
         
         dto_dir = os.path.join(src_main_kotlin, "application", "dto")
-        os.makedirs(dto_dir, exist_ok=True)
+        self._ensure_dir(dto_dir)
         
         # Generate sample application service
-        service_content = self.render_template("graphql/kotlin/domain-driven/application/service/ApplicationService.kt.j2", context)
-        with open(os.path.join(app_service_dir, "ApplicationService.kt"), "w") as f:
-            f.write(service_content)
+        self._emit(os.path.join(app_service_dir, "ApplicationService.kt"), "graphql/kotlin/domain-driven/application/service/ApplicationService.kt.j2", context)
         
         # Generate sample DTOs
-        dto_content = self.render_template("graphql/kotlin/domain-driven/application/dto/DTOs.kt.j2", context)
-        with open(os.path.join(dto_dir, "DTOs.kt"), "w") as f:
-            f.write(dto_content)
+        self._emit(os.path.join(dto_dir, "DTOs.kt"), "graphql/kotlin/domain-driven/application/dto/DTOs.kt.j2", context)
     
     def _generate_infrastructure_components(self, src_main_kotlin: str, context: Dict[str, Any], config: Dict[str, Any]) -> None:
         """Generate infrastructure components for DDD architecture.
@@ -419,12 +379,10 @@ class GraphQLKotlinGenerator(BaseGenerator):
             config: Project configuration
         """
         infra_persistence_dir = os.path.join(src_main_kotlin, "infrastructure", "persistence")
-        os.makedirs(infra_persistence_dir, exist_ok=True)
+        self._ensure_dir(infra_persistence_dir)
         
         # Generate repository implementation
-        repo_impl_content = self.render_template("graphql/kotlin/domain-driven/infrastructure/persistence/RepositoryImpl.kt.j2", context)
-        with open(os.path.join(infra_persistence_dir, "RepositoryImpl.kt"), "w") as f:
-            f.write(repo_impl_content)
+        self._emit(os.path.join(infra_persistence_dir, "RepositoryImpl.kt"), "graphql/kotlin/domain-driven/infrastructure/persistence/RepositoryImpl.kt.j2", context)
     
     def _generate_standard_models(self, src_main_kotlin: str, context: Dict[str, Any], config: Dict[str, Any]) -> None:
         """Generate standard models for non-DDD architectures.
@@ -435,12 +393,10 @@ class GraphQLKotlinGenerator(BaseGenerator):
             config: Project configuration
         """
         model_dir = os.path.join(src_main_kotlin, "model")
-        os.makedirs(model_dir, exist_ok=True)
+        self._ensure_dir(model_dir)
         
         # Generate model class
-        model_content = self.render_template("graphql/kotlin/entity-driven/model/Model.kt.j2", context)
-        with open(os.path.join(model_dir, "Model.kt"), "w") as f:
-            f.write(model_content)
+        self._emit(os.path.join(model_dir, "Model.kt"), "graphql/kotlin/entity-driven/model/Model.kt.j2", context)
     
     def _generate_standard_services(self, src_main_kotlin: str, context: Dict[str, Any], config: Dict[str, Any]) -> None:
         """Generate standard services for non-DDD architectures.
@@ -451,9 +407,7 @@ class GraphQLKotlinGenerator(BaseGenerator):
             config: Project configuration
         """
         service_dir = os.path.join(src_main_kotlin, "service")
-        os.makedirs(service_dir, exist_ok=True)
+        self._ensure_dir(service_dir)
         
         # Generate service class
-        service_content = self.render_template("graphql/kotlin/entity-driven/service/Service.kt.j2", context)
-        with open(os.path.join(service_dir, "Service.kt"), "w") as f:
-            f.write(service_content)
+        self._emit(os.path.join(service_dir, "Service.kt"), "graphql/kotlin/entity-driven/service/Service.kt.j2", context)
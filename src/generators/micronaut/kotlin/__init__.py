@@ -2,16 +2,20 @@
 
 import os
 import json
-from typing import Dict, List, Any, Optional
+from typing import Dict, Iterable, List, Any, Optional
 import re
 
 from src.generators.base import BaseGenerator
+from src.generators.schema.ir import Entity, Field
+from src.generators.schema.type_mapping import is_builtin_type
 from src.core.logging import get_logger
 
 
 class MicronautKotlinGenerator(BaseGenerator):
     """Generator for Micronaut Kotlin applications."""
     
+    language = "kotlin"
+    
     def __init__(self):
         """Initialize the Micronaut Kotlin generator."""
         super().__init__()
@@ -54,9 +58,7 @@ class MicronautKotlinGenerator(BaseGenerator):
         }
         
         # Render pom.xml template
-        pom_content = self.render_template("micronaut/kotlin/pom.xml.j2", context)
-        with open(os.path.join(project_dir, "pom.xml"), "w") as f:
-            f.write(pom_content)
+        self._emit(os.path.join(project_dir, "pom.xml"), "micronaut/kotlin/pom.xml.j2", context)
     
     def _generate_gradle_config(self, project_dir: str, config: Dict[str, Any]) -> None:
         """Generate Gradle configuration (build.gradle.kts).
@@ -79,14 +81,10 @@ class MicronautKotlinGenerator(BaseGenerator):
         }
         
         # Render build.gradle.kts template
-        build_gradle_content = self.render_template("micronaut/kotlin/build.gradle.kts.j2", context)
-        with open(os.path.join(project_dir, "build.gradle.kts"), "w") as f:
-            f.write(build_gradle_content)
+        self._emit(os.path.join(project_dir, "build.gradle.kts"), "micronaut/kotlin/build.gradle.kts.j2", context)
         
         # Render settings.gradle.kts template
-        settings_gradle_content = self.render_template("micronaut/kotlin/settings.gradle.kts.j2", context)
-        with open(os.path.join(project_dir, "settings.gradle.kts"), "w") as f:
-            f.write(settings_gradle_content)
+        self._emit(os.path.join(project_dir, "settings.gradle.kts"), "micronaut/kotlin/settings.gradle.kts.j2", context)
     
     def _generate_source_code(self, project_dir: str, config: Dict[str, Any]) -> None:
         """Generate source code files.
@@ -101,7 +99,7 @@ class MicronautKotlinGenerator(BaseGenerator):
         # Prepare source directories
         src_main_kotlin = os.path.join(project_dir, "src", "main", "kotlin")
         package_path = os.path.join(src_main_kotlin, *package_name.split("."))
-        os.makedirs(package_path, exist_ok=True)
+        self._ensure_dir(package_path)
         
         # Create subdirectories for different components
         controllers_dir = os.path.join(package_path, "controllers")
@@ -111,11 +109,11 @@ class MicronautKotlinGenerator(BaseGenerator):
         config_dir = os.path.join(package_path, "config")
         
         for directory in [controllers_dir, models_dir, repositories_dir, services_dir, config_dir]:
-            os.makedirs(directory, exist_ok=True)
+            self._ensure_dir(directory)
         
         # Create resources directory
         resources_dir = os.path.join(project_dir, "src", "main", "resources")
-        os.makedirs(resources_dir, exist_ok=True)
+        self._ensure_dir(resources_dir)
         
         # Generate application class
         self._generate_application_class(package_path, package_name, config)
@@ -148,9 +146,7 @@ class MicronautKotlinGenerator(BaseGenerator):
             "app_name": config.get("project_name", "app"),
         }
         
-        application_content = self.render_template("micronaut/kotlin/Application.kt.j2", context)
-        with open(os.path.join(package_path, "Application.kt"), "w") as f:
-            f.write(application_content)
+        self._emit(os.path.join(package_path, "Application.kt"), "micronaut/kotlin/Application.kt.j2", context)
     
     def _generate_model_classes(self, models_dir: str, package_name: str, config: Dict[str, Any]) -> None:
         """Generate model classes.
@@ -161,69 +157,58 @@ class MicronautKotlinGenerator(BaseGenerator):
             config: Project configuration dictionary
         """
         models_package = f"{package_name}.models"
-        entities = config.get("entities", [])
+        entities = self._get_entities(config)
         
         if not entities:
             # Generate sample entity if none provided
-            sample_entity = {
-                "name": "Sample",
-                "fields": [
-                    {"name": "id", "type": "Long", "annotations": ["@Id", "@GeneratedValue"]},
-                    {"name": "name", "type": "String", "annotations": ["@Column(nullable = false)"]},
-                    {"name": "description", "type": "String?", "annotations": []},
-                    {"name": "createdAt", "type": "Instant", "annotations": ["@Column(name = \"created_at\")"]},
-                ]
-            }
+            sample_entity = Entity("Sample", fields=(
+                Field("id", "Long", nullable=False, primary_key=True, annotations=("@Id", "@GeneratedValue")),
+                Field("name", "String", nullable=False, annotations=("@Column(nullable = false)",)),
+                Field("description", "String?"),
+                Field("createdAt", "Instant", column="created_at", annotations=("@Column(name = \"created_at\")",)),
+            ))
             
             context = {
                 "package": models_package,
-                "entity_name": sample_entity["name"],
-                "fields": sample_entity["fields"],
+                "entity_name": sample_entity.name,
+                "fields": sample_entity.fields,
                 "imports": ["java.time.Instant", "io.micronaut.data.annotation.*", "jakarta.persistence.*"],
             }
             
-            entity_content = self.render_template("micronaut/kotlin/Entity.kt.j2", context)
-            with open(os.path.join(models_dir, f"{sample_entity['name']}.kt"), "w") as f:
-                f.write(entity_content)
+            self._emit(os.path.join(models_dir, f"{sample_entity.name}.kt"), "micronaut/kotlin/Entity.kt.j2", context)
             
             # Create DTO for sample entity
             if "generate-dtos" in config.get("features", []):
                 dto_context = {
                     "package": models_package,
-                    "entity_name": sample_entity["name"],
-                    "fields": sample_entity["fields"],
+                    "entity_name": sample_entity.name,
+                    "fields": sample_entity.fields,
                     "imports": ["java.time.Instant", "io.micronaut.serde.annotation.Serdeable"],
                 }
                 
-                dto_content = self.render_template("micronaut/kotlin/DTO.kt.j2", dto_context)
-                with open(os.path.join(models_dir, f"{sample_entity['name']}DTO.kt"), "w") as f:
-                    f.write(dto_content)
+                self._emit(os.path.join(models_dir, f"{sample_entity.name}DTO.kt"), "micronaut/kotlin/DTO.kt.j2", dto_context)
         else:
             # Generate entities from configuration
-            for entity in entities:
+            for entity in self._iter_entities(entities):
                 context = {
                     "package": models_package,
-                    "entity_name": entity["name"],
-                    "fields": entity["fields"],
-                    "imports": self._get_imports_for_kotlin_entity(entity["fields"], is_micronaut=True),
+                    "entity_name": entity.name,
+                    "fields": entity.fields,
+                    "imports": self._get_imports_for_kotlin_entity(entity.fields, is_micronaut=True),
                 }
                 
-                entity_content = self.render_template("micronaut/kotlin/Entity.kt.j2", context)
-                with open(os.path.join(models_dir, f"{entity['name']}.kt"), "w") as f:
-                    f.write(entity_content)
+                self._emit(os.path.join(models_dir, f"{entity.name}.kt"), "micronaut/kotlin/Entity.kt.j2", context)
                 
                 # Create DTOs if needed
                 if "generate-dtos" in config.get("features", []):
                     dto_context = {
                         "package": models_package,
-                        "entity_name": entity["name"],
-                        "fields": entity["fields"],
-                        "imports": self._get_imports_for_kotlin_dto(entity["fields"], is_micronaut=True),
+                        "entity_name": entity.name,
+                        "fields": entity.fields,
+                        "imports": self._get_imports_for_kotlin_dto(entity.fields, is_micronaut=True),
                     }
                     
-                    dto_content = self.render_template("micronaut/kotlin/DTO.kt.j2", dto_context)
-                    with open(os.path.join(models_dir, f"{entity['name']}DTO.kt"), "w") as f:
-                        f.write(dto_content)
+                    self._emit(os.path.join(models_dir, f"{entity.name}DTO.kt"), "micronaut/kotlin/DTO.kt.j2", dto_context)
     
     def _generate_controller_classes(self, controllers_dir: str, package_name: str, config: Dict[str, Any]) -> None:
         """Generate controller classes.
@@ -236,25 +221,23 @@ class MicronautKotlinGenerator(BaseGenerator):
         controllers_package = f"{package_name}.controllers"
         models_package = f"{package_name}.models"
         services_package = f"{package_name}.services"
-        entities = config.get("entities", [])
+        entities = self._get_entities(config)
         
         if not entities:
-            entities = [{"name": "Sample"}]
+            entities = [Entity("Sample")]
         
-        for entity in entities:
+        for entity in self._iter_entities(entities):
             context = {
                 "package": controllers_package,
                 "model_package": models_package,
                 "service_package": services_package,
-                "entity_name": entity["name"],
-                "entity_var": entity["name"][0].lower() + entity["name"][1:],
+                "entity_name": entity.name,
+                "entity_var": entity.var_name,
                 "use_dtos": "generate-dtos" in config.get("features", []),
-                "rest_base_path": entity["name"].lower() + "s"
+                "rest_base_path": entity.name.lower() + "s"
             }
             
-            controller_content = self.render_template("micronaut/kotlin/Controller.kt.j2", context)
-            with open(os.path.join(controllers_dir, f"{entity['name']}Controller.kt"), "w") as f:
-                f.write(controller_content)
+            self._emit(os.path.join(controllers_dir, f"{entity.name}Controller.kt"), "micronaut/kotlin/Controller.kt.j2", context)
     
     def _generate_service_classes(self, services_dir: str, package_name: str, config: Dict[str, Any]) -> None:
         """Generate service classes.
@@ -267,38 +250,34 @@ class MicronautKotlinGenerator(BaseGenerator):
         services_package = f"{package_name}.services"
         models_package = f"{package_name}.models"
         repositories_package = f"{package_name}.repositories"
-        entities = config.get("entities", [])
+        entities = self._get_entities(config)
         
         if not entities:
-            entities = [{"name": "Sample"}]
+            entities = [Entity("Sample")]
         
-        for entity in entities:
+        for entity in self._iter_entities(entities):
             # Generate service interface
             interface_context = {
                 "package": services_package,
                 "model_package": models_package,
-                "entity_name": entity["name"],
-                "entity_var": entity["name"][0].lower() + entity["name"][1:],
+                "entity_name": entity.name,
+                "entity_var": entity.var_name,
                 "use_dtos": "generate-dtos" in config.get("features", [])
             }
             
-            interface_content = self.render_template("micronaut/kotlin/Service.kt.j2", interface_context)
-            with open(os.path.join(services_dir, f"{entity['name']}Service.kt"), "w") as f:
-                f.write(interface_content)
+            self._emit(os.path.join(services_dir, f"{entity.name}Service.kt"), "micronaut/kotlin/Service.kt.j2", interface_context)
             
             # Generate service implementation
             impl_context = {
                 "package": services_package,
                 "model_package": models_package,
                 "repository_package": repositories_package,
-                "entity_name": entity["name"],
-                "entity_var": entity["name"][0].lower() + entity["name"][1:],
+                "entity_name": entity.name,
+                "entity_var": entity.var_name,
                 "use_dtos": "generate-dtos" in config.get("features", [])
             }
             
-            impl_content = self.render_template("micronaut/kotlin/ServiceImpl.kt.j2", impl_context)
-            with open(os.path.join(services_dir, f"{entity['name']}ServiceImpl.kt"), "w") as f:
-                f.write(impl_content)
+            self._emit(os.path.join(services_dir, f"{entity.name}ServiceImpl.kt"), "micronaut/kotlin/ServiceImpl.kt.j2", impl_context)
     
     def _generate_repository_interfaces(self, repositories_dir: str, package_name: str, config: Dict[str, Any]) -> None:
         """Generate repository interfaces.
@@ -310,31 +289,21 @@ class MicronautKotlinGenerator(BaseGenerator):
         """
         repositories_package = f"{package_name}.repositories"
         models_package = f"{package_name}.models"
-        entities = config.get("entities", [])
+        entities = self._get_entities(config)
         
         if not entities:
-            entities = [{"name": "Sample", "id_type": "Long"}]
-        
-        for entity in entities:
-            # Determine ID type
-            id_type = "Long"  # Default
-            if "fields" in entity:
-                id_field = next((f for f in entity["fields"] if f.get("name") == "id"), None)
-                if id_field:
-                    id_type = id_field.get("type", "Long")
-                    if id_type.endswith("?"):
-                        id_type = id_type[:-1]  # Remove nullable indicator
-            
+            entities = [Entity("Sample")]
+        
+        for entity in self._iter_entities(entities):
             context = {
                 "package": repositories_package,
                 "model_package": models_package,
-                "entity_name": entity["name"],
-                "id_type": entity.get("id_type", id_type)
+                "entity_name": entity.name,
+                "id_type": entity.id_type,
+                "finders": self._repository_finders(entity)
             }
             
-            repository_content = self.render_template("micronaut/kotlin/Repository.kt.j2", context)
-            with open(os.path.join(repositories_dir, f"{entity['name']}Repository.kt"), "w") as f:
-                f.write(repository_content)
+            self._emit(os.path.join(repositories_dir, f"{entity.name}Repository.kt"), "frameworks/micronaut/kotlin/repository/Repository.kt.j2", context)
     
     def _generate_application_config(self, resources_dir: str, config: Dict[str, Any]) -> None:
         """Generate application configuration files.
@@ -345,15 +314,11 @@ class MicronautKotlinGenerator(BaseGenerator):
         """
         # Generate application.yml
         context = {"config": config}
-        yaml_content = self.render_template("micronaut/kotlin/application.yml.j2", context)
-        with open(os.path.join(resources_dir, "application.yml"), "w") as f:
-            f.write(yaml_content)
+        self._emit(os.path.join(resources_dir, "application.yml"), "micronaut/kotlin/application.yml.j2", context)
         
         # Generate logback.xml
         if "logging" in config.get("features", []):
-            logback_content = self.render_template("micronaut/kotlin/logback.xml.j2", {})
-            with open(os.path.join(resources_dir, "logback.xml"), "w") as f:
-                f.write(logback_content)
+            self._emit(os.path.join(resources_dir, "logback.xml"), "micronaut/kotlin/logback.xml.j2", {})
     
     def _generate_tests(self, project_dir: str, config: Dict[str, Any]) -> None:
         """Generate test files.
@@ -368,7 +333,7 @@ class MicronautKotlinGenerator(BaseGenerator):
         # Prepare test directories
         src_test_kotlin = os.path.join(project_dir, "src", "test", "kotlin")
         test_package_path = os.path.join(src_test_kotlin, *package_name.split("."))
-        os.makedirs(test_package_path, exist_ok=True)
+        self._ensure_dir(test_package_path)
         
         # Create subdirectories for different test types
         controllers_test_dir = os.path.join(test_package_path, "controllers")
@@ -376,7 +341,7 @@ class MicronautKotlinGenerator(BaseGenerator):
         repositories_test_dir = os.path.join(test_package_path, "repositories")
         
         for directory in [controllers_test_dir, services_test_dir, repositories_test_dir]:
-            os.makedirs(directory, exist_ok=True)
+            self._ensure_dir(directory)
         
         # Generate application test
         context = {
@@ -384,61 +349,53 @@ class MicronautKotlinGenerator(BaseGenerator):
             "app_name": config.get("project_name", "app"),
         }
         
-        app_test_content = self.render_template("micronaut/kotlin/ApplicationTest.kt.j2", context)
-        with open(os.path.join(test_package_path, "ApplicationTest.kt"), "w") as f:
-            f.write(app_test_content)
+        self._emit(os.path.join(test_package_path, "ApplicationTest.kt"), "micronaut/kotlin/ApplicationTest.kt.j2", context)
         
         # Generate entity-specific tests
-        entities = config.get("entities", [])
+        entities = self._get_entities(config)
         if not entities:
-            entities = [{"name": "Sample"}]
+            entities = [Entity("Sample")]
         
-        for entity in entities:
+        for entity in self._iter_entities(entities):
             # Controller tests
             controller_test_context = {
                 "package": f"{package_name}.controllers",
                 "model_package": f"{package_name}.models",
                 "service_package": f"{package_name}.services",
-                "entity_name": entity["name"],
-                "entity_var": entity["name"][0].lower() + entity["name"][1:],
+                "entity_name": entity.name,
+                "entity_var": entity.var_name,
                 "use_dtos": "generate-dtos" in config.get("features", [])
             }
             
-            controller_test_content = self.render_template("micronaut/kotlin/ControllerTest.kt.j2", controller_test_context)
-            with open(os.path.join(controllers_test_dir, f"{entity['name']}ControllerTest.kt"), "w") as f:
-                f.write(controller_test_content)
+            self._emit(os.path.join(controllers_test_dir, f"{entity.name}ControllerTest.kt"), "micronaut/kotlin/ControllerTest.kt.j2", controller_test_context)
             
             # Service tests
             service_test_context = {
                 "package": f"{package_name}.services",
                 "model_package": f"{package_name}.models",
                 "repository_package": f"{package_name}.repositories",
-                "entity_name": entity["name"],
-                "entity_var": entity["name"][0].lower() + entity["name"][1:],
+                "entity_name": entity.name,
+                "entity_var": entity.var_name,
                 "use_dtos": "generate-dtos" in config.get("features", [])
             }
             
-            service_test_content = self.render_template("micronaut/kotlin/ServiceTest.kt.j2", service_test_context)
-            with open(os.path.join(services_test_dir, f"{entity['name']}ServiceTest.kt"), "w") as f:
-                f.write(service_test_content)
+            self._emit(os.path.join(services_test_dir, f"{entity.name}ServiceTest.kt"), "micronaut/kotlin/ServiceTest.kt.j2", service_test_context)
             
             # Repository tests
             repository_test_context = {
                 "package": f"{package_name}.repositories",
                 "model_package": f"{package_name}.models",
-                "entity_name": entity["name"],
-                "entity_var": entity["name"][0].lower() + entity["name"][1:]
+                "entity_name": entity.name,
+                "entity_var": entity.var_name
             }
             
-            repository_test_content = self.render_template("micronaut/kotlin/RepositoryTest.kt.j2", repository_test_context)
-            with open(os.path.join(repositories_test_dir, f"{entity['name']}RepositoryTest.kt"), "w") as f:
-                f.write(repository_test_content)
+            self._emit(os.path.join(repositories_test_dir, f"{entity.name}RepositoryTest.kt"), "micronaut/kotlin/RepositoryTest.kt.j2", repository_test_context)
     
-    def _get_imports_for_kotlin_entity(self, fields: List[Dict[str, Any]], is_micronaut: bool = False) -> List[str]:
+    def _get_imports_for_kotlin_entity(self, fields: Iterable[Field], is_micronaut: bool = False) -> List[str]:
         """Get the required imports for a Kotlin entity based on its field types.
         
         Args:
-            fields: List of field definitions
+            fields: Fields of the entity
             is_micronaut: Whether this is a Micronaut project
             
         Returns:
@@ -454,11 +411,7 @@ class MicronautKotlinGenerator(BaseGenerator):
             imports.add("jakarta.persistence.*")
         
         for field in fields:
-            field_type = field.get("type", "")
-            
-            # Remove nullable indicator for import checking
-            if field_type.endswith("?"):
-                field_type = field_type[:-1]
+            field_type = field.type
             
             if field_type in ["LocalDate", "LocalDateTime", "LocalTime"]:
                 imports.add(f"java.time.{field_type}")
@@ -475,18 +428,18 @@ class MicronautKotlinGenerator(BaseGenerator):
                 if inner_types:
                     for inner_type_group in inner_types:
                         for inner_type in inner_type_group:
-                            if inner_type and inner_type not in ["String", "Int", "Long", "Double", "Boolean", "Float", "Short", "Byte"]:
+                            if inner_type and not is_builtin_type(inner_type, "kotlin"):
                                 # This is a simplification; in a real app we'd need better type resolution
                                 if not inner_type.startswith("java.") and not inner_type.startswith("kotlin."):
                                     imports.add(inner_type)
         
         return sorted(list(imports))
     
-    def _get_imports_for_kotlin_dto(self, fields: List[Dict[str, Any]], is_micronaut: bool = False) -> List[str]:
+    def _get_imports_for_kotlin_dto(self, fields: Iterable[Field], is_micronaut: bool = False) -> List[str]:
         """Get the required imports for a Kotlin DTO based on its field types.
         
         Args:
-            fields: List of field definitions
+            fields: Fields of the entity
             is_micronaut: Whether this is a Micronaut project
             
         Returns:
@@ -501,11 +454,7 @@ class MicronautKotlinGenerator(BaseGenerator):
             imports.add("com.fasterxml.jackson.annotation.JsonProperty")
         
         for field in fields:
-            field_type = field.get("type", "")
-            
-            # Remove nullable indicator for import checking
-            if field_type.endswith("?"):
-                field_type = field_type[:-1]
+            field_type = field.type
             
             if field_type in ["LocalDate", "LocalDateTime", "LocalTime"]:
                 imports.add(f"java.time.{field_type}")
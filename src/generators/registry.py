@@ -0,0 +1,263 @@
+"""Registry of the generators of each framework and language.
+
+Generators are registered under a (framework, language) key, either as a
+class or factory or as a lazy ``"module:attribute"`` reference that is only
+imported when the generator is first used. Installed packages can add
+generators through the ``microgenesis.generators`` entry point group, with
+entry points named ``<framework>.<language>``::
+
+    [options.entry_points]
+    microgenesis.generators =
+        quarkus.java = my_package.quarkus:QuarkusJavaGenerator
+
+Entry points are only scanned when a key is not registered, and never
+replace the built-in generators.
+
+Generator instances are expensive to construct and keep the state of the
+generation they run, so the registry keeps a pool of idle instances per
+key and leases each one to a single generation at a time: a long-running
+process constructs a generator only when all the instances of its key are
+busy, i.e. as many as it runs generations of that key concurrently.
+"""
+
+import importlib
+import threading
+from contextlib import contextmanager
+from importlib import metadata
+from typing import Callable, Dict, Iterator, List, Optional, Tuple, Union
+
+from src.core.logging import get_logger
+from src.generators.base import BaseGenerator
+
+logger = get_logger()
+
+# Entry point group of generators provided by other packages
+ENTRY_POINT_GROUP = "microgenesis.generators"
+
+# Generators shipped with MicroGenesis
+BUILTIN_GENERATORS = {
+    ("spring-boot", "java"): "src.generators.spring_boot.java:SpringBootJavaGenerator",
+    ("spring-boot", "kotlin"): "src.generators.spring_boot.kotlin:SpringBootKotlinGenerator",
+    ("micronaut", "java"): "src.generators.micronaut.java:MicronautJavaGenerator",
+    ("micronaut", "kotlin"): "src.generators.micronaut.kotlin:MicronautKotlinGenerator",
+    ("graphql", "java"): "src.generators.graphql.java:GraphQLJavaGenerator",
+    ("graphql", "kotlin"): "src.generators.graphql.kotlin:GraphQLKotlinGenerator",
+}
+
+# Registry key: (framework, language)
+GeneratorKey = Tuple[str, str]
+
+# Generator class or factory, or a "module:attribute" reference to one
+GeneratorFactory = Union[str, Callable[[], BaseGenerator]]
+
+
+class UnknownGeneratorError(ValueError):
+    """Raised when no generator is registered for a framework and language."""
+
+
+class GeneratorRegistry:
+    """Thread-safe registry handing out reusable generator instances."""
+
+    def __init__(self, factories: Optional[Dict[GeneratorKey, GeneratorFactory]] = None,
+                 entry_point_group: Optional[str] = ENTRY_POINT_GROUP):
+        """Initialize the registry.
+
+        Args:
+            factories: Initial registrations by (framework, language)
+            entry_point_group: Entry point group scanned for generators of
+                unregistered keys (None to disable)
+        """
+        self._factories: Dict[GeneratorKey, GeneratorFactory] = dict(factories or {})
+        self._entry_point_group = entry_point_group
+        self._entry_points_loaded = entry_point_group is None
+        # Instances not leased at the moment, and the number created, by key
+        self._idle: Dict[GeneratorKey, List[BaseGenerator]] = {}
+        self._created: Dict[GeneratorKey, int] = {}
+        # Number of times each key was registered, to tell instances of replaced registrations
+        self._versions: Dict[GeneratorKey, int] = {}
+        self._lock = threading.Lock()
+
+    def register(self, framework: str, language: str, factory: GeneratorFactory) -> None:
+        """Register the generator of a framework and language.
+
+        Replaces any previous registration and drops its idle instances.
+
+        Args:
+            framework: Name of the framework (spring-boot, micronaut, etc.)
+            language: Name of the language (java, kotlin, etc.)
+            factory: Generator class or factory, or a "module:attribute"
+                reference to one
+        """
+        key = (framework, language)
+        with self._lock:
+            self._factories[key] = factory
+            self._versions[key] = self._versions.get(key, 0) + 1
+            self._idle.pop(key, None)
+
+    def is_registered(self, framework: str, language: str) -> bool:
+        """Check whether a generator is available for a framework and language.
+
+        Args:
+            framework: Name of the framework
+            language: Name of the language
+
+        Returns:
+            bool: True if a generator is registered or provided by an entry point
+        """
+        key = (framework, language)
+        with self._lock:
+            if key not in self._factories:
+                self._load_entry_points()
+            return key in self._factories
+
+    def available(self) -> List[GeneratorKey]:
+        """List the frameworks and languages that have a generator.
+
+        Returns:
+            List[GeneratorKey]: Sorted (framework, language) pairs
+        """
+        with self._lock:
+            self._load_entry_points()
+            return sorted(self._factories)
+
+    @contextmanager
+    def lease(self, framework: str, language: str) -> Iterator[BaseGenerator]:
+        """Borrow a generator for the duration of one generation.
+
+        An idle instance is reused when there is one; otherwise a new one is
+        created. The instance is returned to the pool afterwards, so it is
+        never used by two generations at the same time.
+
+        Args:
+            framework: Name of the framework
+            language: Name of the language
+
+        Yields:
+            BaseGenerator: Generator for the framework and language
+
+        Raises:
+            UnknownGeneratorError: If no generator is registered for them
+        """
+        key = (framework, language)
+        with self._lock:
+            factory = self._factory(key)
+            version = self._versions.get(key, 0)
+            idle = self._idle.get(key)
+            generator = idle.pop() if idle else None
+        if generator is None:
+            generator = self._create(key, factory)
+        try:
+            yield generator
+        finally:
+            with self._lock:
+                # Instances of a registration replaced in the meantime are dropped
+                if self._versions.get(key, 0) == version:
+                    self._idle.setdefault(key, []).append(generator)
+
+    def created(self, framework: str, language: str) -> int:
+        """Get the number of generator instances created for a key so far.
+
+        Args:
+            framework: Name of the framework
+            language: Name of the language
+
+        Returns:
+            int: Number of instances created
+        """
+        with self._lock:
+            return self._created.get((framework, language), 0)
+
+    def clear(self) -> None:
+        """Drop all idle generator instances."""
+        with self._lock:
+            self._idle.clear()
+
+    def _factory(self, key: GeneratorKey) -> GeneratorFactory:
+        """Get the factory of a key (the lock must be held).
+
+        Raises:
+            UnknownGeneratorError: If no generator is registered for the key
+        """
+        factory = self._factories.get(key)
+        if factory is None:
+            self._load_entry_points()
+            factory = self._factories.get(key)
+        if factory is None:
+            available = ", ".join(f"{f}/{l}" for f, l in sorted(self._factories))
+            raise UnknownGeneratorError(f"No generator found for {key[0]}/{key[1]} (available: {available})")
+        return factory
+
+    def _create(self, key: GeneratorKey, factory: GeneratorFactory) -> BaseGenerator:
+        """Create a generator instance, importing a lazy reference first.
+
+        Args:
+            key: (framework, language)
+            factory: Registered factory of the key
+
+        Returns:
+            BaseGenerator: New generator instance
+        """
+        if isinstance(factory, str):
+            module_name, _, attribute = factory.partition(":")
+            factory = getattr(importlib.import_module(module_name), attribute)
+        generator = factory()
+        with self._lock:
+            self._created[key] = self._created.get(key, 0) + 1
+        logger.debug(f"Created {type(generator).__name__} for {key[0]}/{key[1]}")
+        return generator
+
+    def _load_entry_points(self) -> None:
+        """Register the generators of the entry point group once (the lock must be held)."""
+        if self._entry_points_loaded:
+            return
+        self._entry_points_loaded = True
+        try:
+            entry_points = metadata.entry_points()
+            if hasattr(entry_points, "select"):
+                group = entry_points.select(group=self._entry_point_group)
+            else:
+                # Python < 3.10 returns a dictionary of groups
+                group = entry_points.get(self._entry_point_group, ())
+        except Exception as e:
+            logger.warning(f"Could not scan {self._entry_point_group} entry points: {e}")
+            return
+
+        for entry_point in group:
+            framework, _, language = entry_point.name.rpartition(".")
+            key = (framework, language)
+            if not framework or not language:
+                logger.warning(f"Ignoring generator entry point '{entry_point.name}': "
+                               f"expected a name like <framework>.<language>")
+            elif key in self._factories:
+                logger.debug(f"Ignoring entry point for already registered generator {framework}/{language}")
+            else:
+                self._factories[key] = entry_point.value
+
+
+_registry: Optional[GeneratorRegistry] = None
+_registry_lock = threading.Lock()
+
+
+def get_registry() -> GeneratorRegistry:
+    """Get the process-wide generator registry, with the built-in generators.
+
+    Returns:
+        GeneratorRegistry: The shared registry
+    """
+    global _registry
+    if _registry is None:
+        with _registry_lock:
+            if _registry is None:
+                _registry = GeneratorRegistry(BUILTIN_GENERATORS)
+    return _registry
+
+
+def register_generator(framework: str, language: str, factory: GeneratorFactory) -> None:
+    """Register a generator in the process-wide registry.
+
+    Args:
+        framework: Name of the framework
+        language: Name of the language
+        factory: Generator class or factory, or a "module:attribute" reference to one
+    """
+    get_registry().register(framework, language, factory)
@@ -1,21 +1,140 @@
 """DDL parser for generating entities from SQL schema."""
 
 import re
-from typing import Dict, List, Any, Tuple, Set, Optional
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, Iterable, List, Any, Tuple, Set, Optional
 from src.core.logging import get_logger
+from src.generators.schema.sql_lexer import (
+    find_closing_paren, is_alter_table, is_create_index, is_create_table, iter_file_statements,
+    parse_alter_table, parse_create_index, parse_create_table, parse_index_columns, split_statements,
+    split_top_level, tokenize
+)
+from src.generators.schema.schema_cache import SchemaCache, hash_file, hash_text
+from src.generators.schema.type_mapping import map_column_type
 
 logger = get_logger()
 
+# Table-level constraints inside CREATE TABLE (as opposed to column definitions)
+_PRIMARY_KEY_CONSTRAINT = re.compile(r'(?:CONSTRAINT\s+\S+\s+)?PRIMARY\s+KEY\b', re.IGNORECASE)
+_FOREIGN_KEY_CONSTRAINT = re.compile(r'(?:CONSTRAINT\s+\S+\s+)?FOREIGN\s+KEY\b', re.IGNORECASE)
+_INDEX_CONSTRAINT = re.compile(
+    r'(?:CONSTRAINT\s+\S+\s+)?UNIQUE\b|(?:FULLTEXT\s+|SPATIAL\s+)?(?:INDEX|KEY)\b', re.IGNORECASE
+)
+_OTHER_CONSTRAINT = re.compile(
+    r'(?:CONSTRAINT|UNIQUE|INDEX|KEY|CHECK|FULLTEXT|SPATIAL|EXCLUDE|PERIOD)\b', re.IGNORECASE
+)
+
+# Parts of column and constraint definitions
+_PAREN_CONTENT = re.compile(r'\((.*?)\)')
+_FK_COLUMN = re.compile(r'FOREIGN\s+KEY\s*\(\s*[`"]?(\w+)[`"]?\s*\)', re.IGNORECASE)
+_REF_TABLE = re.compile(r'REFERENCES\s+(?:[`"]?\w+[`"]?\s*\.\s*)*[`"]?(\w+)[`"]?', re.IGNORECASE)
+_REF_COLUMN = re.compile(
+    r'REFERENCES\s+(?:[`"]?\w+[`"]?\s*\.\s*)*[`"]?\w+[`"]?\s*\(\s*[`"]?(\w+)[`"]?\s*\)', re.IGNORECASE
+)
+_COLUMN_DEFINITION = re.compile(r'[`"]?(\w+)[`"]?\s+(?=\w)', re.IGNORECASE)
+_NOT_NULL = re.compile(r'NOT\s+NULL', re.IGNORECASE)
+_DEFAULT = re.compile(r'DEFAULT\s+([^,]+)', re.IGNORECASE)
+_INLINE_PRIMARY_KEY = re.compile(r'\bPRIMARY\s+KEY\b', re.IGNORECASE)
+_INLINE_UNIQUE = re.compile(r'\bUNIQUE\b', re.IGNORECASE)
+
+# Words ending the type of a column definition (e.g. "timestamp with time zone not null")
+_COLUMN_CONSTRAINT_KEYWORDS = {
+    "NOT", "NULL", "DEFAULT", "PRIMARY", "UNIQUE", "REFERENCES", "CHECK", "COLLATE", "CONSTRAINT",
+    "AUTO_INCREMENT", "AUTOINCREMENT", "IDENTITY", "GENERATED", "COMMENT", "CHARSET", "AS", "ON", "KEY",
+}
+
+# Leading "ADD [COLUMN] [IF NOT EXISTS]" of an ALTER TABLE action
+_ADD_ACTION = re.compile(r'ADD\s+(?:COLUMN\s+)?(?:IF\s+NOT\s+EXISTS\s+)?', re.IGNORECASE)
+
+# Words of an index definition that are neither its name nor a column
+_INDEX_KEYWORDS = {"INDEX", "KEY", "FULLTEXT", "SPATIAL", "CLUSTERED", "NONCLUSTERED", "USING", "BTREE", "HASH"}
+
+# Minimum number of CREATE TABLE statements worth starting worker processes for
+PARALLEL_MIN_TABLES = 200
+
+# Parser used by a worker process of a parallel parse
+_worker_parser = None
+
+
+def _init_parse_worker(dialect: str) -> None:
+    """Create the parser of a worker process.
+
+    Args:
+        dialect: SQL dialect of the parent parser
+    """
+    global _worker_parser
+    _worker_parser = DDLParser(dialect)
+
+
+def _parse_table_in_worker(statement: str) -> Optional[Dict[str, Any]]:
+    """Parse a CREATE TABLE statement in a worker process.
+
+    Args:
+        statement: SQL statement
+
+    Returns:
+        Optional[Dict[str, Any]]: Table definition without relationships
+    """
+    return _worker_parser._parse_create_table(statement)
+
+
+def _column_type(definition: str, start: int, dialect: str = "generic") -> str:
+    """Read the type of a column definition.
+
+    The type runs up to the first column constraint outside of parentheses,
+    so multi-word types ("double precision", "timestamp with time zone"),
+    arrays ("int[]") and modifiers ("integer unsigned") are kept whole.
+
+    Args:
+        definition: Column definition
+        start: Offset of the type in the definition
+        dialect: SQL dialect of the definition
+
+    Returns:
+        str: Type with single spaces between its words
+    """
+    depth = 0
+    end = start
+    tokens = list(tokenize(definition[start:], dialect))
+    for position, token in enumerate(tokens):
+        if depth == 0 and token.kind == "word":
+            keyword = token.upper
+            if keyword in _COLUMN_CONSTRAINT_KEYWORDS:
+                break
+            if keyword == "CHARACTER" and position + 1 < len(tokens) and tokens[position + 1].upper == "SET":
+                break
+        if token.value == "(":
+            depth += 1
+        elif token.value == ")":
+            depth -= 1
+        end = start + token.end
+    return " ".join(definition[start:end].split())
+
+
 class DDLParser:
     """Parser for SQL DDL scripts to generate entity models."""
     
-    def __init__(self):
-        """Initialize the DDL parser."""
+    def __init__(self, dialect: str = "generic", jobs: int = 1, cache: Optional[SchemaCache] = None):
+        """Initialize the DDL parser.
+        
+        Args:
+            dialect: SQL dialect used to split statements (see sql_lexer.DIALECTS)
+            jobs: Number of worker processes used to parse table definitions
+            cache: Optional cache of parsed schemas consulted before parsing
+        """
         self.logger = get_logger()
+        self.dialect = dialect
+        self.jobs = jobs
+        self.cache = cache
         
     def parse_ddl_file(self, ddl_file_path: str) -> List[Dict[str, Any]]:
         """Parse a DDL file and extract table definitions.
         
+        The file is streamed in chunks and split one statement at a time;
+        INSERT/REPLACE statements and COPY data blocks are skipped without
+        being materialized, so complete schema dumps (including table data
+        and ``.sql.gz`` files) can be parsed directly.
+        
         Args:
             ddl_file_path: Path to the DDL file
             
@@ -23,9 +142,18 @@ class DDLParser:
             List[Dict[str, Any]]: List of table definitions
         """
         try:
-            with open(ddl_file_path, 'r') as f:
-                ddl_content = f.read()
-            return self.parse_ddl(ddl_content)
+            key = None
+            if self.cache is not None and self.cache.enabled:
+                key = self.cache.make_key(hash_file(ddl_file_path), self.dialect)
+                tables = self.cache.get(key)
+                if tables is not None:
+                    self.logger.debug(f"Using cached schema for {ddl_file_path}")
+                    return tables
+            
+            tables = self.parse_statements(iter_file_statements(ddl_file_path, self.dialect, skip_data=True))
+            if key is not None:
+                self.cache.put(key, tables)
+            return tables
         except Exception as e:
             self.logger.error(f"Error parsing DDL file {ddl_file_path}: {e}")
             return []
@@ -39,37 +167,100 @@ class DDLParser:
         Returns:
             List[Dict[str, Any]]: List of table definitions
         """
-        tables = []
+        key = None
+        if self.cache is not None and self.cache.enabled:
+            key = self.cache.make_key(hash_text(ddl_content), self.dialect)
+            tables = self.cache.get(key)
+            if tables is not None:
+                return tables
+        
+        tables = self.parse_statements(split_statements(ddl_content, self.dialect, skip_data=True))
+        if key is not None:
+            self.cache.put(key, tables)
+        return tables
+    
+    def parse_statements(self, statements: Iterable[str]) -> List[Dict[str, Any]]:
+        """Extract table definitions from SQL statements.
         
-        # Extract CREATE TABLE statements
-        table_pattern = r"CREATE\s+TABLE\s+(?:IF\s+NOT\s+EXISTS\s+)?[`\"]?(\w+)[`\"]?\s*\(([\s\S]*?)\)[\s\S]*?(?:;|$)"
-        table_matches = re.finditer(table_pattern, ddl_content, re.IGNORECASE)
+        Statements that don't define tables, keys or indexes are ignored, so
+        the statements of a complete schema dump can be passed in as they are
+        split. ALTER TABLE and CREATE INDEX statements are applied once all
+        tables are known, so they may appear anywhere in the script.
         
-        # Process each table definition
-        for table_match in table_matches:
-            table_name = table_match.group(1)
-            columns_content = table_match.group(2)
-            
-            # Extract columns and constraints
-            columns, primary_keys, foreign_keys = self._parse_columns_and_constraints(columns_content)
-            
-            table = {
-                'name': table_name,
-                'className': self._to_camel_case(table_name),
-                'columns': columns,
-                'primaryKey': primary_keys,
-                'foreignKeys': foreign_keys,
-                'relationships': []
-            }
+        With more than one job, large schemas have their table definitions
+        parsed in worker processes. Results keep the statement order, and
+        relationships are resolved afterwards in this process, so the output
+        is identical to a serial parse.
+        
+        Args:
+            statements: SQL statements (e.g. from sql_lexer.iter_statements)
             
-            tables.append(table)
+        Returns:
+            List[Dict[str, Any]]: List of table definitions
+        """
+        parsed = []
+        table_statements = []
+        deferred = []
+        for statement in statements:
+            if is_create_table(statement):
+                if self.jobs > 1:
+                    table_statements.append(statement)
+                else:
+                    parsed.append(self._parse_create_table(statement))
+            elif is_alter_table(statement) or is_create_index(statement):
+                deferred.append(statement)
+        
+        if len(table_statements) >= PARALLEL_MIN_TABLES:
+            chunksize = max(1, len(table_statements) // (self.jobs * 4))
+            with ProcessPoolExecutor(max_workers=self.jobs, initializer=_init_parse_worker,
+                                     initargs=(self.dialect,)) as executor:
+                parsed = list(executor.map(_parse_table_in_worker, table_statements, chunksize=chunksize))
+        else:
+            parsed.extend(self._parse_create_table(statement) for statement in table_statements)
+        
+        tables = [table for table in parsed if table is not None]
+        
+        # Keys and indexes declared after the tables (ALTER TABLE, CREATE INDEX)
+        self._apply_deferred_statements(tables, deferred)
         
         # Process relationships after all tables are parsed
         self._process_relationships(tables)
         
         return tables
     
-    def _parse_columns_and_constraints(self, columns_content: str) -> Tuple[List[Dict[str, Any]], List[str], List[Dict[str, Any]]]:
+    def _parse_create_table(self, statement: str) -> Optional[Dict[str, Any]]:
+        """Parse a single CREATE TABLE statement.
+        
+        Args:
+            statement: SQL statement
+            
+        Returns:
+            Optional[Dict[str, Any]]: Table definition, or None if the statement
+                does not create a table
+        """
+        parsed = parse_create_table(statement, self.dialect)
+        if parsed is None:
+            return None
+        
+        table_name, columns_content = parsed
+        
+        # Extract columns and constraints
+        columns, primary_keys, foreign_keys, indexes = self._parse_columns_and_constraints(columns_content)
+        
+        table = {
+            'name': table_name,
+            'className': self._to_camel_case(table_name),
+            'columns': columns,
+            'primaryKey': primary_keys,
+            'foreignKeys': foreign_keys,
+            'indexes': [],
+            'relationships': []
+        }
+        for index in indexes:
+            self._add_index(table, index)
+        return table
+    
+    def _parse_columns_and_constraints(self, columns_content: str) -> Tuple[List[Dict[str, Any]], List[str], List[Dict[str, Any]], List[Dict[str, Any]]]:
         """Parse columns and constraints from a table definition.
         
         Args:
@@ -80,13 +271,15 @@ class DDLParser:
             - List of column definitions
             - List of primary key column names
             - List of foreign key definitions
+            - List of index definitions (unique constraints and indexes)
         """
         columns = []
         primary_keys = []
         foreign_keys = []
+        indexes = []
         
-        # Split by commas, but handle parentheses properly
-        lines = self._split_preserving_parentheses(columns_content)
+        # Split by commas, but handle parentheses and quotes properly
+        lines = split_top_level(columns_content, self.dialect)
         
         for line in lines:
             line = line.strip()
@@ -96,8 +289,8 @@ class DDLParser:
                 continue
             
             # Primary Key constraint
-            if re.search(r'PRIMARY\s+KEY', line, re.IGNORECASE):
-                pk_cols = re.search(r'\((.*?)\)', line)
+            if _PRIMARY_KEY_CONSTRAINT.match(line):
+                pk_cols = _PAREN_CONTENT.search(line)
                 if pk_cols:
                     pk_cols = pk_cols.group(1)
                     for col in pk_cols.split(','):
@@ -105,10 +298,10 @@ class DDLParser:
                         primary_keys.append(col)
             
             # Foreign Key constraint
-            elif re.search(r'FOREIGN\s+KEY', line, re.IGNORECASE):
-                fk_col = re.search(r'FOREIGN\s+KEY\s*\(\s*[`"]?(\w+)[`"]?\s*\)', line, re.IGNORECASE)
-                ref_table = re.search(r'REFERENCES\s+[`"]?(\w+)[`"]?', line, re.IGNORECASE)
-                ref_col = re.search(r'REFERENCES\s+[`"]?\w+[`"]?\s*\(\s*[`"]?(\w+)[`"]?\s*\)', line, re.IGNORECASE)
+            elif _FOREIGN_KEY_CONSTRAINT.match(line):
+                fk_col = _FK_COLUMN.search(line)
+                ref_table = _REF_TABLE.search(line)
+                ref_col = _REF_COLUMN.search(line)
                 
                 if fk_col and ref_table and ref_col:
                     foreign_key = {
@@ -118,16 +311,22 @@ class DDLParser:
                     }
                     foreign_keys.append(foreign_key)
             
+            # Unique constraint or (MySQL) index
+            elif _INDEX_CONSTRAINT.match(line):
+                index = self._parse_index_definition(line)
+                if index is not None:
+                    indexes.append(index)
+            
             # Regular column definition
-            elif not re.search(r'CONSTRAINT|INDEX|KEY', line, re.IGNORECASE):
-                col_def = re.search(r'[`"]?(\w+)[`"]?\s+(\w+(?:\s*\(\s*\d+\s*(?:,\s*\d+\s*)?\))?)', line, re.IGNORECASE)
+            elif not _OTHER_CONSTRAINT.match(line):
+                col_def = _COLUMN_DEFINITION.search(line)
                 if col_def:
                     col_name = col_def.group(1)
-                    col_type = col_def.group(2)
+                    col_type = _column_type(line, col_def.end(), self.dialect)
                     
                     # Check for NOT NULL and DEFAULT
-                    nullable = not bool(re.search(r'NOT\s+NULL', line, re.IGNORECASE))
-                    default_match = re.search(r'DEFAULT\s+([^,]+)', line, re.IGNORECASE)
+                    nullable = not bool(_NOT_NULL.search(line))
+                    default_match = _DEFAULT.search(line)
                     default_value = default_match.group(1).strip() if default_match else None
                     
                     columns.append({
@@ -137,8 +336,164 @@ class DDLParser:
                         'nullable': nullable,
                         'default': default_value
                     })
+                    
+                    # Inline primary key (e.g. "id INT AUTO_INCREMENT PRIMARY KEY")
+                    if _INLINE_PRIMARY_KEY.search(line):
+                        primary_keys.append(col_name)
+                    elif _INLINE_UNIQUE.search(line):
+                        indexes.append({'name': None, 'columns': [col_name], 'unique': True})
         
-        return columns, primary_keys, foreign_keys
+        return columns, primary_keys, foreign_keys, indexes
+    
+    def _parse_index_definition(self, definition: str) -> Optional[Dict[str, Any]]:
+        """Parse a UNIQUE constraint or index definition of a table.
+        
+        Args:
+            definition: Definition such as "CONSTRAINT uq UNIQUE (email)" or
+                "KEY idx_name (last_name, first_name)"
+            
+        Returns:
+            Optional[Dict[str, Any]]: Index with name, columns and unique flag,
+                or None if it doesn't index plain columns
+        """
+        tokens = []
+        for token in tokenize(definition, self.dialect):
+            tokens.append(token)
+            if token.value == "(":
+                break
+        
+        name = None
+        unique = False
+        position = 0
+        if len(tokens) > 1 and tokens[0].upper == "CONSTRAINT":
+            name = tokens[1].name
+            position = 2
+        
+        while position < len(tokens) and tokens[position].value != "(":
+            token = tokens[position]
+            if token.upper == "UNIQUE":
+                unique = True
+            elif token.kind in ("word", "ident") and token.upper not in _INDEX_KEYWORDS:
+                name = token.name
+            position += 1
+        
+        if position >= len(tokens):
+            return None
+        open_pos = tokens[position].start
+        close_pos = find_closing_paren(definition, open_pos, self.dialect)
+        if close_pos is None:
+            return None
+        
+        columns = parse_index_columns(definition[open_pos + 1:close_pos], self.dialect)
+        if not columns:
+            return None
+        return {'name': name, 'columns': columns, 'unique': unique}
+    
+    def _apply_deferred_statements(self, tables: List[Dict[str, Any]], statements: List[str]) -> None:
+        """Apply ALTER TABLE and CREATE INDEX statements to parsed tables.
+        
+        Tables and columns are looked up case-insensitively, since schema
+        dumps often spell names differently in trailing statements.
+        
+        Args:
+            tables: List of table definitions (modified in place)
+            statements: ALTER TABLE and CREATE INDEX statements, in script order
+        """
+        if not statements:
+            return
+        
+        table_index = {table['name'].lower(): table for table in tables}
+        
+        for statement in statements:
+            index = parse_create_index(statement, self.dialect)
+            if index is not None:
+                table = table_index.get(index.pop('table').lower())
+                if table is not None:
+                    self._add_index(table, index)
+                continue
+            
+            altered = parse_alter_table(statement, self.dialect)
+            if altered is None:
+                continue
+            table_name, actions = altered
+            table = table_index.get(table_name.lower())
+            if table is None:
+                self.logger.debug(f"Ignoring ALTER TABLE of unknown table {table_name}")
+                continue
+            
+            for action in actions:
+                add = _ADD_ACTION.match(action)
+                if add:
+                    self._apply_table_definitions(table, action[add.end():])
+    
+    def _apply_table_definitions(self, table: Dict[str, Any], definitions: str) -> None:
+        """Add columns, keys and indexes to an already parsed table.
+        
+        Args:
+            table: Table definition (modified in place)
+            definitions: Column or constraint definitions, as in a CREATE TABLE body
+        """
+        columns, primary_keys, foreign_keys, indexes = self._parse_columns_and_constraints(definitions)
+        
+        known = {column['name'].lower() for column in table['columns']}
+        for column in columns:
+            if column['name'].lower() not in known:
+                table['columns'].append(column)
+                known.add(column['name'].lower())
+        
+        for column in self._resolve_columns(table, primary_keys):
+            if column not in table['primaryKey']:
+                table['primaryKey'].append(column)
+        
+        existing = {(fk['column'].lower(), fk['referencedTable'].lower()) for fk in table['foreignKeys']}
+        for fk in foreign_keys:
+            fk['column'] = self._resolve_columns(table, [fk['column']])[0]
+            if (fk['column'].lower(), fk['referencedTable'].lower()) not in existing:
+                table['foreignKeys'].append(fk)
+                existing.add((fk['column'].lower(), fk['referencedTable'].lower()))
+        
+        for index in indexes:
+            self._add_index(table, index)
+    
+    def _resolve_columns(self, table: Dict[str, Any], names: List[str]) -> List[str]:
+        """Map column names to the spelling used in the table definition.
+        
+        Args:
+            table: Table definition
+            names: Column names in any case
+            
+        Returns:
+            List[str]: Declared column names (unknown names are kept as given)
+        """
+        declared = {column['name'].lower(): column['name'] for column in table['columns']}
+        return [declared.get(name.lower(), name) for name in names]
+    
+    def _add_index(self, table: Dict[str, Any], index: Dict[str, Any]) -> None:
+        """Attach an index to a table, with the entity fields it covers.
+        
+        Indexes on exactly the primary key and duplicates are skipped. Every
+        index records the finder method name generators can use to look
+        entities up through it (e.g. "findByLastNameAndFirstName").
+        
+        Args:
+            table: Table definition (modified in place)
+            index: Index with name, columns and unique flag
+        """
+        columns = self._resolve_columns(table, index['columns'])
+        if columns == table['primaryKey']:
+            return
+        for existing in table['indexes']:
+            if existing['columns'] == columns:
+                existing['unique'] = existing['unique'] or index['unique']
+                return
+        
+        table['indexes'].append({
+            'name': index['name'],
+            'columns': columns,
+            'unique': index['unique'],
+            'fieldNames': [self._to_camel_case(column, False) for column in columns],
+            'finder': 'findBy' + 'And'.join(self._to_camel_case(column) for column in columns)
+        })
     
     def _process_relationships(self, tables: List[Dict[str, Any]]) -> None:
         """Process relationships between tables based on foreign keys.
@@ -236,43 +591,6 @@ class DDLParser:
         else:
             return components[0] + ''.join(x.title() for x in components[1:])
     
-    def _split_preserving_parentheses(self, text: str) -> List[str]:
-        """Split a string by commas while preserving content inside parentheses.
-        
-        Args:
-            text: String to split
-            
-        Returns:
-            List of strings
-        """
-        result = []
-        current = ""
-        paren_level = 0
-        
-        for char in text:
-            if char == '(' and not paren_level:
-                paren_level = 1
-                current += char
-            elif char == '(' and paren_level:
-                paren_level += 1
-                current += char
-            elif char == ')' and paren_level > 1:
-                paren_level -= 1
-                current += char
-            elif char == ')' and paren_level == 1:
-                paren_level = 0
-                current += char
-            elif char == ',' and not paren_level:
-                result.append(current)
-                current = ""
-            else:
-                current += char
-                
-        if current:
-            result.append(current)
-            
-        return result
-    
     def _map_sql_to_java_type(self, sql_type: str) -> str:
         """Map SQL data type to Java type.
         
@@ -282,29 +600,8 @@ class DDLParser:
         Returns:
             Corresponding Java type
         """
-        sql_type = sql_type.lower()
-        
-        if re.search(r'int|tinyint|smallint|mediumint', sql_type):
-            return 'Integer'
-        elif re.search(r'bigint', sql_type):
-            return 'Long'
-        elif re.search(r'decimal|numeric|float', sql_type):
-            return 'Double'
-        elif re.search(r'double', sql_type):
-            return 'Double'
-        elif re.search(r'boolean|bit', sql_type):
-            return 'Boolean'
-        elif re.search(r'date', sql_type):
-            return 'java.time.LocalDate'
-        elif re.search(r'time', sql_type):
-            return 'java.time.LocalTime'
-        elif re.search(r'datetime|timestamp', sql_type):
-            return 'java.time.LocalDateTime'
-        elif re.search(r'blob|binary', sql_type):
-            return 'byte[]'
-        else:
-            return 'String'  # Default for varchar, char, text, etc.
-    
+        return map_column_type(sql_type, "java", self.dialect)
+
     def generate_entities(self, tables: List[Dict[str, Any]], language: str, framework: str) -> Dict[str, str]:
         """Generate entity code from table definitions.
         
@@ -357,7 +654,16 @@ class DDLParser:
             imports.append("import java.util.List;")
             break
             
-        class_definition = f"@Entity\n@Table(name = \"{table['name']}\")\npublic class {table['className']} {{"
+        table_annotation = f"@Table(name = \"{table['name']}\")"
+        if table.get('indexes'):
+            index_annotations = []
+            for index in table['indexes']:
+                name = f"name = \"{index['name']}\", " if index['name'] else ""
+                unique = ", unique = true" if index['unique'] else ""
+                index_annotations.append(f"@Index({name}columnList = \"{', '.join(index['columns'])}\"{unique})")
+            table_annotation = f"@Table(name = \"{table['name']}\", indexes = {{\n    " + ",\n    ".join(index_annotations) + "\n})"
+        
+        class_definition = f"@Entity\n{table_annotation}\npublic class {table['className']} {{"
         
         fields = []
         for col in table['columns']:
@@ -435,25 +741,4 @@ class DDLParser:
         Returns:
             Corresponding Kotlin type
         """
-        sql_type = sql_type.lower()
-        
-        if re.search(r'int|tinyint|smallint|mediumint', sql_type):
-            return 'Int'
-        elif re.search(r'bigint', sql_type):
-            return 'Long'
-        elif re.search(r'decimal|numeric|float', sql_type):
-            return 'Double'
-        elif re.search(r'double', sql_type):
-            return 'Double'
-        elif re.search(r'boolean|bit', sql_type):
-            return 'Boolean'
-        elif re.search(r'date', sql_type):
-            return 'java.time.LocalDate'
-        elif re.search(r'time', sql_type):
-            return 'java.time.LocalTime'
-        elif re.search(r'datetime|timestamp', sql_type):
-            return 'java.time.LocalDateTime'
-        elif re.search(r'blob|binary', sql_type):
-            return 'ByteArray'
-        else:
-            return 'String'  # Default for varchar, char, text, etc.
+        return map_column_type(sql_type, "kotlin", self.dialect)
@@ -0,0 +1,772 @@
+"""Typed intermediate representation (IR) of the schema a project is generated from.
+
+Entities reach the generators from three sources with three shapes: tables
+parsed from DDL (``columns``/``className``/``foreignKeys``), entities defined
+in the UI or a configuration file (``fields``) and models of an OpenAPI
+definition (``properties``). They are normalized once per generation into
+the immutable records of this module, so generators and templates read the
+same attributes regardless of the source.
+
+Records use ``__slots__`` and hold tuples instead of lists, and every name
+and type string is interned: a schema with thousands of tables repeats the
+same few dozen column names and types, which are then stored only once.
+"""
+
+import re
+import sys
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from src.generators.schema.type_mapping import map_column_type, map_openapi_schema
+
+
+def _intern(value: Optional[str]) -> Optional[str]:
+    return sys.intern(value) if isinstance(value, str) else value
+
+
+def _lower_first(name: str) -> str:
+    return name[:1].lower() + name[1:]
+
+
+def _to_class_name(name: str) -> str:
+    return ''.join(word[:1].upper() + word[1:] for word in name.replace('-', '_').split('_') if word)
+
+
+def _to_field_name(name: str) -> str:
+    return _lower_first(_to_class_name(name))
+
+
+class Node:
+    """Base class of the IR records.
+
+    Records are immutable, compare and hash by value and pickle by their
+    constructor arguments, which must follow the order of ``__slots__``.
+    Slots whose names start with an underscore cache data derived from the
+    values; they are not constructor arguments and not part of the value.
+    """
+
+    __slots__ = ()
+
+    # Names of the value slots, in the order of __slots__
+    _fields: Tuple[str, ...] = ()
+
+    # Value slot setters bypassing __setattr__, in the order of _fields
+    _setters: Tuple[Any, ...] = ()
+
+    def __init_subclass__(cls, **kwargs: Any):
+        super().__init_subclass__(**kwargs)
+        cls._fields = tuple(name for name in cls.__slots__ if not name.startswith("_"))
+        cls._setters = tuple(cls.__dict__[name].__set__ for name in cls._fields)
+
+    def __init__(self, *values: Any):
+        for setter, value in zip(self._setters, values):
+            setter(self, value)
+
+    @classmethod
+    def _restore(cls, values: Tuple[Any, ...]) -> "Node":
+        """Create a record from attribute values that are already normalized.
+
+        Skips the normalization of the constructor (interning, tuples), e.g.
+        for records loaded from a snapshot.
+
+        Args:
+            values: Attribute values in the order of ``_fields``
+
+        Returns:
+            Node: The record
+
+        Raises:
+            TypeError: If the number of values does not match the attributes
+        """
+        if len(values) != len(cls._setters):
+            raise TypeError(f"{cls.__name__} takes {len(cls._setters)} values, got {len(values)}")
+        self = object.__new__(cls)
+        for setter, value in zip(cls._setters, values):
+            setter(self, value)
+        return self
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        raise AttributeError(f"{type(self).__name__} is immutable")
+
+    def __delattr__(self, name: str) -> None:
+        raise AttributeError(f"{type(self).__name__} is immutable")
+
+    def _values(self) -> Tuple[Any, ...]:
+        return tuple(getattr(self, name) for name in self._fields)
+
+    def __eq__(self, other: Any) -> bool:
+        return type(other) is type(self) and other._values() == self._values()
+
+    def __hash__(self) -> int:
+        return hash((type(self).__name__,) + self._values())
+
+    def __reduce__(self):
+        return type(self), self._values()
+
+    def __repr__(self) -> str:
+        values = ", ".join(f"{name}={getattr(self, name)!r}" for name in self._fields)
+        return f"{type(self).__name__}({values})"
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Get the record as plain dictionaries and lists.
+
+        Returns:
+            Dict[str, Any]: Record attributes
+        """
+        return {name: _plain(getattr(self, name)) for name in self._fields}
+
+
+def _plain(value: Any) -> Any:
+    if isinstance(value, Node):
+        return value.to_dict()
+    if isinstance(value, tuple):
+        return [_plain(item) for item in value]
+    return value
+
+
+class Field(Node):
+    """Attribute of an entity."""
+
+    __slots__ = ("name", "type", "column", "column_type", "nullable", "primary_key",
+                 "unique", "default", "format", "annotations")
+
+    def __init__(self, name: str, type: str = "String", column: Optional[str] = None,
+                 column_type: Optional[str] = None, nullable: bool = True, primary_key: bool = False,
+                 unique: bool = False, default: Optional[str] = None, format: Optional[str] = None,
+                 annotations: Tuple[str, ...] = ()):
+        """Initialize the field.
+
+        Args:
+            name: Field name in the generated code
+            type: Type in the target language
+            column: Database column name (None if not backed by a column)
+            column_type: Database column type as declared in the DDL
+            nullable: Whether the field may be null
+            primary_key: Whether the field is (part of) the primary key
+            unique: Whether values of the field are unique
+            default: Default value expression
+            format: OpenAPI format of the field (e.g. "email")
+            annotations: Annotations given with the entity definition
+        """
+        super().__init__(_intern(name), _intern(type), _intern(column or name), _intern(column_type),
+                         nullable, primary_key, unique, default, _intern(format), tuple(annotations))
+
+    @property
+    def required(self) -> bool:
+        """Whether the field must have a value."""
+        return not self.nullable
+
+
+class Relationship(Node):
+    """Association of an entity with another entity."""
+
+    __slots__ = ("kind", "target", "field_name", "join_column", "mapped_by",
+                 "join_table", "inverse_join_column", "bidirectional", "fetch")
+
+    def __init__(self, kind: str, target: str, field_name: str, join_column: Optional[str] = None,
+                 mapped_by: Optional[str] = None, join_table: Optional[str] = None,
+                 inverse_join_column: Optional[str] = None, bidirectional: bool = False,
+                 fetch: Optional[str] = None):
+        """Initialize the relationship.
+
+        Args:
+            kind: ManyToOne, OneToMany, OneToOne or ManyToMany
+            target: Class name of the related entity
+            field_name: Name of the field holding the related entity
+            join_column: Foreign key column of the owning side
+            mapped_by: Field of the owning side (inverse side only)
+            join_table: Junction table of a ManyToMany relationship
+            inverse_join_column: Column of the junction table referencing the target
+            bidirectional: Whether the target navigates back to the entity
+            fetch: Fetch type (EAGER or LAZY), if specified
+        """
+        super().__init__(_intern(kind), _intern(target), _intern(field_name), _intern(join_column),
+                         _intern(mapped_by), _intern(join_table), _intern(inverse_join_column),
+                         bidirectional, fetch)
+
+
+class Index(Node):
+    """Database index of an entity."""
+
+    __slots__ = ("name", "columns", "fields", "unique", "finder")
+
+    def __init__(self, name: Optional[str], columns: Iterable[str], fields: Iterable[str],
+                 unique: bool = False, finder: Optional[str] = None):
+        """Initialize the index.
+
+        Args:
+            name: Index name (None if unnamed)
+            columns: Indexed columns
+            fields: Entity fields of the indexed columns
+            unique: Whether the index is unique
+            finder: Repository finder method using the index
+        """
+        super().__init__(name, tuple(_intern(c) for c in columns), tuple(_intern(f) for f in fields),
+                         unique, finder)
+
+
+class Entity(Node):
+    """Entity (or data transfer object) with its fields and associations."""
+
+    __slots__ = ("name", "table", "fields", "relationships", "indexes", "kind", "junction")
+
+    def __init__(self, name: str, table: Optional[str] = None, fields: Iterable[Field] = (),
+                 relationships: Iterable[Relationship] = (), indexes: Iterable[Index] = (),
+                 kind: str = "entity", junction: bool = False):
+        """Initialize the entity.
+
+        Args:
+            name: Class name
+            table: Table name (defaults to the lower-cased class name)
+            fields: Fields in declaration order
+            relationships: Associations with other entities
+            indexes: Database indexes
+            kind: "entity" or "dto"
+            junction: Whether the entity only links two other entities
+        """
+        super().__init__(_intern(name), _intern(table or name.lower()), tuple(fields),
+                         tuple(relationships), tuple(indexes), kind, junction)
+
+    @property
+    def var_name(self) -> str:
+        """Class name with a lower-case first letter (e.g. "orderItem")."""
+        return _lower_first(self.name)
+
+    @property
+    def primary_key(self) -> Tuple[Field, ...]:
+        """Fields of the primary key."""
+        return tuple(field for field in self.fields if field.primary_key)
+
+    @property
+    def id_field(self) -> Optional[Field]:
+        """Identifier field: the first primary key field, or a field named "id"."""
+        for field in self.fields:
+            if field.primary_key:
+                return field
+        return next((field for field in self.fields if field.name == "id"), None)
+
+    @property
+    def id_type(self) -> str:
+        """Type of the identifier field ("Long" if the entity has none)."""
+        id_field = self.id_field
+        return id_field.type if id_field is not None else "Long"
+
+    def field(self, name: str) -> Optional[Field]:
+        """Look a field up by name.
+
+        Args:
+            name: Field name
+
+        Returns:
+            Optional[Field]: The field, or None if the entity has no such field
+        """
+        return next((field for field in self.fields if field.name == name), None)
+
+
+class Parameter(Node):
+    """Parameter of an API endpoint."""
+
+    __slots__ = ("name", "type", "location", "required")
+
+    def __init__(self, name: str, type: str = "String", location: str = "query", required: bool = False):
+        """Initialize the parameter.
+
+        Args:
+            name: Parameter name
+            type: Type in the target language
+            location: path, query, header, cookie or body
+            required: Whether the parameter is mandatory
+        """
+        super().__init__(_intern(name), _intern(type), _intern(location), required)
+
+
+class Endpoint(Node):
+    """API operation."""
+
+    __slots__ = ("path", "method", "operation_id", "tags", "summary", "parameters", "response_type")
+
+    def __init__(self, path: str, method: str, operation_id: str = "", tags: Iterable[str] = ("Default",),
+                 summary: str = "", parameters: Iterable[Parameter] = (), response_type: str = "void"):
+        """Initialize the endpoint.
+
+        Args:
+            path: URL path template
+            method: Upper-case HTTP method
+            operation_id: Operation identifier (method name in generated code)
+            tags: Tags grouping the endpoint into controllers
+            summary: Short description
+            parameters: Parameters, including the request body
+            response_type: Type of the successful response in the target language
+        """
+        super().__init__(path, _intern(method.upper()), operation_id, tuple(_intern(t) for t in tags),
+                         summary, tuple(parameters), _intern(response_type))
+
+
+class EndpointIndex:
+    """Endpoints of a schema indexed by tag, referenced model and path prefix.
+
+    Built once per schema (see Schema.index), so generation phases look the
+    endpoints of a controller, a model or a resource up instead of grouping
+    the endpoint list again.
+    """
+
+    __slots__ = ("by_tag", "by_model", "by_path_prefix", "models_by_tag")
+
+    def __init__(self, endpoints: Iterable[Endpoint], entities: Iterable[Entity] = ()):
+        """Build the indexes.
+
+        Args:
+            endpoints: Endpoints to index
+            entities: Models the endpoints may reference
+        """
+        models = {entity.name: entity for entity in entities}
+        by_tag: Dict[str, List[Endpoint]] = {}
+        by_model: Dict[str, List[Endpoint]] = {}
+        by_path_prefix: Dict[str, List[Endpoint]] = {"/": []}
+        models_by_tag: Dict[str, Dict[str, Entity]] = {}
+
+        for endpoint in endpoints:
+            referenced = {}
+            for type_name in (endpoint.response_type,) + tuple(param.type for param in endpoint.parameters):
+                for name in _TYPE_NAME.findall(type_name):
+                    if name in models:
+                        referenced[name] = models[name]
+            for name in referenced:
+                by_model.setdefault(name, []).append(endpoint)
+            for tag in endpoint.tags:
+                by_tag.setdefault(tag, []).append(endpoint)
+                models_by_tag.setdefault(tag, {}).update(referenced)
+
+            by_path_prefix["/"].append(endpoint)
+            prefix = ""
+            for segment in endpoint.path.strip("/").split("/"):
+                if segment:
+                    prefix += "/" + segment
+                    by_path_prefix.setdefault(prefix, []).append(endpoint)
+
+        # Endpoints per key, in declaration order
+        self.by_tag: Dict[str, Tuple[Endpoint, ...]] = {tag: tuple(group) for tag, group in by_tag.items()}
+        self.by_model: Dict[str, Tuple[Endpoint, ...]] = {name: tuple(group) for name, group in by_model.items()}
+        self.by_path_prefix: Dict[str, Tuple[Endpoint, ...]] = {
+            prefix: tuple(group) for prefix, group in by_path_prefix.items()
+        }
+        # Models referenced by the endpoints of each tag, in order of first reference
+        self.models_by_tag: Dict[str, Tuple[Entity, ...]] = {
+            tag: tuple(referenced.values()) for tag, referenced in models_by_tag.items()
+        }
+
+    def endpoints_of_tag(self, tag: str) -> Tuple[Endpoint, ...]:
+        """Get the endpoints with a tag.
+
+        Args:
+            tag: Tag
+
+        Returns:
+            Tuple[Endpoint, ...]: Endpoints in declaration order
+        """
+        return self.by_tag.get(tag, ())
+
+    def endpoints_of_model(self, name: str) -> Tuple[Endpoint, ...]:
+        """Get the endpoints whose parameters or response reference a model.
+
+        Args:
+            name: Model class name
+
+        Returns:
+            Tuple[Endpoint, ...]: Endpoints in declaration order
+        """
+        return self.by_model.get(name, ())
+
+    def endpoints_under(self, prefix: str) -> Tuple[Endpoint, ...]:
+        """Get the endpoints whose path starts with a path prefix.
+
+        Args:
+            prefix: Whole path segments (e.g. "/users" matches "/users" and
+                "/users/{id}" but not "/users-admin")
+
+        Returns:
+            Tuple[Endpoint, ...]: Endpoints in declaration order
+        """
+        return self.by_path_prefix.get("/" + prefix.strip("/") if prefix.strip("/") else "/", ())
+
+
+class Schema(Node):
+    """Entities and endpoints of a project."""
+
+    __slots__ = ("entities", "endpoints", "language", "_index")
+
+    def __init__(self, entities: Iterable[Entity] = (), endpoints: Iterable[Endpoint] = (),
+                 language: str = "java"):
+        """Initialize the schema.
+
+        Args:
+            entities: Entities and DTOs
+            endpoints: API endpoints
+            language: Target language of all types in the schema
+        """
+        super().__init__(tuple(entities), tuple(endpoints), language)
+
+    def entity(self, name: str) -> Optional[Entity]:
+        """Look an entity up by class name.
+
+        Args:
+            name: Class name
+
+        Returns:
+            Optional[Entity]: The entity, or None if the schema has no such entity
+        """
+        return next((entity for entity in self.entities if entity.name == name), None)
+
+    def entities_of_kind(self, kind: str) -> Tuple[Entity, ...]:
+        """Get the entities of one kind.
+
+        Args:
+            kind: "entity" or "dto"
+
+        Returns:
+            Tuple[Entity, ...]: Entities of the kind in declaration order
+        """
+        return tuple(entity for entity in self.entities if entity.kind == kind)
+
+    @property
+    def index(self) -> EndpointIndex:
+        """Indexes of the endpoints, built on first use."""
+        try:
+            return self._index
+        except AttributeError:
+            index = EndpointIndex(self.endpoints, self.entities)
+            object.__setattr__(self, "_index", index)
+            return index
+
+    def endpoints_by_tag(self) -> Dict[str, Tuple[Endpoint, ...]]:
+        """Group the endpoints by tag.
+
+        Returns:
+            Dict[str, Tuple[Endpoint, ...]]: Endpoints per tag, in order of first appearance
+        """
+        return self.index.by_tag
+
+
+# Type names of entity definitions that differ between the target languages
+_DECLARED_TYPE_ALIASES = {
+    "java": {"Int": "Integer", "Any": "Object", "ByteArray": "byte[]", "DateTime": "LocalDateTime"},
+    "kotlin": {"Integer": "Int", "Object": "Any", "byte[]": "ByteArray", "DateTime": "LocalDateTime"},
+}
+
+# Type names within a (possibly generic) type
+_TYPE_NAME = re.compile(r"[A-Za-z_][\w.]*(?:\[\])?")
+
+
+def translate_type(type_name: str, language: str = "java") -> str:
+    """Translate a declared type, including its type arguments, to a target language.
+
+    Args:
+        type_name: Java or Kotlin type (e.g. "List<Integer>")
+        language: Target language
+
+    Returns:
+        str: Type in the target language (e.g. "List<Int>" for Kotlin)
+    """
+    aliases = _DECLARED_TYPE_ALIASES.get(language)
+    if not aliases:
+        return type_name
+    return _TYPE_NAME.sub(lambda match: aliases.get(match.group(0), match.group(0)), type_name)
+
+
+def entity_name(definition: Any) -> str:
+    """Get the class name of the entity a definition of any source becomes.
+
+    Args:
+        definition: Entity, parsed table, entity definition or OpenAPI model
+
+    Returns:
+        str: Class name of the entity
+    """
+    if isinstance(definition, Entity):
+        return definition.name
+    if 'columns' in definition:
+        return definition.get('className') or _to_class_name(definition['name'])
+    return definition['name']
+
+
+def entity_from_table(table: Dict[str, Any], language: str = "java", dialect: str = "generic") -> Entity:
+    """Build an entity from a table parsed by DDLParser.
+
+    Args:
+        table: Table definition
+        language: Target language of the field types
+        dialect: SQL dialect of the column types
+
+    Returns:
+        Entity: Entity of the table
+    """
+    primary_key = set(table.get('primaryKey', []))
+    unique = {index['columns'][0] for index in table.get('indexes', [])
+              if index.get('unique') and len(index['columns']) == 1}
+
+    fields = [
+        Field(
+            column.get('fieldName') or _to_field_name(column['name']),
+            map_column_type(column['type'], language, dialect),
+            column=column['name'],
+            column_type=column['type'],
+            nullable=column.get('nullable', True) and column['name'] not in primary_key,
+            primary_key=column['name'] in primary_key,
+            unique=column['name'] in unique,
+            default=column.get('default'),
+        )
+        for column in table.get('columns', [])
+    ]
+
+    relationships = []
+    for rel in table.get('relationships', []):
+        join_table = rel.get('joinTable') or {}
+        relationships.append(Relationship(
+            rel['type'], rel['targetEntity'], rel['fieldName'],
+            join_column=rel.get('joinColumn') or join_table.get('joinColumn'),
+            mapped_by=rel.get('mappedBy'),
+            join_table=join_table.get('name'),
+            inverse_join_column=join_table.get('inverseJoinColumn'),
+            bidirectional=rel['type'] != 'ManyToOne',
+        ))
+
+    indexes = [
+        Index(index.get('name'), index['columns'], index.get('fieldNames', ()),
+              index.get('unique', False), index.get('finder'))
+        for index in table.get('indexes', [])
+    ]
+
+    return Entity(entity_name(table), table['name'], fields,
+                  relationships, indexes, junction=table.get('isJunctionTable', False))
+
+
+def field_from_definition(field: Any, language: str = "java") -> Field:
+    """Build a field from an entity definition of the UI or a configuration file.
+
+    Args:
+        field: Field definition with name, type, required/nullable,
+            primaryKey, unique and annotations (a plain string is a field name)
+        language: Target language of the field type
+
+    Returns:
+        Field: The field
+    """
+    if isinstance(field, Field):
+        return field
+    if isinstance(field, str):
+        return Field(field)
+
+    field_type = field.get('type') or "String"
+    nullable = field.get('nullable', not field.get('required', False))
+    if field_type.endswith("?"):
+        field_type, nullable = field_type[:-1], True
+    field_type = translate_type(field_type, language)
+
+    return Field(
+        field['name'],
+        field_type,
+        column=field.get('column') or field.get('columnName'),
+        nullable=nullable,
+        primary_key=field.get('primaryKey', False),
+        unique=field.get('unique', False),
+        default=field.get('default'),
+        format=field.get('format') or None,
+        annotations=field.get('annotations', ()),
+    )
+
+
+def entity_from_definition(entity: Dict[str, Any], language: str = "java") -> Entity:
+    """Build an entity from a definition of the UI or a configuration file.
+
+    Args:
+        entity: Entity definition with name, tableName and fields
+        language: Target language of the field types
+
+    Returns:
+        Entity: The entity
+    """
+    return Entity(
+        entity['name'],
+        entity.get('tableName') or entity.get('table'),
+        [field_from_definition(field, language) for field in entity.get('fields', [])],
+        kind=entity.get('kind', "entity"),
+    )
+
+
+def entity_from_model(model: Dict[str, Any], language: str = "java") -> Entity:
+    """Build an entity or DTO from a model of an OpenAPI definition.
+
+    Args:
+        model: Model with name, type ("entity" or "dto"), properties (JSON
+            schemas by name, or a list of property descriptions) and required
+        language: Target language of the field types
+
+    Returns:
+        Entity: The entity or DTO
+    """
+    properties = model.get('properties') or {}
+    if isinstance(properties, dict):
+        properties = [dict(schema, name=name) for name, schema in properties.items()]
+    required = set(model.get('required', ()))
+
+    fields = [
+        Field(
+            prop['name'],
+            map_openapi_schema(prop, language, default="String"),
+            nullable=not (prop.get('required') or prop['name'] in required),
+            primary_key=prop['name'] == "id",
+            format=prop.get('format') or None,
+        )
+        for prop in properties
+    ]
+    return Entity(model['name'], fields=fields, kind=model.get('type', "dto"))
+
+
+def endpoint_from_dict(endpoint: Dict[str, Any], language: str = "java") -> Endpoint:
+    """Build an endpoint from an endpoint description of parse_openapi.
+
+    Args:
+        endpoint: Endpoint description
+        language: Target language of the parameter and response types
+
+    Returns:
+        Endpoint: The endpoint
+    """
+    parameters = []
+    for param in endpoint.get('parameters', []):
+        if 'type' in param:
+            param_type = param['type']
+        else:
+            param_type = map_openapi_schema(param.get('schema') or {}, language, default="String")
+        parameters.append(Parameter(param['name'], param_type, param.get('in', "query"),
+                                    param.get('required', False)))
+
+    response = endpoint.get('response') or {}
+    if 'type' in response:
+        response_type = response['type']
+    else:
+        response_type = map_openapi_schema(response.get('schema') or {}, language)
+    return Endpoint(
+        endpoint['path'],
+        endpoint['method'],
+        endpoint.get('operationId') or endpoint.get('operation_id') or "",
+        endpoint.get('tags') or ("Default",),
+        endpoint.get('summary', ""),
+        parameters,
+        response_type,
+    )
+
+
+def build_schema(entities: Iterable[Any] = (), language: str = "java", dialect: str = "generic",
+                 relationships: Iterable[Dict[str, Any]] = (), endpoints: Iterable[Any] = ()) -> Schema:
+    """Normalize entity and endpoint definitions of any source into a schema.
+
+    Args:
+        entities: Entities, parsed tables, entity definitions or OpenAPI models
+        language: Target language of all types
+        dialect: SQL dialect of parsed tables
+        relationships: Relationships defined separately from the entities
+            (sourceEntity, targetEntity, type, bidirectional, fetchType)
+        endpoints: Endpoints or endpoint descriptions
+
+    Returns:
+        Schema: The schema
+    """
+    built = []
+    for entity in entities:
+        if isinstance(entity, Entity):
+            built.append(entity)
+        elif 'columns' in entity:
+            built.append(entity_from_table(entity, language, dialect))
+        elif 'properties' in entity:
+            built.append(entity_from_model(entity, language))
+        else:
+            built.append(entity_from_definition(entity, language))
+
+    extra: Dict[str, List[Relationship]] = {}
+    for rel in relationships:
+        extra.setdefault(rel['sourceEntity'], []).append(Relationship(
+            rel['type'], rel['targetEntity'], _lower_first(rel['targetEntity']),
+            bidirectional=rel.get('bidirectional', False), fetch=rel.get('fetchType'),
+        ))
+    if extra:
+        built = [
+            Entity(e.name, e.table, e.fields, e.relationships + tuple(extra[e.name]), e.indexes, e.kind, e.junction)
+            if e.name in extra else e
+            for e in built
+        ]
+
+    return Schema(
+        built,
+        [e if isinstance(e, Endpoint) else endpoint_from_dict(e, language) for e in endpoints],
+        language,
+    )
+
+
+def schema_from_config(config: Dict[str, Any], language: str = "java", dialect: str = "generic") -> Schema:
+    """Build the schema of a project configuration.
+
+    Args:
+        config: Project configuration with ``entities`` (parsed tables or
+            entity definitions) and optionally ``relationships``
+        language: Target language of all types
+        dialect: SQL dialect of parsed tables
+
+    Returns:
+        Schema: The schema
+    """
+    return build_schema(config.get("entities") or (), language, dialect,
+                        relationships=config.get("relationships") or ())
+
+
+def schema_from_api_info(api_info: Dict[str, Any], language: str = "java") -> Schema:
+    """Build the schema of an OpenAPI definition parsed by parse_openapi.
+
+    Args:
+        api_info: Parsed API information with models and endpoints
+        language: Target language of all types
+
+    Returns:
+        Schema: Models (as entities and DTOs) and endpoints of the API
+    """
+    models = api_info.get("models", {})
+    return Schema(
+        [entity_from_model(dict(model, name=model.get('name', name)), language) for name, model in models.items()],
+        [endpoint_from_dict(endpoint, language) for endpoint in api_info.get("endpoints", [])],
+        language,
+    )
+
+
+def retarget_schema(schema: Schema, language: str, dialect: str = "generic") -> Schema:
+    """Translate the types of a schema to another target language.
+
+    Fields backed by a column are mapped again from their column type, all
+    other types are translated by name (see translate_type).
+
+    Args:
+        schema: Schema built for any target language
+        language: Target language of the returned schema
+        dialect: SQL dialect of the column types
+
+    Returns:
+        Schema: The schema itself if it already targets the language, else a translated copy
+    """
+    if schema.language == language:
+        return schema
+
+    def field(f: Field) -> Field:
+        field_type = (map_column_type(f.column_type, language, dialect) if f.column_type
+                      else translate_type(f.type, language))
+        return Field(f.name, field_type, f.column, f.column_type, f.nullable, f.primary_key,
+                     f.unique, f.default, f.format, f.annotations)
+
+    entities = [
+        Entity(e.name, e.table, [field(f) for f in e.fields], e.relationships, e.indexes, e.kind, e.junction)
+        for e in schema.entities
+    ]
+    endpoints = [
+        Endpoint(e.path, e.method, e.operation_id, e.tags, e.summary,
+                 [Parameter(p.name, translate_type(p.type, language), p.location, p.required) for p in e.parameters],
+                 translate_type(e.response_type, language))
+        for e in schema.endpoints
+    ]
+    return Schema(entities, endpoints, language)
@@ -0,0 +1,486 @@
+"""Parser of Swagger/OpenAPI definitions.
+
+Definitions are parsed into a language-neutral API description: models keep
+their JSON schemas and endpoints keep the schemas of their parameters and
+responses, so one parse serves generators of every target language (see
+``schema_from_api_info`` for the typed schema built from it).
+
+References, including references to other files of modular definitions,
+are resolved by ``RefResolver`` (see ``openapi_refs``).
+
+``OpenAPIParser`` memoizes parsed definitions per file and stat signature
+(path, modification time, size) of the definition and the files it
+references, so a definition used by several generation phases is read and
+parsed once. With a ``SchemaCache`` the parsed descriptions are also kept on
+disk, keyed by the content of the file.
+"""
+
+import os
+import re
+from typing import Any, Dict, Iterable, Iterator, List, Mapping, Optional, Tuple
+
+import yaml
+
+from src.core.logging import get_logger
+from src.generators.schema.openapi_refs import RefError, RefResolver, ref_name
+from src.generators.schema.schema_cache import SchemaCache, hash_file, hash_text
+from src.utils.yaml_loader import LazyMapping, gc_paused, load_document, load_document_lazily
+
+logger = get_logger()
+
+# Bump whenever the structure of parsed API descriptions changes
+OPENAPI_PARSER_VERSION = 3
+
+# Operations of a path item that become endpoints
+HTTP_METHODS = ("get", "post", "put", "delete", "patch")
+
+# Media type whose schemas describe request and response bodies
+JSON_MEDIA_TYPE = "application/json"
+
+# Levels of mappings loaded on demand: path items, component sections and components
+LAZY_LEVELS = {"paths": 1, "components": 2}
+
+# Indentation of the first content line of YAML text
+_CONTENT_LINE_PATTERN = re.compile(r"^( *)[^ \n#]", re.MULTILINE)
+
+# "$ref" keys of YAML block mappings, with their indentation
+_REF_KEY_PATTERN = re.compile(r"""\n( *)(?:\$ref|'\$ref'|"\$ref")[ \t]*:""")
+
+# Characters of scalar values that YAML text may spell differently
+_UNSTABLE_CHARACTERS_PATTERN = re.compile(r"[\s'\"]+")
+
+# Operations to parse: (tags, operation ids); None selects all operations
+Selection = Optional[Tuple[Tuple[str, ...], Tuple[str, ...]]]
+
+
+def load_openapi_document(path: str, lazy: bool = False) -> Mapping[str, Any]:
+    """Read a Swagger/OpenAPI definition file.
+
+    Args:
+        path: Path to a YAML (.yaml, .yml) or JSON definition
+        lazy: Load the path items and components of YAML definitions only
+            when they are accessed, so parsing a few operations of a large
+            definition does not load the others
+
+    Returns:
+        Mapping[str, Any]: The definition document (empty for an empty file)
+    """
+    if lazy:
+        return load_document_lazily(path, LAZY_LEVELS) or {}
+    return load_document(path) or {}
+
+
+def select_operations(tags: Optional[Iterable[str]] = None,
+                      operations: Optional[Iterable[str]] = None) -> Selection:
+    """Build the selection of the operations to parse.
+
+    Args:
+        tags: Tags of the operations to parse
+        operations: Operation ids of the operations to parse
+
+    Returns:
+        Selection: Operations having one of the tags or one of the operation
+            ids, or None (all operations) if neither is given
+    """
+    tags = tuple(sorted({tag for tag in tags or () if tag}))
+    operations = tuple(sorted({operation for operation in operations or () if operation}))
+    return (tags, operations) if tags or operations else None
+
+
+def parse_openapi(document: Mapping[str, Any], path: Optional[str] = None,
+                  resolver: Optional[RefResolver] = None, selection: Selection = None) -> Dict[str, Any]:
+    """Extract the models and endpoints of a Swagger/OpenAPI definition.
+
+    References are resolved with a ``RefResolver``: path items, parameters,
+    request bodies and responses may be references to local components or
+    to other files, and schemas defined in other files become models like
+    the ones of ``components/schemas``.
+
+    With a selection, only the selected operations and the models their
+    schemas reference (directly or through other models) are parsed.
+
+    Args:
+        document: Definition document
+        path: File of the document, against which relative file references
+            are resolved
+        resolver: Resolver to use (defaults to a new one for the document)
+        selection: Operations to parse (see select_operations; all if None)
+
+    Returns:
+        Dict[str, Any]: API description with ``info``, ``models`` (by name,
+            with type "entity" or "dto", properties and required) and
+            ``endpoints`` (path, upper-case method, operationId, tags,
+            summary, description, parameters and response, each with its
+            JSON schema)
+
+    Raises:
+        RefError: If a reference cannot be resolved or is circular
+    """
+    resolver = resolver or RefResolver(document, path)
+    models: Dict[str, Dict[str, Any]] = {}
+    # Schemas whose references still have to be scanned for models not parsed yet
+    pending: List[Tuple[Any, str]] = []
+
+    if selection is None:
+        for name, schema in ((document.get("components") or {}).get("schemas") or {}).items():
+            models[name] = _parse_model(resolver, name, schema, resolver.root)
+            pending.append((schema, resolver.root))
+
+    endpoints = []
+    paths = document.get("paths") or {}
+    for url in paths:
+        if not _may_be_selected(paths, url, selection):
+            continue
+        path_item, base = resolver.resolve(paths[url] or {})
+        shared_parameters = path_item.get("parameters") or []
+        for method in HTTP_METHODS:
+            operation = path_item.get(method)
+            if operation is not None and _is_selected(operation, selection):
+                endpoint, schemas = _parse_operation(resolver, url, method, operation, shared_parameters, base)
+                endpoints.append(endpoint)
+                pending.extend(schemas)
+
+    # Every schema is scanned once, so modular definitions are parsed in linear time
+    scanned = set()
+    # Models found while scanning are appended and scanned in turn
+    for schema, base in pending:
+        for ref in _iter_refs(schema):
+            target = resolver.target(ref, base)
+            if target in scanned:
+                continue
+            scanned.add(target)
+            name = ref_name(ref)
+            if name not in models:
+                model_schema, model_base = resolver.resolve({"$ref": ref}, base)
+                models[name] = _parse_model(resolver, name, model_schema, model_base)
+                pending.append((model_schema, model_base))
+
+    return {
+        "info": document.get("info") or {},
+        "models": models,
+        "endpoints": endpoints,
+    }
+
+
+def _may_be_selected(paths: Mapping[str, Any], url: str, selection: Selection) -> bool:
+    """Check whether a path item may have selected operations without loading it.
+
+    Path items of lazily loaded definitions whose text mentions none of the
+    selected tags and operation ids are skipped unloaded.
+    """
+    if selection is None or not isinstance(paths, LazyMapping):
+        return True
+    tags, operation_ids = selection
+    source = paths.source(url)
+    # Referenced path items, escapes and untagged operations ("Default") need the loaded path item
+    if _is_reference(source) or "\\" in source or "Default" in tags:
+        return True
+    return any(_may_mention(source, needle) for needle in tags + operation_ids)
+
+
+def _may_mention(source: str, value: str) -> bool:
+    """Check whether YAML text may contain a scalar with a value.
+
+    Apart from escapes, only quotes (doubled in single-quoted scalars) and
+    whitespace (folded across lines) may be written differently in the text
+    than in the value, so every run of other characters must appear as is.
+    """
+    return all(part in source for part in _UNSTABLE_CHARACTERS_PATTERN.split(value) if part)
+
+
+def _is_reference(source: str) -> bool:
+    """Check whether the YAML text of a mapping entry may be a reference."""
+    body = source.find("\n")
+    if body < 0 or "$ref" in source[:body]:
+        return "$ref" in source
+    first_line = _CONTENT_LINE_PATTERN.search(source, body + 1)
+    if first_line is None:
+        return False
+    indent = len(first_line.group(1))
+    return any(len(match.group(1)) <= indent for match in _REF_KEY_PATTERN.finditer(source, body))
+
+
+def _is_selected(operation: Mapping[str, Any], selection: Selection) -> bool:
+    """Check whether an operation is selected (see select_operations)."""
+    if selection is None:
+        return True
+    tags, operation_ids = selection
+    if operation.get("operationId") in operation_ids:
+        return True
+    return any(tag in tags for tag in operation.get("tags") or ["Default"])
+
+
+def _parse_model(resolver: RefResolver, name: str, schema: Any, base: str) -> Dict[str, Any]:
+    """Describe one model.
+
+    Args:
+        resolver: Reference resolver
+        name: Model name
+        schema: JSON schema of the model
+        base: Document containing the schema
+
+    Returns:
+        Dict[str, Any]: Model description
+    """
+    schema, base = resolver.resolve(schema or {}, base)
+    properties, required = _merge_properties(resolver, schema, base, [])
+    return {
+        "name": name,
+        "type": "entity" if _is_entity(name, schema, properties) else "dto",
+        "description": schema.get("description", ""),
+        "properties": properties,
+        "required": required,
+    }
+
+
+def _merge_properties(resolver: RefResolver, schema: Dict[str, Any], base: str,
+                      enclosing: List[int]) -> Tuple[Dict[str, Any], List[str]]:
+    """Collect the properties of a schema, including those of its ``allOf`` parts.
+
+    Args:
+        resolver: Reference resolver
+        schema: Resolved JSON schema
+        base: Document containing the schema
+        enclosing: Ids of the schemas being merged, to detect composition cycles
+
+    Returns:
+        Tuple[Dict[str, Any], List[str]]: Properties and required property names
+
+    Raises:
+        RefError: If the schema is composed of itself
+    """
+    if id(schema) in enclosing:
+        raise RefError("Circular allOf composition")
+    parts = schema.get("allOf") or []
+    if not parts:
+        return schema.get("properties") or {}, list(schema.get("required") or [])
+
+    properties: Dict[str, Any] = {}
+    required: List[str] = []
+    for part in parts:
+        part, part_base = resolver.resolve(part or {}, base)
+        part_properties, part_required = _merge_properties(resolver, part, part_base, enclosing + [id(schema)])
+        properties.update(part_properties)
+        required.extend(name for name in part_required if name not in required)
+    properties.update(schema.get("properties") or {})
+    required.extend(name for name in schema.get("required") or [] if name not in required)
+    return properties, required
+
+
+def _iter_refs(node: Any) -> Iterator[str]:
+    """Yield the references within a node without following them."""
+    stack = [node]
+    while stack:
+        node = stack.pop()
+        if isinstance(node, dict):
+            ref = node.get("$ref")
+            if isinstance(ref, str):
+                yield ref
+            else:
+                stack.extend(node.values())
+        elif isinstance(node, list):
+            stack.extend(node)
+
+
+def _is_entity(name: str, schema: Dict[str, Any], properties: Dict[str, Any]) -> bool:
+    """Tell persistent entities from data transfer objects.
+
+    Models marked with ``x-entity`` (on the schema or one of its properties)
+    and models whose name contains "Entity" are entities.
+    """
+    if schema.get("x-entity") or "Entity" in name:
+        return True
+    return any(isinstance(prop, dict) and prop.get("x-entity") for prop in properties.values())
+
+
+def _parse_operation(resolver: RefResolver, path: str, method: str, operation: Mapping[str, Any],
+                     shared_parameters: List[Dict[str, Any]],
+                     base: str) -> Tuple[Dict[str, Any], List[Tuple[Any, str]]]:
+    """Describe one operation of a path item.
+
+    Args:
+        resolver: Reference resolver
+        path: URL path template
+        method: Lower-case HTTP method
+        operation: Operation object
+        shared_parameters: Parameters declared for all operations of the path
+        base: Document containing the path item
+
+    Returns:
+        Tuple[Dict[str, Any], List[Tuple[Any, str]]]: Endpoint description and
+            the schemas it uses, with the documents containing them
+    """
+    schemas: List[Tuple[Any, str]] = []
+
+    # Parameters of the operation override shared ones with the same name and location
+    by_key = {}
+    for param in list(shared_parameters) + list(operation.get("parameters") or []):
+        param, param_base = resolver.resolve(param, base)
+        if isinstance(param, dict) and "name" in param:
+            by_key[(param["name"], param.get("in"))] = (param, param_base)
+    parameters = []
+    for param, param_base in by_key.values():
+        schema = param.get("schema") or {}
+        schemas.append((schema, param_base))
+        parameters.append({
+            "name": param["name"],
+            "in": param.get("in", "query"),
+            "required": param.get("required", False),
+            "schema": schema,
+        })
+
+    request_schema, request_base = _json_schema(resolver, operation.get("requestBody"), base)
+    if request_schema:
+        schemas.append((request_schema, request_base))
+        ref = request_schema.get("$ref")
+        model = ref_name(ref) if ref else ""
+        parameters.append({
+            "name": model[:1].lower() + model[1:] if model else "body",
+            "in": "body",
+            "required": True,
+            "schema": request_schema,
+        })
+
+    responses, responses_base = resolver.resolve(operation.get("responses") or {}, base)
+    response_schema, response_base = _json_schema(resolver, _success_response(responses), responses_base)
+    schemas.append((response_schema, response_base))
+
+    endpoint = {
+        "path": path,
+        "method": method.upper(),
+        "operationId": operation.get("operationId", ""),
+        "tags": operation.get("tags") or ["Default"],
+        "summary": operation.get("summary", ""),
+        "description": operation.get("description", ""),
+        "parameters": parameters,
+        "response": {"schema": response_schema},
+    }
+    return endpoint, schemas
+
+
+def _success_response(responses: Dict[Any, Any]) -> Optional[Dict[str, Any]]:
+    """Pick the response of a successful call ("200", "201", else the first 2xx)."""
+    for code in ("200", "201"):
+        if responses.get(code):
+            return responses[code]
+    return next((response for code, response in responses.items() if str(code).startswith("2")), None)
+
+
+def _json_schema(resolver: RefResolver, body: Optional[Dict[str, Any]], base: str) -> Tuple[Dict[str, Any], str]:
+    """Get the JSON schema of a request body or response (empty if it has none).
+
+    Returns:
+        Tuple[Dict[str, Any], str]: The schema and the document containing it
+    """
+    body, base = resolver.resolve(body, base)
+    if not body:
+        return {}, base
+    return ((body.get("content") or {}).get(JSON_MEDIA_TYPE) or {}).get("schema") or {}, base
+
+
+class OpenAPIParser:
+    """Parser of definition files that parses each file only once."""
+
+    def __init__(self, cache: Optional[SchemaCache] = None):
+        """Initialize the parser.
+
+        Args:
+            cache: Persistent cache of parsed definitions (optional)
+        """
+        self.logger = get_logger()
+        self.cache = cache
+        # Parsed descriptions by real path and selection, with the stat signatures
+        # of the definition and the files it references at parse time
+        self._parsed: Dict[Tuple[str, Selection], Tuple[Dict[str, Optional[Tuple[int, int]]], Dict[str, Any]]] = {}
+
+    def parse_file(self, path: str, selection: Selection = None) -> Dict[str, Any]:
+        """Parse a definition file, reusing the result while the file is unchanged.
+
+        A definition is also parsed again when one of the files it references
+        changes. The returned description is shared between callers and must
+        not be modified.
+
+        Args:
+            path: Path to the Swagger/OpenAPI definition file
+            selection: Operations to parse (see select_operations; all if None)
+
+        Returns:
+            Dict[str, Any]: API description (see parse_openapi)
+
+        Raises:
+            OSError: If the file cannot be read
+            ValueError: If the file is not valid YAML or JSON, or one of its
+                references cannot be resolved
+        """
+        memo_key = (os.path.realpath(path), selection)
+
+        parsed = self._parsed.get(memo_key)
+        if parsed is not None and _stat_signatures(parsed[0]) == parsed[0]:
+            return parsed[1]
+
+        api_info, sources = self._load(memo_key[0], selection)
+        self._parsed[memo_key] = (_stat_signatures(sources), api_info)
+        return api_info
+
+    def _load(self, path: str, selection: Selection) -> Tuple[Dict[str, Any], List[str]]:
+        """Parse a definition file, going through the persistent cache if any.
+
+        Args:
+            path: Path to the Swagger/OpenAPI definition file
+            selection: Operations to parse
+
+        Returns:
+            Tuple[Dict[str, Any], List[str]]: API description and the files it
+                was parsed from
+        """
+        key = None
+        if self.cache is not None and self.cache.enabled:
+            # The parser version and the selection take the place of the SQL dialect in the key
+            variant = f"openapi-{OPENAPI_PARSER_VERSION}"
+            if selection is not None:
+                variant += f"-{hash_text(repr(selection))}"
+            key = self.cache.make_key(hash_file(path), variant)
+            entry = self.cache.get(key)
+            # Entries are only valid while the referenced files are unchanged too
+            if entry is not None and all(_hash_or_none(source) == digest for source, digest in entry["sources"].items()):
+                return entry["api_info"], [path] + list(entry["sources"])
+
+        self.logger.info(f"Parsing OpenAPI definition: {path}")
+        try:
+            # The composed document is garbage once parsed; keep the collector from scanning it meanwhile
+            with gc_paused():
+                document = load_openapi_document(path, lazy=selection is not None)
+                resolver = RefResolver(document, path)
+                api_info = parse_openapi(document, path, resolver, selection)
+        except yaml.YAMLError as e:
+            raise ValueError(f"Invalid YAML in {path}: {e}") from e
+
+        sources = [source for source in resolver.files if source != path]
+        if key is not None:
+            self.cache.put(key, {"api_info": api_info, "sources": {source: hash_file(source) for source in sources}})
+        return api_info, [path] + sources
+
+    def clear(self) -> None:
+        """Forget the definitions parsed so far."""
+        self._parsed.clear()
+
+
+def _stat_signatures(paths: Iterable[str]) -> Dict[str, Optional[Tuple[int, int]]]:
+    """Get the (modification time, size) signatures of files (None for missing files)."""
+    signatures = {}
+    for path in paths:
+        try:
+            stat = os.stat(path)
+        except OSError:
+            signatures[path] = None
+        else:
+            signatures[path] = (stat.st_mtime_ns, stat.st_size)
+    return signatures
+
+
+def _hash_or_none(path: str) -> Optional[str]:
+    """Hash the content of a file (None if it cannot be read)."""
+    try:
+        return hash_file(path)
+    except OSError:
+        return None
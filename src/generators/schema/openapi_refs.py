@@ -0,0 +1,217 @@
+"""Resolution of ``$ref`` references in OpenAPI definitions.
+
+Modular definitions spread their paths and components over several files
+and reference them with ``$ref``: local references (``#/components/...``),
+relative file references (``models/User.yaml``) and references into other
+files (``common.yaml#/components/schemas/Error``). ``RefResolver`` resolves
+them lazily: every referenced file is loaded once, the components of every
+document are indexed once, and every resolved reference is memoized, so a
+definition is resolved in time linear in its size. Documents may be lazy
+mappings (see ``load_document_lazily``): only the components that are
+referenced are then constructed. Chains of references
+that lead back to themselves are reported instead of looping forever.
+
+Only files on the local filesystem are supported.
+"""
+
+import os
+from typing import Any, Dict, List, Mapping, Optional, Tuple
+from urllib.parse import unquote
+
+from src.utils.yaml_loader import load_document
+
+# Component sections indexed for direct lookup
+INDEXED_SECTIONS = ("schemas", "parameters", "responses", "requestBodies")
+
+# Absolute location of a referenced node: (document path, JSON pointer)
+RefTarget = Tuple[str, str]
+
+
+class RefError(ValueError):
+    """Raised for references that cannot be resolved."""
+
+
+def ref_name(ref: str) -> str:
+    """Get the name of the component a reference points to.
+
+    Args:
+        ref: Reference (e.g. "#/components/schemas/User", "common.yaml#/components/schemas/Error"
+            or "models/User.yaml")
+
+    Returns:
+        str: Last segment of the JSON pointer, or the file name without
+            extension for references to whole files
+    """
+    location, _, pointer = ref.partition("#")
+    if pointer.strip("/"):
+        return _unescape(pointer.rstrip("/").rsplit("/", 1)[-1])
+    return os.path.splitext(os.path.basename(location))[0]
+
+
+def _unescape(token: str) -> str:
+    """Decode a JSON pointer token."""
+    return unquote(token).replace("~1", "/").replace("~0", "~")
+
+
+class RefResolver:
+    """Lazy, memoizing resolver of the references of one definition."""
+
+    def __init__(self, document: Mapping[str, Any], path: Optional[str] = None):
+        """Initialize the resolver.
+
+        Args:
+            document: Root definition document
+            path: File of the root document; relative file references are
+                resolved against its directory (defaults to the working directory)
+        """
+        self.root = os.path.realpath(path) if path else os.path.join(os.path.realpath(os.getcwd()), "")
+        self._documents: Dict[str, Any] = {self.root: document}
+        self._indexes: Dict[str, Dict[str, Mapping[str, Any]]] = {}
+        self._resolved: Dict[RefTarget, Any] = {}
+
+    @property
+    def files(self) -> List[str]:
+        """Paths of all files loaded so far, starting with the root document."""
+        return [path for path in self._documents if os.path.isfile(path)]
+
+    def target(self, ref: str, base: Optional[str] = None) -> RefTarget:
+        """Get the absolute location of a reference.
+
+        Args:
+            ref: Reference
+            base: Document containing the reference (defaults to the root document)
+
+        Returns:
+            RefTarget: Document path and JSON pointer of the referenced node
+
+        Raises:
+            RefError: For references to remote documents
+        """
+        base = base or self.root
+        location, _, pointer = ref.partition("#")
+        if not location:
+            return base, pointer
+        if "://" in location:
+            raise RefError(f"Remote references are not supported: {ref}")
+        return os.path.realpath(os.path.join(os.path.dirname(base), unquote(location))), pointer
+
+    def is_external(self, target: RefTarget) -> bool:
+        """Check whether a reference target lies outside of the root document.
+
+        Args:
+            target: Reference target (see target())
+
+        Returns:
+            bool: True for targets in other files
+        """
+        return target[0] != self.root
+
+    def resolve(self, node: Any, base: Optional[str] = None) -> Tuple[Any, str]:
+        """Follow the references of a node until reaching a node that is not a reference.
+
+        Args:
+            node: Any node of a definition; only mappings with a ``$ref``
+                are followed
+            base: Document containing the node (defaults to the root document)
+
+        Returns:
+            Tuple[Any, str]: The referenced node and the document containing it
+                (the node itself and ``base`` if it is not a reference)
+
+        Raises:
+            RefError: If a reference cannot be resolved or a chain of
+                references leads back to itself
+        """
+        base = base or self.root
+        chain: List[RefTarget] = []
+        while isinstance(node, Mapping) and isinstance(node.get("$ref"), str):
+            target = self.target(node["$ref"], base)
+            if target in chain:
+                cycle = " -> ".join(f"{os.path.basename(path)}#{pointer}" for path, pointer in chain + [target])
+                raise RefError(f"Circular reference: {cycle}")
+            chain.append(target)
+
+            resolved = self._resolved.get(target)
+            if resolved is None:
+                resolved = self._lookup(target)
+                self._resolved[target] = resolved
+            node, base = resolved, target[0]
+        return node, base
+
+    def _lookup(self, target: RefTarget) -> Any:
+        """Find the node at a reference target.
+
+        Args:
+            target: Document path and JSON pointer
+
+        Returns:
+            Any: The node
+
+        Raises:
+            RefError: If the document or the node does not exist
+        """
+        path, pointer = target
+        document = self._document(path)
+        pointer = pointer.rstrip("/")
+        if not pointer:
+            return document
+
+        index = self._indexes.get(path)
+        if index is None:
+            index = self._indexes[path] = self._build_index(document)
+        section, _, name = pointer[len("/components/"):].partition("/")
+        if pointer.startswith("/components/") and section in index and "/" not in name:
+            node = index[section].get(_unescape(name))
+            if node is not None:
+                return node
+
+        node = document
+        for token in pointer.lstrip("/").split("/"):
+            token = _unescape(token)
+            try:
+                node = node[int(token)] if isinstance(node, list) else node[token]
+            except (KeyError, IndexError, TypeError, ValueError):
+                raise RefError(f"Unresolvable reference: {os.path.basename(path)}#{target[1]}") from None
+        return node
+
+    def _document(self, path: str) -> Any:
+        """Get a document, loading it on first use.
+
+        Args:
+            path: Absolute document path
+
+        Returns:
+            Any: The document
+
+        Raises:
+            RefError: If the document cannot be loaded
+        """
+        document = self._documents.get(path)
+        if document is None:
+            try:
+                document = load_document(path)
+            except (OSError, ValueError) as e:
+                raise RefError(f"Cannot load referenced file {path}: {e}") from e
+            self._documents[path] = document
+        return document
+
+    @staticmethod
+    def _build_index(document: Any) -> Dict[str, Mapping[str, Any]]:
+        """Index the component sections of a document.
+
+        Args:
+            document: Definition document
+
+        Returns:
+            Dict[str, Mapping[str, Any]]: Components by name of each indexed
+                section present in the document
+        """
+        components = document.get("components") if isinstance(document, Mapping) else None
+        if not isinstance(components, Mapping):
+            return {}
+        index = {}
+        for section in INDEXED_SECTIONS:
+            entries = components.get(section)
+            if isinstance(entries, Mapping):
+                index[section] = entries
+        return index
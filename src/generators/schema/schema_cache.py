@@ -0,0 +1,207 @@
+"""Persistent cache of parsed schemas.
+
+Parsing a large DDL file dominates the start of a generation, yet the same
+schema is usually parsed again and again (every CLI run, every Streamlit
+rerun). Parsed table lists are therefore stored below the cache root, keyed
+by the content hash of the DDL together with the parser version and dialect,
+so an unchanged schema is never parsed twice.
+"""
+
+import hashlib
+import os
+import pickle
+import tempfile
+import zlib
+from typing import Any, Dict, List, Optional
+
+from src.core.cache import get_cache_dir
+from src.core.logging import get_logger
+
+logger = get_logger()
+
+# Bump whenever the structure of parsed tables changes
+PARSER_VERSION = 5
+
+# Default upper bound for the total size of cached schemas
+DEFAULT_MAX_BYTES = 64 * 1024 * 1024
+
+# File name suffix of cache entries
+_ENTRY_SUFFIX = ".schema"
+
+# Block size used to hash DDL files
+_HASH_BLOCK_SIZE = 1 << 20
+
+
+def hash_file(path: str) -> str:
+    """Compute the content hash of a file.
+
+    Args:
+        path: File path
+
+    Returns:
+        str: Hex digest of the file content
+    """
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for block in iter(lambda: f.read(_HASH_BLOCK_SIZE), b""):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def hash_text(text: str) -> str:
+    """Compute the content hash of DDL text.
+
+    Args:
+        text: DDL content
+
+    Returns:
+        str: Hex digest of the UTF-8 encoded content
+    """
+    return hashlib.sha256(text.encode("utf-8", errors="replace")).hexdigest()
+
+
+class SchemaCache:
+    """Content-addressed, size-bounded cache of parsed schemas.
+
+    Entries are compressed pickles named after their key. Reading an entry
+    refreshes its modification time, and the least recently used entries are
+    evicted once the cache grows beyond ``max_bytes``.
+    """
+
+    def __init__(self, cache_dir: Optional[str] = None, max_bytes: int = DEFAULT_MAX_BYTES):
+        """Initialize the schema cache.
+
+        Args:
+            cache_dir: Cache directory (defaults to the "schema" directory below the cache root)
+            max_bytes: Upper bound for the total size of all entries
+        """
+        self.logger = get_logger()
+        self.cache_dir = cache_dir or get_cache_dir("schema")
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+
+    @property
+    def enabled(self) -> bool:
+        """Whether a cache directory is available."""
+        return self.cache_dir is not None
+
+    def make_key(self, content_hash: str, dialect: str = "generic") -> str:
+        """Build the cache key of a schema.
+
+        Args:
+            content_hash: Hash of the DDL content (see hash_file and hash_text)
+            dialect: SQL dialect the schema is parsed with
+
+        Returns:
+            str: Cache key
+        """
+        from src import __version__
+
+        key = f"{content_hash}\0{PARSER_VERSION}\0{__version__}\0{dialect}"
+        return hashlib.sha256(key.encode("utf-8")).hexdigest()
+
+    def _entry_path(self, key: str) -> str:
+        return os.path.join(self.cache_dir, key + _ENTRY_SUFFIX)
+
+    def get(self, key: str) -> Optional[List[Dict[str, Any]]]:
+        """Load a parsed schema from the cache.
+
+        Args:
+            key: Cache key (see make_key)
+
+        Returns:
+            Optional[List[Dict[str, Any]]]: Parsed tables, or None if not cached
+        """
+        if not self.enabled:
+            return None
+
+        path = self._entry_path(key)
+        try:
+            with open(path, "rb") as f:
+                tables = pickle.loads(zlib.decompress(f.read()))
+        except FileNotFoundError:
+            self.misses += 1
+            return None
+        except Exception as e:
+            self.logger.warning(f"Discarding unreadable schema cache entry {path}: {e}")
+            self._remove(path)
+            self.misses += 1
+            return None
+
+        try:
+            os.utime(path)
+        except OSError:
+            pass
+        self.hits += 1
+        return tables
+
+    def put(self, key: str, tables: List[Dict[str, Any]]) -> None:
+        """Store a parsed schema and evict old entries if the cache is too large.
+
+        Args:
+            key: Cache key (see make_key)
+            tables: Parsed tables
+        """
+        if not self.enabled:
+            return
+
+        data = zlib.compress(pickle.dumps(tables, protocol=pickle.HIGHEST_PROTOCOL))
+        if len(data) > self.max_bytes:
+            return
+
+        try:
+            fd, temp_path = tempfile.mkstemp(dir=self.cache_dir, suffix=".tmp")
+            with os.fdopen(fd, "wb") as f:
+                f.write(data)
+            os.replace(temp_path, self._entry_path(key))
+        except OSError as e:
+            self.logger.warning(f"Could not write schema cache entry: {e}")
+            return
+
+        self.evict()
+
+    def evict(self) -> int:
+        """Remove the least recently used entries until the cache fits ``max_bytes``.
+
+        Returns:
+            int: Number of removed entries
+        """
+        if not self.enabled:
+            return 0
+
+        entries = []
+        try:
+            with os.scandir(self.cache_dir) as it:
+                for entry in it:
+                    if entry.name.endswith(_ENTRY_SUFFIX) and entry.is_file():
+                        stat = entry.stat()
+                        entries.append((stat.st_mtime, stat.st_size, entry.path))
+        except OSError:
+            return 0
+
+        total = sum(size for _, size, _ in entries)
+        removed = 0
+        for _, size, path in sorted(entries):
+            if total <= self.max_bytes:
+                break
+            if self._remove(path):
+                total -= size
+                removed += 1
+        return removed
+
+    def clear(self) -> None:
+        """Remove all entries."""
+        if not self.enabled:
+            return
+        for name in os.listdir(self.cache_dir):
+            if name.endswith(_ENTRY_SUFFIX):
+                self._remove(os.path.join(self.cache_dir, name))
+
+    @staticmethod
+    def _remove(path: str) -> bool:
+        try:
+            os.remove(path)
+            return True
+        except OSError:
+            return False
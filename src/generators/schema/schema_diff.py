@@ -0,0 +1,162 @@
+"""Structural diff between two parsed schemas.
+
+A diff tells which tables were added, removed or changed between two parses
+of a schema (see DDLParser), down to the columns, keys, indexes and
+relationships of every changed table. Generators use it to regenerate only
+the files of affected entities after a schema migration.
+"""
+
+import json
+from typing import Any, Dict, List, Set
+
+
+def _by_name(items: List[Dict[str, Any]]) -> Dict[str, Dict[str, Any]]:
+    return {item['name']: item for item in items}
+
+
+def _canonical(item: Dict[str, Any]) -> str:
+    return json.dumps(item, sort_keys=True)
+
+
+class TableDiff:
+    """Changes of a single table present in both schemas."""
+
+    def __init__(self, name: str):
+        """Initialize the table diff.
+
+        Args:
+            name: Table name
+        """
+        self.name = name
+        self.columns_added: List[str] = []
+        self.columns_removed: List[str] = []
+        self.columns_changed: List[str] = []
+        self.relationships_added: List[Dict[str, Any]] = []
+        self.relationships_removed: List[Dict[str, Any]] = []
+        self.primary_key_changed = False
+        self.foreign_keys_changed = False
+        self.indexes_changed = False
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Get the table diff as a dictionary.
+
+        Returns:
+            Dict[str, Any]: Table diff
+        """
+        return {
+            "name": self.name,
+            "columns_added": self.columns_added,
+            "columns_removed": self.columns_removed,
+            "columns_changed": self.columns_changed,
+            "relationships_added": self.relationships_added,
+            "relationships_removed": self.relationships_removed,
+            "primary_key_changed": self.primary_key_changed,
+            "foreign_keys_changed": self.foreign_keys_changed,
+            "indexes_changed": self.indexes_changed,
+        }
+
+
+class SchemaDiff:
+    """Tables added, removed, changed and unchanged between two schemas."""
+
+    def __init__(self):
+        """Initialize an empty schema diff."""
+        self.added: List[str] = []
+        self.removed: List[str] = []
+        self.changed: Dict[str, TableDiff] = {}
+        self.unchanged: List[str] = []
+
+    @property
+    def is_empty(self) -> bool:
+        """Whether both schemas are identical."""
+        return not (self.added or self.removed or self.changed)
+
+    @property
+    def affected_tables(self) -> Set[str]:
+        """Names of the tables whose generated files must be regenerated."""
+        return set(self.added) | set(self.changed)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Get the diff as a dictionary.
+
+        Returns:
+            Dict[str, Any]: Schema diff
+        """
+        return {
+            "added": self.added,
+            "removed": self.removed,
+            "changed": [table.to_dict() for table in self.changed.values()],
+            "unchanged": len(self.unchanged),
+        }
+
+    def format_summary(self) -> str:
+        """Format a one-line summary of the diff.
+
+        Returns:
+            str: Summary such as "2 added, 1 removed, 3 changed, 994 unchanged tables"
+        """
+        return (f"{len(self.added)} added, {len(self.removed)} removed, "
+                f"{len(self.changed)} changed, {len(self.unchanged)} unchanged tables")
+
+
+def diff_tables(old: Dict[str, Any], new: Dict[str, Any]) -> TableDiff:
+    """Compare two definitions of the same table.
+
+    Args:
+        old: Previous table definition
+        new: Current table definition
+
+    Returns:
+        TableDiff: Changes of the table (empty if nothing structural changed)
+    """
+    diff = TableDiff(new['name'])
+
+    old_columns = _by_name(old.get('columns', []))
+    new_columns = _by_name(new.get('columns', []))
+    diff.columns_added = [name for name in new_columns if name not in old_columns]
+    diff.columns_removed = [name for name in old_columns if name not in new_columns]
+    diff.columns_changed = [
+        name for name, column in new_columns.items()
+        if name in old_columns and old_columns[name] != column
+    ]
+
+    old_relationships = {_canonical(rel): rel for rel in old.get('relationships', [])}
+    new_relationships = {_canonical(rel): rel for rel in new.get('relationships', [])}
+    diff.relationships_added = [rel for key, rel in new_relationships.items() if key not in old_relationships]
+    diff.relationships_removed = [rel for key, rel in old_relationships.items() if key not in new_relationships]
+
+    diff.primary_key_changed = old.get('primaryKey') != new.get('primaryKey')
+    diff.foreign_keys_changed = old.get('foreignKeys') != new.get('foreignKeys')
+    diff.indexes_changed = old.get('indexes') != new.get('indexes')
+    return diff
+
+
+def diff_schemas(old_tables: List[Dict[str, Any]], new_tables: List[Dict[str, Any]]) -> SchemaDiff:
+    """Compute the structural diff between two parsed schemas.
+
+    Tables are matched by name. A table counts as changed when any part of
+    its definition differs, including relationships implied by foreign keys
+    of other tables.
+
+    Args:
+        old_tables: Tables of the previous schema
+        new_tables: Tables of the current schema
+
+    Returns:
+        SchemaDiff: Diff from the previous to the current schema
+    """
+    diff = SchemaDiff()
+    old_by_name = _by_name(old_tables)
+    new_by_name = _by_name(new_tables)
+
+    for name, table in new_by_name.items():
+        previous = old_by_name.get(name)
+        if previous is None:
+            diff.added.append(name)
+        elif previous == table:
+            diff.unchanged.append(name)
+        else:
+            diff.changed[name] = diff_tables(previous, table)
+
+    diff.removed = [name for name in old_by_name if name not in new_by_name]
+    return diff
@@ -0,0 +1,227 @@
+"""Binary snapshots of the schema IR.
+
+A snapshot stores a parsed (and possibly enriched) schema, so large teams can
+share one canonical schema and every generation loads it in milliseconds
+instead of parsing the DDL again.
+
+Layout::
+
+    magic (8 bytes) | format version (uint16) | reserved (2 bytes)
+    | payload length (uint64) | SHA-256 of the payload (32 bytes) | payload
+
+All integers are little-endian. The payload is the zlib-compressed UTF-8 JSON
+encoding of the snapshot metadata and the records as nested arrays, so any
+Python version reads the snapshots of any other, and decoding a snapshot only
+ever yields plain data. Records are rebuilt with their constructors, which
+turn the arrays back into tuples and intern the names and types again.
+
+The checksum detects damaged files; it does not authenticate them.
+"""
+
+import hashlib
+import json
+import os
+import struct
+import tempfile
+import time
+import zlib
+from typing import Any, Dict, Optional, Tuple
+
+from src.core.logging import get_logger
+from src.generators.schema.ir import (
+    Endpoint, Entity, Field, Index, Parameter, Relationship, Schema, retarget_schema
+)
+
+logger = get_logger()
+
+# File signature of snapshots
+MAGIC = b"MGSCHEMA"
+
+# Bump whenever the payload layout or the IR records change
+FORMAT_VERSION = 3
+
+# Conventional file name suffix of snapshots
+SNAPSHOT_SUFFIX = ".mgschema"
+
+_HEADER = struct.Struct("<8sH2xQ32s")
+
+
+class SnapshotError(ValueError):
+    """Raised for files that are not valid schema snapshots."""
+
+
+def dumps_snapshot(schema: Schema, dialect: str = "generic") -> bytes:
+    """Encode a schema as a snapshot.
+
+    Args:
+        schema: Schema to store
+        dialect: SQL dialect of the column types of the schema
+
+    Returns:
+        bytes: The snapshot
+    """
+    from src import __version__
+
+    metadata = {
+        "language": schema.language,
+        "dialect": dialect,
+        "generator_version": __version__,
+        "created": time.time(),
+        "entities": len(schema.entities),
+        "endpoints": len(schema.endpoints),
+    }
+    entities = tuple(
+        (e.name, e.table, tuple(f._values() for f in e.fields), tuple(r._values() for r in e.relationships),
+         tuple(i._values() for i in e.indexes), e.kind, e.junction)
+        for e in schema.entities
+    )
+    endpoints = tuple(
+        (e.path, e.method, e.operation_id, e.tags, e.summary, tuple(p._values() for p in e.parameters),
+         e.response_type)
+        for e in schema.endpoints
+    )
+
+    document = json.dumps([metadata, entities, endpoints], ensure_ascii=False, separators=(",", ":"))
+    payload = zlib.compress(document.encode("utf-8"))
+    return _HEADER.pack(MAGIC, FORMAT_VERSION, len(payload), hashlib.sha256(payload).digest()) + payload
+
+
+def loads_snapshot(data: bytes, language: Optional[str] = None) -> Schema:
+    """Decode a snapshot.
+
+    Args:
+        data: The snapshot
+        language: Target language of the returned schema (defaults to the
+            language the snapshot was taken for)
+
+    Returns:
+        Schema: The stored schema, retargeted to ``language`` if needed
+
+    Raises:
+        SnapshotError: If the data is not a valid snapshot of this format version
+    """
+    metadata, entities, endpoints = _decode_payload(data)
+    try:
+        schema = Schema(
+            [Entity(name, table, [Field(*values) for values in fields],
+                    [Relationship(*values) for values in relationships],
+                    [Index(*values) for values in indexes], kind, junction)
+             for name, table, fields, relationships, indexes, kind, junction in entities],
+            [Endpoint(path, method, operation_id, tags, summary, [Parameter(*values) for values in parameters],
+                      response_type)
+             for path, method, operation_id, tags, summary, parameters, response_type in endpoints],
+            metadata["language"],
+        )
+    except (AttributeError, KeyError, TypeError, ValueError) as e:
+        raise SnapshotError(f"Malformed schema snapshot: {e}") from e
+
+    if language and language != schema.language:
+        schema = retarget_schema(schema, language, metadata.get("dialect", "generic"))
+    return schema
+
+
+def snapshot_info(data: bytes) -> Dict[str, Any]:
+    """Read the metadata of a snapshot.
+
+    Args:
+        data: The snapshot
+
+    Returns:
+        Dict[str, Any]: Language, dialect, generator version, creation time,
+            the number of entities and endpoints and the format version
+
+    Raises:
+        SnapshotError: If the data is not a valid snapshot of this format version
+    """
+    return dict(_decode_payload(data)[0], format_version=FORMAT_VERSION)
+
+
+def save_snapshot(schema: Schema, path: str, dialect: str = "generic") -> int:
+    """Write a schema snapshot to a file.
+
+    The file is replaced atomically, so readers never see a partial snapshot.
+
+    Args:
+        schema: Schema to store
+        path: Snapshot file path
+        dialect: SQL dialect of the column types of the schema
+
+    Returns:
+        int: Size of the snapshot in bytes
+    """
+    data = dumps_snapshot(schema, dialect)
+    directory = os.path.dirname(os.path.abspath(path))
+    os.makedirs(directory, exist_ok=True)
+
+    fd, temp_path = tempfile.mkstemp(dir=directory, suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(data)
+        os.replace(temp_path, path)
+    except BaseException:
+        try:
+            os.remove(temp_path)
+        except OSError:
+            pass
+        raise
+
+    logger.info(f"Wrote schema snapshot with {len(schema.entities)} entities to {path} ({len(data)} bytes)")
+    return len(data)
+
+
+def load_snapshot(path: str, language: Optional[str] = None) -> Schema:
+    """Load a schema snapshot from a file.
+
+    Args:
+        path: Snapshot file path
+        language: Target language of the returned schema (defaults to the
+            language the snapshot was taken for)
+
+    Returns:
+        Schema: The stored schema
+
+    Raises:
+        OSError: If the file cannot be read
+        SnapshotError: If the file is not a valid snapshot of this format version
+    """
+    with open(path, "rb") as f:
+        data = f.read()
+    try:
+        return loads_snapshot(data, language)
+    except SnapshotError as e:
+        raise SnapshotError(f"{path}: {e}") from e
+
+
+def _decode_payload(data: bytes) -> Tuple[Dict[str, Any], tuple, tuple]:
+    """Verify the header and checksum of a snapshot and decode its payload.
+
+    Args:
+        data: The snapshot
+
+    Returns:
+        Tuple: Metadata, encoded entities and encoded endpoints
+
+    Raises:
+        SnapshotError: If the data is not a valid snapshot of this format version
+    """
+    if len(data) < _HEADER.size:
+        raise SnapshotError("Truncated schema snapshot")
+    magic, version, length, checksum = _HEADER.unpack_from(data)
+    if magic != MAGIC:
+        raise SnapshotError("Not a schema snapshot")
+    if version != FORMAT_VERSION:
+        raise SnapshotError(f"Unsupported schema snapshot version {version} (expected {FORMAT_VERSION})")
+
+    payload = memoryview(data)[_HEADER.size:]
+    if len(payload) != length:
+        raise SnapshotError(f"Schema snapshot has {len(payload)} payload bytes, expected {length}")
+    if hashlib.sha256(payload).digest() != checksum:
+        raise SnapshotError("Schema snapshot checksum mismatch")
+
+    try:
+        metadata, entities, endpoints = json.loads(zlib.decompress(payload).decode("utf-8"))
+    except (RecursionError, TypeError, ValueError, zlib.error) as e:
+        raise SnapshotError(f"Malformed schema snapshot: {e}") from e
+    if not isinstance(metadata, dict):
+        raise SnapshotError("Malformed schema snapshot: missing metadata")
+    return metadata, entities, endpoints
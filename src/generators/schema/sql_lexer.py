@@ -0,0 +1,814 @@
+"""Single-pass SQL lexer for DDL scripts.
+
+The statement splitter scans its input once, jumping between the characters
+that can change the lexical state (quotes, comment starts, dollar quotes and
+semicolons), so its cost is linear in the size of the input. It accepts the
+input in chunks and yields statements as soon as they are complete, which
+lets callers process arbitrarily large dumps without holding them in memory.
+
+Comments are removed from the statements; quoted strings and identifiers are
+kept verbatim. Supported quoting:
+
+- ``'strings'`` with doubled quotes and (optionally) backslash escapes
+- ``"identifiers"``, ```backtick identifiers``` and ``[bracket identifiers]``
+- PostgreSQL dollar quoting (``$$ ... $$`` and ``$tag$ ... $tag$``)
+- ``-- line comments``, ``/* block comments */`` and (MySQL) ``# comments``
+"""
+
+import codecs
+import gzip
+import re
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
+
+# Lexer options per SQL dialect
+DIALECTS: Dict[str, Dict[str, bool]] = {
+    "generic": {"backslash_escapes": True, "hash_comments": False},
+    "mysql": {"backslash_escapes": True, "hash_comments": True},
+    "postgresql": {"backslash_escapes": False, "hash_comments": False},
+    "h2": {"backslash_escapes": False, "hash_comments": False},
+    "sqlserver": {"backslash_escapes": False, "hash_comments": False},
+}
+
+# Statements carrying table data rather than schema
+DATA_STATEMENTS = {"INSERT", "REPLACE"}
+
+# Bytes read at a time when streaming SQL files
+DEFAULT_CHUNK_SIZE = 1 << 20
+
+# Characters that may change the lexical state of the splitter
+_SPECIAL = re.compile(r"[;'\"`\[$/\-]")
+_SPECIAL_WITH_HASH = re.compile(r"[;'\"`\[$/\-#]")
+
+_QUOTED = {
+    ("'", True): re.compile(r"'(?:[^'\\]|\\[\s\S]|'')*'"),
+    ("'", False): re.compile(r"'(?:[^']|'')*'"),
+    ('"', True): re.compile(r'"(?:[^"\\]|\\[\s\S]|"")*"'),
+    ('"', False): re.compile(r'"(?:[^"]|"")*"'),
+    ("`", True): re.compile(r"`(?:[^`]|``)*`"),
+    ("`", False): re.compile(r"`(?:[^`]|``)*`"),
+    ("[", True): re.compile(r"\[[^\]]*\]"),
+    ("[", False): re.compile(r"\[[^\]]*\]"),
+}
+
+# Words that may appear between CREATE and TABLE
+_TABLE_MODIFIERS = {"TEMPORARY", "TEMP", "GLOBAL", "LOCAL", "UNLOGGED", "OR", "REPLACE", "EXTERNAL", "TRANSIENT"}
+
+# Words that may appear between CREATE and INDEX
+_INDEX_MODIFIERS = {"UNIQUE", "CLUSTERED", "NONCLUSTERED", "FULLTEXT", "SPATIAL", "BITMAP"}
+
+# Consumes plain text and quoted strings of a skipped data statement in one
+# match. "(?=(x+))\\1" emulates an atomic group, so a failed match can't
+# backtrack into the runs.
+_SKIP_DATA = {
+    True: re.compile(r"""(?:(?=([^;'"`\[$/\-#]+))\1|'(?:(?=([^'\\]+))\2|\\[\s\S]|'')*'|"(?:(?=([^"\\]+))\3|\\[\s\S]|"")*")*"""),
+    False: re.compile(r"""(?:(?=([^;'"`\[$/\-#]+))\1|'(?:(?=([^']+))\2|'')*'|"(?:(?=([^"]+))\3|"")*")*"""),
+}
+
+_FIRST_WORD = re.compile(r"([A-Za-z_]+)[^A-Za-z_]")
+_COPY_FROM_STDIN = re.compile(r"COPY\s[\s\S]*\sFROM\s+STDIN\b", re.IGNORECASE)
+
+
+def _data_statement(statement: str) -> bool:
+    """Check whether a statement inserts table data.
+
+    Args:
+        statement: SQL statement
+
+    Returns:
+        bool: True for INSERT/REPLACE statements
+    """
+    match = _FIRST_WORD.match(statement + " ")
+    return match is not None and match.group(1).upper() in DATA_STATEMENTS
+
+
+# Quick check run before tokenizing a statement
+_CREATE_TABLE_START = re.compile(r"CREATE\s+(?:[A-Za-z_]+\s+){0,3}?TABLE\s", re.IGNORECASE)
+_ALTER_TABLE_START = re.compile(r"ALTER\s+TABLE\s", re.IGNORECASE)
+_CREATE_INDEX_START = re.compile(r"CREATE\s+(?:[A-Za-z_]+\s+){0,2}?INDEX\s", re.IGNORECASE)
+
+_DOLLAR_TAG = re.compile(r"\$(?:[A-Za-z_]\w*)?\$")
+_DOLLAR_PREFIX = re.compile(r"\$\w*")
+
+# String literals, with and without backslash escapes. E'...' strings
+# (PostgreSQL escape strings) always treat backslashes as escapes.
+_STRING = {
+    True: r"[EeNn]?'(?:[^'\\]|\\[\s\S]|'')*'",
+    False: r"[Ee]'(?:[^'\\]|\\[\s\S]|'')*'|[Nn]?'(?:[^']|'')*'",
+}
+
+# Quoted tokens, parentheses and commas: everything that matters for nesting
+_STRUCTURE = {
+    escapes: re.compile(r"""
+    (?:%s)
+  | "(?:[^"]|"")*"|`(?:[^`]|``)*`|\[[^\]]*\]
+  | \$\$[\s\S]*?\$\$|\$(?P<tag>[A-Za-z_]\w*)\$[\s\S]*?\$(?P=tag)\$
+  | [(),]
+""" % string, re.VERBOSE)
+    for escapes, string in _STRING.items()
+}
+
+# Tokens of a single statement
+_TOKEN = {
+    escapes: re.compile(r"""
+    (?P<ws>\s+)
+  | (?P<string>%s)
+  | (?P<ident>"(?:[^"]|"")*"|`(?:[^`]|``)*`|\[[^\]]*\])
+  | (?P<dollar>\$\$[\s\S]*?\$\$|\$(?P<tag>[A-Za-z_]\w*)\$[\s\S]*?\$(?P=tag)\$)
+  | (?P<number>\d+(?:\.\d*)?)
+  | (?P<word>[A-Za-z_][\w$]*)
+  | (?P<punct>[(),;.])
+  | (?P<other>[\s\S])
+""" % string, re.VERBOSE)
+    for escapes, string in _STRING.items()
+}
+
+
+def _backslash_escapes(dialect: str) -> bool:
+    """Check whether string literals of a dialect use backslash escapes.
+
+    Args:
+        dialect: SQL dialect name (see DIALECTS)
+
+    Returns:
+        bool: True if a backslash escapes the next character
+
+    Raises:
+        ValueError: If the dialect is not supported
+    """
+    options = DIALECTS.get(dialect)
+    if options is None:
+        raise ValueError(f"Unsupported SQL dialect: {dialect}")
+    return options["backslash_escapes"]
+
+
+class Token:
+    """A lexical token of an SQL statement."""
+
+    __slots__ = ("kind", "value", "start", "end")
+
+    def __init__(self, kind: str, value: str, start: int, end: int):
+        """Initialize the token.
+
+        Args:
+            kind: Token kind (string, ident, dollar, number, word, punct or other)
+            value: Token text
+            start: Offset of the first character in the statement
+            end: Offset after the last character in the statement
+        """
+        self.kind = kind
+        self.value = value
+        self.start = start
+        self.end = end
+
+    @property
+    def upper(self) -> str:
+        """Upper-cased token text (for keyword comparisons)."""
+        return self.value.upper()
+
+    @property
+    def name(self) -> str:
+        """Token text with identifier quoting removed."""
+        if self.kind == "ident":
+            inner = self.value[1:-1]
+            quote = self.value[0]
+            return inner.replace(quote * 2, quote) if quote in "\"`" else inner
+        return self.value
+
+    def __repr__(self) -> str:
+        return f"Token({self.kind!r}, {self.value!r})"
+
+
+def tokenize(statement: str, dialect: str = "generic") -> Iterator[Token]:
+    """Split a statement into tokens, skipping whitespace.
+
+    Args:
+        statement: SQL statement without comments
+        dialect: SQL dialect name (see DIALECTS)
+
+    Yields:
+        Token: Tokens in order of appearance
+    """
+    for match in _TOKEN[_backslash_escapes(dialect)].finditer(statement):
+        kind = match.lastgroup
+        if kind == "ws":
+            continue
+        yield Token(kind, match.group(), match.start(), match.end())
+
+
+def find_closing_paren(text: str, open_pos: int, dialect: str = "generic") -> Optional[int]:
+    """Find the parenthesis closing the one at ``open_pos``.
+
+    Parentheses inside quoted strings and identifiers are ignored.
+
+    Args:
+        text: SQL text
+        open_pos: Offset of an opening parenthesis
+        dialect: SQL dialect name (see DIALECTS)
+
+    Returns:
+        Optional[int]: Offset of the matching closing parenthesis, or None if
+            the parentheses are unbalanced
+    """
+    depth = 0
+    for match in _STRUCTURE[_backslash_escapes(dialect)].finditer(text, open_pos):
+        value = match.group()
+        if value == "(":
+            depth += 1
+        elif value == ")":
+            depth -= 1
+            if depth == 0:
+                return match.start()
+    return None
+
+
+def split_top_level(text: str, dialect: str = "generic") -> List[str]:
+    """Split text at commas outside of parentheses and quotes.
+
+    Args:
+        text: Text to split (e.g. the body of a CREATE TABLE statement)
+        dialect: SQL dialect name (see DIALECTS)
+
+    Returns:
+        List[str]: Parts of the text, in order
+    """
+    parts = []
+    depth = 0
+    start = 0
+    for match in _STRUCTURE[_backslash_escapes(dialect)].finditer(text):
+        value = match.group()
+        if value == "(":
+            depth += 1
+        elif value == ")":
+            depth -= 1
+        elif value == "," and depth == 0:
+            parts.append(text[start:match.start()])
+            start = match.end()
+    if start < len(text):
+        parts.append(text[start:])
+    return parts
+
+
+class StatementSplitter:
+    """Incremental splitter turning SQL text into statements.
+
+    Feed text in arbitrary chunks; complete statements are returned as soon
+    as their terminating semicolon has been seen. Only the text of the
+    current, unfinished statement is buffered.
+
+    With ``skip_data`` enabled, data statements (INSERT/REPLACE) are scanned
+    for their end but never materialized, and the data blocks following
+    ``COPY ... FROM stdin`` (pg_dump) are always skipped since they are not
+    SQL. This keeps memory bounded by the largest DDL statement even for
+    dumps that contain the table data.
+    """
+
+    def __init__(self, dialect: str = "generic", skip_data: bool = False):
+        """Initialize the statement splitter.
+
+        Args:
+            dialect: SQL dialect name (see DIALECTS)
+            skip_data: Whether to drop INSERT/REPLACE/COPY statements
+
+        Raises:
+            ValueError: If the dialect is not supported
+        """
+        self.backslash_escapes = _backslash_escapes(dialect)
+        options = DIALECTS[dialect]
+        self.skip_data = skip_data
+        self._special = _SPECIAL_WITH_HASH if options["hash_comments"] else _SPECIAL
+        self._skip_data_pattern = _SKIP_DATA[self.backslash_escapes]
+
+        self._buffer = ""
+        # Scan position in the buffer and start of the text not yet in _parts
+        self._pos = 0
+        self._segment_start = 0
+        self._parts: List[str] = []
+        # Whether the current statement is a data statement being skipped,
+        # or has been checked and is kept
+        self._skipping = False
+        self._classified = False
+        # Whether the scan is inside the data block of a COPY ... FROM stdin
+        self._in_copy_data = False
+        # Number of data statements dropped so far
+        self.skipped_statements = 0
+
+    def feed(self, chunk: str) -> List[str]:
+        """Add text and return the statements it completes.
+
+        Args:
+            chunk: Next piece of SQL text
+
+        Returns:
+            List[str]: Completed statements (comments removed, stripped)
+        """
+        if self._segment_start:
+            self._buffer = self._buffer[self._segment_start:]
+            self._pos -= self._segment_start
+            self._segment_start = 0
+        self._buffer += chunk
+        return self._scan(final=False)
+
+    def close(self) -> List[str]:
+        """Finish splitting and return the trailing statement, if any.
+
+        Returns:
+            List[str]: Remaining statements
+        """
+        statements = self._scan(final=True)
+        statement = self._finish_statement(len(self._buffer))
+        if statement:
+            statements.append(statement)
+        self._buffer = ""
+        self._pos = self._segment_start = 0
+        return statements
+
+    def _finish_statement(self, end: int) -> Optional[str]:
+        """End the current statement at ``end`` and reset the statement state.
+
+        Args:
+            end: Buffer offset of the end of the statement
+
+        Returns:
+            Optional[str]: The statement, or None if it is empty or skipped
+        """
+        statement = None
+        if self._skipping:
+            self.skipped_statements += 1
+        else:
+            self._parts.append(self._buffer[self._segment_start:end])
+            statement = "".join(self._parts).strip()
+            if _COPY_FROM_STDIN.match(statement):
+                self._in_copy_data = True
+                if self.skip_data:
+                    self.skipped_statements += 1
+                    statement = None
+            elif self.skip_data and _data_statement(statement):
+                self.skipped_statements += 1
+                statement = None
+
+        self._parts = []
+        self._skipping = False
+        self._classified = False
+        return statement or None
+
+    def _classify(self, final: bool) -> None:
+        """Decide from its first word whether the current statement is skipped.
+
+        Args:
+            final: Whether no more text will follow
+        """
+        head = "".join(self._parts)[:64] + self._buffer[self._segment_start:self._segment_start + 64]
+        head = head.lstrip()
+        match = _FIRST_WORD.match(head)
+        if match is None:
+            # Wait for the first word to be complete unless it can't be one
+            if final or (head and not (head[0].isalpha() or head[0] == "_")) or len(head) >= 64:
+                self._classified = True
+            return
+
+        self._classified = True
+        if match.group(1).upper() in DATA_STATEMENTS:
+            self._skipping = True
+
+    def _scan(self, final: bool) -> List[str]:
+        statements = []
+        buffer = self._buffer
+        length = len(buffer)
+        pos = self._pos
+        search = self._special.search
+
+        skip_data = self._skip_data_pattern.match if self.skip_data else None
+        # Strings ending at the very end of the buffer may continue in the next chunk
+        skip_end = length if final else length - 1
+
+        while True:
+            if skip_data is not None:
+                if not self._classified:
+                    self._classify(final)
+                if self._skipping and pos < skip_end:
+                    pos = skip_data(buffer, pos, skip_end).end()
+
+            if self._in_copy_data:
+                end = self._match_copy_data(buffer, pos, final)
+                if end is None:
+                    # Keep the last characters in case the terminator is cut off
+                    pos = self._segment_start = max(pos, length - 3)
+                    break
+                self._in_copy_data = False
+                pos = self._segment_start = end
+                continue
+
+            match = search(buffer, pos)
+            if match is None:
+                pos = length
+                break
+
+            index = match.start()
+            char = buffer[index]
+
+            if char == ";":
+                statement = self._finish_statement(index)
+                if statement:
+                    statements.append(statement)
+                pos = self._segment_start = index + 1
+                continue
+
+            if char in "'\"`[":
+                end = self._match_quoted(buffer, index, char, final)
+            elif char == "-" or char == "/" or char == "#":
+                end = self._match_comment(buffer, index, char, final)
+                if end is not None and end > index:
+                    # Replace the comment with a single space
+                    self._parts.append(buffer[self._segment_start:index])
+                    self._parts.append(" ")
+                    pos = self._segment_start = end
+                    continue
+            else:
+                end = self._match_dollar(buffer, index, final)
+
+            if end is None:
+                # The token may continue in the next chunk
+                pos = index
+                break
+            pos = max(end, index + 1)
+
+        if self._skipping and not final:
+            # Drop the text of the data statement scanned so far
+            self._parts = []
+            self._segment_start = pos
+
+        self._pos = pos
+        return statements
+
+    def _match_copy_data(self, buffer: str, pos: int, final: bool) -> Optional[int]:
+        """Find the end of a COPY data block (a line containing only ``\\.``).
+
+        Args:
+            buffer: Buffered text
+            pos: Offset where the search starts (just after the COPY statement)
+            final: Whether no more text will follow
+
+        Returns:
+            Optional[int]: Offset after the terminator, or None if more text is needed
+        """
+        length = len(buffer)
+        while True:
+            index = buffer.find("\n\\.", pos)
+            if index < 0:
+                return length if final else None
+            after = index + 3
+            if after >= length:
+                return length if final else None
+            if buffer[after] == "\n" or buffer[after] == "\r":
+                return after
+            pos = index + 1
+
+    def _match_quoted(self, buffer: str, index: int, quote: str, final: bool) -> Optional[int]:
+        match = _QUOTED[(quote, self.backslash_escapes)].match(buffer, index)
+        if match is None:
+            return len(buffer) if final else None
+        end = match.end()
+        # A quote at the very end could be the first half of an escaped quote
+        if end == len(buffer) and not final and quote != "[":
+            return None
+        return end
+
+    def _match_comment(self, buffer: str, index: int, char: str, final: bool) -> Optional[int]:
+        length = len(buffer)
+        if char == "#":
+            newline = buffer.find("\n", index)
+        else:
+            if index + 1 >= length:
+                return length if final else None
+            if buffer[index + 1] != ("-" if char == "-" else "*"):
+                return index
+            if char == "/":
+                close = buffer.find("*/", index + 2)
+                if close < 0:
+                    return length if final else None
+                return close + 2
+            newline = buffer.find("\n", index)
+
+        if newline < 0:
+            return length if final else None
+        return newline + 1
+
+    def _match_dollar(self, buffer: str, index: int, final: bool) -> Optional[int]:
+        match = _DOLLAR_TAG.match(buffer, index)
+        if match is None:
+            # "$tag" may be cut off by the end of the chunk
+            if not final and _DOLLAR_PREFIX.match(buffer, index).end() == len(buffer):
+                return None
+            return index
+        tag = match.group()
+        close = buffer.find(tag, match.end())
+        if close < 0:
+            return len(buffer) if final else None
+        return close + len(tag)
+
+
+def iter_statements(chunks: Iterable[str], dialect: str = "generic", skip_data: bool = False) -> Iterator[str]:
+    """Split SQL text supplied in chunks into statements.
+
+    Args:
+        chunks: Pieces of SQL text (e.g. blocks read from a file)
+        dialect: SQL dialect name (see DIALECTS)
+        skip_data: Whether to drop INSERT/REPLACE/COPY statements
+
+    Yields:
+        str: Statements without comments or terminating semicolons
+    """
+    splitter = StatementSplitter(dialect, skip_data=skip_data)
+    for chunk in chunks:
+        yield from splitter.feed(chunk)
+    yield from splitter.close()
+
+
+def split_statements(sql: str, dialect: str = "generic", skip_data: bool = False) -> Iterator[str]:
+    """Split SQL text into statements.
+
+    Args:
+        sql: SQL text
+        dialect: SQL dialect name (see DIALECTS)
+        skip_data: Whether to drop INSERT/REPLACE/COPY statements
+
+    Yields:
+        str: Statements without comments or terminating semicolons
+    """
+    return iter_statements([sql], dialect, skip_data)
+
+
+def read_file_chunks(path: str, chunk_size: int = DEFAULT_CHUNK_SIZE) -> Iterator[str]:
+    """Read a (possibly gzip-compressed) SQL file as decoded text chunks.
+
+    The file is never loaded as a whole. Bytes that are not valid UTF-8
+    (e.g. binary or latin-1 table data) are replaced rather than failing.
+
+    Args:
+        path: Path to the SQL file (``.gz`` files are decompressed)
+        chunk_size: Number of bytes read at a time
+
+    Yields:
+        str: Decoded text chunks
+    """
+    opener = gzip.open if path.endswith(".gz") else open
+    decoder = codecs.getincrementaldecoder("utf-8")(errors="replace")
+    with opener(path, "rb") as f:
+        while True:
+            data = f.read(chunk_size)
+            if not data:
+                break
+            text = decoder.decode(data)
+            if text:
+                yield text
+    text = decoder.decode(b"", final=True)
+    if text:
+        yield text
+
+
+def iter_file_statements(path: str, dialect: str = "generic", skip_data: bool = True,
+                         chunk_size: int = DEFAULT_CHUNK_SIZE) -> Iterator[str]:
+    """Split an SQL file into statements while streaming it from disk.
+
+    Args:
+        path: Path to the SQL file (``.gz`` files are decompressed)
+        dialect: SQL dialect name (see DIALECTS)
+        skip_data: Whether to drop INSERT/REPLACE/COPY statements
+        chunk_size: Number of bytes read at a time
+
+    Yields:
+        str: Statements without comments or terminating semicolons
+    """
+    return iter_statements(read_file_chunks(path, chunk_size), dialect, skip_data)
+
+
+def is_create_table(statement: str) -> bool:
+    """Quickly check whether a statement may be a CREATE TABLE statement.
+
+    Args:
+        statement: SQL statement
+
+    Returns:
+        bool: False if the statement certainly doesn't create a table
+    """
+    return _CREATE_TABLE_START.match(statement) is not None
+
+
+def _parse_name(tokens: List[Token], index: int) -> Tuple[Optional[str], int]:
+    """Read a possibly qualified name (schema.table or catalog.schema.table).
+
+    Args:
+        tokens: Statement tokens
+        index: Index of the first token of the name
+
+    Returns:
+        Tuple[Optional[str], int]: Unqualified name (None if there is no name)
+            and the index of the token after it
+    """
+    name = None
+    while index < len(tokens) and tokens[index].kind in ("word", "ident"):
+        name = tokens[index].name
+        index += 1
+        if index < len(tokens) and tokens[index].value == ".":
+            index += 1
+        else:
+            break
+    return name, index
+
+
+def parse_create_table(statement: str, dialect: str = "generic") -> Optional[Tuple[str, str]]:
+    """Extract the table name and body of a CREATE TABLE statement.
+
+    Args:
+        statement: SQL statement
+        dialect: SQL dialect name (see DIALECTS)
+
+    Returns:
+        Optional[Tuple[str, str]]: Unqualified table name and the text between
+            the parentheses of the column list, or None if the statement does
+            not create a table with a column list
+    """
+    if not is_create_table(statement):
+        return None
+
+    # Only the header up to the column list needs to be tokenized
+    tokens = []
+    for token in tokenize(statement, dialect):
+        tokens.append(token)
+        if token.value == "(" or token.value == ";":
+            break
+    if len(tokens) < 4 or tokens[0].upper != "CREATE":
+        return None
+
+    index = 1
+    # Skip modifiers such as TEMPORARY, UNLOGGED or GLOBAL TEMPORARY
+    while index < len(tokens) and tokens[index].kind == "word" and tokens[index].upper != "TABLE":
+        if tokens[index].upper not in _TABLE_MODIFIERS:
+            return None
+        index += 1
+    if index >= len(tokens) or tokens[index].upper != "TABLE":
+        return None
+    index += 1
+
+    if [token.upper for token in tokens[index:index + 3]] == ["IF", "NOT", "EXISTS"]:
+        index += 3
+
+    name, index = _parse_name(tokens, index)
+    if name is None or index >= len(tokens) or tokens[index].value != "(":
+        return None
+
+    open_pos = tokens[index].start
+    close_pos = find_closing_paren(statement, open_pos, dialect)
+    if close_pos is None:
+        return None
+
+    return name, statement[open_pos + 1:close_pos]
+
+
+def is_alter_table(statement: str) -> bool:
+    """Quickly check whether a statement may be an ALTER TABLE statement.
+
+    Args:
+        statement: SQL statement
+
+    Returns:
+        bool: False if the statement certainly doesn't alter a table
+    """
+    return _ALTER_TABLE_START.match(statement) is not None
+
+
+def is_create_index(statement: str) -> bool:
+    """Quickly check whether a statement may be a CREATE INDEX statement.
+
+    Args:
+        statement: SQL statement
+
+    Returns:
+        bool: False if the statement certainly doesn't create an index
+    """
+    return _CREATE_INDEX_START.match(statement) is not None
+
+
+def parse_alter_table(statement: str, dialect: str = "generic") -> Optional[Tuple[str, List[str]]]:
+    """Extract the table name and actions of an ALTER TABLE statement.
+
+    Args:
+        statement: SQL statement
+        dialect: SQL dialect name (see DIALECTS)
+
+    Returns:
+        Optional[Tuple[str, List[str]]]: Unqualified table name and the
+            comma-separated actions (e.g. "ADD CONSTRAINT fk FOREIGN KEY ..."),
+            or None if the statement doesn't alter a table
+    """
+    if not is_alter_table(statement):
+        return None
+
+    tokens = []
+    for token in tokenize(statement, dialect):
+        tokens.append(token)
+        if len(tokens) >= 8:
+            break
+
+    index = 2
+    if [token.upper for token in tokens[index:index + 2]] == ["IF", "EXISTS"]:
+        index += 2
+    if index < len(tokens) and tokens[index].upper == "ONLY":
+        index += 1
+
+    name, index = _parse_name(tokens, index)
+    if name is None or index >= len(tokens):
+        return None
+
+    actions = [action.strip() for action in split_top_level(statement[tokens[index].start:], dialect)]
+    return name, [action for action in actions if action]
+
+
+def parse_index_columns(column_list: str, dialect: str = "generic") -> List[str]:
+    """Extract the column names of an index column list.
+
+    Sort orders, MySQL prefix lengths and operator classes are dropped.
+
+    Args:
+        column_list: Text between the parentheses of an index definition
+        dialect: SQL dialect name (see DIALECTS)
+
+    Returns:
+        List[str]: Column names, in index order; empty for expression indexes
+            (e.g. ``lower(email)``), which can't be looked up by column
+    """
+    columns = []
+    for part in split_top_level(column_list, dialect):
+        tokens = []
+        for token in tokenize(part, dialect):
+            tokens.append(token)
+            if len(tokens) == 3:
+                break
+        if not tokens or tokens[0].kind not in ("word", "ident"):
+            return []
+        if len(tokens) > 1 and tokens[1].value == "(" and (len(tokens) < 3 or tokens[2].kind != "number"):
+            return []
+        columns.append(tokens[0].name)
+    return columns
+
+
+def parse_create_index(statement: str, dialect: str = "generic") -> Optional[Dict[str, Any]]:
+    """Extract the definition of a CREATE INDEX statement.
+
+    Args:
+        statement: SQL statement
+        dialect: SQL dialect name (see DIALECTS)
+
+    Returns:
+        Optional[Dict[str, Any]]: Index with "name", "table", "columns" and
+            "unique" keys, or None if the statement doesn't create an index on
+            table columns
+    """
+    if not is_create_index(statement):
+        return None
+
+    tokens = []
+    for token in tokenize(statement, dialect):
+        tokens.append(token)
+        if token.value == "(":
+            break
+
+    unique = False
+    index = 1
+    while index < len(tokens) and tokens[index].upper in _INDEX_MODIFIERS:
+        unique = unique or tokens[index].upper == "UNIQUE"
+        index += 1
+    if index >= len(tokens) or tokens[index].upper != "INDEX":
+        return None
+    index += 1
+
+    if index < len(tokens) and tokens[index].upper == "CONCURRENTLY":
+        index += 1
+    if [token.upper for token in tokens[index:index + 3]] == ["IF", "NOT", "EXISTS"]:
+        index += 3
+
+    name = None
+    if index < len(tokens) and tokens[index].upper != "ON":
+        name, index = _parse_name(tokens, index)
+    if index >= len(tokens) or tokens[index].upper != "ON":
+        return None
+    index += 1
+    if index < len(tokens) and tokens[index].upper == "ONLY":
+        index += 1
+
+    table, index = _parse_name(tokens, index)
+    # Skip an access method such as "USING btree"
+    while index < len(tokens) and tokens[index].value != "(":
+        index += 1
+    if table is None or index >= len(tokens):
+        return None
+
+    open_pos = tokens[index].start
+    close_pos = find_closing_paren(statement, open_pos, dialect)
+    if close_pos is None:
+        return None
+
+    columns = parse_index_columns(statement[open_pos + 1:close_pos], dialect)
+    if not columns:
+        return None
+    return {"name": name, "table": table, "columns": columns, "unique": unique}
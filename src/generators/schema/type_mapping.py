@@ -0,0 +1,380 @@
+"""Table-driven mapping of database and API types to Java and Kotlin types.
+
+Column types are normalized (case, whitespace, length and precision
+arguments, MySQL ``UNSIGNED``) and resolved in two table lookups: the
+dialect-specific type table falls back to the generic one, and the resulting
+logical type is mapped to the target language. Results are memoized per
+(type, language, dialect), so a schema with thousands of columns only
+resolves each distinct type once.
+
+Types outside of ``java.lang`` / ``kotlin`` are returned fully qualified
+(e.g. ``java.math.BigDecimal``), so generated code compiles without imports.
+"""
+
+import re
+from functools import lru_cache
+from typing import Any, Dict, FrozenSet, Optional, Tuple
+
+from src.generators.schema.openapi_refs import ref_name
+
+# Target languages
+LANGUAGES = ("java", "kotlin")
+
+# Type families with their own type tables
+DIALECTS = ("generic", "mysql", "postgresql", "h2", "sqlserver")
+
+# Logical type used for types no table knows
+DEFAULT_LOGICAL_TYPE = "string"
+
+# Logical types per target language
+LANGUAGE_TYPES: Dict[str, Dict[str, str]] = {
+    "java": {
+        "int8": "Byte",
+        "int16": "Short",
+        "int32": "Integer",
+        "int64": "Long",
+        "biginteger": "java.math.BigInteger",
+        "decimal": "java.math.BigDecimal",
+        "float32": "Float",
+        "float64": "Double",
+        "bool": "Boolean",
+        "string": "String",
+        "date": "java.time.LocalDate",
+        "time": "java.time.LocalTime",
+        "time_tz": "java.time.OffsetTime",
+        "datetime": "java.time.LocalDateTime",
+        "datetime_tz": "java.time.OffsetDateTime",
+        "bytes": "byte[]",
+        "uuid": "java.util.UUID",
+    },
+    "kotlin": {
+        "int8": "Byte",
+        "int16": "Short",
+        "int32": "Int",
+        "int64": "Long",
+        "biginteger": "java.math.BigInteger",
+        "decimal": "java.math.BigDecimal",
+        "float32": "Float",
+        "float64": "Double",
+        "bool": "Boolean",
+        "string": "String",
+        "date": "java.time.LocalDate",
+        "time": "java.time.LocalTime",
+        "time_tz": "java.time.OffsetTime",
+        "datetime": "java.time.LocalDateTime",
+        "datetime_tz": "java.time.OffsetDateTime",
+        "bytes": "ByteArray",
+        "uuid": "java.util.UUID",
+    },
+}
+
+# Types that never need an import, per target language
+BUILTIN_TYPES: Dict[str, FrozenSet[str]] = {
+    "java": frozenset({
+        "String", "Object", "Byte", "Short", "Integer", "Long", "Float", "Double", "Boolean", "Character",
+        "byte", "short", "int", "long", "float", "double", "boolean", "char", "void", "byte[]",
+    }),
+    "kotlin": frozenset({
+        "String", "Any", "Unit", "Byte", "Short", "Int", "Long", "Float", "Double", "Boolean", "Char",
+        "ByteArray",
+    }),
+}
+
+# SQL types understood by every dialect (the common subset of MySQL,
+# PostgreSQL, H2 and SQL Server type names)
+_GENERIC_TYPES: Dict[str, str] = {
+    "tinyint": "int8",
+    "smallint": "int16",
+    "mediumint": "int32",
+    "int": "int32",
+    "integer": "int32",
+    "bigint": "int64",
+    "int2": "int16",
+    "int4": "int32",
+    "int8": "int64",
+    "smallserial": "int16",
+    "serial": "int32",
+    "bigserial": "int64",
+    "decimal": "decimal",
+    "numeric": "decimal",
+    "dec": "decimal",
+    "number": "decimal",
+    "money": "decimal",
+    "smallmoney": "decimal",
+    "real": "float32",
+    "float4": "float32",
+    "float": "float64",
+    "float8": "float64",
+    "double": "float64",
+    "double precision": "float64",
+    "decfloat": "decimal",
+    "boolean": "bool",
+    "bool": "bool",
+    "bit": "bool",
+    "char": "string",
+    "character": "string",
+    "nchar": "string",
+    "varchar": "string",
+    "nvarchar": "string",
+    "varchar2": "string",
+    "character varying": "string",
+    "char varying": "string",
+    "varchar_ignorecase": "string",
+    "text": "string",
+    "tinytext": "string",
+    "mediumtext": "string",
+    "longtext": "string",
+    "ntext": "string",
+    "clob": "string",
+    "nclob": "string",
+    "character large object": "string",
+    "json": "string",
+    "jsonb": "string",
+    "xml": "string",
+    "enum": "string",
+    "set": "string",
+    "citext": "string",
+    "date": "date",
+    "time": "time",
+    "time without time zone": "time",
+    "timetz": "time_tz",
+    "time with time zone": "time_tz",
+    "datetime": "datetime",
+    "datetime2": "datetime",
+    "smalldatetime": "datetime",
+    "timestamp": "datetime",
+    "timestamp without time zone": "datetime",
+    "timestamptz": "datetime_tz",
+    "timestamp with time zone": "datetime_tz",
+    "datetimeoffset": "datetime_tz",
+    "year": "int16",
+    "binary": "bytes",
+    "varbinary": "bytes",
+    "binary varying": "bytes",
+    "blob": "bytes",
+    "tinyblob": "bytes",
+    "mediumblob": "bytes",
+    "longblob": "bytes",
+    "binary large object": "bytes",
+    "bytea": "bytes",
+    "image": "bytes",
+    "uuid": "uuid",
+    "uniqueidentifier": "uuid",
+}
+
+# Dialect-specific deviations from the generic table. Keys may include the
+# normalized arguments ("tinyint(1)") to match a specific size only.
+_DIALECT_TYPES: Dict[str, Dict[str, str]] = {
+    "generic": {},
+    "mysql": {
+        # BOOLEAN is an alias of TINYINT(1), and BIT(1) is used the same way
+        "tinyint(1)": "bool",
+        "bit(1)": "bool",
+        "bit": "bytes",
+        # FLOAT is single precision, REAL is DOUBLE unless REAL_AS_FLOAT is set
+        "float": "float32",
+        "real": "float64",
+    },
+    "postgresql": {
+        "bit": "string",
+        "bit(1)": "bool",
+        "varbit": "string",
+        "bit varying": "string",
+    },
+    "h2": {
+        "float": "float64",
+        "real": "float32",
+        "java_object": "bytes",
+    },
+    "sqlserver": {
+        # SQL Server TIMESTAMP is a row version, not a point in time
+        "timestamp": "bytes",
+        "rowversion": "bytes",
+        "float": "float64",
+        "real": "float32",
+    },
+}
+
+# Integer types that need the next wider type when UNSIGNED
+_UNSIGNED_WIDENING = {
+    "int8": "int16",
+    "int16": "int32",
+    "int32": "int64",
+    "int64": "biginteger",
+}
+
+# OpenAPI (type, format) pairs; a None format is the fallback for the type
+_OPENAPI_TYPES: Dict[Tuple[str, Optional[str]], str] = {
+    ("integer", None): "int32",
+    ("integer", "int32"): "int32",
+    ("integer", "int64"): "int64",
+    ("number", None): "float64",
+    ("number", "float"): "float32",
+    ("number", "double"): "float64",
+    ("boolean", None): "bool",
+    ("string", None): "string",
+    ("string", "date"): "date",
+    ("string", "date-time"): "datetime_tz",
+    ("string", "uuid"): "uuid",
+    ("string", "byte"): "bytes",
+    ("string", "binary"): "bytes",
+}
+
+_WHITESPACE = re.compile(r"\s+")
+_ARGUMENTS = re.compile(r"\s*\(\s*([^)]*?)\s*\)")
+_MODIFIERS = re.compile(r"\b(unsigned|signed|zerofill)\b")
+
+
+def normalize_sql_type(sql_type: str) -> Tuple[str, str, bool]:
+    """Normalize an SQL column type.
+
+    Args:
+        sql_type: Column type as written in the DDL (e.g. "INT(11) UNSIGNED")
+
+    Returns:
+        Tuple[str, str, bool]: Base type name ("int"), normalized arguments
+            ("11", empty if none) and whether the type is unsigned
+    """
+    text = _WHITESPACE.sub(" ", sql_type.strip().lower())
+    unsigned = False
+    if "signed" in text or "zerofill" in text:
+        unsigned = "unsigned" in text
+        text = _MODIFIERS.sub("", text)
+
+    arguments = ""
+    match = _ARGUMENTS.search(text)
+    if match:
+        arguments = match.group(1).replace(" ", "")
+        text = text[:match.start()] + text[match.end():]
+
+    return _WHITESPACE.sub(" ", text).strip(), arguments, unsigned
+
+
+@lru_cache(maxsize=4096)
+def logical_type(column_type: str, dialect: str = "generic") -> str:
+    """Resolve a column type to its logical type.
+
+    Args:
+        column_type: SQL type
+        dialect: Type family (see DIALECTS); unknown dialects use the generic table
+
+    Returns:
+        str: Logical type (a key of the LANGUAGE_TYPES tables)
+    """
+    base, arguments, unsigned = normalize_sql_type(column_type)
+
+    array = base.endswith("[]")
+    if array:
+        base = base[:-2].strip()
+
+    overrides = _DIALECT_TYPES.get(dialect, {})
+    logical = None
+    if arguments:
+        logical = overrides.get(f"{base}({arguments})")
+    if logical is None:
+        logical = overrides.get(base) or _GENERIC_TYPES.get(base, DEFAULT_LOGICAL_TYPE)
+
+    if unsigned:
+        logical = _UNSIGNED_WIDENING.get(logical, logical)
+    return f"{logical}[]" if array else logical
+
+
+@lru_cache(maxsize=4096)
+def map_column_type(column_type: str, language: str = "java", dialect: str = "generic") -> str:
+    """Map a database column type to a Java or Kotlin type.
+
+    Args:
+        column_type: SQL type, e.g. "VARCHAR(255)"
+        language: Target language ("java" or "kotlin")
+        dialect: Type family (see DIALECTS)
+
+    Returns:
+        str: Target language type (arrays become ``List<...>``)
+
+    Raises:
+        ValueError: If the language is not supported
+    """
+    return _to_language(logical_type(column_type, dialect), language)
+
+
+@lru_cache(maxsize=1024)
+def map_openapi_type(openapi_type: str, openapi_format: Optional[str] = None, language: str = "java") -> str:
+    """Map an OpenAPI schema type to a Java or Kotlin type.
+
+    Args:
+        openapi_type: OpenAPI type (integer, number, string, boolean, ...)
+        openapi_format: Optional OpenAPI format (int64, date-time, uuid, ...)
+        language: Target language ("java" or "kotlin")
+
+    Returns:
+        str: Target language type ("Object"/"Any" for objects and unknown types)
+
+    Raises:
+        ValueError: If the language is not supported
+    """
+    logical = _OPENAPI_TYPES.get((openapi_type, openapi_format)) or _OPENAPI_TYPES.get((openapi_type, None))
+    if logical is None:
+        if language not in LANGUAGE_TYPES:
+            raise ValueError(f"Unsupported language: {language}")
+        return "Any" if language == "kotlin" else "Object"
+    return _to_language(logical, language)
+
+
+def map_openapi_schema(schema: Dict[str, Any], language: str = "java", default: str = "void") -> str:
+    """Map an OpenAPI schema, including references and arrays, to a Java or Kotlin type.
+
+    Args:
+        schema: JSON schema (``$ref``, ``type``/``format`` or an array of either)
+        language: Target language ("java" or "kotlin")
+        default: Type used for an empty schema
+
+    Returns:
+        str: Referenced model name, ``List<...>`` for arrays or the mapped type
+
+    Raises:
+        ValueError: If the language is not supported
+    """
+    if not schema:
+        return default
+    if "$ref" in schema:
+        return ref_name(schema["$ref"])
+    if schema.get("type") == "array":
+        items = schema.get("items") or {"type": "object"}
+        return f"List<{map_openapi_schema(items, language, default)}>"
+    if "type" in schema:
+        return map_openapi_type(schema["type"], schema.get("format"), language)
+    return default
+
+
+def is_builtin_type(type_name: str, language: str = "java") -> bool:
+    """Check whether a type is available without an import.
+
+    Args:
+        type_name: Simple or qualified type name
+        language: Target language ("java" or "kotlin")
+
+    Returns:
+        bool: True for language built-ins such as String or Int
+    """
+    return type_name in BUILTIN_TYPES.get(language, frozenset())
+
+
+def _to_language(logical: str, language: str) -> str:
+    """Map a logical type to the target language.
+
+    Args:
+        logical: Logical type, possibly with an array suffix
+        language: Target language
+
+    Returns:
+        str: Target language type
+
+    Raises:
+        ValueError: If the language is not supported
+    """
+    types = LANGUAGE_TYPES.get(language)
+    if types is None:
+        raise ValueError(f"Unsupported language: {language}")
+    if logical.endswith("[]"):
+        return f"List<{types[logical[:-2]]}>"
+    return types[logical]
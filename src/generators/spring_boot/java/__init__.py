@@ -1,11 +1,11 @@
 """Spring Boot generator for Java applications."""
 
 import os
-import json
 from typing import Dict, List, Any, Optional
 import re
 
 from src.generators.base import BaseGenerator
+from src.generators.schema.ir import Schema
 from src.generators.architecture import ServiceArchitecture
 from src.core.logging import get_logger
 
@@ -57,9 +57,7 @@ class SpringBootJavaGenerator(BaseGenerator):
             "features": config.get("features", []),
         }
           # Render pom.xml template using Spring Boot specific Maven template
-        pom_content = self.render_template("build-systems/maven/spring-boot/pom.xml.j2", context)
-        with open(os.path.join(project_dir, "pom.xml"), "w") as f:
-            f.write(pom_content)
+        self._emit(os.path.join(project_dir, "pom.xml"), "build-systems/maven/spring-boot/pom.xml.j2", context)
     def _generate_gradle_config(self, project_dir: str, config: Dict[str, Any]) -> None:
         """Generate Gradle configuration (build.gradle).
         
@@ -85,29 +83,19 @@ class SpringBootJavaGenerator(BaseGenerator):
         }
         
         # Render build.gradle template
-        build_gradle_content = self.render_template("build-systems/gradle/groovy/spring-boot/build.gradle.j2", context)
-        with open(os.path.join(project_dir, "build.gradle"), "w") as f:
-            f.write(build_gradle_content)
+        self._emit(os.path.join(project_dir, "build.gradle"), "build-systems/gradle/groovy/spring-boot/build.gradle.j2", context)
         
         # Render settings.gradle template
-        settings_gradle_content = self.render_template("build-systems/gradle/groovy/settings.gradle.j2", context)
-        with open(os.path.join(project_dir, "settings.gradle"), "w") as f:
-            f.write(settings_gradle_content)
+        self._emit(os.path.join(project_dir, "settings.gradle"), "build-systems/gradle/groovy/settings.gradle.j2", context)
           # Add Gradle wrapper
         gradle_wrapper_dir = os.path.join(project_dir, "gradle", "wrapper")
-        os.makedirs(gradle_wrapper_dir, exist_ok=True)
+        self._ensure_dir(gradle_wrapper_dir)
         
-        gradle_wrapper_props = self.render_template("build-systems/gradle/wrapper/gradle-wrapper.properties.j2", context)
-        with open(os.path.join(gradle_wrapper_dir, "gradle-wrapper.properties"), "w") as f:
-            f.write(gradle_wrapper_props)
+        self._emit(os.path.join(gradle_wrapper_dir, "gradle-wrapper.properties"), "build-systems/gradle/wrapper/gradle-wrapper.properties.j2", context)
         
-        gradlew_content = self.render_template("build-systems/gradle/wrapper/gradlew.j2", {})
-        with open(os.path.join(project_dir, "gradlew"), "w") as f:
-            f.write(gradlew_content)
+        self._emit(os.path.join(project_dir, "gradlew"), "build-systems/gradle/wrapper/gradlew.j2", {})
         
-        gradlew_bat_content = self.render_template("build-systems/gradle/wrapper/gradlew.bat.j2", {})
-        with open(os.path.join(project_dir, "gradlew.bat"), "w") as f:
-            f.write(gradlew_bat_content)
+        self._emit(os.path.join(project_dir, "gradlew.bat"), "build-systems/gradle/wrapper/gradlew.bat.j2", {})
     
     def _generate_source_code(self, project_dir: str, config: Dict[str, Any]) -> None:
         """Generate source code files.
@@ -136,7 +124,7 @@ class SpringBootJavaGenerator(BaseGenerator):
             os.path.join(src_main_resources, "static"),
             os.path.join(src_main_resources, "templates"),
         ]:
-            os.makedirs(path, exist_ok=True)
+            self._ensure_dir(path)
             
         # Get architecture handler
         architecture = self.get_architecture_handler(config)
@@ -159,10 +147,8 @@ class SpringBootJavaGenerator(BaseGenerator):
         context.update(architecture.get_template_context_additions(config))
         
         # Generate application class
-        app_class_content = self.render_template("frameworks/spring-boot/java/Application.java.j2", context)
         app_class_path = os.path.join(base_package_dir, f"{context['application_name']}.java")
-        with open(app_class_path, "w") as f:
-            f.write(app_class_content)
+        self._emit(app_class_path, "frameworks/spring-boot/java/Application.java.j2", context)
         
         # Generate configuration
         self._generate_application_config(src_main_resources, context, config)
@@ -188,14 +174,14 @@ class SpringBootJavaGenerator(BaseGenerator):
         
         # Test source directories
         src_test_java = os.path.join(project_dir, "src", "test", "java", base_package_path)
-        os.makedirs(src_test_java, exist_ok=True)
+        self._ensure_dir(src_test_java)
         
         src_test_resources = os.path.join(project_dir, "src", "test", "resources")
-        os.makedirs(src_test_resources, exist_ok=True)
+        self._ensure_dir(src_test_resources)
         
         # Create test directories
         for dir_name in ["controller", "service", "repository"]:
-            os.makedirs(os.path.join(src_test_java, dir_name), exist_ok=True)
+            self._ensure_dir(os.path.join(src_test_java, dir_name))
         
         # Context for template rendering
         context = {
@@ -205,16 +191,12 @@ class SpringBootJavaGenerator(BaseGenerator):
         }
         
         # Generate application tests
-        app_test_content = self.render_template("frameworks/spring-boot/java/test/ApplicationTests.java.j2", context)
         test_file_path = os.path.join(project_dir, "src", "test", "java", base_package_path, f"{context['application_name']}Tests.java")
-        os.makedirs(os.path.dirname(test_file_path), exist_ok=True)
-        with open(test_file_path, "w") as f:
-            f.write(app_test_content)
+        self._ensure_dir(os.path.dirname(test_file_path))
+        self._emit(test_file_path, "frameworks/spring-boot/java/test/ApplicationTests.java.j2", context)
         
         # Generate test configuration
-        test_properties = self.render_template("frameworks/spring-boot/resources/application-test.properties.j2", context)
-        with open(os.path.join(src_test_resources, "application-test.properties"), "w") as f:
-            f.write(test_properties)
+        self._emit(os.path.join(src_test_resources, "application-test.properties"), "frameworks/spring-boot/resources/application-test.properties.j2", context)
           # Generate sample tests
         swagger_path = config.get("swagger_file")
         if swagger_path:
@@ -232,19 +214,13 @@ class SpringBootJavaGenerator(BaseGenerator):
         use_yaml = any(feature == "yaml-config" for feature in config.get("features", []))
         
         if use_yaml:
-            app_config = self.render_template("frameworks/spring-boot/resources/application.yml.j2", context)
-            with open(os.path.join(resources_dir, "application.yml"), "w") as f:
-                f.write(app_config)
+            self._emit(os.path.join(resources_dir, "application.yml"), "frameworks/spring-boot/resources/application.yml.j2", context)
         else:
             # Default to YAML if properties template doesn't exist
-            app_config = self.render_template("frameworks/spring-boot/resources/application.yml.j2", context)
-            with open(os.path.join(resources_dir, "application.yml"), "w") as f:
-                f.write(app_config)
+            self._emit(os.path.join(resources_dir, "application.yml"), "frameworks/spring-boot/resources/application.yml.j2", context)
           # Generate logback configuration if needed
         if any(feature == "logging" for feature in config.get("features", [])):
-            logback_config = self.render_template("frameworks/spring-boot/resources/logback-spring.xml.j2", context)
-            with open(os.path.join(resources_dir, "logback-spring.xml"), "w") as f:
-                f.write(logback_config)
+            self._emit(os.path.join(resources_dir, "logback-spring.xml"), "frameworks/spring-boot/resources/logback-spring.xml.j2", context)
     
     def _generate_from_swagger(self, src_dir: str, swagger_path: str, context: Dict[str, Any], config: Dict[str, Any]) -> None:
         """Generate code from Swagger/OpenAPI definition.
@@ -255,95 +231,82 @@ class SpringBootJavaGenerator(BaseGenerator):
             context: Template rendering context
             config: Project configuration dictionary
         """
-        api_info = self.parse_swagger_file(swagger_path)
-        if not api_info:
+        api = self._get_api_schema(swagger_path)
+        if api is None:
             self.logger.warning("Failed to parse Swagger file or empty API definition")
             return
         
         # Generate models
-        self._generate_models(src_dir, api_info, context, config)
+        self._generate_models(src_dir, api, context, config)
         
         # Generate DTOs
-        self._generate_dtos(src_dir, api_info, context, config)
+        self._generate_dtos(src_dir, api, context, config)
         
         # Generate controllers
-        self._generate_controllers(src_dir, api_info, context, config)
+        self._generate_controllers(src_dir, api, context, config)
         
         # Generate services
-        self._generate_services(src_dir, api_info, context, config)
+        self._generate_services(src_dir, api, context, config)
         
         # Generate repositories
-        self._generate_repositories(src_dir, api_info, context, config)
+        self._generate_repositories(src_dir, api, context, config)
         
         # Generate mappers
-        self._generate_mappers(src_dir, api_info, context, config)
+        self._generate_mappers(src_dir, api, context, config)
     
-    def _generate_models(self, src_dir: str, api_info: Dict[str, Any], context: Dict[str, Any], config: Dict[str, Any]) -> None:
+    def _generate_models(self, src_dir: str, api: Schema, context: Dict[str, Any], config: Dict[str, Any]) -> None:
         """Generate model classes from API info.
         
         Args:
             src_dir: Source directory for generated code
-            api_info: API information extracted from Swagger
+            api: Models and endpoints of the API
             context: Template rendering context
             config: Project configuration dictionary
         """
         model_dir = os.path.join(src_dir, "model")
         
-        for model_name, model_info in api_info.get("models", {}).items():
-            if model_info["type"] == "entity":
-                # Prepare model context
-                model_context = {**context, "model": model_info}
-                  # Generate entity class
-                entity_content = self.render_template("frameworks/spring-boot/java/entity/Entity.java.j2", model_context)
-                with open(os.path.join(model_dir, f"{model_name}.java"), "w") as f:
-                    f.write(entity_content)
+        for model in api.entities_of_kind("entity"):
+            # Prepare model context
+            model_context = {**context, "model": model}
+            # Generate entity class
+            self._emit(os.path.join(model_dir, f"{model.name}.java"), "frameworks/spring-boot/java/entity/Entity.java.j2", model_context)
     
-    def _generate_dtos(self, src_dir: str, api_info: Dict[str, Any], context: Dict[str, Any], config: Dict[str, Any]) -> None:
+    def _generate_dtos(self, src_dir: str, api: Schema, context: Dict[str, Any], config: Dict[str, Any]) -> None:
         """Generate DTO classes from API info.
         
         Args:
             src_dir: Source directory for generated code
-            api_info: API information extracted from Swagger
+            api: Models and endpoints of the API
             context: Template rendering context
             config: Project configuration dictionary
         """
         dto_dir = os.path.join(src_dir, "dto")
         # Create DTO directory if it doesn't exist
-        os.makedirs(dto_dir, exist_ok=True)
+        self._ensure_dir(dto_dir)
         
-        for model_name, model_info in api_info.get("models", {}).items():
-            if model_info["type"] == "dto" or any(feature == "generate-dtos" for feature in config.get("features", [])):
+        generate_all = any(feature == "generate-dtos" for feature in config.get("features", []))
+        for model in api.entities:
+            if model.kind == "dto" or generate_all:
                 # Prepare DTO context
-                dto_context = {**context, "dto": model_info}
+                dto_context = {**context, "dto": model}
                 # Generate DTO class
-                dto_content = self.render_template("frameworks/spring-boot/java/dto/DTO.java.j2", dto_context)
-                with open(os.path.join(dto_dir, f"{model_name}.java"), "w") as f:
-                    f.write(dto_content)
+                self._emit(os.path.join(dto_dir, f"{model.name}.java"), "frameworks/spring-boot/java/dto/DTO.java.j2", dto_context)
     
-    def _generate_controllers(self, src_dir: str, api_info: Dict[str, Any], context: Dict[str, Any], config: Dict[str, Any]) -> None:
+    def _generate_controllers(self, src_dir: str, api: Schema, context: Dict[str, Any], config: Dict[str, Any]) -> None:
         """Generate controller classes from API info.
         
         Args:
             src_dir: Source directory for generated code
-            api_info: API information extracted from Swagger
+            api: Models and endpoints of the API
             context: Template rendering context
             config: Project configuration dictionary
         """
         controller_dir = os.path.join(src_dir, "controller")
         # Create controller directory if it doesn't exist
-        os.makedirs(controller_dir, exist_ok=True)
-        
-        # Group endpoints by tag
-        endpoints_by_tag = {}
-        for endpoint in api_info.get("endpoints", []):
-            tags = endpoint.get("tags", ["Default"])
-            for tag in tags:
-                if tag not in endpoints_by_tag:
-                    endpoints_by_tag[tag] = []
-                endpoints_by_tag[tag].append(endpoint)
+        self._ensure_dir(controller_dir)
         
         # Generate controller per tag
-        for tag, endpoints in endpoints_by_tag.items():
+        for tag, endpoints in api.index.by_tag.items():
             controller_name = self._to_pascal_case(tag) + "Controller"
             
             # Prepare controller context
@@ -351,41 +314,31 @@ class SpringBootJavaGenerator(BaseGenerator):
                 **context,
                 "controller_name": controller_name,
                 "tag": tag,
-                "endpoints": endpoints
+                "endpoints": endpoints,
+                "models": api.index.models_by_tag[tag]
             }
               # Generate controller class
-            controller_content = self.render_template("frameworks/spring-boot/java/controller/Controller.java.j2", controller_context)
-            with open(os.path.join(controller_dir, f"{controller_name}.java"), "w") as f:
-                f.write(controller_content)
+            self._emit(os.path.join(controller_dir, f"{controller_name}.java"), "frameworks/spring-boot/java/controller/Controller.java.j2", controller_context)
     
-    def _generate_services(self, src_dir: str, api_info: Dict[str, Any], context: Dict[str, Any], config: Dict[str, Any]) -> None:
+    def _generate_services(self, src_dir: str, api: Schema, context: Dict[str, Any], config: Dict[str, Any]) -> None:
         """Generate service classes from API info.
         
         Args:
             src_dir: Source directory for generated code
-            api_info: API information extracted from Swagger
+            api: Models and endpoints of the API
             context: Template rendering context
             config: Project configuration dictionary
         """
         service_dir = os.path.join(src_dir, "service")
         impl_dir = os.path.join(service_dir, "impl")
         # Create service and impl directories
-        os.makedirs(service_dir, exist_ok=True)
-        os.makedirs(impl_dir, exist_ok=True)
+        self._ensure_dir(service_dir)
+        self._ensure_dir(impl_dir)
         
         service_type = config.get("service_type", "domain-driven")
         
-        # Group endpoints by tag (similar to controllers)
-        endpoints_by_tag = {}
-        for endpoint in api_info.get("endpoints", []):
-            tags = endpoint.get("tags", ["Default"])
-            for tag in tags:
-                if tag not in endpoints_by_tag:
-                    endpoints_by_tag[tag] = []
-                endpoints_by_tag[tag].append(endpoint)
-        
-        # Generate service interfaces and implementations
-        for tag, endpoints in endpoints_by_tag.items():
+        # Generate service interfaces and implementations per tag (like controllers)
+        for tag, endpoints in api.index.by_tag.items():
             service_name = self._to_pascal_case(tag) + "Service"
             impl_name = service_name + "Impl"
             
@@ -396,78 +349,70 @@ class SpringBootJavaGenerator(BaseGenerator):
                 "impl_name": impl_name,
                 "tag": tag,
                 "endpoints": endpoints,
+                "models": api.index.models_by_tag[tag],
                 "service_type": service_type
             }
               # Generate service interface
-            service_content = self.render_template("frameworks/spring-boot/java/service/Service.java.j2", service_context)
-            with open(os.path.join(service_dir, f"{service_name}.java"), "w") as f:
-                f.write(service_content)
+            self._emit(os.path.join(service_dir, f"{service_name}.java"), "frameworks/spring-boot/java/service/Service.java.j2", service_context)
             
             # Generate service implementation
-            impl_content = self.render_template("frameworks/spring-boot/java/service/ServiceImpl.java.j2", service_context)
-            with open(os.path.join(service_dir, "impl", f"{impl_name}.java"), "w") as f:
-                f.write(impl_content)
+            self._emit(os.path.join(service_dir, "impl", f"{impl_name}.java"), "frameworks/spring-boot/java/service/ServiceImpl.java.j2", service_context)
     
-    def _generate_repositories(self, src_dir: str, api_info: Dict[str, Any], context: Dict[str, Any], config: Dict[str, Any]) -> None:
+    def _generate_repositories(self, src_dir: str, api: Schema, context: Dict[str, Any], config: Dict[str, Any]) -> None:
         """Generate repository interfaces from API info.
         
         Args:
             src_dir: Source directory for generated code
-            api_info: API information extracted from Swagger
+            api: Models and endpoints of the API
             context: Template rendering context
             config: Project configuration dictionary
         """
         repo_dir = os.path.join(src_dir, "repository")
         
-        for model_name, model_info in api_info.get("models", {}).items():
-            if model_info["type"] == "entity":
-                # Prepare repository context
-                repo_context = {
-                    **context,
-                    "model": model_info,
-                    "repository_name": f"{model_name}Repository"
-                }
-                  # Generate repository interface
-                repo_content = self.render_template("frameworks/spring-boot/java/repository/Repository.java.j2", repo_context)
-                with open(os.path.join(repo_dir, f"{repo_context['repository_name']}.java"), "w") as f:
-                    f.write(repo_content)
+        for model in api.entities_of_kind("entity"):
+            # Prepare repository context
+            repo_context = {
+                **context,
+                "model": model,
+                "repository_name": f"{model.name}Repository",
+                "endpoints": api.index.endpoints_of_model(model.name)
+            }
+            # Generate repository interface
+            self._emit(os.path.join(repo_dir, f"{repo_context['repository_name']}.java"), "frameworks/spring-boot/java/repository/Repository.java.j2", repo_context)
     
-    def _generate_mappers(self, src_dir: str, api_info: Dict[str, Any], context: Dict[str, Any], config: Dict[str, Any]) -> None:
+    def _generate_mappers(self, src_dir: str, api: Schema, context: Dict[str, Any], config: Dict[str, Any]) -> None:
         """Generate mapper classes for entity-DTO conversion.
         
         Args:
             src_dir: Source directory for generated code
-            api_info: API information extracted from Swagger
+            api: Models and endpoints of the API
             context: Template rendering context
             config: Project configuration dictionary
         """
         # Create mapper directory
         mapper_dir = os.path.join(src_dir, "mapper")
-        os.makedirs(mapper_dir, exist_ok=True)
+        self._ensure_dir(mapper_dir)
         
-        entities = [name for name, info in api_info.get("models", {}).items() if info["type"] == "entity"]
-        dtos = [name for name, info in api_info.get("models", {}).items() if info["type"] == "dto"]
+        dtos = api.entities_of_kind("dto")
         
         # Match entities with DTOs and generate mappers
-        for entity_name in entities:
+        for entity in api.entities_of_kind("entity"):
             # Find matching DTOs (e.g., UserDTO matches User)
-            matching_dtos = [dto for dto in dtos if entity_name in dto]
+            matching_dtos = [dto for dto in dtos if entity.name in dto.name]
             
             if matching_dtos:
-                for dto_name in matching_dtos:
+                for dto in matching_dtos:
                     # Prepare mapper context
                     mapper_context = {
                         **context,
-                        "entity": api_info["models"][entity_name],
-                        "dto": api_info["models"].get(dto_name, {}),
-                        "mapper_name": f"{entity_name}Mapper",
-                        "entity_name": entity_name,
-                        "dto_name": dto_name
+                        "entity": entity,
+                        "dto": dto,
+                        "mapper_name": f"{entity.name}Mapper",
+                        "entity_name": entity.name,
+                        "dto_name": dto.name
                     }
                       # Generate mapper class
-                    mapper_content = self.render_template("frameworks/spring-boot/java/mapper/Mapper.java.j2", mapper_context)
-                    with open(os.path.join(mapper_dir, f"{mapper_context['mapper_name']}.java"), "w") as f:
-                        f.write(mapper_content)
+                    self._emit(os.path.join(mapper_dir, f"{mapper_context['mapper_name']}.java"), "frameworks/spring-boot/java/mapper/Mapper.java.j2", mapper_context)
     
     def _generate_tests_from_swagger(self, test_dir: str, swagger_path: str, context: Dict[str, Any], config: Dict[str, Any]) -> None:
         """Generate tests from Swagger/OpenAPI definition.
@@ -478,18 +423,11 @@ class SpringBootJavaGenerator(BaseGenerator):
             context: Template rendering context
             config: Project configuration dictionary
         """
-        api_info = self.parse_swagger_file(swagger_path)
-        if not api_info:
+        api = self._get_api_schema(swagger_path)
+        if api is None:
             return
         
-        # Group endpoints by tag
-        endpoints_by_tag = {}
-        for endpoint in api_info.get("endpoints", []):
-            tags = endpoint.get("tags", ["Default"])
-            for tag in tags:
-                if tag not in endpoints_by_tag:
-                    endpoints_by_tag[tag] = []
-                endpoints_by_tag[tag].append(endpoint)
+        endpoints_by_tag = api.index.by_tag
         
         # Generate controller tests
         controller_test_dir = os.path.join(test_dir, "controller")
@@ -506,9 +444,7 @@ class SpringBootJavaGenerator(BaseGenerator):
                 "endpoints": endpoints
             }
               # Generate controller test class
-            test_content = self.render_template("frameworks/spring-boot/java/test/ControllerTest.java.j2", test_context)
-            with open(os.path.join(controller_test_dir, f"{test_name}.java"), "w") as f:
-                f.write(test_content)
+            self._emit(os.path.join(controller_test_dir, f"{test_name}.java"), "frameworks/spring-boot/java/test/ControllerTest.java.j2", test_context)
         
         # Generate service tests
         service_test_dir = os.path.join(test_dir, "service")
@@ -525,9 +461,7 @@ class SpringBootJavaGenerator(BaseGenerator):
                 "endpoints": endpoints
             }
               # Generate service test class
-            test_content = self.render_template("frameworks/spring-boot/java/test/ServiceTest.java.j2", test_context)
-            with open(os.path.join(service_test_dir, f"{test_name}.java"), "w") as f:
-                f.write(test_content)
+            self._emit(os.path.join(service_test_dir, f"{test_name}.java"), "frameworks/spring-boot/java/test/ServiceTest.java.j2", test_context)
     def _generate_sample_code(self, src_dir: str, context: Dict[str, Any], config: Dict[str, Any]) -> None:
         """Generate sample code when no Swagger file is provided.
         
@@ -538,39 +472,27 @@ class SpringBootJavaGenerator(BaseGenerator):
         """
         # Create sample model
         model_dir = os.path.join(src_dir, "model")
-        sample_model = self.render_template("frameworks/spring-boot/java/entity/SampleEntity.java.j2", context)
-        with open(os.path.join(model_dir, "SampleEntity.java"), "w") as f:
-            f.write(sample_model)
+        self._emit(os.path.join(model_dir, "SampleEntity.java"), "frameworks/spring-boot/java/entity/SampleEntity.java.j2", context)
           # Create sample DTO
         dto_dir = os.path.join(src_dir, "dto")
-        sample_dto = self.render_template("frameworks/spring-boot/java/dto/SampleDTO.java.j2", context)
-        with open(os.path.join(dto_dir, "SampleDTO.java"), "w") as f:
-            f.write(sample_dto)
+        self._emit(os.path.join(dto_dir, "SampleDTO.java"), "frameworks/spring-boot/java/dto/SampleDTO.java.j2", context)
         
         # Create sample controller
         controller_dir = os.path.join(src_dir, "controller")
-        sample_controller = self.render_template("frameworks/spring-boot/java/controller/SampleController.java.j2", context)
-        with open(os.path.join(controller_dir, "SampleController.java"), "w") as f:
-            f.write(sample_controller)
+        self._emit(os.path.join(controller_dir, "SampleController.java"), "frameworks/spring-boot/java/controller/SampleController.java.j2", context)
         
         # Create sample service
         service_dir = os.path.join(src_dir, "service")
         impl_dir = os.path.join(service_dir, "impl")
-        os.makedirs(impl_dir, exist_ok=True)
+        self._ensure_dir(impl_dir)
         
-        sample_service = self.render_template("frameworks/spring-boot/java/service/SampleService.java.j2", context)
-        with open(os.path.join(service_dir, "SampleService.java"), "w") as f:
-            f.write(sample_service)
+        self._emit(os.path.join(service_dir, "SampleService.java"), "frameworks/spring-boot/java/service/SampleService.java.j2", context)
         
-        sample_service_impl = self.render_template("frameworks/spring-boot/java/service/SampleServiceImpl.java.j2", context)
-        with open(os.path.join(impl_dir, "SampleServiceImpl.java"), "w") as f:
-            f.write(sample_service_impl)
+        self._emit(os.path.join(impl_dir, "SampleServiceImpl.java"), "frameworks/spring-boot/java/service/SampleServiceImpl.java.j2", context)
         
         # Create sample repository
         repo_dir = os.path.join(src_dir, "repository")
-        sample_repo = self.render_template("frameworks/spring-boot/java/repository/SampleRepository.java.j2", context)
-        with open(os.path.join(repo_dir, "SampleRepository.java"), "w") as f:
-            f.write(sample_repo)
+        self._emit(os.path.join(repo_dir, "SampleRepository.java"), "frameworks/spring-boot/java/repository/SampleRepository.java.j2", context)
     
     def _to_pascal_case(self, text: str) -> str:
         """Convert string to PascalCase.
@@ -675,143 +597,3 @@ class SpringBootJavaGenerator(BaseGenerator):
         
         # Return an instance of the architecture handler
         return architecture_class()
-    def parse_swagger_file(self, swagger_path: str) -> Dict[str, Any]:
-        """Parse Swagger/OpenAPI file and extract API information.
-        
-        Args:
-            swagger_path: Path to the Swagger/OpenAPI definition file
-            
-        Returns:
-            Dict[str, Any]: Extracted API information including models and endpoints
-        """
-        import yaml
-        import os
-
-        _, ext = os.path.splitext(swagger_path)
-        
-        with open(swagger_path, "r") as f:
-            if ext.lower() in ['.yaml', '.yml']:
-                swagger_data = yaml.safe_load(f)
-            else:
-                swagger_data = json.load(f)
-        
-        api_info = {
-            "models": {},
-            "endpoints": []
-        }
-        
-        # Parse model definitions (OpenAPI 3.0)
-        components = swagger_data.get("components", {})
-        schemas = components.get("schemas", {})
-        
-        for model_name, schema in schemas.items():
-            # Determine if the model is an entity or DTO based on schema properties
-            is_entity = any(
-                prop.get("x-entity", False) 
-                for prop in schema.get("properties", {}).values()
-            )
-            
-            api_info["models"][model_name] = {
-                "name": model_name,
-                "type": "entity" if is_entity else "dto",
-                "properties": schema.get("properties", {}),
-                "required": schema.get("required", [])
-            }
-        
-        # Parse paths (endpoints)
-        paths = swagger_data.get("paths", {})
-        for path, methods in paths.items():
-            for method, operation in methods.items():
-                if method.lower() not in ["get", "post", "put", "delete", "patch"]:
-                    continue
-                
-                # Extract response type from successful response schemas
-                responses = operation.get("responses", {})
-                success_response = responses.get("200", {}) or responses.get("201", {})
-                response_schema = (
-                    success_response.get("content", {})
-                    .get("application/json", {})
-                    .get("schema", {})
-                )
-                
-                response_type = "void"
-                if response_schema:
-                    if "$ref" in response_schema:
-                        ref = response_schema["$ref"].split("/")[-1]
-                        response_type = ref
-                    elif response_schema.get("type") == "array":
-                        if "$ref" in response_schema.get("items", {}):
-                            ref = response_schema["items"]["$ref"].split("/")[-1]
-                            response_type = f"List<{ref}>"
-                        else:
-                            response_type = f"List<{response_schema['items'].get('type', 'Object')}>"
-                    else:
-                        response_type = response_schema.get("type", "void")
-                
-                # Extract parameters
-                parameters = []
-                for param in operation.get("parameters", []):
-                    param_schema = param.get("schema", {})
-                    param_type = "String"  # Default to String if type not specified
-                    
-                    if "$ref" in param_schema:
-                        ref = param_schema["$ref"].split("/")[-1]
-                        param_type = ref
-                    elif param_schema.get("type") == "array":
-                        if "$ref" in param_schema.get("items", {}):
-                            ref = param_schema["items"]["$ref"].split("/")[-1]
-                            param_type = f"List<{ref}>"
-                        else:
-                            param_type = f"List<{param_schema['items'].get('type', 'Object')}>"
-                    elif "type" in param_schema:
-                        type_mapping = {
-                            "string": "String",
-                            "integer": "Integer",
-                            "number": "Double",
-                            "boolean": "Boolean",
-                            "array": "List",
-                            "object": "Object"
-                        }
-                        param_type = type_mapping.get(param_schema["type"], "String")
-                    
-                    parameters.append({
-                        "name": param["name"],
-                        "type": param_type,
-                        "in": param["in"],
-                        "required": param.get("required", False)
-                    })
-                
-                # Extract request body if present
-                if "requestBody" in operation:
-                    request_schema = (
-                        operation["requestBody"]
-                        .get("content", {})
-                        .get("application/json", {})
-                        .get("schema", {})
-                    )
-                    
-                    if request_schema:
-                        if "$ref" in request_schema:
-                            ref = request_schema["$ref"].split("/")[-1]
-                            parameters.append({
-                                "name": self._to_camel_case(ref, False),
-                                "type": ref,
-                                "in": "body",
-                                "required": True
-                            })
-                
-                endpoint = {
-                    "path": path,
-                    "method": method.upper(),
-                    "operationId": operation.get("operationId", ""),
-                    "tags": operation.get("tags", ["Default"]),
-                    "summary": operation.get("summary", ""),
-                    "parameters": parameters,
-                    "response": {
-                        "type": response_type
-                    }
-                }
-                
-                api_info["endpoints"].append(endpoint)
-        
-        return api_info
@@ -4,7 +4,7 @@ import streamlit as st
 import pandas as pd
 from src.ui.utils.helpers import update_selection
 from src.ui.styles.css import apply_custom_css
-from src.ui.utils.core_integration import parse_ddl_file
+from src.ui.utils.core_integration import parse_ddl_file, read_schema_snapshot
 
 
 def render_step_1_ui(languages, frameworks, build_tools, pipelines, databases, features, service_types):
@@ -308,7 +308,8 @@ def render_step_2_ui():
             if preview_btn:
                 with st.spinner("Parsing DDL and generating entities..."):
                     try:
-                        parsed_entities = parse_ddl_file(ddl_content)
+                        database = st.session_state.selections.get('database')
+                        parsed_entities = parse_ddl_file(ddl_content, database["id"] if database else None)
                         
                         if parsed_entities:
                             # Show preview of parsed entities in a table
@@ -340,6 +341,21 @@ def render_step_2_ui():
                             st.warning("No entities found in the DDL file")
                     except Exception as e:
                         st.error(f"Error parsing DDL: {str(e)}")
+        
+        st.write("Or upload a schema snapshot saved by an earlier generation (`--save-schema-snapshot`).")
+        snapshot_file = st.file_uploader("Upload Schema Snapshot", type=["mgschema"], key="snapshot_uploader")
+        if snapshot_file:
+            snapshot_data = snapshot_file.getvalue()
+            snapshot_info = read_schema_snapshot(snapshot_data)
+            if snapshot_info:
+                st.session_state.selections['schema_snapshot'] = snapshot_data
+                st.success(f"Schema snapshot with {snapshot_info['entities']} entities "
+                           f"({snapshot_info['language']}, {snapshot_info['dialect']}) will be used for generation")
+            else:
+                st.session_state.selections['schema_snapshot'] = None
+                st.error("The uploaded file is not a valid schema snapshot")
+        else:
+            st.session_state.selections['schema_snapshot'] = None
     
     # Tab 2: Manual Entity Design
     with tabs[1]:
@@ -626,6 +642,11 @@ def render_step_4_ui(generate_zip_fn):
             value="./output",
             help="Directory where the generated code will be placed"
         )
+        write_to_disk = st.checkbox(
+            "Write project to output directory",
+            value=True,
+            help="Uncheck to generate the project straight into a ZIP download without writing files on the server"
+        )
         
     with col2:
         # Generate button
@@ -639,25 +660,41 @@ def render_step_4_ui(generate_zip_fn):
                 
                 # Generate the project
                 config = prepare_config_from_ui(st.session_state)
-                project_path = generate_project_from_ui(config)
                 
-                if project_path and os.path.exists(project_path):
-                    st.session_state.generated_path = project_path
-                    st.session_state.show_download = True
-                      # Save to project history
-                    from src.ui.state.session_state import save_project_to_history
-                    save_project_to_history()
+                if not write_to_disk:
+                    from src.ui.utils.core_integration import generate_project_archive_from_ui
                     
-                    # Success message with project path
-                    st.success(f"Project generated successfully at: {project_path}")
-                    
-                    # Show file structure
-                    show_file_structure(project_path)
+                    # Generate straight into an in-memory ZIP
+                    archive = generate_project_archive_from_ui(config)
+                    if archive:
+                        st.session_state.generated_zip = archive
+                        st.session_state.generated_path = None
+                        st.session_state.show_download = True
+                        st.success("Project generated successfully. Use the button below to download it.")
+                    else:
+                        st.error("Failed to generate project. See logs for details.")
                 else:
-                    st.error("Failed to generate project. See logs for details.")
+                    project_path = generate_project_from_ui(config)
+                    
+                    if project_path and os.path.exists(project_path):
+                        st.session_state.generated_path = project_path
+                        st.session_state.generated_zip = None
+                        st.session_state.show_download = True
+                        # Save to project history
+                        from src.ui.state.session_state import save_project_to_history
+                        save_project_to_history()
+                        
+                        # Success message with project path
+                        st.success(f"Project generated successfully at: {project_path}")
+                        
+                        # Show file structure
+                        show_file_structure(project_path)
+                    else:
+                        st.error("Failed to generate project. See logs for details.")
     
     # Download zip option
-    if st.session_state.show_download and hasattr(st.session_state, 'generated_path'):
+    if st.session_state.show_download and (getattr(st.session_state, 'generated_path', None)
+                                           or getattr(st.session_state, 'generated_zip', None)):
         col1, col2 = st.columns([1, 1])
         
         with col1:
@@ -670,7 +707,7 @@ def render_step_4_ui(generate_zip_fn):
             
         with col2:
             # Open folder button
-            if st.button("Open Project Folder"):
+            if st.session_state.generated_path and st.button("Open Project Folder"):
                 import subprocess
                 import os
                 
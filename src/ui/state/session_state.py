@@ -29,7 +29,8 @@ def initialize_session_state():
             'serviceType': None,
             'features': [],
             'swagger': None,
-            'ddl': None
+            'ddl': None,
+            'schema_snapshot': None
         }
         
     # File uploads
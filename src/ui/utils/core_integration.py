@@ -1,11 +1,12 @@
 """Integration utilities between UI and core functionality."""
 
+import io
 import os
 import json
 from typing import Dict, Any, Optional, List
 
 import streamlit as st
-from src.core.scaffolding import ScaffoldingEngine
+from src.core.scaffolding import ScaffoldingEngine, sql_dialect
 from src.core.config import Config
 from src.core.logging import get_logger
 
@@ -36,6 +37,37 @@ def generate_project_from_ui(config_data: Dict[str, Any]) -> Optional[str]:
         return None
 
 
+def generate_project_archive_from_ui(config_data: Dict[str, Any], archive_format: str = "zip",
+                                     compresslevel: Optional[int] = None) -> Optional[bytes]:
+    """Generate a project straight into an in-memory archive.
+    
+    Nothing is written to the output directory, so no project tree is left
+    behind on the server.
+    
+    Args:
+        config_data: Project configuration dictionary
+        archive_format: Archive format ("zip" or "tar.gz")
+        compresslevel: Compression level (0-9)
+        
+    Returns:
+        bytes: The archive contents, or None if generation failed
+    """
+    try:
+        logger.info(f"Generating project archive with config: {config_data}")
+        
+        from src.generators.base.output import create_archive_sink
+        buffer = io.BytesIO()
+        sink = create_archive_sink(buffer, archive_format=archive_format, compresslevel=compresslevel)
+        
+        engine = ScaffoldingEngine(output_dir=config_data.get("output_dir", "./output"))
+        engine.generate_project(config_data, sink=sink)
+        
+        return buffer.getvalue()
+    except Exception as e:
+        logger.error(f"Error generating project archive: {e}")
+        return None
+
+
 def prepare_config_from_ui(ui_data: Dict[str, Any]) -> Dict[str, Any]:
     """Convert UI form data to the format expected by the scaffolding engine.
     
@@ -108,6 +140,10 @@ def prepare_config_from_ui(ui_data: Dict[str, Any]) -> Dict[str, Any]:
     if selections.get("ddl"):
         config["ddl"] = selections["ddl"]
     
+    # Add schema snapshot if provided (replaces the entities)
+    if selections.get("schema_snapshot"):
+        config["schema_snapshot"] = selections["schema_snapshot"]
+    
     return config
 
 
@@ -190,22 +226,44 @@ def load_ui_settings() -> Dict[str, Any]:
         return default_settings
 
 
-def parse_ddl_file(file_content: str) -> List[Dict[str, Any]]:
+def parse_ddl_file(file_content: str, database: Optional[str] = None) -> List[Dict[str, Any]]:
     """Parse DDL file content to extract entity information.
     
     Args:
         file_content: Content of the DDL file
+        database: Database selected for the project, which decides the SQL dialect
         
     Returns:
         list: List of entity dictionaries
     """
     try:
         from src.generators.schema.ddl_parser import DDLParser
+        from src.generators.schema.schema_cache import SchemaCache
         
-        parser = DDLParser()
+        # Streamlit re-runs this on every interaction; the cache avoids re-parsing
+        parser = DDLParser(sql_dialect({"database": database}), cache=SchemaCache())
         entities = parser.parse_ddl(file_content)
         
         return entities
     except Exception as e:
         logger.error(f"Error parsing DDL file: {e}")
         return []
+
+
+def read_schema_snapshot(data: bytes) -> Optional[Dict[str, Any]]:
+    """Validate an uploaded schema snapshot and read its metadata.
+    
+    Args:
+        data: Contents of the snapshot file
+        
+    Returns:
+        dict: Snapshot metadata (language, dialect, number of entities, ...),
+            or None if the data is not a valid snapshot
+    """
+    from src.generators.schema.snapshot import SnapshotError, snapshot_info
+    
+    try:
+        return snapshot_info(data)
+    except SnapshotError as e:
+        logger.error(f"Error reading schema snapshot: {e}")
+        return None
@@ -23,7 +23,11 @@ def generate_zip():
     Returns:
         bytes: The ZIP file contents
     """
-    if not hasattr(st.session_state, 'generated_path') or not os.path.exists(st.session_state.generated_path):
+    # Projects generated straight into an archive are already zipped
+    if getattr(st.session_state, 'generated_zip', None):
+        return st.session_state.generated_zip
+    
+    if not getattr(st.session_state, 'generated_path', None) or not os.path.exists(st.session_state.generated_path):
         return create_simple_zip()
     
     # Create a ZIP file of the actual generated project
@@ -0,0 +1,277 @@
+"""Loading of YAML and JSON documents.
+
+YAML is parsed with the libyaml-based ``CSafeLoader`` when PyYAML was built
+with libyaml, which is an order of magnitude faster than the pure-Python
+``SafeLoader`` on large OpenAPI definitions. Both loaders only construct
+plain Python objects; without libyaml the pure-Python loader is used.
+
+The cyclic garbage collector is paused while a document is constructed:
+building millions of dictionaries and lists otherwise triggers collections
+that scan the growing, entirely reachable document again and again.
+
+``load_document_lazily`` indexes the entries of the block mappings at the
+top of a YAML document by scanning its text, and loads each entry from its
+own slice of the text on first access, so callers that read part of a large
+document pay for that part only.
+"""
+
+import gc
+import json
+import os
+from contextlib import contextmanager
+import re
+from typing import IO, Any, Dict, Iterator, Mapping, Optional, Tuple, Union
+
+import yaml
+from yaml.nodes import ScalarNode
+from yaml.resolver import Resolver
+
+# Safe loader class used for all YAML documents
+SafeLoader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+# Whether YAML is parsed by libyaml
+HAS_LIBYAML = SafeLoader is not yaml.SafeLoader
+
+# File extensions of YAML documents
+YAML_EXTENSIONS = (".yaml", ".yml")
+
+# Tag of string scalars
+_STR_TAG = "tag:yaml.org,2002:str"
+
+# Key of a block mapping entry: single-quoted, double-quoted without escapes,
+# or plain, followed by the value indicator
+_KEY_PATTERN = re.compile(
+    r"""(?:'((?:[^'\n]|'')*)'|"([^"\\\n]*)"|([^\s'"#&*!|>%@`{}\[\],?:-][^#\n]*?|-[^\s#][^#\n]*?))"""
+    r"[ \t]*:(?:[ \t]+|$)"
+)
+
+# Optional "---" line starting the document
+_DOCUMENT_START_PATTERN = re.compile(r"\A(?:[ \t]*(?:#[^\n]*)?\n)*---[ \t]*(?:#[^\n]*)?(?:\n|\Z)")
+
+# Aliases, which may refer to anchors of other entries
+_ALIAS_PATTERN = re.compile(r"\*[^\s\[\]{},*]")
+
+# Indentation of the first content line
+_INDENT_PATTERN = re.compile(r"^( *)[^ \n#]", re.MULTILINE)
+
+# Index entry: (entry start, entry end, whether the value starts on the next line)
+_Entry = Tuple[int, int, bool]
+
+_resolver = Resolver()
+
+
+def load_yaml(stream: Union[str, bytes, IO]) -> Any:
+    """Parse a YAML document.
+
+    Args:
+        stream: Document text, bytes or an open file
+
+    Returns:
+        Any: The document (None for an empty document)
+
+    Raises:
+        yaml.YAMLError: If the document is not valid YAML
+    """
+    with gc_paused():
+        return yaml.load(stream, Loader=SafeLoader)
+
+
+def load_document(path: str) -> Any:
+    """Load a YAML or JSON file, chosen by its extension.
+
+    Files ending in .yaml or .yml are parsed as YAML, all others as JSON.
+
+    Args:
+        path: File path
+
+    Returns:
+        Any: The document
+
+    Raises:
+        OSError: If the file cannot be read
+        ValueError: If the file is not valid JSON
+        yaml.YAMLError: If the file is not valid YAML
+    """
+    if os.path.splitext(path)[1].lower() in YAML_EXTENSIONS:
+        # libyaml detects the encoding itself and reads bytes without decoding them first
+        with open(path, "rb") as f:
+            return load_yaml(f)
+    with open(path, "r", encoding="utf-8") as f:
+        return json.load(f)
+
+
+def load_document_lazily(path: str, nested: Optional[Dict[str, int]] = None) -> Any:
+    """Load a YAML or JSON file, loading the entries of YAML mappings on demand.
+
+    The root of a YAML document written as a block mapping is returned as a
+    ``LazyMapping``. Documents that cannot be indexed safely (e.g. because
+    they use aliases), JSON files and other YAML documents are loaded as by
+    load_document().
+
+    Args:
+        path: File path
+        nested: Levels of block mappings below each root key whose entries
+            are loaded on demand too (e.g. ``{"components": 2}`` for the
+            component sections and their components); the values of other
+            keys are loaded whole on first access
+
+    Returns:
+        Any: The document
+
+    Raises:
+        OSError: If the file cannot be read
+        ValueError: If the file is not valid JSON
+        yaml.YAMLError: If the file is not valid YAML
+    """
+    if os.path.splitext(path)[1].lower() in YAML_EXTENSIONS:
+        with open(path, "rb") as f:
+            data = f.read()
+        try:
+            text = data.decode("utf-8").lstrip("\ufeff")
+        except UnicodeDecodeError:
+            text = None
+        if text is not None and not _has_aliases(text):
+            document_start = _DOCUMENT_START_PATTERN.match(text)
+            entries = _index_block_mapping(text, document_start.end() if document_start else 0, len(text))
+            if entries:
+                return LazyMapping(text, entries, nested=nested or {})
+        return load_yaml(data)
+    return load_document(path)
+
+
+class LazyMapping(Mapping):
+    """Read-only mapping over the text of a YAML block mapping.
+
+    Keys are read from the text up front; each value is loaded from the
+    text of its entry on first access and kept. Values that are block
+    mappings within the configured depth are lazy mappings themselves.
+    """
+
+    def __init__(self, text: str, entries: Dict[Any, _Entry], depth: int = 1,
+                 nested: Optional[Dict[str, int]] = None):
+        """Initialize the mapping.
+
+        Args:
+            text: Document text
+            entries: Position of the entry of each key (see _index_block_mapping)
+            depth: Levels of lazy mappings, including this one
+            nested: Depth of the values of each key (overrides depth - 1)
+        """
+        self._text = text
+        self._entries = entries
+        self._depth = depth
+        self._nested = nested
+        self._values: Dict[Any, Any] = {}
+
+    def __getitem__(self, key: Any) -> Any:
+        try:
+            return self._values[key]
+        except KeyError:
+            pass
+        start, end, block = self._entries[key]
+        depth = self._nested.get(key, 0) if self._nested is not None else self._depth - 1
+
+        value = None
+        if depth > 0 and block:
+            body = self._text.find("\n", start, end) + 1
+            entries = _index_block_mapping(self._text, body, end) if body else None
+            if entries:
+                value = LazyMapping(self._text, entries, depth)
+        if value is None:
+            value = next(iter(load_yaml(self._text[start:end]).values()))
+        self._values[key] = value
+        return value
+
+    def __iter__(self) -> Iterator[Any]:
+        return iter(self._entries)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def source(self, key: Any) -> str:
+        """Get the YAML text of the entry of a key.
+
+        Args:
+            key: Key of the mapping
+
+        Returns:
+            str: Text of the entry, including its key
+
+        Raises:
+            KeyError: If the mapping has no such key
+        """
+        start, end, _ = self._entries[key]
+        return self._text[start:end]
+
+
+def _has_aliases(text: str) -> bool:
+    """Check whether YAML text may contain aliases."""
+    return any(match.start() == 0 or text[match.start() - 1] in " \t\n[{,:-" for match in _ALIAS_PATTERN.finditer(text))
+
+
+def _index_block_mapping(text: str, start: int, end: int) -> Optional[Dict[Any, _Entry]]:
+    """Index the entries of a block mapping by scanning its text.
+
+    Args:
+        text: Document text
+        start: Start of the first line of the mapping
+        end: End of the mapping
+
+    Returns:
+        Optional[Dict[Any, _Entry]]: Position of the entry of each key, or
+            None if the text is not a block mapping with simple keys, or
+            lines less indented than the mapping make its extent unclear
+    """
+    first_line = _INDENT_PATTERN.search(text, start, end)
+    if first_line is None:
+        return None
+    indent = len(first_line.group(1))
+    # Patterns start with the newline so the scans skip ahead to line starts
+    if indent and re.compile(f"\n {{0,{indent - 1}}}[^ \n#]").search(text, first_line.start(), end):
+        return None
+    lines = [first_line.start()]
+    lines.extend(match.start() + 1 for match in re.compile(f"\n {{{indent}}}[^ \n#]").finditer(text, first_line.start(), end))
+
+    entries: Dict[Any, _Entry] = {}
+    previous = None
+    for line_start in lines:
+        content = line_start + indent
+        if text.startswith("-", content) and text[content + 1:content + 2] in (" ", "\n", ""):
+            # Item of a sequence that is the value of the previous entry
+            continue
+        line_end = text.find("\n", content, end)
+        line_end = end if line_end < 0 else line_end
+        match = _KEY_PATTERN.match(text, content, line_end)
+        if match is None:
+            return None
+
+        single_quoted, double_quoted, plain = match.groups()
+        if single_quoted is not None:
+            key = single_quoted.replace("''", "'")
+        elif double_quoted is not None:
+            key = double_quoted
+        elif _resolver.resolve(ScalarNode, plain, (True, False)) == _STR_TAG:
+            key = plain
+        else:
+            key = load_yaml(plain)
+
+        if previous is not None:
+            entries[previous[0]] = (previous[1], line_start, previous[2])
+        rest = text[match.end():line_end].strip()
+        previous = (key, line_start, not rest or rest.startswith("#"))
+    if previous is None:
+        return None
+    entries[previous[0]] = (previous[1], end, previous[2])
+    return entries
+
+
+@contextmanager
+def gc_paused() -> Iterator[None]:
+    """Disable the cyclic garbage collector for the duration of the block."""
+    enabled = gc.isenabled()
+    gc.disable()
+    try:
+        yield
+    finally:
+        if enabled:
+            gc.enable()
@@ -0,0 +1,15 @@
+"""Shared pytest fixtures."""
+
+import pytest
+
+from src.generators.base.templating import clear_environments
+
+
+@pytest.fixture(autouse=True)
+def isolated_cache_dir(tmp_path, monkeypatch):
+    """Keep the persistent caches of each test out of the user's cache directory."""
+    monkeypatch.setenv("MICROGENESIS_CACHE_DIR", str(tmp_path / "cache"))
+    # Shared template environments hold the bytecode cache of the directory they were created with
+    clear_environments()
+    yield
+    clear_environments()
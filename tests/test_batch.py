@@ -0,0 +1,149 @@
+"""Test module for batch generation."""
+
+import os
+import json
+import unittest
+import tempfile
+from unittest.mock import patch
+
+from src.core.batch import BatchRunner, BatchResult, expand_manifest, load_manifest
+
+
+RESOURCE_DIR = os.path.join(os.path.dirname(__file__), "resource")
+
+
+class TestBatchManifest(unittest.TestCase):
+    """Test cases for batch manifest expansion."""
+
+    def test_expand_service_architectures(self):
+        """Test expanding a config with service architectures into projects."""
+        manifest = load_manifest(os.path.join(RESOURCE_DIR, "config.json"))
+        projects = expand_manifest(manifest)
+
+        self.assertEqual(len(projects), len(manifest["service_architectures"]))
+
+        names = [name for name, _ in projects]
+        self.assertEqual(names[0], "domain-driven")
+
+        output_dirs = {config["output_dir"] for _, config in projects}
+        self.assertEqual(len(output_dirs), len(projects))
+
+        for _, config in projects:
+            self.assertEqual(config["project_name"], "MicroGenesisDemo")
+            self.assertEqual(config["framework"], {"name": "spring-boot", "version": "3.2.0"})
+            self.assertNotIn("service_architectures", config)
+            self.assertNotIn("output_subdir", config)
+
+    def test_expand_projects_with_defaults(self):
+        """Test expanding a project list with shared defaults."""
+        manifest = {
+            "defaults": {"base_package": "com.example", "framework": {"name": "micronaut"}},
+            "projects": [
+                {"project_name": "orders", "framework": {"version": "4.0.0"}},
+                {"project_name": "orders"},
+            ],
+        }
+        projects = expand_manifest(manifest)
+
+        self.assertEqual([name for name, _ in projects], ["orders", "orders-2"])
+        self.assertEqual(projects[0][1]["framework"], {"name": "micronaut", "version": "4.0.0"})
+        self.assertEqual(projects[1][1]["base_package"], "com.example")
+
+    def test_duplicate_architecture_names(self):
+        """Test that service architectures sharing a name get unique names."""
+        manifest = {
+            "project_name": "shop",
+            "service_architectures": [
+                {"name": "api", "output_subdir": "one"},
+                {"name": "api", "output_subdir": "two"},
+                {"name": "api-2", "output_subdir": "three"},
+            ],
+        }
+        projects = expand_manifest(manifest)
+
+        self.assertEqual([name for name, _ in projects], ["api", "api-3", "api-2"])
+        self.assertEqual(projects[1][1]["output_dir"], os.path.join(os.getcwd(), "two"))
+
+    def test_load_yaml_manifest(self):
+        """Test loading a YAML manifest."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            path = os.path.join(temp_dir, "batch.yaml")
+            with open(path, "w") as f:
+                f.write("projects:\n  - project_name: one\n  - project_name: two\n")
+            projects = expand_manifest(load_manifest(path))
+
+        self.assertEqual([name for name, _ in projects], ["one", "two"])
+
+
+class TestBatchRunner(unittest.TestCase):
+    """Test cases for the BatchRunner class."""
+
+    def setUp(self):
+        """Set up test fixtures."""
+        self.temp_dir = tempfile.TemporaryDirectory()
+
+    def tearDown(self):
+        """Clean up test fixtures."""
+        self.temp_dir.cleanup()
+
+    def _project(self, name, framework):
+        return (name, {
+            "project_name": name,
+            "base_package": "com.example",
+            "framework": {"name": framework},
+            "language": {"name": "java"},
+            "output_dir": os.path.join(self.temp_dir.name, name),
+        })
+
+    def test_failure_is_isolated_in_process(self):
+        """Test that one failing project does not abort the batch."""
+        projects = [self._project("good", "spring-boot"), self._project("bad", "unknown")]
+
+        def fake_generate(engine, config, **options):
+            if config["framework"]["name"] == "unknown":
+                raise ValueError("unsupported framework")
+            return os.path.join(engine.output_dir, config["project_name"])
+
+        with patch("src.core.batch.ScaffoldingEngine.generate_project", fake_generate):
+            results = BatchRunner(workers=1).run(projects)
+
+        self.assertEqual([r.name for r in results], ["good", "bad"])
+        self.assertTrue(results[0].success)
+        self.assertFalse(results[1].success)
+        self.assertIn("unsupported framework", results[1].error)
+
+    def test_generation_options_reach_engine(self):
+        """Test that the generation options apply to every project of the batch."""
+        calls = []
+
+        def fake_generate(engine, config, **options):
+            calls.append(options)
+            return os.path.join(engine.output_dir, config["project_name"])
+
+        runner = BatchRunner(workers=1, incremental=False, jobs=4, render_backend="thread", schema_cache=False)
+        with patch("src.core.batch.ScaffoldingEngine.generate_project", fake_generate):
+            results = runner.run([self._project("first", "spring-boot"), self._project("second", "micronaut")])
+
+        self.assertTrue(all(result.success for result in results))
+        self.assertEqual(calls, [{"incremental": False, "jobs": 4, "render_backend": "thread",
+                                  "schema_cache": False}] * 2)
+
+    def test_failures_reported_from_worker_pool(self):
+        """Test that results from a process pool keep manifest order."""
+        projects = [self._project("first", "unknown"), self._project("second", "unknown")]
+        results = BatchRunner(workers=2).run(projects)
+
+        self.assertEqual([r.name for r in results], ["first", "second"])
+        for result in results:
+            self.assertIsInstance(result, BatchResult)
+            self.assertFalse(result.success)
+            self.assertTrue(result.error)
+
+    def test_result_as_dict(self):
+        """Test converting a result to a dictionary."""
+        result = BatchResult("svc", True, project_dir="/tmp/svc", duration=1.23456)
+        self.assertEqual(json.loads(json.dumps(result.as_dict()))["duration"], 1.235)
+
+
+if __name__ == "__main__":
+    unittest.main()
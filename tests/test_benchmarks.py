@@ -0,0 +1,108 @@
+"""Test module for the benchmark suite helpers."""
+
+import os
+import unittest
+import tempfile
+
+from benchmarks.compare import compare_results
+from benchmarks.runner import run_scenario
+from benchmarks.synthetic import generate_ddl, generate_fixture_openapi, generate_openapi, write_openapi
+
+
+class TestSyntheticInputs(unittest.TestCase):
+    """Test cases for synthetic DDL and OpenAPI inputs."""
+
+    def test_generate_ddl(self):
+        """Test that the DDL script has the requested number of tables."""
+        ddl = generate_ddl(25)
+        self.assertEqual(ddl.count("CREATE TABLE"), 25)
+        self.assertIn("REFERENCES table_00023(id)", ddl)
+        self.assertEqual(ddl, generate_ddl(25))
+
+    def test_generate_openapi(self):
+        """Test that the specification has the requested number of operations."""
+        spec = generate_openapi(12)
+        operations = sum(len(methods) for methods in spec["paths"].values())
+        self.assertEqual(operations, 12)
+        self.assertEqual(len(spec["components"]["schemas"]), 3)
+
+    def test_generate_fixture_openapi(self):
+        """Test that the sample definitions are copied with renamed references."""
+        spec = generate_fixture_openapi(200)
+        operations = sum(len(methods) for methods in spec["paths"].values())
+        self.assertGreaterEqual(operations, 200)
+
+        refs = {value for value in _iter_refs(spec)}
+        self.assertTrue(refs)
+        for ref in refs:
+            _, _, section, name = ref.split("/")
+            self.assertIn(name, spec["components"][section])
+
+    def test_run_parser_scenario(self):
+        """Test measuring the OpenAPI parser in-process."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            inputs = {
+                "swagger_file": write_openapi(os.path.join(temp_dir, "api.yaml"), 10),
+                "output_dir": temp_dir,
+            }
+            result = run_scenario("openapi_parser", inputs)
+
+        self.assertIsNone(result["error"])
+        self.assertEqual(result["items"], 10)
+        self.assertGreater(result["seconds"], 0)
+
+
+def _iter_refs(node):
+    if isinstance(node, dict):
+        for key, value in node.items():
+            if key == "$ref":
+                yield value
+            else:
+                yield from _iter_refs(value)
+    elif isinstance(node, list):
+        for item in node:
+            yield from _iter_refs(item)
+
+
+class TestCompareResults(unittest.TestCase):
+    """Test cases for comparing benchmark results."""
+
+    def _results(self, *entries):
+        return {"results": [dict(zip(["scenario", "scale", "seconds", "peak_rss_kb", "error"], entry))
+                            for entry in entries]}
+
+    def test_compare_results(self):
+        """Test that regressions beyond the threshold are flagged."""
+        baseline = self._results(
+            ("ddl_parser", 100, 1.0, 50000, None),
+            ("openapi_parser", 100, 1.0, 50000, None),
+            ("generate", 100, 1.0, 50000, None),
+            ("removed", 100, 1.0, 50000, None),
+        )
+        current = self._results(
+            ("ddl_parser", 100, 1.05, 50000, None),
+            ("openapi_parser", 100, 1.5, 50000, None),
+            ("generate", 100, 0.5, 50000, None),
+            ("added", 100, 1.0, 50000, None),
+        )
+
+        statuses = {row["scenario"]: row["status"] for row in compare_results(baseline, current, threshold=0.10)}
+        self.assertEqual(statuses, {
+            "ddl_parser": "ok",
+            "openapi_parser": "regression",
+            "generate": "improvement",
+            "added": "new",
+            "removed": "missing",
+        })
+
+    def test_noise_floor_and_errors(self):
+        """Test that tiny absolute changes are ignored and new failures are regressions."""
+        baseline = self._results(("fast", 10, 0.001, 50000, None), ("broken", 10, 1.0, 50000, None))
+        current = self._results(("fast", 10, 0.002, 50000, None), ("broken", 10, 0.1, 50000, "KeyError: 'x'"))
+
+        statuses = {row["scenario"]: row["status"] for row in compare_results(baseline, current)}
+        self.assertEqual(statuses, {"fast": "ok", "broken": "regression"})
+
+
+if __name__ == "__main__":
+    unittest.main()
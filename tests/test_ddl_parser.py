@@ -3,7 +3,25 @@
 import os
 import unittest
 import tempfile
+from unittest import mock
+
+from src.generators.schema import ddl_parser
 from src.generators.schema.ddl_parser import DDLParser
+from src.generators.schema.schema_cache import SchemaCache
+
+
+def generate_ddl(tables):
+    """Generate a DDL script of tables each referencing the previous one."""
+    statements = []
+    for i in range(tables):
+        columns = ["id BIGINT NOT NULL AUTO_INCREMENT PRIMARY KEY", "name VARCHAR(100) NOT NULL",
+                   "price DECIMAL(10, 2) DEFAULT 0.00", "created_at DATETIME DEFAULT CURRENT_TIMESTAMP"]
+        if i > 0:
+            columns.append(f"table_{i - 1}_id BIGINT")
+            columns.append(f"FOREIGN KEY (table_{i - 1}_id) REFERENCES table_{i - 1}(id)")
+        statements.append(f"CREATE TABLE table_{i} (\n    " + ",\n    ".join(columns) + "\n);\n")
+    return "\n".join(statements)
+
 
 class TestDDLParser(unittest.TestCase):
     """Test cases for the DDL parser."""
@@ -92,6 +110,130 @@ class TestDDLParser(unittest.TestCase):
         self.assertIn("@Table(name = \"users\")", kotlin_code)
         self.assertIn("@Id", kotlin_code)
         self.assertIn("val id: Int", kotlin_code)
+    
+    def test_deferred_keys_and_indexes(self):
+        """Test that ALTER TABLE and CREATE INDEX statements are applied to their tables."""
+        tables = self.parser.parse_ddl("""
+            ALTER TABLE ONLY public.orders ADD CONSTRAINT orders_pkey PRIMARY KEY (ID);
+            CREATE TABLE public.users (
+                id integer NOT NULL,
+                email varchar(100) UNIQUE,
+                last_name text,
+                first_name text,
+                KEY idx_name (last_name, first_name)
+            );
+            CREATE TABLE public.orders (id integer NOT NULL, user_id integer);
+            ALTER TABLE ONLY public.users ADD CONSTRAINT users_pkey PRIMARY KEY (id);
+            ALTER TABLE public.orders
+                ADD CONSTRAINT orders_user_fk FOREIGN KEY (USER_ID) REFERENCES public.users(id),
+                ADD COLUMN note text;
+            CREATE INDEX idx_orders_user ON public.orders USING btree (user_id);
+        """)
+        users, orders = tables
+        
+        self.assertEqual(users["primaryKey"], ["id"])
+        self.assertEqual(orders["primaryKey"], ["id"])
+        self.assertEqual(orders["foreignKeys"], [
+            {"column": "user_id", "referencedTable": "users", "referencedColumn": "id"}
+        ])
+        self.assertEqual([column["name"] for column in orders["columns"]], ["id", "user_id", "note"])
+        self.assertEqual(orders["relationships"][0]["type"], "ManyToOne")
+        
+        self.assertEqual([(index["finder"], index["unique"]) for index in users["indexes"]], [
+            ("findByEmail", True), ("findByLastNameAndFirstName", False)
+        ])
+        self.assertEqual(orders["indexes"][0]["name"], "idx_orders_user")
+        self.assertIn('@Index(name = "idx_name", columnList = "last_name, first_name")',
+                      self.parser._generate_java_entity(users, "spring-boot"))
+    
+    def test_multi_word_and_array_types(self):
+        """Test that column types are read up to their first constraint."""
+        parser = DDLParser(dialect="postgresql")
+        events, = parser.parse_ddl("""
+            CREATE TABLE events (
+                id bigint NOT NULL,
+                happened_at timestamp(3) with time zone NOT NULL,
+                code character varying(20) DEFAULT 'x',
+                score double precision,
+                tags int[],
+                hits integer unsigned NOT NULL,
+                state varchar(10) CHARACTER SET utf8 COLLATE utf8_bin
+            );
+        """)
+        
+        self.assertEqual([(column["type"], parser._map_sql_to_java_type(column["type"])) for column in events["columns"]], [
+            ("BIGINT", "Long"),
+            ("TIMESTAMP(3) WITH TIME ZONE", "java.time.OffsetDateTime"),
+            ("CHARACTER VARYING(20)", "String"),
+            ("DOUBLE PRECISION", "Double"),
+            ("INT[]", "List<Integer>"),
+            ("INTEGER UNSIGNED", "Long"),
+            ("VARCHAR(10)", "String"),
+        ])
+        self.assertEqual(events["columns"][2]["default"], "'x'")
+        self.assertFalse(events["columns"][1]["nullable"])
+    
+    def test_parallel_parse_matches_serial_parse(self):
+        """Test that parsing in worker processes gives the serial result."""
+        ddl = generate_ddl(40)
+        
+        with mock.patch.object(ddl_parser, "PARALLEL_MIN_TABLES", 10):
+            parallel = DDLParser(jobs=2).parse_ddl(ddl)
+        
+        self.assertEqual(parallel, DDLParser().parse_ddl(ddl))
+        self.assertEqual(len(parallel), 40)
+
+
+
+class TestSchemaCache(unittest.TestCase):
+    """Test cases for the persistent schema cache."""
+    
+    def setUp(self):
+        """Set up test fixtures."""
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.cache = SchemaCache(cache_dir=self.temp_dir.name)
+        self.ddl_file = os.path.join(self.temp_dir.name, "schema.sql")
+        with open(self.ddl_file, "w") as f:
+            f.write(generate_ddl(5))
+    
+    def tearDown(self):
+        """Clean up test fixtures."""
+        self.temp_dir.cleanup()
+    
+    def test_unchanged_schema_is_not_parsed_again(self):
+        """Test that a cached schema is returned without parsing."""
+        parser = DDLParser(cache=self.cache)
+        tables = parser.parse_ddl_file(self.ddl_file)
+        self.assertEqual((self.cache.hits, self.cache.misses), (0, 1))
+        
+        with mock.patch.object(DDLParser, "parse_statements") as parse_statements:
+            self.assertEqual(parser.parse_ddl_file(self.ddl_file), tables)
+            parse_statements.assert_not_called()
+        self.assertEqual(self.cache.hits, 1)
+        
+        # Another dialect or changed content is a different schema
+        DDLParser(dialect="mysql", cache=self.cache).parse_ddl_file(self.ddl_file)
+        with open(self.ddl_file, "a") as f:
+            f.write("CREATE TABLE extra (id INT PRIMARY KEY);\n")
+        self.assertEqual(len(parser.parse_ddl_file(self.ddl_file)), 6)
+        self.assertEqual(self.cache.misses, 3)
+    
+    def test_least_recently_used_entries_are_evicted(self):
+        """Test that the cache stays within its size limit."""
+        tables = DDLParser().parse_ddl(generate_ddl(5))
+        self.cache.put("first", tables)
+        entry_size = os.path.getsize(os.path.join(self.temp_dir.name, "first.schema"))
+        self.cache.max_bytes = entry_size * 2
+        
+        self.cache.put("second", tables)
+        os.utime(os.path.join(self.temp_dir.name, "first.schema"), (0, 0))
+        os.utime(os.path.join(self.temp_dir.name, "second.schema"), (1, 1))
+        self.assertEqual(self.cache.get("first"), tables)
+        self.cache.put("third", tables)
+        
+        self.assertIsNotNone(self.cache.get("first"))
+        self.assertIsNone(self.cache.get("second"))
+        self.assertIsNotNone(self.cache.get("third"))
 
 
 if __name__ == "__main__":
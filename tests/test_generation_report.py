@@ -0,0 +1,103 @@
+"""Test module for generation profiling reports."""
+
+import os
+import json
+import unittest
+import tempfile
+
+import jinja2
+
+from src.generators.base import BaseGenerator
+from src.generators.base.report import GenerationReport
+
+
+class EntityGenerator(BaseGenerator):
+    """Minimal generator writing one file per entity."""
+
+    def __init__(self):
+        super().__init__()
+        self.template_env = jinja2.Environment(loader=jinja2.DictLoader({
+            "entity.j2": "class {{ entity.name }} {}",
+            "readme.j2": "# {{ config.project_name }}",
+        }))
+
+    def _create_project_structure(self, project_dir, config):
+        self._ensure_dir(project_dir)
+
+    def _generate_build_config(self, project_dir, config):
+        pass
+
+    def _generate_source_code(self, project_dir, config):
+        for entity in config["entities"]:
+            self._emit(os.path.join(project_dir, "src", f"{entity['name']}.java"), "entity.j2", {"entity": entity})
+
+    def _generate_tests(self, project_dir, config):
+        pass
+
+    def _generate_pipeline_config(self, project_dir, config):
+        pass
+
+    def _generate_documentation(self, project_dir, config):
+        self._emit(os.path.join(project_dir, "README.md"), "readme.j2", {"config": config})
+
+
+class TestGenerationReport(unittest.TestCase):
+    """Test cases for the GenerationReport class."""
+
+    def setUp(self):
+        """Set up test fixtures."""
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.project_dir = os.path.join(self.temp_dir.name, "demo")
+        self.config = {
+            "project_name": "demo",
+            "entities": [{"name": "Customer"}, {"name": "Order"}],
+        }
+
+    def tearDown(self):
+        """Clean up test fixtures."""
+        self.temp_dir.cleanup()
+
+    def test_generate_collects_report(self):
+        """Test that generation reports phases, templates and bytes written."""
+        plan = EntityGenerator().generate(self.project_dir, self.config, incremental=False)
+        report = plan.report
+
+        self.assertEqual(report.generator, "EntityGenerator")
+        for phase in ["structure", "build_config", "source", "tests", "pipeline", "documentation", "render", "write"]:
+            self.assertIn(phase, report.phases)
+        self.assertGreaterEqual(report.total_seconds, report.phases["render"])
+
+        self.assertEqual(report.templates["entity.j2"].renders, 2)
+        self.assertEqual(report.templates["readme.j2"].renders, 1)
+
+        # Two entities, the README and the generation manifest
+        self.assertEqual(report.files_written, 4)
+        self.assertEqual(report.bytes_written, sum(len(task.content.encode("utf-8")) for task in plan))
+
+        # Nothing is rendered or written when nothing changed
+        report = EntityGenerator().generate(self.project_dir, self.config).report
+        self.assertEqual(report.templates, {})
+        self.assertEqual(report.files_unchanged, 4)
+
+    def test_report_serialization(self):
+        """Test that reports can be dumped as JSON and printed as a table."""
+        report = GenerationReport("demo", generator="EntityGenerator")
+        report.add_phase("render", 0.5)
+        report.add_phase("structure", 0.25)
+        report.add_render("entity.j2", 0.1)
+        report.add_render("entity.j2", 0.2)
+        report.add_render("readme.j2", 0.05)
+
+        data = json.loads(report.to_json())
+        self.assertEqual(list(data["phases"]), ["structure", "render"])
+        self.assertEqual(list(data["templates"]), ["entity.j2", "readme.j2"])
+        self.assertEqual(data["templates"]["entity.j2"]["renders"], 2)
+
+        table = report.format_table(max_templates=1)
+        self.assertIn("entity.j2", table)
+        self.assertNotIn("readme.j2", table)
+        self.assertIn("1 more templates", table)
+
+
+if __name__ == "__main__":
+    unittest.main()
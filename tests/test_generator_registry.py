@@ -0,0 +1,145 @@
+"""Test module for the generator registry."""
+
+import os
+import tempfile
+import threading
+import unittest
+from importlib import metadata
+from unittest.mock import patch
+
+import jinja2
+
+from src.core.main import validate_config
+from src.core.scaffolding import ScaffoldingEngine
+from src.generators.base import BaseGenerator
+from src.generators.registry import BUILTIN_GENERATORS, GeneratorRegistry, UnknownGeneratorError
+
+
+class ReadmeGenerator(BaseGenerator):
+    """Minimal generator writing a README."""
+
+    def __init__(self):
+        super().__init__()
+        self.template_env = jinja2.Environment(loader=jinja2.DictLoader({"readme.j2": "{{ config.project_name }}"}))
+
+    def _run_generation_phases(self, project_dir, config):
+        self._emit(os.path.join(project_dir, "README.md"), "readme.j2", {"config": config})
+
+    def _generate_build_config(self, project_dir, config):
+        pass
+
+    def _generate_source_code(self, project_dir, config):
+        pass
+
+    def _generate_tests(self, project_dir, config):
+        pass
+
+
+class FakeEntryPoints(list):
+    """Entry points of the ``importlib.metadata`` API of Python 3.10+."""
+
+    def select(self, group):
+        return [entry_point for entry_point in self if entry_point.group == group]
+
+
+class TestGeneratorRegistry(unittest.TestCase):
+    """Test cases for registering and leasing generators."""
+
+    def test_builtin_generators_are_imported_lazily(self):
+        """Test that a lazy reference is imported on first use and the instance reused."""
+        from src.generators.spring_boot.java import SpringBootJavaGenerator
+
+        registry = GeneratorRegistry(BUILTIN_GENERATORS, entry_point_group=None)
+        self.assertEqual(registry.created("spring-boot", "java"), 0)
+        with registry.lease("spring-boot", "java") as first:
+            self.assertIsInstance(first, SpringBootJavaGenerator)
+        with registry.lease("spring-boot", "java") as second:
+            self.assertIs(second, first)
+        self.assertEqual(registry.created("spring-boot", "java"), 1)
+
+    def test_leased_instances_are_not_shared(self):
+        """Test that concurrent generations never use the same instance."""
+        registry = GeneratorRegistry({("demo", "java"): ReadmeGenerator}, entry_point_group=None)
+        with registry.lease("demo", "java") as outer:
+            with registry.lease("demo", "java") as inner:
+                self.assertIsNot(inner, outer)
+
+        in_use = set()
+        errors = []
+        barrier = threading.Barrier(4)
+
+        def generate():
+            for _ in range(20):
+                with registry.lease("demo", "java") as generator:
+                    if id(generator) in in_use:
+                        errors.append("shared instance")
+                    in_use.add(id(generator))
+                    barrier.wait(timeout=5)
+                    in_use.discard(id(generator))
+
+        threads = [threading.Thread(target=generate) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self.assertEqual(errors, [])
+        self.assertLessEqual(registry.created("demo", "java"), 4)
+
+    def test_unknown_generator(self):
+        """Test that unknown frameworks are reported instead of falling back."""
+        registry = GeneratorRegistry(BUILTIN_GENERATORS, entry_point_group=None)
+        self.assertFalse(registry.is_registered("quarkus", "java"))
+        with self.assertRaisesRegex(UnknownGeneratorError, "quarkus/java"):
+            with registry.lease("quarkus", "java"):
+                pass
+
+    def test_register_replaces_generator(self):
+        """Test that re-registering drops the instances of the previous registration."""
+        registry = GeneratorRegistry({("demo", "java"): ReadmeGenerator}, entry_point_group=None)
+        with registry.lease("demo", "java") as old:
+            registry.register("demo", "java", ReadmeGenerator)
+        with registry.lease("demo", "java") as new:
+            self.assertIsNot(new, old)
+
+    def test_entry_points(self):
+        """Test that entry points add generators without replacing registered ones."""
+        group = "microgenesis.generators"
+        entry_points = FakeEntryPoints([
+            metadata.EntryPoint("quarkus.java", "collections:OrderedDict", group),
+            metadata.EntryPoint("spring-boot.java", "collections:OrderedDict", group),
+            metadata.EntryPoint("invalid", "collections:OrderedDict", group),
+        ])
+        registry = GeneratorRegistry(BUILTIN_GENERATORS, entry_point_group=group)
+        with patch("src.generators.registry.metadata.entry_points", return_value=entry_points) as scan:
+            self.assertTrue(registry.is_registered("spring-boot", "java"))
+            scan.assert_not_called()
+
+            self.assertIn(("quarkus", "java"), registry.available())
+            with registry.lease("quarkus", "java") as generator:
+                self.assertEqual(type(generator).__name__, "OrderedDict")
+            self.assertEqual(registry.available().count(("spring-boot", "java")), 1)
+            self.assertFalse(registry.is_registered("invalid", ""))
+            scan.assert_called_once()
+
+    def test_engine_reuses_generator(self):
+        """Test that the engine reuses one generator instance across projects."""
+        registry = GeneratorRegistry({("demo", "java"): ReadmeGenerator}, entry_point_group=None)
+        with tempfile.TemporaryDirectory() as temp_dir, \
+                patch("src.generators.registry._registry", registry):
+            for name in ("first", "second"):
+                config = {"project_name": name, "base_package": "com.example",
+                          "framework": {"name": "demo"}, "language": {"name": "java"},
+                          "build_system": {"name": "maven"}, "schema_cache": False}
+                engine = ScaffoldingEngine(output_dir=temp_dir)
+                project_dir = engine.generate_project(config)
+                with open(os.path.join(project_dir, "README.md")) as f:
+                    self.assertEqual(f.read(), name)
+
+            self.assertEqual(validate_config(config), [])
+            config["framework"] = {"name": "quarkus"}
+            self.assertIn("No generator available for quarkus/java", validate_config(config))
+        self.assertEqual(registry.created("demo", "java"), 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -7,6 +7,7 @@ import shutil
 from unittest.mock import patch
 
 from src.generators.graphql.java import GraphQLJavaGenerator
+from src.generators.schema.ir import entity_from_definition
 
 
 class TestGraphQLJavaGenerator(unittest.TestCase):
@@ -158,7 +159,7 @@ class TestGraphQLJavaGenerator(unittest.TestCase):
     def test_get_imports_for_entity(self):
         """Test import generation for entity."""
         # Test data
-        entity = {
+        entity = entity_from_definition({
             "name": "ComplexEntity",
             "fields": [
                 {"name": "id", "type": "String", "annotations": ["@Id"]},
@@ -166,7 +167,7 @@ class TestGraphQLJavaGenerator(unittest.TestCase):
                 {"name": "items", "type": "List<Item>", "annotations": []},
                 {"name": "status", "type": "Status", "package": "com.example.models.enums"}
             ]
-        }
+        })
         
         # Call the method
         imports = self.generator._get_imports_for_entity(entity)
@@ -0,0 +1,213 @@
+"""Test module for incremental regeneration."""
+
+import os
+import json
+import unittest
+import tempfile
+
+import copy
+import jinja2
+
+from src.generators.base import BaseGenerator
+from src.generators.base.manifest import GenerationManifest, ContextHasher
+from src.generators.schema.ddl_parser import DDLParser
+from src.generators.schema.schema_diff import diff_schemas
+
+
+class EntityGenerator(BaseGenerator):
+    """Minimal generator writing one file per entity."""
+
+    def __init__(self):
+        super().__init__()
+        self.template_env = jinja2.Environment(loader=jinja2.DictLoader({
+            "entity.j2": "class {{ entity.name }} { {% for f in entity.fields %}{{ f }}; {% endfor %}}",
+            "readme.j2": "{{ config.project_name }}",
+        }))
+
+    def _run_generation_phases(self, project_dir, config):
+        self._emit(os.path.join(project_dir, "README.md"), "readme.j2", {"config": config})
+        for entity in self._iter_entities(config["entities"]):
+            self._emit(os.path.join(project_dir, "src", f"{entity['name']}.java"), "entity.j2", {"entity": entity})
+
+    def _generate_build_config(self, project_dir, config):
+        pass
+
+    def _generate_source_code(self, project_dir, config):
+        pass
+
+    def _generate_tests(self, project_dir, config):
+        pass
+
+
+class TestIncrementalGeneration(unittest.TestCase):
+    """Test cases for manifest-driven incremental regeneration."""
+
+    def setUp(self):
+        """Set up test fixtures."""
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.project_dir = os.path.join(self.temp_dir.name, "demo")
+        self.config = {
+            "project_name": "demo",
+            "entities": [
+                {"name": "Customer", "fields": ["id", "name"]},
+                {"name": "Order", "fields": ["id", "total"]},
+            ],
+        }
+
+    def tearDown(self):
+        """Clean up test fixtures."""
+        self.temp_dir.cleanup()
+
+    def _generated(self, plan):
+        manifest_path = GenerationManifest.manifest_path(self.project_dir)
+        return sorted(os.path.basename(task.path) for task in plan if task.path != manifest_path)
+
+    def test_first_run_writes_manifest(self):
+        """Test that a manifest entry is recorded for every generated file."""
+        EntityGenerator().generate(self.project_dir, self.config)
+
+        with open(GenerationManifest.manifest_path(self.project_dir)) as f:
+            manifest = json.load(f)
+
+        self.assertEqual(sorted(manifest["files"]), ["README.md", "src/Customer.java", "src/Order.java"])
+        entry = manifest["files"]["src/Order.java"]
+        self.assertEqual(entry["template"], "entity.j2")
+        self.assertTrue(entry["template_hash"])
+        self.assertTrue(entry["context_hash"])
+
+    def test_rerun_only_renders_changed_files(self):
+        """Test that a re-run skips files whose inputs are unchanged."""
+        EntityGenerator().generate(self.project_dir, self.config)
+
+        plan = EntityGenerator().generate(self.project_dir, self.config)
+        self.assertEqual(self._generated(plan), [])
+        self.assertEqual(len(plan.skipped), 3)
+
+        self.config["entities"][1]["fields"].append("status")
+        plan = EntityGenerator().generate(self.project_dir, self.config)
+        # README depends on the whole config, so it changes as well
+        self.assertEqual(self._generated(plan), ["Order.java", "README.md"])
+
+        with open(os.path.join(self.project_dir, "src", "Order.java")) as f:
+            self.assertIn("status", f.read())
+
+        # The manifest still covers skipped files
+        plan = EntityGenerator().generate(self.project_dir, self.config)
+        self.assertEqual(self._generated(plan), [])
+
+    def test_deleted_file_is_regenerated(self):
+        """Test that files removed from disk are generated again."""
+        EntityGenerator().generate(self.project_dir, self.config)
+        os.remove(os.path.join(self.project_dir, "src", "Customer.java"))
+
+        plan = EntityGenerator().generate(self.project_dir, self.config)
+        self.assertEqual(self._generated(plan), ["Customer.java"])
+
+    def test_template_change_invalidates_files(self):
+        """Test that changing a template re-renders the files using it."""
+        EntityGenerator().generate(self.project_dir, self.config)
+
+        generator = EntityGenerator()
+        generator.template_env.loader.mapping["readme.j2"] = "# {{ config.project_name }}"
+        plan = generator.generate(self.project_dir, self.config)
+        self.assertEqual(self._generated(plan), ["README.md"])
+
+    def test_non_incremental_run_renders_everything(self):
+        """Test that incremental generation can be disabled."""
+        EntityGenerator().generate(self.project_dir, self.config)
+
+        plan = EntityGenerator().generate(self.project_dir, self.config, incremental=False)
+        self.assertEqual(self._generated(plan), ["Customer.java", "Order.java", "README.md"])
+
+    def test_context_hash_ignores_key_order(self):
+        """Test that context hashes are canonical."""
+        hasher = ContextHasher()
+        self.assertEqual(hasher.hash({"a": 1, "b": [1, 2]}), hasher.hash({"b": [1, 2], "a": 1}))
+        self.assertNotEqual(hasher.hash({"a": 1}), hasher.hash({"a": "1"}))
+
+
+    def test_schema_diff_keeps_unchanged_entities(self):
+        """Test that only the files of changed entities are planned."""
+        EntityGenerator().generate(self.project_dir, self.config)
+        previous = copy.deepcopy(self.config["entities"])
+
+        self.config["entities"][1]["fields"].append("status")
+        schema_diff = diff_schemas(previous, self.config["entities"])
+        self.assertEqual(schema_diff.unchanged, ["Customer"])
+
+        generator = EntityGenerator()
+        plan = generator.generate(self.project_dir, self.config, schema_diff=schema_diff)
+        # README depends on the whole config; Customer.java isn't even planned
+        self.assertEqual(self._generated(plan), ["Order.java", "README.md"])
+        self.assertEqual(plan.skipped, [])
+        # The kept Customer.java and the re-rendered but identical README
+        self.assertEqual(plan.report.files_unchanged, 2)
+
+        # The kept files stay in the manifest
+        with open(GenerationManifest.manifest_path(self.project_dir)) as f:
+            manifest = json.load(f)
+        self.assertEqual(manifest["files"]["src/Customer.java"]["entity"], "Customer")
+
+        # Entity files are planned again when a template or setting changes
+        generator = EntityGenerator()
+        generator.template_env.loader.mapping["entity.j2"] = "class {{ entity.name }} {}"
+        plan = generator.generate(self.project_dir, self.config, schema_diff=diff_schemas(
+            self.config["entities"], self.config["entities"]
+        ))
+        self.assertEqual(self._generated(plan), ["Customer.java", "Order.java"])
+
+        self.config["project_name"] = "renamed"
+        plan = EntityGenerator().generate(self.project_dir, self.config, schema_diff=diff_schemas(
+            self.config["entities"], self.config["entities"]
+        ))
+        self.assertEqual(self._generated(plan), ["Customer.java", "Order.java", "README.md"])
+
+    def test_schema_diff(self):
+        """Test the structural diff of two parsed schemas."""
+        parser = DDLParser()
+        old = parser.parse_ddl("""
+            CREATE TABLE users (id INT PRIMARY KEY, name VARCHAR(50));
+            CREATE TABLE orders (id INT PRIMARY KEY, total DECIMAL(10, 2));
+            CREATE TABLE audit (id INT PRIMARY KEY);
+        """)
+        new = parser.parse_ddl("""
+            CREATE TABLE users (id INT PRIMARY KEY, name VARCHAR(100));
+            CREATE TABLE orders (id INT PRIMARY KEY, total DECIMAL(10, 2), user_id INT,
+                FOREIGN KEY (user_id) REFERENCES users(id));
+            CREATE TABLE payments (id INT PRIMARY KEY);
+        """)
+
+        schema_diff = diff_schemas(old, new)
+        self.assertEqual(schema_diff.added, ["payments"])
+        self.assertEqual(schema_diff.removed, ["audit"])
+        self.assertEqual(schema_diff.affected_tables, {"users", "orders", "payments"})
+
+        users, orders = schema_diff.changed["users"], schema_diff.changed["orders"]
+        self.assertEqual(users.columns_changed, ["name"])
+        self.assertEqual([rel["type"] for rel in users.relationships_added], ["OneToMany"])
+        self.assertEqual(orders.columns_added, ["user_id"])
+        self.assertTrue(orders.foreign_keys_changed)
+        self.assertFalse(orders.primary_key_changed)
+        self.assertTrue(diff_schemas(new, new).is_empty)
+
+    def test_schema_diff_of_parsed_tables(self):
+        """Test that unchanged tables keep the files of their entities."""
+        class TableGenerator(EntityGenerator):
+            def _run_generation_phases(self, project_dir, config):
+                for entity in self._iter_entities(self._get_entities(config)):
+                    self._emit(os.path.join(project_dir, "src", f"{entity.name}.java"), "entity.j2", {"entity": entity})
+
+        parser = DDLParser()
+        old = parser.parse_ddl("CREATE TABLE users (id INT PRIMARY KEY); CREATE TABLE audit_log (id INT PRIMARY KEY);")
+        new = parser.parse_ddl("CREATE TABLE users (id INT PRIMARY KEY); CREATE TABLE audit_log (id BIGINT PRIMARY KEY);")
+        self.config["entities"] = old
+        TableGenerator().generate(self.project_dir, self.config)
+
+        self.config["entities"] = new
+        plan = TableGenerator().generate(self.project_dir, self.config, schema_diff=diff_schemas(old, new))
+        self.assertEqual(self._generated(plan), ["AuditLog.java"])
+        self.assertEqual(plan.report.files_unchanged, 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
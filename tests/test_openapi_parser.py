@@ -0,0 +1,230 @@
+"""Test module for the OpenAPI parser."""
+
+import glob
+import os
+import shutil
+import tempfile
+import unittest
+from unittest.mock import patch
+
+from src.core.scaffolding import normalize_project_config
+from src.generators.schema import openapi_parser
+from src.generators.schema.ir import schema_from_api_info
+from src.generators.schema.openapi_parser import OpenAPIParser, parse_openapi, select_operations
+from src.generators.schema.schema_cache import SchemaCache
+from src.generators.spring_boot.java import SpringBootJavaGenerator
+from src.utils.yaml_loader import load_document
+
+
+SPEC = """
+openapi: 3.0.3
+paths:
+  /users/{id}:
+    parameters:
+      - name: id
+        in: path
+        required: true
+        schema: {type: integer, format: int64}
+    get:
+      operationId: getUser
+      tags: [Users]
+      responses:
+        '200':
+          content:
+            application/json:
+              schema: {$ref: '#/components/schemas/User'}
+    put:
+      operationId: updateUser
+      tags: [Users]
+      requestBody:
+        content:
+          application/json:
+            schema: {$ref: '#/components/schemas/UserDTO'}
+      responses:
+        '204': {}
+components:
+  schemas:
+    User:
+      x-entity: true
+      required: [email]
+      properties:
+        id: {type: integer, format: int64}
+        email: {type: string}
+    UserDTO:
+      properties:
+        email: {type: string}
+"""
+
+SPEC_ORDERS = """
+  /orders:
+    get:
+      operationId: listOrders
+      tags: [Orders]
+      responses:
+        '200':
+          content:
+            application/json:
+              schema: {type: array, items: {$ref: '#/components/schemas/UserDTO'}}
+"""
+
+SPEC_QUOTED = """
+openapi: 3.0.3
+paths:
+  /pets:
+    get:
+      operationId: 'list''Pets'
+      tags: ['Owner''s pets']
+      responses:
+        '200': {content: {application/json: {schema: {$ref: '#/components/schemas/Pet'}}}}
+  /vets:
+    get:
+      operationId: listVets
+      tags: ["Vet \\u0041ppointments"]
+      responses:
+        '204': {}
+  /visits:
+    get:
+      operationId: listVisits
+      tags: [Long
+        visit tag]
+      responses:
+        '204': {}
+components:
+  schemas:
+    Pet:
+      properties:
+        name: {type: string}
+"""
+
+
+class TestOpenAPIParser(unittest.TestCase):
+    """Test cases for parsing OpenAPI definitions once."""
+
+    def setUp(self):
+        """Set up a temporary definition file."""
+        self.temp_dir = tempfile.mkdtemp()
+        self.spec_path = os.path.join(self.temp_dir, "api.yaml")
+        with open(self.spec_path, "w") as f:
+            f.write(SPEC)
+
+    def tearDown(self):
+        """Clean up temporary files."""
+        shutil.rmtree(self.temp_dir)
+
+    def test_parse_openapi(self):
+        """Test that models and endpoints keep their schemas for every language."""
+        api_info = OpenAPIParser().parse_file(self.spec_path)
+
+        self.assertEqual({name: model["type"] for name, model in api_info["models"].items()},
+                         {"User": "entity", "UserDTO": "dto"})
+        update = api_info["endpoints"][1]
+        self.assertEqual((update["method"], update["operationId"]), ("PUT", "updateUser"))
+        self.assertEqual([(p["name"], p["in"]) for p in update["parameters"]], [("id", "path"), ("userDTO", "body")])
+
+        java = schema_from_api_info(api_info, "java")
+        kotlin = schema_from_api_info(api_info, "kotlin")
+        self.assertEqual(java.endpoints[0].response_type, "User")
+        self.assertEqual(java.endpoints[1].response_type, "void")
+        self.assertEqual(kotlin.endpoints[1].parameters[0].type, "Long")
+        self.assertEqual(kotlin.entity("User").field("id").type, "Long")
+
+    def test_fixture_definitions(self):
+        """Test that the sample definitions parse into typed schemas."""
+        parser = OpenAPIParser()
+        for path in glob.glob(os.path.join(os.path.dirname(__file__), "resource", "*", "service.yaml")):
+            api = schema_from_api_info(parser.parse_file(path))
+            self.assertTrue(api.endpoints, path)
+            self.assertTrue(api.entities, path)
+
+    def test_parses_unchanged_files_once(self):
+        """Test memoization per path and stat signature."""
+        parser = OpenAPIParser()
+        with patch.object(openapi_parser, "parse_openapi", wraps=parse_openapi) as parse:
+            first = parser.parse_file(self.spec_path)
+            self.assertIs(parser.parse_file(os.path.join(self.temp_dir, ".", "api.yaml")), first)
+            self.assertEqual(parse.call_count, 1)
+
+            with open(self.spec_path, "a") as f:
+                f.write("info: {title: Changed}\n")
+            self.assertEqual(parser.parse_file(self.spec_path)["info"], {"title": "Changed"})
+            self.assertEqual(parse.call_count, 2)
+
+    def test_persistent_cache(self):
+        """Test that parsed definitions are reused across parsers through the cache."""
+        cache = SchemaCache(cache_dir=os.path.join(self.temp_dir, "cache"))
+        os.makedirs(cache.cache_dir)
+        expected = OpenAPIParser(cache=cache).parse_file(self.spec_path)
+
+        with patch.object(openapi_parser, "parse_openapi") as parse:
+            self.assertEqual(OpenAPIParser(cache=cache).parse_file(self.spec_path), expected)
+            parse.assert_not_called()
+        self.assertEqual(cache.hits, 1)
+
+    def test_generator_parses_once_per_plan(self):
+        """Test that all generation phases share one parse of the definition."""
+        generator = SpringBootJavaGenerator()
+        config = normalize_project_config({
+            "project_name": "api", "base_package": "com.example", "framework": "spring-boot",
+            "language": "java", "build_system": {"name": "maven"}, "swagger_file": self.spec_path,
+        })
+
+        with patch.object(openapi_parser, "parse_openapi", wraps=parse_openapi) as parse:
+            plan = generator.build_plan(os.path.join(self.temp_dir, "out"), config)
+            self.assertEqual(parse.call_count, 1)
+
+        paths = {os.path.basename(task.path) for task in plan}
+        self.assertIn("UsersController.java", paths)
+        self.assertIn("UsersControllerTest.java", paths)
+
+    def test_selected_operations(self):
+        """Test that selective parses equal the selected part of a full parse."""
+        parser = OpenAPIParser()
+        for path in glob.glob(os.path.join(os.path.dirname(__file__), "resource", "*", "service.yaml")):
+            full = parser.parse_file(path)
+            tags = sorted({tag for endpoint in full["endpoints"] for tag in endpoint["tags"]})
+            operation_ids = [endpoint["operationId"] for endpoint in full["endpoints"] if endpoint["operationId"]]
+            for selection in (select_operations([tags[0]]), select_operations(operations=operation_ids[-1:])):
+                if selection is None:
+                    continue
+                selected = parser.parse_file(path, selection)
+                self.assertEqual(selected["endpoints"], [
+                    endpoint for endpoint in full["endpoints"]
+                    if set(endpoint["tags"]) & set(selection[0]) or endpoint["operationId"] in selection[1]
+                ])
+                for name, model in selected["models"].items():
+                    self.assertEqual(model, full["models"][name])
+
+        self.assertIsNone(select_operations([], None))
+        self.assertEqual(select_operations(["b", "a", "b"]), (("a", "b"), ()))
+
+    def test_selected_quoted_values(self):
+        """Test that tags and operation ids spelled differently in the text are still selected."""
+        with open(self.spec_path, "w") as f:
+            f.write(SPEC_QUOTED)
+        document = load_document(self.spec_path)
+        for selection in (select_operations(["Owner's pets"]), select_operations(operations=["list'Pets"]),
+                          select_operations(["Vet Appointments"]), select_operations(["Long visit tag"])):
+            selected = OpenAPIParser().parse_file(self.spec_path, selection)
+            self.assertEqual(len(selected["endpoints"]), 1)
+            self.assertEqual(selected, parse_openapi(document, self.spec_path, selection=selection))
+
+    def test_generator_selected_tags(self):
+        """Test that only the operations of the selected tags are generated."""
+        with open(self.spec_path, "w") as f:
+            f.write(SPEC.replace("paths:\n", "paths:" + SPEC_ORDERS, 1))
+        generator = SpringBootJavaGenerator()
+        config = normalize_project_config({
+            "project_name": "api", "base_package": "com.example", "framework": "spring-boot",
+            "language": "java", "build_system": {"name": "maven"}, "swagger_file": self.spec_path,
+        })
+
+        all_paths = {os.path.basename(task.path) for task in generator.build_plan(self.temp_dir, config)}
+        config["swagger_tags"] = ["Orders"]
+        paths = {os.path.basename(task.path) for task in generator.build_plan(self.temp_dir, config)}
+        self.assertIn("UsersController.java", all_paths)
+        self.assertIn("OrdersController.java", paths)
+        self.assertNotIn("UsersController.java", paths)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,190 @@
+"""Test module for resolving references in OpenAPI definitions."""
+
+import os
+import shutil
+import tempfile
+import unittest
+
+from src.generators.schema.ir import schema_from_api_info
+from src.generators.schema.openapi_parser import OpenAPIParser, load_openapi_document, parse_openapi
+from src.generators.schema.openapi_refs import RefError, RefResolver, ref_name
+from src.generators.schema.schema_cache import SchemaCache
+
+
+MAIN = """
+openapi: 3.0.3
+paths:
+  /users:
+    $ref: 'paths/users.yaml'
+  /users/{id}:
+    get:
+      operationId: getUser
+      tags: [Users]
+      parameters:
+        - $ref: '#/components/parameters/UserId'
+      responses:
+        $ref: '#/components/responses/UserResponses'
+components:
+  parameters:
+    UserId:
+      $ref: '#/components/parameters/Id'
+    Id:
+      name: id
+      in: path
+      required: true
+      schema: {type: integer, format: int64}
+  responses:
+    UserResponses:
+      '200':
+        $ref: '#/components/responses/UserFound'
+    UserFound:
+      content:
+        application/json:
+          schema: {$ref: 'models/User.yaml'}
+  requestBodies:
+    NewUser:
+      content:
+        application/json:
+          schema: {$ref: 'models/User.yaml'}
+  schemas:
+    Audited:
+      properties:
+        createdAt: {type: string, format: date-time}
+"""
+
+USERS_PATH = """
+post:
+  operationId: createUser
+  tags: [Users]
+  requestBody:
+    $ref: '../api.yaml#/components/requestBodies/NewUser'
+  responses:
+    '201':
+      content:
+        application/json:
+          schema:
+            type: array
+            items: {$ref: '../common.yaml#/components/schemas/Error'}
+"""
+
+USER_MODEL = """
+x-entity: true
+allOf:
+  - $ref: '../api.yaml#/components/schemas/Audited'
+  - required: [email]
+    properties:
+      email: {type: string}
+      manager: {$ref: 'User.yaml'}
+      address: {$ref: '#/components/schemas/Address'}
+components:
+  schemas:
+    Address:
+      properties:
+        street: {type: string}
+"""
+
+COMMON = """
+components:
+  schemas:
+    Error:
+      properties:
+        message: {type: string}
+"""
+
+
+class TestOpenAPIRefs(unittest.TestCase):
+    """Test cases for the reference resolver."""
+
+    def setUp(self):
+        """Set up a modular definition spread over several files."""
+        self.temp_dir = tempfile.mkdtemp()
+        self.spec_path = self._write("api.yaml", MAIN)
+        self._write(os.path.join("paths", "users.yaml"), USERS_PATH)
+        self._write(os.path.join("models", "User.yaml"), USER_MODEL)
+        self._write("common.yaml", COMMON)
+
+    def tearDown(self):
+        """Clean up temporary files."""
+        shutil.rmtree(self.temp_dir)
+
+    def _write(self, name, content):
+        """Write a file of the definition."""
+        path = os.path.join(self.temp_dir, name)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(path, "w") as f:
+            f.write(content)
+        return path
+
+    def test_ref_name(self):
+        """Test naming of referenced components."""
+        self.assertEqual(ref_name("#/components/schemas/User"), "User")
+        self.assertEqual(ref_name("common.yaml#/components/schemas/Error"), "Error")
+        self.assertEqual(ref_name("models/User.yaml"), "User")
+        self.assertEqual(ref_name("#/components/schemas/a~1b"), "a/b")
+
+    def test_modular_definition(self):
+        """Test that path items, parameters, bodies, responses and file schemas are resolved."""
+        api_info = OpenAPIParser().parse_file(self.spec_path)
+
+        self.assertEqual(set(api_info["models"]), {"Audited", "User", "Address", "Error"})
+        user = api_info["models"]["User"]
+        self.assertEqual(user["type"], "entity")
+        self.assertEqual(list(user["properties"]), ["createdAt", "email", "manager", "address"])
+        self.assertEqual(user["required"], ["email"])
+
+        api = schema_from_api_info(api_info, "java")
+        create, get = api.endpoints
+        self.assertEqual((create.path, create.method, create.response_type), ("/users", "POST", "List<Error>"))
+        self.assertEqual([(p.name, p.type) for p in create.parameters], [("user", "User")])
+        self.assertEqual([(p.name, p.location, p.type) for p in get.parameters], [("id", "path", "Long")])
+        self.assertEqual(get.response_type, "User")
+        self.assertEqual(api.entity("User").field("address").type, "Address")
+
+    def test_memoized_lookups(self):
+        """Test that each file is loaded once and each reference resolved once."""
+        resolver = RefResolver(load_openapi_document(self.spec_path), self.spec_path)
+        first, base = resolver.resolve({"$ref": "models/User.yaml"})
+        again, _ = resolver.resolve({"$ref": "./models/../models/User.yaml"})
+        self.assertIs(first, again)
+        self.assertEqual(os.path.basename(base), "User.yaml")
+        # References inside a file are relative to that file
+        address, _ = resolver.resolve({"$ref": "#/components/schemas/Address"}, base)
+        self.assertIn("street", address["properties"])
+        self.assertEqual(len(resolver.files), 2)
+
+    def test_circular_references(self):
+        """Test that reference cycles are reported instead of looping."""
+        document = {"components": {"schemas": {
+            "A": {"$ref": "#/components/schemas/B"},
+            "B": {"$ref": "#/components/schemas/A"},
+        }}}
+        with self.assertRaisesRegex(RefError, "Circular reference"):
+            parse_openapi(document)
+
+        # Recursive models only reference themselves and are fine
+        api_info = parse_openapi({"components": {"schemas": {
+            "Node": {"properties": {"children": {"type": "array", "items": {"$ref": "#/components/schemas/Node"}}}},
+        }}})
+        self.assertEqual(schema_from_api_info(api_info).entities[0].field("children").type, "List<Node>")
+
+    def test_unresolvable_references(self):
+        """Test errors for missing files, missing components and remote references."""
+        resolver = RefResolver({}, self.spec_path)
+        for ref in ("missing.yaml", "#/components/schemas/Missing", "https://example.com/api.yaml"):
+            with self.assertRaises(RefError):
+                resolver.resolve({"$ref": ref})
+
+    def test_referenced_file_changes(self):
+        """Test that changing a referenced file invalidates the memoized and cached parses."""
+        cache = SchemaCache(cache_dir=os.path.join(self.temp_dir, "cache"))
+        os.makedirs(cache.cache_dir)
+        memoizing = OpenAPIParser()
+        memoizing.parse_file(self.spec_path)
+        OpenAPIParser(cache=cache).parse_file(self.spec_path)
+
+        self._write("common.yaml", COMMON.replace("message", "detail"))
+        for parser in (memoizing, OpenAPIParser(cache=cache)):
+            self.assertIn("detail", parser.parse_file(self.spec_path)["models"]["Error"]["properties"])
+
+if __name__ == "__main__":
+    unittest.main()
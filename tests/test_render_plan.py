@@ -0,0 +1,271 @@
+"""Test module for the two-phase render plan."""
+
+import io
+import os
+import tarfile
+import zipfile
+import unittest
+import tempfile
+
+import jinja2
+
+from src.generators.base.render_plan import RenderPlan, RenderTask
+from src.generators.base.templating import get_environment, clear_environments
+from src.generators.base.output import FileSystemSink, ZipSink, TarGzSink, create_archive_sink
+from src.generators.micronaut.kotlin import MicronautKotlinGenerator
+from src.generators.schema.ddl_parser import DDLParser
+from src.generators.spring_boot.java import SpringBootJavaGenerator
+from src.generators.spring_boot.kotlin import SpringBootKotlinGenerator
+
+
+class TestRenderPlan(unittest.TestCase):
+    """Test cases for the RenderPlan class."""
+
+    def setUp(self):
+        """Set up test fixtures."""
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.template_env = jinja2.Environment(loader=jinja2.DictLoader({
+            "hello.j2": "Hello {{ name }}!"
+        }))
+
+    def tearDown(self):
+        """Clean up test fixtures."""
+        self.temp_dir.cleanup()
+
+    def test_render_tasks_in_order(self):
+        """Test that tasks keep insertion order and render on demand."""
+        plan = RenderPlan(self.temp_dir.name)
+        plan.add_template(os.path.join(self.temp_dir.name, "a.txt"), "hello.j2", {"name": "A"})
+        plan.add_content(os.path.join(self.temp_dir.name, "b.txt"), "static")
+
+        self.assertEqual(len(plan), 2)
+        self.assertFalse(plan.tasks[0].is_rendered)
+
+        plan.render(self.template_env)
+
+        self.assertEqual([task.content for task in plan], ["Hello A!", "static"])
+        self.assertEqual(plan.relative_path(plan.tasks[1].path), "b.txt")
+
+    def test_parallel_render_keeps_order(self):
+        """Test that thread and process pools render every task into its own slot."""
+        template_dir = os.path.join(self.temp_dir.name, "templates")
+        os.makedirs(template_dir)
+        with open(os.path.join(template_dir, "hello.j2"), "w") as f:
+            f.write("Hello {{ name }}!")
+        shared_env = get_environment(template_dir, use_bytecode_cache=False)
+        self.addCleanup(clear_environments)
+
+        for env, backend in [(self.template_env, "thread"), (shared_env, "process"), (self.template_env, "process")]:
+            plan = RenderPlan(self.temp_dir.name)
+            for i in range(50):
+                plan.add_template(os.path.join(self.temp_dir.name, f"{i}.txt"), "hello.j2", {"name": i})
+            plan.render(env, jobs=4, backend=backend)
+
+            self.assertEqual([task.content for task in plan], [f"Hello {i}!" for i in range(50)])
+
+        with self.assertRaises(ValueError):
+            RenderPlan().render(self.template_env, jobs=2, backend="gpu")
+
+    def test_context_is_copied(self):
+        """Test that later changes to a shared context don't affect queued tasks."""
+        context = {"name": "first"}
+        task = RenderTask("out.txt", template_name="hello.j2", context=context)
+        context["name"] = "second"
+
+        self.assertEqual(task.render(self.template_env), "Hello first!")
+
+    def test_file_system_sink(self):
+        """Test writing a rendered plan to disk."""
+        plan = RenderPlan(self.temp_dir.name)
+        empty_dir = os.path.join(self.temp_dir.name, "empty")
+        nested_file = os.path.join(self.temp_dir.name, "nested", "dir", "c.txt")
+        plan.add_directory(empty_dir)
+        plan.add_template(nested_file, "hello.j2", {"name": "C"})
+        plan.render(self.template_env)
+
+        FileSystemSink().write_plan(plan)
+
+        self.assertTrue(os.path.isdir(empty_dir))
+        with open(nested_file) as f:
+            self.assertEqual(f.read(), "Hello C!")
+
+    def test_file_system_sink_skips_identical_files(self):
+        """Test that identical files keep their modification time."""
+        same_path = os.path.join(self.temp_dir.name, "same.txt")
+        changed_path = os.path.join(self.temp_dir.name, "changed.txt")
+        for path in [same_path, changed_path]:
+            with open(path, "w") as f:
+                f.write("old")
+            os.utime(path, (1000000000, 1000000000))
+
+        plan = RenderPlan(self.temp_dir.name)
+        plan.add_content(same_path, "old")
+        plan.add_content(changed_path, "new")
+        plan.add_content(os.path.join(self.temp_dir.name, "created.txt"), "created")
+
+        stats = FileSystemSink().write_plan(plan)
+
+        self.assertEqual(stats.as_dict(), {"created": 1, "updated": 1, "unchanged": 1})
+        self.assertEqual(os.path.getmtime(same_path), 1000000000)
+        self.assertNotEqual(os.path.getmtime(changed_path), 1000000000)
+        with open(changed_path) as f:
+            self.assertEqual(f.read(), "new")
+
+    def test_sink_rejects_unrendered_plan(self):
+        """Test that a sink refuses to write tasks that were never rendered."""
+        plan = RenderPlan(self.temp_dir.name)
+        plan.add_template(os.path.join(self.temp_dir.name, "a.txt"), "hello.j2", {"name": "A"})
+
+        with self.assertRaises(ValueError):
+            FileSystemSink().write_plan(plan)
+
+
+class TestArchiveSinks(unittest.TestCase):
+    """Test cases for sinks writing straight into archives."""
+
+    def setUp(self):
+        """Set up test fixtures."""
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.project_dir = os.path.join(self.temp_dir.name, "demo")
+        self.plan = RenderPlan(self.project_dir)
+        self.plan.add_directory(os.path.join(self.project_dir, "empty"))
+        self.plan.add_content(os.path.join(self.project_dir, "src", "App.java"), "class App {}")
+
+    def tearDown(self):
+        """Clean up test fixtures."""
+        self.temp_dir.cleanup()
+
+    def test_zip_sink_writes_in_memory(self):
+        """Test that a ZIP archive is built in memory without touching disk."""
+        buffer = io.BytesIO()
+        sink = ZipSink(buffer, compresslevel=1)
+        stats = sink.write_plan(self.plan)
+        sink.close()
+
+        self.assertEqual(stats.created, 1)
+        self.assertFalse(os.path.exists(self.project_dir))
+        with zipfile.ZipFile(io.BytesIO(buffer.getvalue())) as archive:
+            self.assertEqual(sorted(archive.namelist()), ["demo/empty/", "demo/src/App.java"])
+            self.assertEqual(archive.read("demo/src/App.java"), b"class App {}")
+
+    def test_tar_gz_sink_writes_in_memory(self):
+        """Test that a tar.gz archive is built in memory."""
+        buffer = io.BytesIO()
+        sink = TarGzSink(buffer)
+        sink.write_plan(self.plan)
+        sink.close()
+
+        buffer.seek(0)
+        with tarfile.open(fileobj=buffer, mode="r:gz") as archive:
+            self.assertEqual(sorted(archive.getnames()), ["demo/empty", "demo/src/App.java"])
+            self.assertEqual(archive.extractfile("demo/src/App.java").read(), b"class App {}")
+
+    def test_archive_keeps_last_content_of_a_path(self):
+        """Test that a path rendered twice becomes a single archive entry."""
+        self.plan.add_content(os.path.join(self.project_dir, "src", "App.java"), "class App { int v; }")
+        buffer = io.BytesIO()
+        sink = ZipSink(buffer)
+        stats = sink.write_plan(self.plan)
+
+        self.assertEqual((stats.created, stats.updated), (1, 0))
+        with self.assertRaisesRegex(ValueError, "demo/src/App.java"):
+            sink.write_file(os.path.join(self.project_dir, "src", "App.java"), "class App {}")
+        sink.close()
+
+        with zipfile.ZipFile(io.BytesIO(buffer.getvalue())) as archive:
+            self.assertEqual(archive.namelist().count("demo/src/App.java"), 1)
+            self.assertEqual(archive.read("demo/src/App.java"), b"class App { int v; }")
+
+    def test_create_archive_sink_infers_format(self):
+        """Test that the archive format follows the file extension."""
+        tar_sink = create_archive_sink(os.path.join(self.temp_dir.name, "demo.tgz"))
+        zip_sink = create_archive_sink(os.path.join(self.temp_dir.name, "demo.zip"))
+        tar_sink.close()
+        zip_sink.close()
+
+        self.assertIsInstance(tar_sink, TarGzSink)
+        self.assertIsInstance(zip_sink, ZipSink)
+        with self.assertRaises(ValueError):
+            create_archive_sink(io.BytesIO(), archive_format="rar")
+
+
+class TestGeneratorRenderPlan(unittest.TestCase):
+    """Test cases for building render plans from a generator."""
+
+    def setUp(self):
+        """Set up test fixtures."""
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.project_dir = os.path.join(self.temp_dir.name, "demo")
+        self.config = {
+            "project_name": "demo",
+            "base_package": "com.example.demo",
+            "framework": {"name": "spring-boot", "version": "3.2.0"},
+            "language": {"name": "java", "version": "17"},
+            "build_system": {"name": "maven"},
+            "pipeline": {"name": "github-actions"},
+        }
+
+    def tearDown(self):
+        """Clean up test fixtures."""
+        self.temp_dir.cleanup()
+
+    def test_build_plan_does_not_touch_disk(self):
+        """Test that planning a project writes nothing."""
+        generator = SpringBootJavaGenerator()
+        plan = generator.build_plan(self.project_dir, self.config)
+
+        self.assertFalse(os.path.exists(self.project_dir))
+        self.assertIn(self.project_dir, plan.directories)
+
+        paths = [plan.relative_path(task.path) for task in plan]
+        self.assertIn("README.md", paths)
+        self.assertIn(os.path.join(".github", "workflows", "ci.yml"), paths)
+        self.assertIsNone(generator._plan)
+
+    def test_kotlin_plan_without_entities(self):
+        """Test that Kotlin projects without entities get the sample entity."""
+        config = dict(self.config, language={"name": "kotlin"}, features=["generate-dtos"])
+        for generator_class in (SpringBootKotlinGenerator, MicronautKotlinGenerator):
+            with self.subTest(generator=generator_class.__name__):
+                plan = generator_class().build_plan(self.project_dir, config)
+
+                tasks = {os.path.basename(task.path): task for task in plan}
+                self.assertIn("SampleDTO.kt", tasks)
+                sample = tasks["Sample.kt"]
+                self.assertEqual(sample.context["entity_name"], "Sample")
+                self.assertEqual([f.name for f in sample.context["fields"]], ["id", "name", "description", "createdAt"])
+
+    def test_kotlin_repository_finders(self):
+        """Test that Kotlin repositories declare a finder for every index of their entity."""
+        config = dict(self.config, language={"name": "kotlin"}, entities=DDLParser().parse_ddl("""
+            CREATE TABLE users (
+                id BIGINT PRIMARY KEY,
+                email VARCHAR(100) UNIQUE,
+                last_name VARCHAR(50),
+                first_name VARCHAR(50)
+            );
+            CREATE INDEX idx_name ON users (last_name, first_name);
+        """))
+        for generator_class in (SpringBootKotlinGenerator, MicronautKotlinGenerator):
+            with self.subTest(generator=generator_class.__name__):
+                generator = generator_class()
+                plan = generator.build_plan(self.project_dir, config)
+
+                repository = next(task for task in plan if task.path.endswith("UsersRepository.kt"))
+                content = repository.render(generator.template_env)
+                self.assertIn("interface UsersRepository", content)
+                self.assertIn("fun findByEmail(email: String): Optional<Users>", content)
+                self.assertIn("fun findByLastNameAndFirstName(lastName: String, firstName: String): List<Users>", content)
+
+    def test_emit_outside_generate_writes_immediately(self):
+        """Test that generator helpers still write when called directly."""
+        generator = SpringBootJavaGenerator()
+        path = os.path.join(self.project_dir, "docs", "notes.txt")
+        generator._write_file(path, "notes")
+
+        with open(path) as f:
+            self.assertEqual(f.read(), "notes")
+
+
+if __name__ == "__main__":
+    unittest.main()
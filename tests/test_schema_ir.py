@@ -0,0 +1,182 @@
+"""Test module for the typed schema IR."""
+
+import pickle
+import unittest
+
+from src.generators.base.manifest import ContextHasher
+from src.generators.schema.ddl_parser import DDLParser
+from src.generators.schema.ir import (
+    Endpoint, Entity, Field, Parameter, Schema, build_schema, entity_from_definition, entity_from_table,
+    schema_from_api_info
+)
+
+
+DDL = """
+CREATE TABLE customers (
+    id BIGINT AUTO_INCREMENT PRIMARY KEY,
+    email VARCHAR(255) NOT NULL UNIQUE,
+    created_at DATETIME
+);
+
+CREATE TABLE orders (
+    id BIGINT AUTO_INCREMENT PRIMARY KEY,
+    customer_id BIGINT NOT NULL,
+    total DECIMAL(10,2),
+    FOREIGN KEY (customer_id) REFERENCES customers(id)
+);
+"""
+
+
+class TestSchemaIR(unittest.TestCase):
+    """Test cases for building and using the schema IR."""
+
+    def test_entity_from_table(self):
+        """Test that parsed tables become entities with typed fields."""
+        tables = DDLParser().parse_ddl(DDL)
+        customer = entity_from_table(tables[0], "kotlin")
+        order = entity_from_table(tables[1], "kotlin")
+
+        self.assertEqual(customer.name, "Customers")
+        self.assertEqual(customer.table, "customers")
+        self.assertEqual([f.name for f in customer.fields], ["id", "email", "createdAt"])
+        self.assertEqual(customer.id_type, "Long")
+        self.assertFalse(customer.id_field.nullable)
+        self.assertTrue(customer.field("email").unique)
+        self.assertTrue(customer.field("email").required)
+        self.assertEqual(customer.field("createdAt").type, "java.time.LocalDateTime")
+        self.assertEqual(customer.field("createdAt").column, "created_at")
+        self.assertEqual(order.field("total").type, "java.math.BigDecimal")
+
+        self.assertEqual([(r.kind, r.target) for r in order.relationships], [("ManyToOne", "Customers")])
+        self.assertEqual(order.relationships[0].join_column, "customer_id")
+        self.assertEqual([(r.kind, r.target) for r in customer.relationships], [("OneToMany", "Orders")])
+
+    def test_entity_from_definition(self):
+        """Test that UI and configuration entities are normalized per language."""
+        definition = {
+            "name": "Product",
+            "tableName": "products",
+            "fields": [
+                {"name": "id", "type": "Long", "primaryKey": True, "required": True},
+                {"name": "quantity", "type": "Integer", "required": True},
+                {"name": "note", "type": "String?"},
+                "legacy",
+            ],
+        }
+        product = entity_from_definition(definition, "kotlin")
+
+        self.assertEqual(product.table, "products")
+        self.assertEqual([f.type for f in product.fields], ["Long", "Int", "String", "String"])
+        self.assertEqual([f.nullable for f in product.fields], [False, False, True, True])
+        self.assertEqual(product.var_name, "product")
+        self.assertEqual(entity_from_definition(definition, "java").field("quantity").type, "Integer")
+
+    def test_build_schema_from_mixed_sources(self):
+        """Test that a schema accepts entities of every source and separate relationships."""
+        tables = DDLParser().parse_ddl(DDL)
+        schema = build_schema(
+            tables + [{"name": "Tag", "fields": [{"name": "label", "type": "String"}]}],
+            relationships=[{"sourceEntity": "Tag", "targetEntity": "Orders", "type": "ManyToMany",
+                            "bidirectional": True, "fetchType": "LAZY"}],
+        )
+
+        self.assertEqual([e.name for e in schema.entities], ["Customers", "Orders", "Tag"])
+        tag = schema.entity("Tag")
+        self.assertEqual(tag.relationships[0].field_name, "orders")
+        self.assertEqual(tag.relationships[0].fetch, "LAZY")
+        self.assertIs(build_schema([tag]).entities[0], tag)
+
+    def test_schema_from_api_info(self):
+        """Test that OpenAPI models and endpoints become entities and endpoints."""
+        api_info = {
+            "models": {
+                "User": {"name": "User", "type": "entity", "required": ["email"], "properties": {
+                    "id": {"type": "integer", "format": "int64"},
+                    "email": {"type": "string", "format": "email"},
+                    "roles": {"type": "array", "items": {"$ref": "#/components/schemas/Role"}},
+                }},
+                "UserDTO": {"name": "UserDTO", "type": "dto", "properties": {}},
+            },
+            "endpoints": [
+                {"path": "/users/{id}", "method": "GET", "operationId": "getUser", "tags": ["Users"],
+                 "parameters": [{"name": "id", "type": "Long", "in": "path", "required": True}],
+                 "response": {"type": "User"}},
+                {"path": "/health", "method": "GET", "tags": ["Default"], "parameters": [], "response": {"type": "void"}},
+            ],
+        }
+        api = schema_from_api_info(api_info)
+
+        user = api.entity("User")
+        self.assertEqual([f.type for f in user.fields], ["Long", "String", "List<Role>"])
+        self.assertTrue(user.field("email").required)
+        self.assertEqual(user.field("email").format, "email")
+        self.assertEqual([e.name for e in api.entities_of_kind("dto")], ["UserDTO"])
+        self.assertEqual(api.endpoints[0].operation_id, "getUser")
+        self.assertEqual(api.endpoints[0].parameters[0].location, "path")
+        self.assertEqual(list(api.endpoints_by_tag()), ["Users", "Default"])
+
+    def test_records_are_immutable_values(self):
+        """Test immutability, value semantics and pickling of records."""
+        entity = Entity("Customer", fields=[Field("id", "Long", primary_key=True, nullable=False)])
+
+        with self.assertRaises(AttributeError):
+            entity.name = "Other"
+        with self.assertRaises(AttributeError):
+            entity.extra = 1
+        self.assertFalse(hasattr(entity, "__dict__"))
+
+        copy = pickle.loads(pickle.dumps(entity))
+        self.assertEqual(copy, entity)
+        self.assertEqual(hash(copy), hash(entity))
+        self.assertEqual(entity.to_dict()["fields"][0]["type"], "Long")
+
+    def test_endpoint_index(self):
+        """Test the indexes of endpoints by tag, referenced model and path prefix."""
+        user, role = Entity("User", kind="dto"), Entity("Role")
+        endpoints = (
+            Endpoint("/users", "GET", "listUsers", ["Users"], response_type="List<User>"),
+            Endpoint("/users/{id}/roles", "PUT", "setRoles", ["Users", "Roles"],
+                     parameters=[Parameter("roles", "List<Role>", "body")]),
+            Endpoint("/users-admin", "GET", "admin", ["Admin"]),
+        )
+        schema = Schema([user, role], endpoints)
+
+        index = schema.index
+        self.assertIs(schema.index, index)
+        self.assertEqual(list(index.by_tag), ["Users", "Roles", "Admin"])
+        self.assertEqual(schema.endpoints_by_tag()["Users"], endpoints[:2])
+        self.assertEqual(index.endpoints_of_model("Role"), endpoints[1:2])
+        self.assertEqual(index.endpoints_of_model("Order"), ())
+        self.assertEqual(index.models_by_tag["Users"], (user, role))
+        self.assertEqual(index.models_by_tag["Admin"], ())
+        self.assertEqual(index.endpoints_under("/users/"), endpoints[:2])
+        self.assertEqual(index.endpoints_under("users/{id}"), endpoints[1:2])
+        self.assertEqual(index.endpoints_under("/"), endpoints)
+
+        # The cached index is not part of the value
+        copy = pickle.loads(pickle.dumps(schema))
+        self.assertEqual(copy, schema)
+        self.assertEqual(hash(copy), hash(schema))
+        self.assertNotIn("_index", schema.to_dict())
+        self.assertEqual(ContextHasher().hash({"api": copy}), ContextHasher().hash({"api": schema}))
+
+    def test_strings_are_interned(self):
+        """Test that repeated names and types share one string object."""
+        tables = DDLParser().parse_ddl(DDL)
+        customer, order = (entity_from_table(table) for table in tables)
+        self.assertIs(customer.fields[0].column, order.fields[0].column)
+        self.assertIs(customer.fields[0].type, order.fields[0].type)
+
+    def test_context_hash_of_records(self):
+        """Test that records hash by value in rendering contexts."""
+        first = entity_from_definition({"name": "A", "fields": [{"name": "x", "type": "String"}]})
+        second = entity_from_definition({"name": "A", "fields": [{"name": "x", "type": "String"}]})
+        changed = entity_from_definition({"name": "A", "fields": [{"name": "x", "type": "Long"}]})
+
+        hasher = ContextHasher()
+        self.assertEqual(hasher.hash({"entity": first}), hasher.hash({"entity": second}))
+        self.assertNotEqual(hasher.hash({"entity": first}), hasher.hash({"entity": changed}))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,175 @@
+"""Test module for binary schema snapshots."""
+
+import hashlib
+import json
+import os
+import shutil
+import struct
+import tempfile
+import unittest
+import zlib
+from unittest.mock import patch
+
+import jinja2
+
+from src.core.scaffolding import ScaffoldingEngine, sql_dialect
+from src.generators.base import BaseGenerator
+from src.generators.schema.ddl_parser import DDLParser
+from src.generators.registry import GeneratorRegistry
+from src.generators.schema.ir import build_schema, schema_from_api_info
+from src.generators.schema.snapshot import (
+    FORMAT_VERSION, SnapshotError, dumps_snapshot, load_snapshot, loads_snapshot, save_snapshot, snapshot_info
+)
+
+
+# Size of the snapshot header preceding the payload
+HEADER_SIZE = 52
+
+DDL = """
+CREATE TABLE customers (
+    id BIGINT AUTO_INCREMENT PRIMARY KEY,
+    email VARCHAR(255) NOT NULL UNIQUE,
+    score INT,
+    avatar BLOB
+);
+
+CREATE TABLE orders (
+    id BIGINT AUTO_INCREMENT PRIMARY KEY,
+    customer_id BIGINT NOT NULL,
+    FOREIGN KEY (customer_id) REFERENCES customers(id)
+);
+"""
+
+
+class ReadmeGenerator(BaseGenerator):
+    """Minimal generator writing a README."""
+
+    def __init__(self):
+        super().__init__()
+        self.template_env = jinja2.Environment(loader=jinja2.DictLoader({"readme.j2": "{{ config.project_name }}"}))
+
+    def _run_generation_phases(self, project_dir, config):
+        self._emit(os.path.join(project_dir, "README.md"), "readme.j2", {"config": config})
+
+    def _generate_build_config(self, project_dir, config):
+        pass
+
+    def _generate_source_code(self, project_dir, config):
+        pass
+
+    def _generate_tests(self, project_dir, config):
+        pass
+
+
+class TestSchemaSnapshot(unittest.TestCase):
+    """Test cases for saving and loading schema snapshots."""
+
+    def setUp(self):
+        """Set up a schema with entities, relationships, indexes and endpoints."""
+        self.temp_dir = tempfile.mkdtemp()
+        tables = DDLParser(dialect="mysql").parse_ddl(DDL)
+        api = schema_from_api_info({"endpoints": [
+            {"path": "/customers/{id}", "method": "GET", "operationId": "getCustomer", "tags": ["Customers"],
+             "parameters": [{"name": "id", "type": "Integer", "in": "path", "required": True}],
+             "response": {"type": "List<Integer>"}},
+        ]})
+        self.schema = build_schema(
+            tables + [{"name": "Tag", "fields": [{"name": "label", "type": "String", "annotations": ["@Size(max = 20)"]}]}],
+            "java", "mysql", endpoints=api.endpoints,
+        )
+
+    def tearDown(self):
+        """Clean up temporary files."""
+        shutil.rmtree(self.temp_dir)
+
+    def test_round_trip(self):
+        """Test that a loaded snapshot equals the saved schema."""
+        path = os.path.join(self.temp_dir, "shared", "schema.mgschema")
+        size = save_snapshot(self.schema, path, "mysql")
+
+        self.assertEqual(os.path.getsize(path), size)
+        loaded = load_snapshot(path)
+        self.assertEqual(loaded, self.schema)
+        self.assertEqual(loaded.entity("Orders").relationships[0].target, "Customers")
+        self.assertIs(loaded.entities[0].fields[0].name, loaded.entities[1].fields[0].name)
+
+        info = snapshot_info(dumps_snapshot(self.schema, "mysql"))
+        self.assertEqual((info["language"], info["dialect"], info["entities"], info["endpoints"]),
+                         ("java", "mysql", 3, 1))
+        self.assertEqual(info["format_version"], FORMAT_VERSION)
+
+    def test_load_for_another_language(self):
+        """Test that snapshots are retargeted to the language of the generator."""
+        kotlin = loads_snapshot(dumps_snapshot(self.schema, "mysql"), "kotlin")
+
+        customers = kotlin.entity("Customers")
+        self.assertEqual(kotlin.language, "kotlin")
+        self.assertEqual(customers.field("score").type, "Int")
+        self.assertEqual(customers.field("avatar").type, "ByteArray")
+        self.assertEqual(kotlin.endpoints[0].parameters[0].type, "Int")
+        self.assertEqual(kotlin.endpoints[0].response_type, "List<Int>")
+        self.assertEqual(kotlin.entity("Tag").field("label").annotations, ("@Size(max = 20)",))
+
+    def test_invalid_snapshots(self):
+        """Test that foreign, corrupted, truncated and future snapshots are rejected."""
+        data = dumps_snapshot(self.schema)
+        corrupted = bytearray(data)
+        corrupted[-1] ^= 0xFF
+        future = data[:8] + struct.pack("<H", FORMAT_VERSION + 1) + data[10:]
+
+        for invalid in (b"CREATE TABLE", bytes(corrupted), data[:-1], future):
+            with self.assertRaises(SnapshotError):
+                loads_snapshot(invalid)
+        self.assertIsInstance(SnapshotError("x"), ValueError)
+
+    def test_payload_is_plain_data(self):
+        """Test that the payload is JSON and malformed records are rejected."""
+        data = dumps_snapshot(self.schema)
+        header = data[:HEADER_SIZE]
+        metadata, entities, endpoints = json.loads(zlib.decompress(data[HEADER_SIZE:]))
+        self.assertEqual(metadata["entities"], 3)
+
+        entities[0][2][0].append("extra")
+        payload = zlib.compress(json.dumps([metadata, entities, endpoints]).encode("utf-8"))
+        forged = header[:12] + struct.pack("<Q", len(payload)) + hashlib.sha256(payload).digest() + payload
+        with self.assertRaisesRegex(SnapshotError, "Malformed"):
+            loads_snapshot(forged)
+
+    def test_engine_loads_snapshot_instead_of_ddl(self):
+        """Test that the engine takes the schema from a snapshot path or its contents."""
+        path = os.path.join(self.temp_dir, "schema.mgschema")
+        save_snapshot(self.schema, path, "mysql")
+        engine = ScaffoldingEngine(output_dir=self.temp_dir)
+
+        schema, dialect = engine._load_schema_snapshot(path, "kotlin", with_dialect=True)
+        self.assertEqual(dialect, "mysql")
+        self.assertEqual(schema.entity("Customers").field("score").type, "Int")
+
+        with open(path, "rb") as f:
+            schema, _ = engine._load_schema_snapshot(f.read(), "java")
+        self.assertEqual(schema, self.schema)
+
+    def test_engine_parses_ddl_in_database_dialect(self):
+        """Test that the DDL file is parsed in the dialect of the project's database."""
+        ddl_file = os.path.join(self.temp_dir, "schema.sql")
+        with open(ddl_file, "w") as f:
+            f.write("# MySQL comment\nCREATE TABLE flags (id BIGINT PRIMARY KEY, active TINYINT(1));\n")
+        path = os.path.join(self.temp_dir, "schema.mgschema")
+        registry = GeneratorRegistry({("demo", "java"): ReadmeGenerator}, entry_point_group=None)
+        config = {"project_name": "flags", "base_package": "com.example", "framework": {"name": "demo"},
+                  "language": {"name": "java"}, "database": {"name": "mysql"}, "ddl_file": ddl_file}
+
+        with patch("src.generators.registry._registry", registry):
+            ScaffoldingEngine(output_dir=self.temp_dir).generate_project(
+                config, schema_cache=False, save_schema_snapshot=path)
+
+        with open(path, "rb") as f:
+            self.assertEqual(snapshot_info(f.read())["dialect"], "mysql")
+        self.assertEqual(load_snapshot(path).entity("Flags").field("active").type, "Boolean")
+        self.assertEqual(sql_dialect({"database": "PostgreSQL"}), "postgresql")
+        self.assertEqual(sql_dialect({"database": {"name": "mongodb"}}), "generic")
+        self.assertEqual(sql_dialect({"database": {"name": "mysql"}, "sql_dialect": "h2"}), "h2")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,173 @@
+"""Test module for the SQL lexer and statement splitter."""
+
+import gzip
+import os
+import tempfile
+import unittest
+
+from src.generators.schema.ddl_parser import DDLParser
+from src.generators.schema.sql_lexer import (
+    StatementSplitter, iter_file_statements, iter_statements, parse_alter_table, parse_create_index,
+    parse_create_table, split_statements, split_top_level
+)
+
+
+SQL = """-- Schema dump; generated
+CREATE TABLE `customers` (
+    id BIGINT NOT NULL,
+    note VARCHAR(20) DEFAULT 'a;b''c(',   /* block; comment ) */
+    PRIMARY KEY (id)
+);
+INSERT INTO customers VALUES (1, 'it\\'s; fine');
+CREATE FUNCTION touch() RETURNS trigger AS $body$ BEGIN; END; $body$ LANGUAGE plpgsql;
+CREATE TABLE IF NOT EXISTS sales."Order Items" (
+    id INT PRIMARY KEY,
+    customer_id BIGINT,
+    FOREIGN KEY (customer_id) REFERENCES customers(id)
+)
+"""
+
+
+class TestStatementSplitter(unittest.TestCase):
+    """Test cases for splitting SQL text into statements."""
+
+    def test_split_statements(self):
+        """Test that quotes, comments and dollar quoting don't end statements."""
+        statements = list(split_statements(SQL))
+
+        self.assertEqual(len(statements), 4)
+        self.assertTrue(statements[0].startswith("CREATE TABLE `customers`"))
+        self.assertNotIn("comment", statements[0])
+        self.assertIn("'a;b''c('", statements[0])
+        self.assertEqual(statements[1], "INSERT INTO customers VALUES (1, 'it\\'s; fine')")
+        self.assertIn("$body$ BEGIN; END; $body$", statements[2])
+
+    def test_chunked_input_gives_same_statements(self):
+        """Test that statements don't depend on where the input is cut."""
+        expected = list(split_statements(SQL))
+        for size in range(1, 40):
+            chunks = [SQL[i:i + size] for i in range(0, len(SQL), size)]
+            self.assertEqual(list(iter_statements(chunks)), expected, f"chunk size {size}")
+
+    def test_dialects(self):
+        """Test dialect specific quoting and comments."""
+        self.assertEqual(list(split_statements("SELECT 'C:\\'; SELECT 2", dialect="postgresql")),
+                         ["SELECT 'C:\\'", "SELECT 2"])
+        self.assertEqual(list(split_statements("# note; here\nSELECT 1", dialect="mysql")), ["SELECT 1"])
+        with self.assertRaises(ValueError):
+            StatementSplitter("cobol")
+
+
+DUMP = """CREATE TABLE a (id INT);
+INSERT INTO a VALUES (1,'x;y'),(2,'it\\'s'),(3,'a''b;');
+COPY public.a (id, note) FROM stdin;
+1\tsemi;colon 'open quote
+2\t\\.not the end
+\\.
+CREATE TABLE b (id INT);
+REPLACE INTO a VALUES (3, '-- not a comment');
+CREATE TABLE c (id INT)
+"""
+
+
+class TestDataSkipping(unittest.TestCase):
+    """Test cases for skipping table data in schema dumps."""
+
+    def test_skip_data_statements(self):
+        """Test that INSERT/REPLACE statements and COPY data are dropped."""
+        expected = ["CREATE TABLE a (id INT)", "CREATE TABLE b (id INT)", "CREATE TABLE c (id INT)"]
+        for size in [1, 2, 3, 7, 64, len(DUMP)]:
+            splitter = StatementSplitter(skip_data=True)
+            statements = []
+            for i in range(0, len(DUMP), size):
+                statements.extend(splitter.feed(DUMP[i:i + size]))
+            statements.extend(splitter.close())
+
+            self.assertEqual(statements, expected, f"chunk size {size}")
+            self.assertEqual(splitter.skipped_statements, 3)
+
+    def test_copy_data_is_never_parsed_as_sql(self):
+        """Test that COPY data blocks are skipped even when data is kept."""
+        statements = list(split_statements(DUMP))
+        self.assertIn("COPY public.a (id, note) FROM stdin", statements)
+        self.assertEqual(statements[statements.index("COPY public.a (id, note) FROM stdin") + 1],
+                         "CREATE TABLE b (id INT)")
+
+    def test_stream_compressed_file(self):
+        """Test streaming a gzip-compressed dump in small chunks."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            path = os.path.join(temp_dir, "dump.sql.gz")
+            with gzip.open(path, "wt") as f:
+                f.write(DUMP)
+
+            statements = list(iter_file_statements(path, chunk_size=5))
+            tables = DDLParser().parse_ddl_file(path)
+
+        self.assertEqual(len(statements), 3)
+        self.assertEqual([table["name"] for table in tables], ["a", "b", "c"])
+
+
+class TestCreateTable(unittest.TestCase):
+    """Test cases for extracting CREATE TABLE statements."""
+
+    def test_parse_create_table(self):
+        """Test extracting names and column lists."""
+        statements = list(split_statements(SQL))
+
+        name, body = parse_create_table(statements[0])
+        self.assertEqual(name, "customers")
+        self.assertEqual([part.strip().split()[0] for part in split_top_level(body)], ["id", "note", "PRIMARY"])
+
+        self.assertEqual(parse_create_table(statements[3])[0], "Order Items")
+        self.assertIsNone(parse_create_table(statements[1]))
+        self.assertIsNone(parse_create_table("CREATE TABLE copy AS SELECT * FROM customers"))
+
+    def test_trailing_backslash_without_escapes(self):
+        """Test literals ending in a backslash in dialects without backslash escapes."""
+        body = "dir VARCHAR(100) DEFAULT 'C:\\', note TEXT DEFAULT E'it\\'s', id INT"
+        self.assertEqual([part.split()[0] for part in split_top_level(body, "postgresql")], ["dir", "note", "id"])
+
+        statement = "CREATE TABLE paths (dir VARCHAR(100) DEFAULT 'C:\\', id INT)"
+        self.assertEqual(parse_create_table(statement, "postgresql"),
+                         ("paths", "dir VARCHAR(100) DEFAULT 'C:\\', id INT"))
+
+        tables = DDLParser("postgresql").parse_ddl(statement + ";\nCREATE TABLE other (id INT);")
+        self.assertEqual([table["name"] for table in tables], ["paths", "other"])
+        self.assertEqual([column["name"] for column in tables[0]["columns"]], ["dir", "id"])
+
+    def test_ddl_parser_uses_statements(self):
+        """Test that the DDL parser handles the full dump."""
+        tables = DDLParser().parse_ddl(SQL)
+
+        self.assertEqual([table["name"] for table in tables], ["customers", "Order Items"])
+        customers, items = tables
+        self.assertEqual([column["name"] for column in customers["columns"]], ["id", "note"])
+        self.assertEqual(customers["primaryKey"], ["id"])
+        self.assertEqual(items["primaryKey"], ["id"])
+        self.assertEqual(items["foreignKeys"][0]["referencedTable"], "customers")
+        self.assertTrue(any(r["type"] == "OneToMany" for r in customers["relationships"]))
+
+    
+    def test_parse_alter_table_and_create_index(self):
+        """Test extracting ALTER TABLE actions and CREATE INDEX definitions."""
+        name, actions = parse_alter_table(
+            "ALTER TABLE ONLY public.orders ADD CONSTRAINT fk FOREIGN KEY (user_id) "
+            "REFERENCES public.users(id), ADD KEY idx (a, b)"
+        )
+        self.assertEqual(name, "orders")
+        self.assertEqual(actions, [
+            "ADD CONSTRAINT fk FOREIGN KEY (user_id) REFERENCES public.users(id)", "ADD KEY idx (a, b)"
+        ])
+        
+        index = parse_create_index(
+            'CREATE UNIQUE INDEX CONCURRENTLY IF NOT EXISTS "idx" ON ONLY public.users USING btree '
+            '(email DESC, code(10))'
+        )
+        self.assertEqual(index, {"name": "idx", "table": "users", "columns": ["email", "code"], "unique": True})
+        self.assertEqual(parse_create_index("CREATE INDEX ON t (a)")["columns"], ["a"])
+        self.assertIsNone(parse_create_index("CREATE INDEX idx ON users (lower(email))"))
+        self.assertIsNone(parse_alter_table(SQL))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,122 @@
+"""Test module for the shared template environment."""
+
+import os
+import unittest
+import tempfile
+from unittest.mock import patch
+
+import jinja2
+
+from src.generators.base import templating
+from src.generators.base.templating import (
+    get_environment, clear_environments, compile_templates, get_template_hash, COMPILED_TEMPLATES_ENV
+)
+from src.generators.spring_boot.java import SpringBootJavaGenerator
+from src.generators.micronaut.java import MicronautJavaGenerator
+
+
+class TestTemplating(unittest.TestCase):
+    """Test cases for the shared template environment."""
+
+    def setUp(self):
+        """Set up test fixtures."""
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.templates_dir = os.path.join(self.temp_dir.name, "templates")
+        self.cache_dir = os.path.join(self.temp_dir.name, "cache")
+        os.makedirs(self.templates_dir)
+        with open(os.path.join(self.templates_dir, "greeting.j2"), "w") as f:
+            f.write("{{ name | pascalcase }} / {{ name | camelcase }} / {{ name | snakecase }} / {{ name | kebabcase }}")
+
+        self._old_cache_dir = os.environ.get("MICROGENESIS_CACHE_DIR")
+        os.environ["MICROGENESIS_CACHE_DIR"] = self.cache_dir
+        self.compiled_dir = os.path.join(self.temp_dir.name, "compiled")
+        os.environ[COMPILED_TEMPLATES_ENV] = self.compiled_dir
+        clear_environments()
+
+    def tearDown(self):
+        """Clean up test fixtures."""
+        clear_environments()
+        del os.environ[COMPILED_TEMPLATES_ENV]
+        if self._old_cache_dir is None:
+            del os.environ["MICROGENESIS_CACHE_DIR"]
+        else:
+            os.environ["MICROGENESIS_CACHE_DIR"] = self._old_cache_dir
+        self.temp_dir.cleanup()
+
+    def test_environment_is_shared(self):
+        """Test that generators share one environment per search path."""
+        self.assertIs(SpringBootJavaGenerator().template_env, MicronautJavaGenerator().template_env)
+        self.assertIs(get_environment(), get_environment(templating.TEMPLATES_DIR))
+        self.assertIsNot(get_environment(), get_environment(self.templates_dir))
+
+    def test_case_filters(self):
+        """Test the case conversion filters."""
+        template = get_environment(self.templates_dir).get_template("greeting.j2")
+        self.assertEqual(template.render(name="order line-item"),
+                         "OrderLineItem / orderLineItem / order_line_item / order-line-item")
+
+    def test_bytecode_cache_is_persisted(self):
+        """Test that compiled templates are stored in the cache directory."""
+        get_environment(self.templates_dir).get_template("greeting.j2")
+
+        cached = os.listdir(os.path.join(self.cache_dir, "templates"))
+        self.assertEqual(len(cached), 1)
+
+        # A fresh environment loads the template from the bytecode cache
+        clear_environments()
+        template = get_environment(self.templates_dir).get_template("greeting.j2")
+        self.assertTrue(template.render(name="a").startswith("A"))
+
+    def test_precompiled_templates(self):
+        """Test loading bundled templates from precompiled modules."""
+        stats = compile_templates()
+        self.assertGreater(stats["compiled"], 100)
+        self.assertEqual(stats["failed"], 0)
+
+        env = get_environment()
+        self.assertIsInstance(env.loader, jinja2.ChoiceLoader)
+        self.assertTrue(env.get_template("common/docs/README.md.j2").filename.endswith(".py"))
+
+        # Templates missing from the precompiled set fall back to the sources
+        for name in os.listdir(self.compiled_dir):
+            if name.endswith(".py"):
+                os.remove(os.path.join(self.compiled_dir, name))
+        clear_environments()
+        template = get_environment().get_template("common/docs/README.md.j2")
+        self.assertTrue(template.filename.endswith("README.md.j2"))
+
+    def test_changed_templates_are_loaded_from_source(self):
+        """Test that templates edited after precompiling are not served from stale modules."""
+        with open(os.path.join(self.templates_dir, "farewell.j2"), "w") as f:
+            f.write("Bye {{ name }}")
+        with patch.object(templating, "TEMPLATES_DIR", self.templates_dir):
+            compile_templates(search_path=self.templates_dir)
+            with open(os.path.join(self.templates_dir, "farewell.j2"), "w") as f:
+                f.write("See you {{ name }}")
+
+            env = get_environment(self.templates_dir)
+            self.assertTrue(env.get_template("greeting.j2").filename.endswith(".py"))
+            farewell = env.get_template("farewell.j2")
+            self.assertEqual(farewell.render(name="Ann"), "See you Ann")
+            self.assertTrue(farewell.filename.endswith("farewell.j2"))
+            self.assertEqual(get_template_hash(env, "farewell.j2"),
+                             templating._hash_source("See you {{ name }}"))
+
+    def test_precompiled_templates_from_other_version_are_ignored(self):
+        """Test that precompiled templates built for another version are not used."""
+        os.makedirs(self.compiled_dir)
+        with open(os.path.join(self.compiled_dir, templating.COMPILED_STAMP_FILE), "w") as f:
+            f.write('{"version": "0.0.0"}')
+
+        self.assertIsInstance(get_environment().loader, jinja2.FileSystemLoader)
+
+    def test_base_generator_case_helpers(self):
+        """Test that every generator has the case helpers used by its filters."""
+        generator = MicronautJavaGenerator()
+        self.assertEqual(generator._to_camel_case("user_account"), "userAccount")
+        self.assertEqual(generator._to_snake_case("User Account"), "user_account")
+        self.assertEqual(generator._to_kebab_case("User Account"), "user-account")
+
+
+if __name__ == "__main__":
+    unittest.main()
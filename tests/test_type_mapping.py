@@ -0,0 +1,63 @@
+"""Test module for SQL and OpenAPI type mapping."""
+
+import unittest
+
+from src.generators.schema.ddl_parser import DDLParser
+from src.generators.schema.type_mapping import (
+    is_builtin_type, map_column_type, map_openapi_type, normalize_sql_type
+)
+
+
+class TestTypeMapping(unittest.TestCase):
+    """Test cases for the type mapping tables."""
+
+    def test_normalize_sql_type(self):
+        """Test that case, whitespace, arguments and modifiers are normalized."""
+        self.assertEqual(normalize_sql_type("INT(11) UNSIGNED"), ("int", "11", True))
+        self.assertEqual(normalize_sql_type("numeric( 10 , 2 )"), ("numeric", "10,2", False))
+        self.assertEqual(normalize_sql_type("TIMESTAMP(6)  WITH TIME ZONE"), ("timestamp with time zone", "6", False))
+
+    def test_longest_type_names_win(self):
+        """Test types that prefix matching used to confuse."""
+        self.assertEqual(map_column_type("BIGINT"), "Long")
+        self.assertEqual(map_column_type("DATETIME"), "java.time.LocalDateTime")
+        self.assertEqual(map_column_type("TIMESTAMP"), "java.time.LocalDateTime")
+        self.assertEqual(map_column_type("TIME"), "java.time.LocalTime")
+        self.assertEqual(map_column_type("DECIMAL(10,2)", "kotlin"), "java.math.BigDecimal")
+        self.assertEqual(map_column_type("INT", "kotlin"), "Int")
+        self.assertEqual(map_column_type("geometry"), "String")
+
+    def test_dialects(self):
+        """Test dialect-specific type semantics."""
+        self.assertEqual(map_column_type("TINYINT(1)", dialect="mysql"), "Boolean")
+        self.assertEqual(map_column_type("TINYINT(4)", dialect="mysql"), "Byte")
+        self.assertEqual(map_column_type("INT UNSIGNED", dialect="mysql"), "Long")
+        self.assertEqual(map_column_type("FLOAT", dialect="mysql"), "Float")
+        self.assertEqual(map_column_type("FLOAT", dialect="postgresql"), "Double")
+        self.assertEqual(map_column_type("bytea", "kotlin", "postgresql"), "ByteArray")
+        self.assertEqual(map_column_type("text[]", "kotlin", "postgresql"), "List<String>")
+        self.assertEqual(map_column_type("timestamptz", dialect="postgresql"), "java.time.OffsetDateTime")
+        self.assertEqual(map_column_type("UUID", dialect="h2"), "java.util.UUID")
+        self.assertEqual(map_column_type("TIME WITH TIME ZONE", dialect="postgresql"), "java.time.OffsetTime")
+        self.assertEqual(map_column_type("timetz", "kotlin", "postgresql"), "java.time.OffsetTime")
+
+    def test_openapi_types(self):
+        """Test OpenAPI type and format mapping."""
+        self.assertEqual(map_openapi_type("integer"), "Integer")
+        self.assertEqual(map_openapi_type("integer", "int64", "kotlin"), "Long")
+        self.assertEqual(map_openapi_type("string", "uuid"), "java.util.UUID")
+        self.assertEqual(map_openapi_type("string", "email"), "String")
+        self.assertEqual(map_openapi_type("object", language="kotlin"), "Any")
+        self.assertTrue(is_builtin_type("Int", "kotlin"))
+        self.assertFalse(is_builtin_type("Customer", "java"))
+        with self.assertRaises(ValueError):
+            map_column_type("INT", "scala")
+
+    def test_ddl_parser_uses_its_dialect(self):
+        """Test that the DDL parser maps types with the dialect it parses."""
+        self.assertEqual(DDLParser()._map_sql_to_java_type("TINYINT(1)"), "Byte")
+        self.assertEqual(DDLParser(dialect="mysql")._map_sql_to_java_type("TINYINT(1)"), "Boolean")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,84 @@
+"""Test module for the YAML and JSON document loader."""
+
+import gc
+import glob
+import os
+import tempfile
+import unittest
+from unittest.mock import patch
+
+import yaml
+
+from src.utils import yaml_loader
+from src.utils.yaml_loader import LazyMapping, load_document, load_document_lazily, load_yaml
+
+
+class TestYamlLoader(unittest.TestCase):
+    """Test cases for loading YAML and JSON documents."""
+
+    def test_load_document_by_extension(self):
+        """Test that .yaml/.yml files are parsed as YAML and other files as JSON."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            documents = {"config.yml": "name: app\nfeatures: [logging]\n", "config.json": '{"name": "app"}'}
+            for name, content in documents.items():
+                with open(os.path.join(temp_dir, name), "w") as f:
+                    f.write(content)
+
+            self.assertEqual(load_document(os.path.join(temp_dir, "config.yml")),
+                             {"name": "app", "features": ["logging"]})
+            self.assertEqual(load_document(os.path.join(temp_dir, "config.json")), {"name": "app"})
+
+    def test_pure_python_fallback(self):
+        """Test that documents load the same without libyaml."""
+        text = "openapi: 3.0.3\npaths:\n  /users:\n    get: {operationId: listUsers}\n"
+        expected = yaml.safe_load(text)
+        self.assertEqual(load_yaml(text), expected)
+        with patch.object(yaml_loader, "SafeLoader", yaml.SafeLoader):
+            self.assertEqual(load_yaml(text.encode("utf-8")), expected)
+
+    def test_only_plain_objects(self):
+        """Test that arbitrary Python objects cannot be constructed."""
+        with self.assertRaises(yaml.YAMLError):
+            load_yaml("!!python/object/apply:os.system ['true']")
+
+    def test_garbage_collector_restored(self):
+        """Test that the garbage collector is re-enabled, also after errors."""
+        self.assertTrue(gc.isenabled())
+        load_yaml("a: 1")
+        with self.assertRaises(yaml.YAMLError):
+            load_yaml("a: [1")
+        self.assertTrue(gc.isenabled())
+
+    def test_lazy_document(self):
+        """Test that lazily loaded documents equal eagerly loaded ones."""
+        documents = {
+            "block.yaml": (
+                "---\n# Comment\nopenapi: 3.0.3\npaths:\n  /users:\n    get:\n      tags:\n      - Users\n"
+                "  '/it''s': {get: {operationId: quoted}}\n  \"/a: b\": {}\n# Comment\nresponses:\n  200:\n"
+                "    description: |\n      Multi-line\n\n      text\n  default: {}\nlist:\n- 1\n- 2\n"
+            ),
+            "aliases.yaml": "defaults: &defaults {a: 1}\npaths:\n  /x: *defaults\n",
+            "flow.yaml": "{paths: {/x: {}}}\n",
+        }
+        with tempfile.TemporaryDirectory() as temp_dir:
+            for name, content in documents.items():
+                path = os.path.join(temp_dir, name)
+                with open(path, "w") as f:
+                    f.write(content)
+                document = load_document_lazily(path, {"paths": 1, "responses": 1})
+                self.assertEqual(document, load_document(path), name)
+                self.assertEqual(isinstance(document, LazyMapping), name == "block.yaml", name)
+
+            document = load_document_lazily(os.path.join(temp_dir, "block.yaml"), {"paths": 1})
+            self.assertIsInstance(document["paths"], LazyMapping)
+            self.assertEqual(document["paths"].source("/users"), "  /users:\n    get:\n      tags:\n      - Users\n")
+            self.assertEqual(list(document["responses"]), [200, "default"])
+
+        for path in glob.glob(os.path.join(os.path.dirname(__file__), "resource", "*", "service.yaml")):
+            document = load_document_lazily(path, {"paths": 1, "components": 2})
+            self.assertIsInstance(document, LazyMapping)
+            self.assertEqual(document, load_document(path), path)
+
+
+if __name__ == "__main__":
+    unittest.main()